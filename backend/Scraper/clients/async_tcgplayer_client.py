@@ -0,0 +1,147 @@
+"""asyncio-based TCGplayer fetches with the blocking client's contract.
+
+`TCGPlayerClient` fetches one URL at a time and sleeps 1-2 s before each, so
+a set's card price guide and its sealed-product endpoints are strictly
+serialized: every request waits for the previous response before its own
+pacing sleep even starts.
+
+`AsyncTCGPlayerClient` is that client with an async request path on
+`httpx.AsyncClient`. The response cache, the challenge-page detection, the
+retry/backoff and the metrics are the inherited ones, so the run report reads
+the same. What changes is the rate budget: each request reserves the next
+start slot one jitter interval after the previous slot (the same 1-2 s as
+the blocking client) instead of after the previous response, and at most
+HTTP_ASYNC_MAX_CONCURRENCY requests are in flight. Under a process-wide
+`SharedRateLimiter` the limiter paces the requests instead. The blocking
+methods remain available and unchanged.
+"""
+
+import asyncio
+import os
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+import requests
+
+from .shared_rate_limiter import active_shared_rate_limiter
+from .tcgplayer_client import TCGPlayerClient
+
+
+class AsyncTCGPlayerClient(TCGPlayerClient):
+    def __init__(self):
+        super().__init__()
+        self.max_concurrency = max(1, int(os.getenv("HTTP_ASYNC_MAX_CONCURRENCY", "4")))
+        self._next_request_slot: Optional[float] = None
+
+    async def _reserve_request_slot(self, pace_lock: asyncio.Lock) -> None:
+        limiter = active_shared_rate_limiter()
+        if limiter is not None:
+            await asyncio.to_thread(self._acquire_shared_request, limiter)
+            self.metrics["http_requests_total"] += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        async with pace_lock:
+            # Counted at reservation so concurrent requests cannot overrun the cap.
+            self._check_request_cap()
+            self.metrics["http_requests_total"] += 1
+            now = loop.time()
+            slot = max(now, self._next_request_slot or now) + random.uniform(
+                self.request_delay_min, self.request_delay_max
+            )
+            self._next_request_slot = slot
+        await asyncio.sleep(max(0.0, slot - loop.time()))
+
+    async def _backoff_sleep_async(self, attempt: int) -> None:
+        await asyncio.sleep(self.base_backoff_seconds * (2 ** (attempt - 1)) + random.uniform(0.0, 0.6))
+
+    async def _request_json_async(
+        self,
+        http: httpx.AsyncClient,
+        gate: asyncio.Semaphore,
+        pace_lock: asyncio.Lock,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        as_price_guide: bool = False,
+        conditional: bool = False,
+    ) -> Any:
+        request_key = self._request_key(method, url, payload)
+        is_helper_request = self._is_helper_or_metadata_url(url)
+
+        cached = self._cached_response(request_key, is_helper_request)
+        if cached is not None:
+            return self._cached_result(cached, as_price_guide)
+        headers = self._conditional_headers(url, as_price_guide and conditional)
+
+        self.metrics["http_requests_cache_misses"] += 1
+
+        last_error: Optional[str] = None
+        for attempt in range(1, self.max_request_retries + 1):
+            async with gate:
+                await self._reserve_request_slot(pace_lock)
+                try:
+                    response = await http.request(method.upper(), url, json=payload, headers=headers or None)
+                    if as_price_guide:
+                        return self._price_guide_result(request_key, response, attempt, url)
+                    parsed = self._parse_response(response, attempt, url)
+                    return self._record_success(request_key, parsed, is_helper_request)
+                except (ValueError, httpx.HTTPError, requests.RequestException) as exc:
+                    last_error = str(exc)
+            if attempt >= self.max_request_retries:
+                break
+            self.metrics["retry_count_total"] += 1
+            await self._backoff_sleep_async(attempt)
+
+        raise RuntimeError(f"Request failed for {url}: {last_error}")
+
+    async def _gather(self, requests_to_run: Sequence[Any]) -> List[Any]:
+        """Run `(coroutine_factory, *args)` entries against one connection pool."""
+        gate = asyncio.Semaphore(self.max_concurrency)
+        pace_lock = asyncio.Lock()
+        timeout = httpx.Timeout(self.read_timeout_seconds, connect=self.connect_timeout_seconds)
+        async with httpx.AsyncClient(headers=self.headers, timeout=timeout) as http:
+            return await asyncio.gather(
+                *(factory(http, gate, pace_lock, *args) for factory, *args in requests_to_run)
+            )
+
+    async def _fetch_product_market_price_async(self, http, gate, pace_lock, price_url):
+        try:
+            data = await self._request_json_async(http, gate, pace_lock, "GET", price_url)
+            return data.get("result", [])[0].get("buckets", [])[0].get("marketPrice", None)
+        except (IndexError, AttributeError, ValueError) as exc:
+            print(f"Error parsing data from {price_url}: {exc}")
+            return None
+        except Exception as exc:
+            print(f"Failed to fetch data from {price_url}: {exc}")
+            return None
+
+    async def _fetch_price_guide_async(self, http, gate, pace_lock, price_guide_url):
+        return await self._request_json_async(
+            http, gate, pace_lock, "GET", price_guide_url, as_price_guide=True, conditional=True
+        )
+
+    def fetch_price_data_many(
+        self,
+        price_guide_urls: Sequence[str],
+        *,
+        conditional_urls: Sequence[str] = (),
+    ) -> List[Any]:
+        """Fetch several price guides concurrently; results in input order.
+
+        URLs in `conditional_urls` come back as a `PriceGuideFetch` (see
+        `fetch_price_guide`). Raises the first failure, like consecutive
+        `fetch_price_data` calls.
+        """
+        return asyncio.run(self._gather([
+            (self._fetch_price_guide_async, url) if url in conditional_urls else (self._request_json_async, "GET", url)
+            for url in price_guide_urls
+        ]))
+
+    def fetch_product_market_prices(self, price_urls: Sequence[str]) -> List[Optional[float]]:
+        """`fetch_product_market_price` for several URLs concurrently, in input order."""
+        return asyncio.run(self._gather([
+            (self._fetch_product_market_price_async, url) for url in price_urls
+        ]))
@@ -0,0 +1,114 @@
+"""Process-wide request pacing shared by concurrent scrape workers.
+
+A single `TCGPlayerClient` paces itself with a random 1-2 s sleep before each
+request and enforces MAX_HTTP_REQUESTS_PER_RUN and MAX_CONSECUTIVE_RATE_LIMITS
+on its own counters. That is correct for one job at a time, but N workers in
+one process would each get the full budget and their own pacing, multiplying
+the upstream load by N.
+
+While a `SharedRateLimiter` is installed (`shared_rate_limiter_scope`), every
+client in the process draws from it instead: one token bucket paces all
+requests, one counter holds the run's request budget, and one streak counts
+consecutive rate-limit/challenge responses across workers. Once the budget is
+spent or the streak trips, the limiter stays exhausted for the rest of the run
+so every worker stops asking. Outside a scope clients behave exactly as
+before.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class SharedRateLimiter:
+    def __init__(
+        self,
+        *,
+        requests_per_second: float,
+        burst: int,
+        max_requests: int,
+        max_consecutive_rate_limits: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.requests_per_second = max(0.01, float(requests_per_second))
+        self.burst = max(1, int(burst))
+        self.max_requests = int(max_requests)
+        self.max_consecutive_rate_limits = int(max_consecutive_rate_limits)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled_at = clock()
+        self.requests_granted = 0
+        self.consecutive_rate_limits = 0
+        self.rate_limit_events = 0
+        self.exhausted_reason: Optional[str] = None
+
+    def acquire(self) -> bool:
+        """Wait for a token and charge one request to the shared budget.
+
+        Returns False without waiting when the budget is spent or the shared
+        rate-limit streak has tripped.
+        """
+        while True:
+            with self._lock:
+                if self.exhausted_reason:
+                    return False
+                if self.requests_granted >= self.max_requests:
+                    self.exhausted_reason = "request_cap_exceeded"
+                    return False
+                now = self._clock()
+                self._tokens = min(
+                    float(self.burst), self._tokens + (now - self._refilled_at) * self.requests_per_second
+                )
+                self._refilled_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.requests_granted += 1
+                    return True
+                wait_seconds = (1.0 - self._tokens) / self.requests_per_second
+            self._sleep(wait_seconds)
+
+    def record_rate_limit(self) -> int:
+        """Count a rate-limit/challenge response; returns the shared streak."""
+        with self._lock:
+            self.rate_limit_events += 1
+            self.consecutive_rate_limits += 1
+            if self.consecutive_rate_limits >= self.max_consecutive_rate_limits:
+                self.exhausted_reason = "sustained_rate_limit"
+            return self.consecutive_rate_limits
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_rate_limits = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requestsGranted": self.requests_granted,
+                "maxRequests": self.max_requests,
+                "rateLimitEvents": self.rate_limit_events,
+                "consecutiveRateLimits": self.consecutive_rate_limits,
+                "exhaustedReason": self.exhausted_reason,
+            }
+
+
+_shared_limiter: Optional[SharedRateLimiter] = None
+
+
+def active_shared_rate_limiter() -> Optional[SharedRateLimiter]:
+    return _shared_limiter
+
+
+@contextmanager
+def shared_rate_limiter_scope(limiter: Optional[SharedRateLimiter]) -> Iterator[Optional[SharedRateLimiter]]:
+    """Route every TCGplayer request in the process through `limiter`."""
+    global _shared_limiter
+    previous = _shared_limiter
+    _shared_limiter = limiter
+    try:
+        yield limiter
+    finally:
+        _shared_limiter = previous
@@ -9,6 +9,10 @@ from typing import Any, Dict, Optional, Tuple
 
 import requests
 
+from .price_guide_store import PriceGuideFetch, PriceGuideStore, body_hash
+from .shared_rate_limiter import SharedRateLimiter, active_shared_rate_limiter
+from ..parsers.price_guide_stream import validate_price_guide_body
+
 
 class RequestCapExceededError(RuntimeError):
     """Raised when run-level HTTP request cap is exceeded."""
@@ -53,12 +57,14 @@ class TCGPlayerClient:
         self._helper_seen_today: Dict[Tuple[str, str], bool] = {}
         self._today_utc = datetime.now(timezone.utc).date().isoformat()
         self._consecutive_rate_limit_events = 0
+        self.price_guide_store = PriceGuideStore.from_env()
 
         self.metrics: Dict[str, Any] = {
             "http_requests_total": 0,
             "http_requests_cache_hits": 0,
             "http_requests_cache_misses": 0,
             "http_requests_skipped_redundant": 0,
+            "http_requests_not_modified": 0,
             "rate_limit_events": 0,
             "retry_count_total": 0,
             "aborted_due_to_request_cap": False,
@@ -98,6 +104,17 @@ class TCGPlayerClient:
                 f"HTTP request cap exceeded ({self.max_requests_per_run})"
             )
 
+    def _acquire_shared_request(self, limiter: SharedRateLimiter) -> None:
+        if limiter.acquire():
+            return
+        if limiter.exhausted_reason == "sustained_rate_limit":
+            self.metrics["aborted_due_to_rate_limit"] = True
+            raise SustainedRateLimitError(
+                "Sustained rate-limit/challenge responses detected across workers; aborting run early"
+            )
+        self.metrics["aborted_due_to_request_cap"] = True
+        raise RequestCapExceededError(f"Shared HTTP request cap exceeded ({limiter.max_requests})")
+
     def _is_challenge_or_login_page(self, response: requests.Response) -> bool:
         content_type = (response.headers.get("Content-Type") or "").lower()
         if "html" not in content_type:
@@ -119,13 +136,18 @@ class TCGPlayerClient:
     def _record_rate_limit_event(self, reason: str, attempt: int, url: str) -> None:
         self.metrics["rate_limit_events"] += 1
         self._consecutive_rate_limit_events += 1
+        limiter = active_shared_rate_limiter()
+        if limiter is not None:
+            # The streak that aborts the run is the one shared by every worker.
+            self._consecutive_rate_limit_events = limiter.record_rate_limit()
         if self._consecutive_rate_limit_events == 1 or self._consecutive_rate_limit_events % 3 == 0:
             print(
                 f"[scraper-http] rate-limit/challenge event reason={reason} "
                 f"attempt={attempt} url={url} "
                 f"streak={self._consecutive_rate_limit_events}"
             )
-        if self._consecutive_rate_limit_events >= self.max_consecutive_rate_limits:
+        max_consecutive = limiter.max_consecutive_rate_limits if limiter is not None else self.max_consecutive_rate_limits
+        if self._consecutive_rate_limit_events >= max_consecutive:
             self.metrics["aborted_due_to_rate_limit"] = True
             raise SustainedRateLimitError(
                 "Sustained rate-limit/challenge responses detected; aborting run early"
@@ -137,26 +159,125 @@ class TCGPlayerClient:
         while len(self._request_cache) > self.max_request_cache_entries:
             self._request_cache.popitem(last=False)
 
-    def _request_json(self, method: str, url: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _cached_response(self, request_key: str, is_helper_request: bool) -> Optional[Dict[str, Any]]:
+        if request_key not in self._request_cache:
+            return None
+        self._request_cache.move_to_end(request_key)
+        self.metrics["http_requests_cache_hits"] += 1
+        self.metrics["http_requests_skipped_redundant"] += 1
+        if is_helper_request:
+            helper_key = (self._today_utc, request_key)
+            if helper_key not in self._helper_seen_today:
+                self._helper_seen_today[helper_key] = True
+        return copy.deepcopy(self._request_cache[request_key])
+
+    def _parse_response(self, response: Any, attempt: int, url: str) -> Dict[str, Any]:
+        self._check_response(response, attempt, url)
+        return response.json()
+
+    def _check_response(self, response: Any, attempt: int, url: str) -> None:
+        """Status and challenge checks shared by the blocking and async clients."""
+        if response.status_code in (429, 503):
+            self._record_rate_limit_event(str(response.status_code), attempt, url)
+            raise requests.HTTPError(f"HTTP {response.status_code}")
+
+        if self._is_challenge_or_login_page(response):
+            self._record_rate_limit_event("challenge_html", attempt, url)
+            raise requests.HTTPError("Challenge/login HTML response received")
+
+        if response.status_code >= 500:
+            raise requests.HTTPError(f"HTTP {response.status_code}")
+
+        if response.status_code != 200:
+            raise requests.HTTPError(f"HTTP {response.status_code}")
+
+    def _record_success(self, request_key: str, parsed: Dict[str, Any], is_helper_request: bool) -> Dict[str, Any]:
+        self._cache_response(request_key, parsed)
+        self._consecutive_rate_limit_events = 0
+        limiter = active_shared_rate_limiter()
+        if limiter is not None:
+            limiter.record_success()
+        if is_helper_request:
+            self._helper_seen_today[(self._today_utc, request_key)] = True
+        return copy.deepcopy(parsed)
+
+    def _conditional_headers(self, url: str, conditional: bool) -> Dict[str, str]:
+        if not conditional or self.price_guide_store is None:
+            return {}
+        return self.price_guide_store.conditional_headers(url)
+
+    def _price_guide_result(self, request_key: str, response: Any, attempt: int, url: str) -> PriceGuideFetch:
+        """A price-guide response, compared with what the store saw last time."""
+        store = self.price_guide_store
+        if response.status_code == 304 and store is not None:
+            self.metrics["http_requests_not_modified"] += 1
+            self._consecutive_rate_limit_events = 0
+            limiter = active_shared_rate_limiter()
+            if limiter is not None:
+                limiter.record_success()
+            return PriceGuideFetch(data=None, body_hash=store.stored_body_hash(url), unchanged=True)
+
+        # The body stays undecoded: the parser streams its rows
+        # (PriceGuideFetch.rows), and the response cache keeps the immutable
+        # bytes rather than a decoded tree it would deep-copy on every hit. It
+        # is still walked once here, so a truncated or malformed body raises
+        # (and is retried) before its hash is recorded or it is cached.
+        self._check_response(response, attempt, url)
+        content = response.content
+        validate_price_guide_body(content)
+        content_hash = body_hash(content)
+        unchanged = False
+        if store is not None:
+            unchanged = store.stored_body_hash(url) == content_hash
+            store.record_response(
+                url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                content_hash=content_hash,
+            )
+        return PriceGuideFetch(
+            data=None,
+            body_hash=content_hash,
+            unchanged=unchanged,
+            content=self._record_success(request_key, content, False),
+        )
+
+    def _cached_result(self, cached: Any, as_price_guide: bool) -> Any:
+        """A response-cache hit in the shape the caller asked for."""
+        if as_price_guide:
+            if isinstance(cached, bytes):
+                return PriceGuideFetch(data=None, body_hash=None, unchanged=False, content=cached)
+            return PriceGuideFetch(data=cached, body_hash=None, unchanged=False)
+        return json.loads(cached) if isinstance(cached, bytes) else cached
+
+    def _request_json(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        as_price_guide: bool = False,
+        conditional: bool = False,
+    ) -> Any:
+        """The parsed JSON body, or a `PriceGuideFetch` when `as_price_guide`."""
         request_key = self._request_key(method, url, payload)
         is_helper_request = self._is_helper_or_metadata_url(url)
 
-        if request_key in self._request_cache:
-            self._request_cache.move_to_end(request_key)
-            self.metrics["http_requests_cache_hits"] += 1
-            self.metrics["http_requests_skipped_redundant"] += 1
-            if is_helper_request:
-                helper_key = (self._today_utc, request_key)
-                if helper_key not in self._helper_seen_today:
-                    self._helper_seen_today[helper_key] = True
-            return copy.deepcopy(self._request_cache[request_key])
+        cached = self._cached_response(request_key, is_helper_request)
+        if cached is not None:
+            return self._cached_result(cached, as_price_guide)
+        headers = self._conditional_headers(url, as_price_guide and conditional)
 
         self.metrics["http_requests_cache_misses"] += 1
 
         last_error: Optional[str] = None
         for attempt in range(1, self.max_request_retries + 1):
-            self._check_request_cap()
-            self._jitter_sleep()
+            limiter = active_shared_rate_limiter()
+            if limiter is None:
+                self._check_request_cap()
+                self._jitter_sleep()
+            else:
+                self._acquire_shared_request(limiter)
             self.metrics["http_requests_total"] += 1
 
             try:
@@ -164,29 +285,13 @@ class TCGPlayerClient:
                     method=method.upper(),
                     url=url,
                     json=payload,
+                    headers=headers or None,
                     timeout=(self.connect_timeout_seconds, self.read_timeout_seconds),
                 )
-
-                if response.status_code in (429, 503):
-                    self._record_rate_limit_event(str(response.status_code), attempt, url)
-                    raise requests.HTTPError(f"HTTP {response.status_code}")
-
-                if self._is_challenge_or_login_page(response):
-                    self._record_rate_limit_event("challenge_html", attempt, url)
-                    raise requests.HTTPError("Challenge/login HTML response received")
-
-                if response.status_code >= 500:
-                    raise requests.HTTPError(f"HTTP {response.status_code}")
-
-                if response.status_code != 200:
-                    raise requests.HTTPError(f"HTTP {response.status_code}")
-
-                parsed = response.json()
-                self._cache_response(request_key, parsed)
-                self._consecutive_rate_limit_events = 0
-                if is_helper_request:
-                    self._helper_seen_today[(self._today_utc, request_key)] = True
-                return copy.deepcopy(parsed)
+                if as_price_guide:
+                    return self._price_guide_result(request_key, response, attempt, url)
+                parsed = self._parse_response(response, attempt, url)
+                return self._record_success(request_key, parsed, is_helper_request)
             except (ValueError, requests.RequestException) as exc:
                 last_error = str(exc)
                 if attempt >= self.max_request_retries:
@@ -200,6 +305,10 @@ class TCGPlayerClient:
         """Fetch price data from TCGPlayer API with run-level cache and safety controls."""
         return self._request_json("GET", price_guide_url)
 
+    def fetch_price_guide(self, price_guide_url: str, *, conditional: bool = True) -> PriceGuideFetch:
+        """Fetch a price guide, conditionally when a price-guide store is configured."""
+        return self._request_json("GET", price_guide_url, as_price_guide=True, conditional=conditional)
+
     def fetch_product_market_price(self, price_url):
         """Fetch market price for a sealed product."""
         try:
@@ -0,0 +1,29 @@
+from types import MappingProxyType
+from typing import Any, List, Mapping, Sequence, Tuple
+
+
+def freeze_record(value: Any) -> Any:
+    """Read-only view of a parsed record: mappings become mappingproxies, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_record(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_record(item) for item in value)
+    return value
+
+
+def freeze_records(records: Sequence[Any]) -> Tuple[Any, ...]:
+    """Parsed records that can be handed to every consumer without copying."""
+    return tuple(freeze_record(record) for record in records)
+
+
+def thaw_record(value: Any) -> Any:
+    """Plain (JSON-serializable) copy of a frozen record."""
+    if isinstance(value, Mapping):
+        return {key: thaw_record(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_record(item) for item in value]
+    return value
+
+
+def thaw_records(records: Sequence[Any]) -> List[Any]:
+    return [thaw_record(record) for record in records]
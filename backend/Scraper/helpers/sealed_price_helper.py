@@ -2,12 +2,19 @@ def parse_sealed_prices(endpoints, tcg_client):
     """Fetch and parse all sealed product prices"""
     price_results = {}
 
+    fetched = {}
+    if hasattr(tcg_client, "fetch_product_market_prices"):
+        # The async client fetches every endpoint concurrently.
+        labelled = [(label, url) for label, url in endpoints.items() if url]
+        prices = tcg_client.fetch_product_market_prices([url for _label, url in labelled])
+        fetched = {label: price for (label, _url), price in zip(labelled, prices)}
+
     for label, url in endpoints.items():
         if not url:
             print(f"{label}: $Unavailable (No URL)")
             continue
 
-        price = tcg_client.fetch_product_market_price(url)
+        price = fetched[label] if label in fetched else tcg_client.fetch_product_market_price(url)
         if price is not None:
             print(f"{label}: ${price}")
             price_results[label] = price
@@ -0,0 +1,140 @@
+"""Incremental decoding of TCGplayer price-guide bodies.
+
+A price guide is one JSON object whose `result` array holds every
+product/printing/condition row of a set - tens of thousands of rows for the
+big sets. `response.json()` materializes the whole tree before the parser
+sees the first row, and the parser then discards most of it (only Near Mint
+rows survive grouping).
+
+`iter_price_guide_rows` walks the body with the stdlib decoder instead,
+yielding one `result` row at a time from a bounded text window, so the
+parser can group and drop rows as they arrive. Other top-level fields are
+decoded and skipped. Malformed or truncated bodies raise ValueError, as
+`json.loads` would; `validate_price_guide_body` drains a body the same way to
+reject one up front.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Union
+
+
+STREAM_CHUNK_BYTES = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _chunked(content: bytes, size: int) -> Iterator[bytes]:
+    view = memoryview(content)
+    for offset in range(0, len(view), size):
+        yield bytes(view[offset:offset + size])
+
+
+class _Reader:
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk of text; False once the body is exhausted."""
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+        if not self.eof:
+            self.eof = True
+            tail = self._decoder.decode(b"", final=True)
+            if tail:
+                self.buffer += tail
+                return True
+        return False
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Price guide body ended unexpectedly")
+
+    def take(self, expected: str) -> str:
+        char = self.peek()
+        if char not in expected:
+            raise ValueError(f"Malformed price guide body: expected {expected!r}, found {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number or literal that ends the window may continue in the next chunk.
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _object_rows(reader: _Reader, field: str) -> Iterator[Any]:
+    reader.take("{")
+    if reader.peek() == "}":
+        reader.take("}")
+        return
+    while True:
+        key = reader.value()
+        reader.take(":")
+        if key == field and reader.peek() == "[":
+            reader.take("[")
+            if reader.peek() == "]":
+                reader.take("]")
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.take(",]") == "]":
+                        break
+        else:
+            reader.value()
+        if reader.take(",}") == "}":
+            return
+
+
+def iter_price_guide_rows(
+    body: Union[bytes, Iterable[bytes]],
+    *,
+    field: str = "result",
+    chunk_bytes: int = STREAM_CHUNK_BYTES,
+) -> Iterator[Any]:
+    """Yield the elements of the top-level `field` array of a JSON object body."""
+    reader = _Reader(_chunked(body, chunk_bytes) if isinstance(body, (bytes, bytearray)) else body)
+    yield from _object_rows(reader, field)
+
+
+def validate_price_guide_body(body: bytes, *, chunk_bytes: int = STREAM_CHUNK_BYTES) -> None:
+    """Raise ValueError unless `body` is exactly one well-formed JSON object.
+
+    Walks the body like `iter_price_guide_rows`, one row at a time, so a
+    fetched guide can be checked before it is cached or its hash recorded.
+    """
+    reader = _Reader(_chunked(body, chunk_bytes))
+    for _ in _object_rows(reader, "result"):
+        pass
+    while True:
+        reader.pos = _WHITESPACE.match(reader.buffer, reader.pos).end()
+        if reader.pos < len(reader.buffer):
+            raise ValueError("Malformed price guide body: data after the top-level object")
+        if not reader.fill():
+            return
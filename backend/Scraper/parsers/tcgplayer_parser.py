@@ -24,45 +24,57 @@ class TCGPlayerParser:
         Returns:
             List of parsed and cleaned card dictionaries
         """
-        raw_cards = raw_data.get("result", [])
+        return self.parse_card_rows(raw_data.get("result", []))
+
+    def parse_card_rows(self, rows):
+        """
+        Parse price-guide rows as they arrive (see price_guide_stream).
+
+        Rows are grouped by productID and source variant in one pass; only
+        each group's distinct Near Mint rows are retained, so a streamed
+        guide never has to be held in memory whole.
+
+        Args:
+            rows: Iterable of raw TCGPlayer price-guide rows
+
+        Returns:
+            List of parsed and cleaned card dictionaries
+        """
         # Product ids identify commercial cards; canonical printings/finishes
         # beneath them are independently observable source variants.
+        # products: product_id -> signature -> [distinct NM rows, NM row count]
         products = {}
-        for row_index, card in enumerate(raw_cards):
+        raw_row_count = 0
+        for row_index, row in enumerate(rows):
+            raw_row_count += 1
             # Synthetic row identity is only a compatibility path for unit/
             # imported payloads; live TCGplayer rows always carry productID.
-            product_id = str(card.get("productID") or f"_row:{row_index}").strip()
-            products.setdefault(product_id, []).append(card)
-
-        variant_groups = {}
-        for product_id, rows in products.items():
-            for row in rows:
-                edition, printing_type = parse_tcgplayer_printing(row.get("printing"))
-                special_type = determine_special_type(row.get("productName"), row.get("rarity"))
-                signature = build_external_variant_key(edition, printing_type, special_type)
-                variant_groups.setdefault((product_id, signature), []).append(row)
+            product_id = str(row.get("productID") or f"_row:{row_index}").strip()
+            edition, printing_type = parse_tcgplayer_printing(row.get("printing"))
+            special_type = determine_special_type(row.get("productName"), row.get("rarity"))
+            signature = build_external_variant_key(edition, printing_type, special_type)
+            group = products.setdefault(product_id, {}).setdefault(signature, [{}, 0])
+            if clean_condition(row.get("condition") or "") == "Near Mint":
+                identity = tuple(sorted((key, repr(value)) for key, value in row.items()))
+                group[0].setdefault(identity, row)
+                group[1] += 1
 
         selected_cards = []
         ambiguous_variant_groups = []
         missing_nm_variant_groups = []
         duplicate_nm_rows_deduped = 0
-        for (product_id, signature), rows in variant_groups.items():
-            near_mint = [
-                row for row in rows
-                if clean_condition(row.get("condition") or "") == "Near Mint"
-            ]
-            if not near_mint:
-                missing_nm_variant_groups.append(f"{product_id}|{signature}")
-                continue
-            unique_nm = {}
-            for row in near_mint:
-                identity = tuple(sorted((key, repr(value)) for key, value in row.items()))
-                unique_nm.setdefault(identity, row)
-            duplicate_nm_rows_deduped += len(near_mint) - len(unique_nm)
-            if len(unique_nm) != 1:
-                ambiguous_variant_groups.append(f"{product_id}|{signature}")
-                continue
-            selected_cards.append(next(iter(unique_nm.values())))
+        variant_group_count = 0
+        for product_id, signatures in products.items():
+            for signature, (unique_nm, near_mint_count) in signatures.items():
+                variant_group_count += 1
+                if not near_mint_count:
+                    missing_nm_variant_groups.append(f"{product_id}|{signature}")
+                    continue
+                duplicate_nm_rows_deduped += near_mint_count - len(unique_nm)
+                if len(unique_nm) != 1:
+                    ambiguous_variant_groups.append(f"{product_id}|{signature}")
+                    continue
+                selected_cards.append(next(iter(unique_nm.values())))
 
         card_data = {}
         dropped_no_market = 0
@@ -105,19 +117,19 @@ class TCGPlayerParser:
         cards = list(card_data.values())
         
         print(
-            f"[DIAG][parse_cards] raw={len(raw_cards)} products={len(products)} "
+            f"[DIAG][parse_cards] raw={raw_row_count} products={len(products)} "
             f"kept={len(cards)} "
             f"dropped_no_market_price={dropped_no_market} "
             f"dropped_other={dropped_invalid} "
-            f"source_variant_groups={len(variant_groups)} "
+            f"source_variant_groups={variant_group_count} "
             f"rejected_ambiguous_variants={len(ambiguous_variant_groups)} "
             f"rejected_missing_nm_variants={len(missing_nm_variant_groups)}"
         )
 
         self.last_card_parse_report = {
-            "raw_rows": len(raw_cards),
+            "raw_rows": raw_row_count,
             "commercial_products": len(products),
-            "source_variant_groups": len(variant_groups),
+            "source_variant_groups": variant_group_count,
             "accepted_variant_groups": len(selected_cards),
             "payload_cards": len(cards),
             "ambiguous_variant_groups": sorted(ambiguous_variant_groups),
@@ -130,13 +142,14 @@ class TCGPlayerParser:
 
         return self._clean_card_data(cards)
     
-    def parse_sealed_products(self, config, client):
+    def parse_sealed_products(self, config, client, sealed_raw=None):
         """
         Parse sealed product data from a single URL.
 
         Args:
             config: Configuration object containing SEALED_DETAILS_URL
             client: TCGPlayerClient instance
+            sealed_raw: Already-fetched SEALED_DETAILS_URL response, if any
 
         Returns:
             List of cleaned sealed product dictionaries
@@ -144,7 +157,8 @@ class TCGPlayerParser:
         set_name = config.SET_NAME
 
         # Fetch data from the URL
-        sealed_raw = client.fetch_price_data(config.SEALED_DETAILS_URL)
+        if sealed_raw is None:
+            sealed_raw = client.fetch_price_data(config.SEALED_DETAILS_URL)
         raw_products = sealed_raw.get("result", [])
 
         # Deduplicate strictly by productName
@@ -1,4 +1,6 @@
-from ...clients.tcgplayer_client import TCGPlayerClient
+from ...clients.async_tcgplayer_client import AsyncTCGPlayerClient
+from ...clients.price_guide_store import parse_fingerprint
+from ...helpers.record_helper import freeze_records, thaw_records
 from ...parsers.tcgplayer_parser import TCGPlayerParser
 from ..dto_builders.tcgplayer_dto_builder import TCGPlayerDTOBuilder
 from backend.db.controllers.ingest_controller import IngestController
@@ -7,7 +9,6 @@ from backend.db.services.scrape_failure_classification import (
     ERROR_EXTERNAL_VARIANT_IDENTITY_CONFLICT,
 )
 from collections import OrderedDict
-import copy
 import json
 import sys
 import os
@@ -18,7 +19,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.
 
 class TCGScraper:
     def __init__(self, enable_db_ingestion=False, target_market_date=None):
-        self.client = TCGPlayerClient()
+        self.client = AsyncTCGPlayerClient()
         self.dto_builder = TCGPlayerDTOBuilder()
         self.enable_db_ingestion = enable_db_ingestion
         self.target_market_date = target_market_date
@@ -29,7 +30,9 @@ class TCGScraper:
             self.ingest_controller = IngestController()
 
     def _cache_parsed(self, cache, key, value):
-        cache[key] = copy.deepcopy(value)
+        # Parsed records are frozen (record_helper), so the cache and every
+        # scrape share them without copying.
+        cache[key] = value
         cache.move_to_end(key)
         while len(cache) > self.max_parsed_cache_entries:
             cache.popitem(last=False)
@@ -37,36 +40,63 @@ class TCGScraper:
     def scrape(self, config, excel_path):
         """Main scraping workflow"""
         
-        # Step 1: Fetch raw data
-        raw_data = self.client.fetch_price_data(config.CARD_DETAILS_URL)
-        _raw_count = len(raw_data.get("result", []))
+        # Step 1: Fetch raw data. The sealed price guide is fetched alongside
+        # the card guide unless its parse is already cached (or it has no URL,
+        # which the parser handles on its own). The card guide is fetched
+        # conditionally when a price-guide store is configured.
+        card_url = config.CARD_DETAILS_URL
+        sealed_cache_key = (config.SEALED_DETAILS_URL, config.SET_NAME)
+        if sealed_cache_key in self._parsed_sealed_cache or not config.SEALED_DETAILS_URL:
+            card_fetch = self.client.fetch_price_guide(card_url)
+            sealed_raw = None
+        else:
+            card_fetch, sealed_raw = self.client.fetch_price_data_many(
+                [card_url, config.SEALED_DETAILS_URL], conditional_urls=[card_url]
+            )
+
+        store = self.client.price_guide_store
+        fingerprint = parse_fingerprint(config.SET_NAME, config.PULL_RATE_MAPPING)
+        stored_parse = None
+        if store is not None and card_fetch.unchanged:
+            stored_parse = store.load_parse(card_url, card_fetch.body_hash, fingerprint)
+        if not card_fetch.has_body and stored_parse is None:
+            # Not modified, but the previous parse is gone: fetch the body.
+            card_fetch = self.client.fetch_price_guide(card_url, conditional=False)
+
         print(
             f"[DIAG][{config.SET_NAME}] step=fetch "
-            f"raw_cards={_raw_count} "
-            f"url={config.CARD_DETAILS_URL}"
+            f"raw_cards={'streamed' if card_fetch.has_body else 'unchanged'} "
+            f"url={card_url}"
         )
 
         # Step 2: Parse data
         parser = TCGPlayerParser(config.PULL_RATE_MAPPING)
-        card_cache_key = (config.CARD_DETAILS_URL, config.SET_NAME)
-        if card_cache_key in self._parsed_cards_cache:
+        card_cache_key = (card_url, config.SET_NAME)
+        if stored_parse is not None:
+            # Same body and parse inputs as the stored parse: reuse it.
+            card_dicts = freeze_records(stored_parse["cards"])
+            parser.last_card_parse_report = dict(stored_parse.get("parseReport") or {})
+        elif card_cache_key in self._parsed_cards_cache:
             self._parsed_cards_cache.move_to_end(card_cache_key)
-            card_dicts = copy.deepcopy(self._parsed_cards_cache[card_cache_key])
+            card_dicts = self._parsed_cards_cache[card_cache_key]
         else:
-            card_dicts = parser.parse_cards(raw_data)
+            card_dicts = freeze_records(parser.parse_card_rows(card_fetch.rows()))
             self._cache_parsed(self._parsed_cards_cache, card_cache_key, card_dicts)
+            if store is not None and card_fetch.body_hash:
+                store.save_parse(card_url, card_fetch.body_hash, fingerprint, cards=thaw_records(card_dicts),
+                                 parse_report=dict(getattr(parser, 'last_card_parse_report', {}) or {}))
 
         print(
             f"[DIAG][{config.SET_NAME}] step=parse "
-            f"parsed_cards={len(card_dicts)}"
+            f"parsed_cards={len(card_dicts)} "
+            f"reused_stored_parse={stored_parse is not None}"
         )
 
-        sealed_cache_key = (config.SEALED_DETAILS_URL, config.SET_NAME)
         if sealed_cache_key in self._parsed_sealed_cache:
             self._parsed_sealed_cache.move_to_end(sealed_cache_key)
-            sealed_dicts = copy.deepcopy(self._parsed_sealed_cache[sealed_cache_key])
+            sealed_dicts = self._parsed_sealed_cache[sealed_cache_key]
         else:
-            sealed_dicts = parser.parse_sealed_products(config, self.client)
+            sealed_dicts = freeze_records(parser.parse_sealed_products(config, self.client, sealed_raw=sealed_raw))
             self._cache_parsed(self._parsed_sealed_cache, sealed_cache_key, sealed_dicts)
 
         # Step 3: Build DTO
@@ -100,6 +130,9 @@ class TCGScraper:
                    "priceRowsUpdated": 0, "priceRowsSkippedDuplicates": 0,
                    "ingestionErrors": [], "sourceVariantKeys": source_variant_keys,
                    "marketDate": self.target_market_date,
+                   "priceGuideUnchanged": bool(card_fetch.unchanged),
+                   "priceGuideParseReused": stored_parse is not None,
+                   "ingestionSkipped": False,
                    **parse_diagnostics}
 
         _payload_cards = len(payload.get('data', {}).get('cards', []))
@@ -115,11 +148,22 @@ class TCGScraper:
         print(f"  - Cards: {len(data.get('cards', []))}")
         print(f"  - Sealed Products: {len(data.get('sealed_products', []))}")
         
-        with open('payload_debug.json', 'w') as f:
-            json.dump(payload, f, indent=2)
+        if self._is_debug_json_dump_enabled():
+            with open('payload_debug.json', 'w') as f:
+                json.dump(payload, f, indent=2)
         
-        # Step 5: Ingest to database (if enabled)
-        if self.enable_db_ingestion:
+        # Step 5: Ingest to database (if enabled). A re-run for a market date
+        # that already ingested this exact card guide and sealed data skips it;
+        # the caller's postcondition still verifies that day's rows.
+        ingestion_key = parse_fingerprint(fingerprint, thaw_records(sealed_dicts))
+        ingested_set_id = None
+        if self.enable_db_ingestion and store is not None and stored_parse is not None:
+            ingested_set_id = store.ingested_set_id(
+                card_url, card_fetch.body_hash, ingestion_key, self.target_market_date)
+        if ingested_set_id:
+            print(f"[DIAG][{config.SET_NAME}] step=ingest skipped=unchanged_price_guide set_id={ingested_set_id}")
+            outcome.update({"ingestionSkipped": True, "ingestionSuccess": True, "setId": ingested_set_id})
+        elif self.enable_db_ingestion:
             outcome["ingestionAttempted"] = True
             print("\n[SEND] Sending data to database...")
             try:
@@ -145,6 +189,10 @@ class TCGScraper:
                         f"set_id={_set_id} "
                         f"cards_inserted={_cards_inserted}"
                     )
+                    if store is not None and card_fetch.body_hash:
+                        store.record_ingested(card_url, card_fetch.body_hash,
+                                              ingestion_key=ingestion_key,
+                                              market_date=self.target_market_date, set_id=_set_id)
                     print("[OK] Database ingestion successful")
                     print(f"\n[SUMMARY] Ingestion Summary:")
                     if 'summary' in result:
@@ -170,6 +218,9 @@ class TCGScraper:
     def get_request_metrics(self):
         return self.client.get_metrics()
 
+    def _is_debug_json_dump_enabled(self):
+        return str(os.getenv("DEBUG_JSON_DUMP_ENABLED", "")).strip().lower() == "true"
+
 def validate_ingestion_result(payload, result):
     if not result or not result.get('success'):
         raise RuntimeError(f"Database ingestion failed: {(result or {}).get('error', 'Unknown error')}")
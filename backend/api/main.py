@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import hmac
 import logging
 import os
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import Body, Cookie, FastAPI, Header, HTTPException, Query, Request  # type: ignore[reportMissingImports]
+from fastapi.concurrency import run_in_threadpool  # type: ignore[reportMissingImports]
 from fastapi.middleware.cors import CORSMiddleware  # type: ignore[reportMissingImports]
-from fastapi.responses import JSONResponse  # type: ignore[reportMissingImports]
+from fastapi.responses import JSONResponse, PlainTextResponse  # type: ignore[reportMissingImports]
 from pydantic import BaseModel  # type: ignore[reportMissingImports]
 
+from backend.api.metrics import (
+    PROMETHEUS_TEXT_CONTENT_TYPE,
+    MeasuredJSONResponse,
+    RequestMetricsMiddleware,
+    render_metrics,
+)
+from backend.api.warm_start import get_warm_start_state, start_warm_start_if_enabled
 from backend.db.services.waitlist_signup_service import (
     insert_waitlist_signup,
     verify_waitlist_signup_token,
@@ -61,21 +71,23 @@ from backend.db.services.pokemon_set_market_service import (
 from backend.db.services.pokemon_public_snapshot_service import (
     get_pokemon_explore_rankings_snapshot_payload,
     get_pokemon_set_card_validation_snapshot_payload,
-    get_pokemon_set_cards_page_snapshot_payload,
     get_pokemon_set_cards_snapshot_payload,
     get_pokemon_set_insights_critical_snapshot_payload,
     get_pokemon_set_insights_secondary_snapshot_payload,
     get_pokemon_set_insights_snapshot_payload,
     get_pokemon_set_market_dashboard_snapshot_payload,
     get_pokemon_set_market_movers_snapshot_payload,
-    get_pokemon_set_overview_snapshot_payload,
-    get_pokemon_set_page_snapshot_payload,
     get_pokemon_set_pull_rates_snapshot_payload,
-    get_pokemon_set_shell_snapshot_payload,
     get_pokemon_set_top_chase_snapshot_payload,
     get_pokemon_set_top_market_cards_snapshot_payload,
     get_pokemon_set_value_history_snapshot_payload,
 )
+from backend.db.services.pokemon_public_snapshot_async_service import (
+    get_pokemon_set_cards_page_snapshot_payload_async,
+    get_pokemon_set_overview_snapshot_payload_async,
+    get_pokemon_set_page_snapshot_payload_async,
+    get_pokemon_set_shell_snapshot_payload_async,
+)
 from backend.db.services.pokemon_explore_card_movers_service import (
     ExploreCardMoversUnavailable,
     read_explore_card_movers_snapshot,
@@ -87,7 +99,17 @@ from backend.db.services.pokemon_explore_set_value_service import (
 from backend.db.services.pokemon_set_sealed_market_snapshot_service import read_snapshot as read_sealed_market_snapshot
 
 
-app = FastAPI(title="EVR Collection API")
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    warm_start_task = start_warm_start_if_enabled()
+    try:
+        yield
+    finally:
+        if warm_start_task is not None and not warm_start_task.done():
+            warm_start_task.cancel()
+
+
+app = FastAPI(title="EVR Collection API", lifespan=_lifespan, default_response_class=MeasuredJSONResponse)
 
 logger = logging.getLogger(__name__)
 
@@ -215,6 +237,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so the measured latency includes CORS handling.
+app.add_middleware(RequestMetricsMiddleware)
 
 
 @app.get("/collection/dashboard")
@@ -399,6 +423,34 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def readiness_check():
+    """Warm-start readiness for the load balancer: 503 until the opt-in warm
+    start (API_WARM_START) has finished, 200 once warm or when it is disabled."""
+    state = get_warm_start_state()
+    return JSONResponse(content=state.snapshot(), status_code=200 if state.ready else 503)
+
+
+@app.get("/internal/metrics")
+def internal_metrics(authorization: Optional[str] = Header(default=None, alias="authorization")):
+    """Prometheus text exposition of the process metrics registry.
+
+    The scraper must send INTERNAL_METRICS_TOKEN as a bearer token. Without a
+    token the route is hidden (404) unless INTERNAL_METRICS_OPEN is set, so a
+    deployment that forgets the token does not publish its route metrics.
+    """
+    expected_token = (os.getenv("INTERNAL_METRICS_TOKEN") or "").strip()
+    if not expected_token:
+        if not _is_truthy(os.getenv("INTERNAL_METRICS_OPEN")):
+            return JSONResponse(content={"message": "Not Found"}, status_code=404)
+    elif not hmac.compare_digest(_extract_token(authorization, None) or "", expected_token):
+        return JSONResponse(
+            content={"message": "Unauthorized", "code": "INTERNAL_METRICS_UNAUTHORIZED"},
+            status_code=401,
+        )
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_TEXT_CONTENT_TYPE)
+
+
 @app.get("/evr/runs/latest")
 def get_latest_evr_run(
     target_type: str = Query(...),
@@ -411,7 +463,7 @@ def get_latest_evr_run(
 
 
 @app.get("/explore/page")
-def get_explore_page(
+async def get_explore_page(
     target_type: str = Query(...),
     target_id: str = Query(...),
     limit_distribution_bins: Optional[str] = Query(default=None),
@@ -420,8 +472,11 @@ def get_explore_page(
     """Return complete Explore page payload for a target (set, edition, pack, etc.)."""
     try:
         if str(target_type or "").strip().lower() == "set":
-            return get_pokemon_set_page_snapshot_payload(set_id=target_id)
-        payload = get_explore_page_payload(
+            return await get_pokemon_set_page_snapshot_payload_async(set_id=target_id)
+        # The generic Explore payload is still assembled synchronously; keep it
+        # off the event loop.
+        payload = await run_in_threadpool(
+            get_explore_page_payload,
             target_type=target_type,
             target_id=target_id,
             limit_distribution_bins=limit_distribution_bins,
@@ -695,7 +750,7 @@ def get_pokemon_set_cards(set_id: str):
 
 
 @app.get("/tcgs/pokemon/sets/{set_id}/cards/page")
-def get_pokemon_set_cards_page(
+async def get_pokemon_set_cards_page(
     set_id: str,
     page: Optional[str] = Query(default=None),
     page_size: Optional[str] = Query(default=None),
@@ -710,7 +765,7 @@ def get_pokemon_set_cards_page(
 ):
     """Return a single paginated slice of checklist cards for a Pokemon set."""
     try:
-        return get_pokemon_set_cards_page_snapshot_payload(
+        return await get_pokemon_set_cards_page_snapshot_payload_async(
             set_id=set_id,
             page=page or 1,
             page_size=page_size,
@@ -869,10 +924,10 @@ def get_pokemon_set_insights_secondary(set_id: str):
 
 
 @app.get("/tcgs/pokemon/sets/{set_id}/shell")
-def get_pokemon_set_shell(set_id: str):
+async def get_pokemon_set_shell(set_id: str):
     """Return the lightweight header/title-card snapshot for a Pokemon set (no payload_json)."""
     try:
-        return get_pokemon_set_shell_snapshot_payload(set_id=set_id)
+        return await get_pokemon_set_shell_snapshot_payload_async(set_id=set_id)
     except ExplorePageError as exc:
         return JSONResponse(
             content={"message": exc.message, "code": exc.code},
@@ -887,10 +942,10 @@ def get_pokemon_set_shell(set_id: str):
 
 
 @app.get("/tcgs/pokemon/sets/{set_id}/page")
-def get_pokemon_set_page(set_id: str):
+async def get_pokemon_set_page(set_id: str):
     """Return page-ready public Pokemon set analytics snapshot."""
     try:
-        return get_pokemon_set_page_snapshot_payload(set_id=set_id)
+        return await get_pokemon_set_page_snapshot_payload_async(set_id=set_id)
     except ExplorePageError as exc:
         return JSONResponse(
             content={"message": exc.message, "code": exc.code},
@@ -935,13 +990,13 @@ def get_pokemon_set_market_dashboard(
 
 
 @app.get("/tcgs/pokemon/sets/{set_id}/overview")
-def get_pokemon_set_overview(
+async def get_pokemon_set_overview(
     set_id: str,
     window: Optional[str] = Query(default=None),
 ):
     """Return the slim Overview-tab snapshot (set value trend + performance vs cost) for a Pokemon set."""
     try:
-        return get_pokemon_set_overview_snapshot_payload(set_id=set_id, window=window or "365d")
+        return await get_pokemon_set_overview_snapshot_payload_async(set_id=set_id, window=window or "365d")
     except PokemonSetMarketError as exc:
         return JSONResponse(
             content={"message": exc.message, "code": exc.code},
@@ -0,0 +1,152 @@
+"""Per-route request metrics for the API process.
+
+Two feeds, one registry (backend.utils.metrics_registry):
+
+- RequestMetricsMiddleware times every HTTP request and counts the response
+  bytes actually sent, labelled by the matched route TEMPLATE
+  (`/tcgs/pokemon/sets/{set_id}/page`), never the raw path, so a set id can
+  never become a label value.
+- MeasuredJSONResponse is the app's default response class. While rendering a
+  route's payload it picks up the `meta.timings` block the snapshot readers
+  already compute (snapshotQueryMs, set_resolve_ms, ...) and hands it to the
+  middleware, so those ad-hoc numbers become per-route histograms instead of
+  being read one response at a time.
+
+GET /internal/metrics renders the registry in the Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from fastapi.responses import JSONResponse  # type: ignore[reportMissingImports]
+
+from backend.utils.metrics_registry import LATENCY_BUCKETS_SECONDS, PAYLOAD_BUCKETS_BYTES, REGISTRY
+
+
+PROMETHEUS_TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_DURATION = REGISTRY.histogram(
+    "evr_api_request_duration_seconds",
+    "Wall time from request receipt to the last response byte, by route template.",
+    ("route", "method", "status"),
+    buckets=LATENCY_BUCKETS_SECONDS,
+)
+RESPONSE_BYTES = REGISTRY.histogram(
+    "evr_api_response_bytes",
+    "Response body bytes sent, by route template.",
+    ("route",),
+    buckets=PAYLOAD_BUCKETS_BYTES,
+)
+ROUTE_PHASE_DURATION = REGISTRY.histogram(
+    "evr_api_route_phase_seconds",
+    "Phases a route reported in its payload meta.timings, by route template and phase.",
+    ("route", "phase"),
+    buckets=LATENCY_BUCKETS_SECONDS,
+)
+DB_QUERY_DURATION = REGISTRY.histogram(
+    "evr_api_db_query_seconds",
+    "Total query time a route reported in its payload meta.timings (every *query* phase).",
+    ("route",),
+    buckets=LATENCY_BUCKETS_SECONDS,
+)
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_MS_SUFFIX = re.compile(r"_ms$")
+
+
+@dataclass
+class _RequestSample:
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+_CURRENT_SAMPLE: ContextVar[Optional[_RequestSample]] = ContextVar("evr_api_request_sample", default=None)
+
+
+def _phase_name(key: str) -> str:
+    """`snapshotQueryMs` and `snapshot_query_ms` are the same phase."""
+    return _MS_SUFFIX.sub("", _CAMEL_BOUNDARY.sub("_", key).lower())
+
+
+def _numeric_timings(content: Any) -> Dict[str, float]:
+    meta = content.get("meta") if isinstance(content, dict) else None
+    timings = meta.get("timings") if isinstance(meta, dict) else None
+    if not isinstance(timings, dict):
+        return {}
+    return {
+        _phase_name(str(key)): float(value)
+        for key, value in timings.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+    }
+
+
+class MeasuredJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        sample = _CURRENT_SAMPLE.get()
+        if sample is not None:
+            sample.timings = _numeric_timings(content)
+        return super().render(content)
+
+
+def _route_template(scope: Dict[str, Any]) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def _observe_timings(route: str, timings: Dict[str, float]) -> None:
+    query_ms = 0.0
+    saw_query = False
+    for phase, value_ms in timings.items():
+        ROUTE_PHASE_DURATION.observe(value_ms / 1000, route=route, phase=phase)
+        if "query" in phase:
+            query_ms += value_ms
+            saw_query = True
+    if saw_query:
+        DB_QUERY_DURATION.observe(query_ms / 1000, route=route)
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware: nothing is buffered, and the sample is shared with
+    the route through a context variable set before the app runs."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sample = _RequestSample()
+        token = _CURRENT_SAMPLE.set(sample)
+        started = time.perf_counter()
+        status = 500
+        sent_bytes = 0
+
+        async def send_with_metrics(message: Dict[str, Any]) -> None:
+            nonlocal status, sent_bytes
+            if message["type"] == "http.response.start":
+                status = int(message["status"])
+            elif message["type"] == "http.response.body":
+                sent_bytes += len(message.get("body") or b"")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _CURRENT_SAMPLE.reset(token)
+            route = _route_template(scope)
+            REQUEST_DURATION.observe(
+                time.perf_counter() - started, route=route, method=scope.get("method", ""), status=status
+            )
+            RESPONSE_BYTES.observe(sent_bytes, route=route)
+            _observe_timings(route, sample.timings)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render_prometheus()
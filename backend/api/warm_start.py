@@ -0,0 +1,186 @@
+"""Opt-in warm start for the API process.
+
+After a deploy the first visitor to every set page pays the cold costs of the
+process: the lazy async client, fresh PostgREST connections, the rankings
+read plus its legacy-contract upgrade and enrichment, and one snapshot read per
+set. With API_WARM_START enabled those costs are paid once, in a background
+task started by the app lifespan, while /ready reports 503 so the load balancer
+keeps traffic on the previous process until it is done.
+
+Every step is best effort. A failed prefetch only means that route pays its own
+cold cost on first request, exactly as without warm start, so it is recorded on
+the readiness payload but never keeps the process out of rotation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool  # type: ignore[reportMissingImports]
+
+from backend.db.services.pokemon_explore_card_movers_service import read_explore_card_movers_snapshot
+from backend.db.services.pokemon_explore_set_value_service import read_explore_set_value_snapshot
+from backend.db.services.pokemon_public_snapshot_async_service import get_pokemon_set_shell_snapshot_payload_async
+from backend.db.services.pokemon_public_snapshot_service import get_pokemon_explore_rankings_snapshot_payload
+from backend.db.services.pokemon_sets_catalog_service import get_pokemon_sets_catalog_payload
+
+
+logger = logging.getLogger(__name__)
+
+WARM_START_ENV = "API_WARM_START"
+WARM_START_SET_CONCURRENCY_ENV = "API_WARM_START_SET_CONCURRENCY"
+DEFAULT_WARM_START_SET_CONCURRENCY = 4
+
+
+@dataclass
+class WarmStartState:
+    status: str = "cold"  # cold | warming | warm | disabled
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    elapsed_ms: Optional[float] = None
+    steps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        return self.status in {"warm", "disabled"}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "ready": self.ready,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "elapsedMs": self.elapsed_ms,
+            "steps": {name: dict(step) for name, step in self.steps.items()},
+        }
+
+
+_STATE = WarmStartState()
+
+
+def get_warm_start_state() -> WarmStartState:
+    return _STATE
+
+
+def _is_truthy(value: Optional[str]) -> bool:
+    return (value or "").strip().lower() in {"1", "true", "yes"}
+
+
+def _set_concurrency_from_env() -> int:
+    try:
+        return max(1, int(os.getenv(WARM_START_SET_CONCURRENCY_ENV) or DEFAULT_WARM_START_SET_CONCURRENCY))
+    except ValueError:
+        return DEFAULT_WARM_START_SET_CONCURRENCY
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+async def _run_step(state: WarmStartState, name: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+    started = time.perf_counter()
+    try:
+        result = await operation()
+    except Exception as exc:
+        state.steps[name] = {"status": "failed", "ms": _elapsed_ms(started), "error": type(exc).__name__}
+        logger.warning("[warm-start] step failed step=%s error=%s", name, exc, exc_info=True)
+        return None
+    state.steps[name] = {"status": "ok", "ms": _elapsed_ms(started)}
+    return result
+
+
+def _public_set_ids(catalog: Optional[Dict[str, Any]]) -> List[str]:
+    return [str(row["id"]) for row in (catalog or {}).get("sets") or [] if isinstance(row, dict) and row.get("id")]
+
+
+async def _prefetch_set_shells(set_ids: List[str], concurrency: int) -> Dict[str, int]:
+    """Read every public set's shell snapshot by its resolved UUID.
+
+    The shell is the first read of every set page. UUIDs skip identifier
+    resolution, so this is one cheap indexed read per set that opens the async
+    client's connection pool to the size a set page fan-out needs.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = 0
+
+    async def prefetch(set_id: str) -> None:
+        nonlocal failed
+        async with semaphore:
+            try:
+                await get_pokemon_set_shell_snapshot_payload_async(set_id)
+            except Exception:
+                failed += 1
+                logger.warning("[warm-start] set shell prefetch failed set_id=%s", set_id, exc_info=True)
+
+    await asyncio.gather(*(prefetch(set_id) for set_id in set_ids))
+    if set_ids and failed == len(set_ids):
+        raise RuntimeError(f"every set shell prefetch failed count={failed}")
+    return {"sets": len(set_ids), "failed": failed}
+
+
+async def run_warm_start(
+    state: Optional[WarmStartState] = None,
+    *,
+    set_concurrency: int = DEFAULT_WARM_START_SET_CONCURRENCY,
+) -> WarmStartState:
+    state = state or _STATE
+    started = time.perf_counter()
+    state.status = "warming"
+    state.started_at = datetime.now(timezone.utc).isoformat()
+    state.steps = {}
+    logger.info("[warm-start] started set_concurrency=%s", set_concurrency)
+
+    catalog = await _run_step(
+        state, "pokemon_sets_catalog", lambda: run_in_threadpool(get_pokemon_sets_catalog_payload)
+    )
+    set_ids = _public_set_ids(catalog)
+    if "pokemon_sets_catalog" in state.steps:
+        state.steps["pokemon_sets_catalog"]["sets"] = len(set_ids)
+
+    # The rankings read also primes its last-known-good payload, which is what
+    # a transient outage right after the deploy falls back to.
+    set_shells: Dict[str, Any] = {}
+
+    async def prefetch_shells() -> None:
+        set_shells.update(await _prefetch_set_shells(set_ids, set_concurrency))
+
+    await asyncio.gather(
+        _run_step(
+            state,
+            "explore_rankings",
+            lambda: run_in_threadpool(get_pokemon_explore_rankings_snapshot_payload),
+        ),
+        _run_step(state, "explore_card_movers", lambda: run_in_threadpool(read_explore_card_movers_snapshot)),
+        _run_step(state, "explore_set_value", lambda: run_in_threadpool(read_explore_set_value_snapshot)),
+        _run_step(state, "set_shells", prefetch_shells),
+    )
+    state.steps["set_shells"].update(set_shells)
+
+    state.status = "warm"
+    state.finished_at = datetime.now(timezone.utc).isoformat()
+    state.elapsed_ms = _elapsed_ms(started)
+    logger.info(
+        "[warm-start] complete elapsed_ms=%s failed_steps=%s",
+        state.elapsed_ms,
+        sorted(name for name, step in state.steps.items() if step["status"] != "ok"),
+    )
+    return state
+
+
+def start_warm_start_if_enabled() -> Optional["asyncio.Task[WarmStartState]"]:
+    """Schedule the warm start on the running loop when API_WARM_START is set.
+
+    Disabled is reported as ready: a process that was never asked to warm has
+    nothing to wait for.
+    """
+    if not _is_truthy(os.getenv(WARM_START_ENV)):
+        _STATE.status = "disabled"
+        return None
+    _STATE.status = "cold"
+    return asyncio.get_running_loop().create_task(run_warm_start(set_concurrency=_set_concurrency_from_env()))
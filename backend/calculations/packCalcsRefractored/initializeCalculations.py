@@ -14,6 +14,24 @@ from ..utils.special_type_normalization import (
 
 CARD_NAME_WITH_NUMBER_PATTERN = r'^(?P<name>.+?)\s*-\s*(?P<number>[A-Za-z0-9.-]+/[A-Za-z0-9.-]+)\s*$'
 
+
+def map_distinct(function, *columns):
+    """Row-wise ``function(*row_values)`` evaluated once per distinct row.
+
+    Rarity, special-type and pull-rate columns hold a handful of distinct
+    values across hundreds of cards, so each distinct combination is computed
+    once and broadcast back to its rows. Returns the Series a row-wise
+    ``apply`` would: same index, same values, same inferred dtype.
+    """
+    results = {}
+    values = []
+    for key in zip(*(column.tolist() for column in columns)):
+        if key not in results:
+            results[key] = function(*key)
+        values.append(results[key])
+    return pd.Series(values, index=columns[0].index)
+
+
 class PackEVInitializer:
     """Handles initialization and data loading for pack EV calculations"""
     
@@ -93,22 +111,19 @@ class PackEVInitializer:
     def _derive_rarity_columns(self, df):
         df['rarity_raw'] = df['Rarity'].astype(str).str.lower().str.strip()
         df['rarity_group'] = df['rarity_raw'].map(self.config.RARITY_MAPPING)
-        df['rarity_key'] = df['Rarity'].apply(normalize_rarity_key)
+        df['rarity_key'] = map_distinct(normalize_rarity_key, df['Rarity'])
         self._warn_on_unmapped_rarities(df)
 
     def _derive_special_type_columns(self, df):
         df['special_type_raw'] = df['Special Type'].astype(str).str.lower().str.strip()
-        df['special_type_key'] = df['Special Type'].apply(normalize_special_type_key)
+        df['special_type_key'] = map_distinct(normalize_special_type_key, df['Special Type'])
         self._warn_on_non_pattern_special_types(df)
 
     def _derive_aggregation_columns(self, df):
-        df['pattern_key'] = df['special_type_key'].apply(derive_pattern_key)
+        df['pattern_key'] = map_distinct(derive_pattern_key, df['special_type_key'])
         # Preserve base rarity semantics explicitly for downstream slot logic.
         df['base_rarity_key'] = df['rarity_key']
-        df['aggregation_key'] = df.apply(
-            lambda row: derive_aggregation_key(row['rarity_key'], row['special_type_key']),
-            axis=1,
-        )
+        df['aggregation_key'] = map_distinct(derive_aggregation_key, df['rarity_key'], df['special_type_key'])
         # classification_key remains base-rarity oriented; aggregation_key carries overlay/reporting buckets.
         df['classification_key'] = df['base_rarity_key']
 
@@ -127,7 +142,7 @@ class PackEVInitializer:
 
     def _warn_on_non_pattern_special_types(self, df):
         has_special_type = df['special_type_raw'].ne('')
-        non_pattern_mask = has_special_type & ~df['special_type_key'].apply(is_recognized_pattern_special_type)
+        non_pattern_mask = has_special_type & ~map_distinct(is_recognized_pattern_special_type, df['special_type_key'])
 
         if not non_pattern_mask.any():
             return
@@ -211,13 +226,12 @@ class PackEVInitializer:
             )
 
     def _calculate_ev_columns(self, df):
-        df['Effective_Pull_Rate'] = df.apply(
-            lambda row: self.calculate_effective_pull_rate(
-                row['rarity_group'], 
-                row['Pull Rate (1/X)'],
-                row.get('pattern_key', '')
-            ),
-            axis=1
+        pattern_keys = df['pattern_key'] if 'pattern_key' in df.columns else pd.Series('', index=df.index)
+        df['Effective_Pull_Rate'] = map_distinct(
+            self.calculate_effective_pull_rate,
+            df['rarity_group'],
+            df['Pull Rate (1/X)'],
+            pattern_keys,
         )
 
         self._apply_pattern_overlay_pull_rate_overrides(df)
@@ -151,17 +151,15 @@ class PackCalculations(PackEVCalculator):
                 return 0.0
             
             total_variance = 0.0
-            
-            for _, card in cards_df.iterrows():
-                price = card['Price ($)']
-                
-                # Probability of selecting this specific card in one draw
-                p = 1 / total_cards_in_rarity
-                
-                # For num_slots independent draws with replacement:
-                # Variance in count = num_slots * p * (1-p)
-                variance_count = num_slots * p * (1 - p)
-                
+
+            # Probability of selecting this specific card in one draw
+            p = 1 / total_cards_in_rarity
+
+            # For num_slots independent draws with replacement:
+            # Variance in count = num_slots * p * (1-p)
+            variance_count = num_slots * p * (1 - p)
+
+            for price in cards_df['Price ($)'].tolist():
                 # Variance in dollar value = price² * variance_in_count
                 card_variance = (price ** 2) * variance_count
                 total_variance += card_variance
@@ -189,10 +187,9 @@ class PackCalculations(PackEVCalculator):
             rare_slot_prob = rare_slot_config.get('rare', 0)
             if rare_slot_prob > 0 and not rare_cards.empty:
                 num_rares = len(rare_cards)
-                for _, card in rare_cards.iterrows():
-                    # Each rare has equal probability within the rare category
-                    card_prob = rare_slot_prob / num_rares
-                    outcomes.append((card_prob, card['Price ($)']))
+                # Each rare has equal probability within the rare category
+                card_prob = rare_slot_prob / num_rares
+                outcomes.extend((card_prob, price) for price in rare_cards['Price ($)'].tolist())
             
             # Add hit cards that can appear in rare slot
             for rarity, slot_prob in rare_slot_config.items():
@@ -203,9 +200,8 @@ class PackCalculations(PackEVCalculator):
 
                 if not hit_subset.empty:
                     num_hits = len(hit_subset)
-                    for _, card in hit_subset.iterrows():
-                        card_prob = slot_prob / num_hits
-                        outcomes.append((card_prob, card['Price ($)']))
+                    card_prob = slot_prob / num_hits
+                    outcomes.extend((card_prob, price) for price in hit_subset['Price ($)'].tolist())
             
             if not outcomes:
                 return 0.0
@@ -246,9 +242,11 @@ class PackCalculations(PackEVCalculator):
                             )
                         if not reverse_cards.empty:
                             num_reverse = len(reverse_cards)
-                            for _, card in reverse_cards.iterrows():
-                                card_prob = probability / num_reverse
-                                slot_outcomes_list.append((card_prob, card['Reverse Variant Price ($)']))
+                            card_prob = probability / num_reverse
+                            slot_outcomes_list.extend(
+                                (card_prob, price)
+                                for price in reverse_cards['Reverse Variant Price ($)'].tolist()
+                            )
                     
                     # Keep reverse-slot specials explicitly enumerated to preserve pack math.
                     elif is_supported_reverse_special_outcome(outcome_type):
@@ -256,9 +254,10 @@ class PackCalculations(PackEVCalculator):
                         
                         if not special_cards.empty:
                             num_special = len(special_cards)
-                            for _, card in special_cards.iterrows():
-                                card_prob = probability / num_special
-                                slot_outcomes_list.append((card_prob, card['Price ($)']))
+                            card_prob = probability / num_special
+                            slot_outcomes_list.extend(
+                                (card_prob, price) for price in special_cards['Price ($)'].tolist()
+                            )
                 
                 # Calculate variance for this slot
                 if slot_outcomes_list:
@@ -2,12 +2,17 @@ import logging
 import math
 import os
 import random
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 import requests
 
+from .pokemon_tcg_response_cache import PokemonTCGResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +35,15 @@ DEFAULT_MAX_ATTEMPTS = 4
 DEFAULT_BACKOFF_BASE_SECONDS = 1.0
 DEFAULT_MAX_RETRY_AFTER_SECONDS = 30.0
 
+# Pages of one set requested at once once page one has reported ``totalCount``.
+# 1 keeps the strictly sequential walk.
+DEFAULT_PAGE_CONCURRENCY = 1
+
+# API set ids combined into one ``q=`` query by ``prefetch_sets``. Each page of
+# a combined query is as full as a single-set page, so small sets stop costing
+# a request each.
+DEFAULT_SETS_PER_QUERY = 8
+
 # Statuses worth asking again for. The provider behind api.pokemontcg.io returns
 # 500 intermittently on identical requests, so these are the difference between a
 # working sync and a dead one.
@@ -120,6 +134,9 @@ class PokemonTCGAPIClient:
         max_attempts: Optional[int] = None,
         backoff_base_seconds: Optional[float] = None,
         max_retry_after_seconds: Optional[float] = None,
+        page_concurrency: Optional[int] = None,
+        sets_per_query: Optional[int] = None,
+        response_cache: Optional[PokemonTCGResponseCache] = None,
         sleep: Callable[[float], None] = time.sleep,
         jitter: Callable[[float, float], float] = random.uniform,
     ):
@@ -156,12 +173,34 @@ class PokemonTCGAPIClient:
             else _env_float("POKEMON_TCG_MAX_RETRY_AFTER_SECONDS", DEFAULT_MAX_RETRY_AFTER_SECONDS)
         )
 
+        self.page_concurrency = max(
+            1,
+            page_concurrency
+            if page_concurrency is not None
+            else _env_int("POKEMON_TCG_PAGE_CONCURRENCY", DEFAULT_PAGE_CONCURRENCY),
+        )
+        self.sets_per_query = max(
+            1,
+            sets_per_query
+            if sets_per_query is not None
+            else _env_int("POKEMON_TCG_SETS_PER_QUERY", DEFAULT_SETS_PER_QUERY),
+        )
+        self.response_cache = (
+            response_cache if response_cache is not None else PokemonTCGResponseCache.from_env()
+        )
+
         self._session = session if session is not None else requests
         self._sleep = sleep
         self._jitter = jitter
 
         # Rolling counter so completion diagnostics can report retry pressure.
+        # Concurrent page fetches bump it from worker threads.
         self.request_retries = 0
+        self._retries_lock = threading.Lock()
+
+        # Normalized cards per (set id, select fields) fetched by prefetch_sets,
+        # served by iter_cards_for_set for the rest of this client's life.
+        self._prefetched_cards: Dict[Tuple[str, str], List[Dict[str, Optional[str]]]] = {}
 
     # ------------------------------------------------------------------
     # Set resolution
@@ -224,6 +263,213 @@ class PokemonTCGAPIClient:
     ) -> Generator[Dict[str, Optional[str]], None, None]:
         """Yield every unique card in a set, or raise.
 
+        Cards already fetched by ``prefetch_sets`` are served from memory. With
+        a response cache configured the set goes through ``prefetch_sets``
+        first, so an unchanged ``updatedAt`` skips the card pages entirely.
+        """
+        key = (set_id, select_fields)
+        if key not in self._prefetched_cards and self.response_cache is not None:
+            self.prefetch_sets(
+                [set_id],
+                page_size=page_size,
+                select_fields=select_fields,
+                rate_limit_delay=rate_limit_delay,
+            )
+        if key in self._prefetched_cards:
+            for card in self._prefetched_cards[key]:
+                yield dict(card)
+            return
+
+        yield from self._iter_cards(
+            f"set.id:{set_id}",
+            set_id,
+            page_size=page_size,
+            select_fields=select_fields,
+            rate_limit_delay=rate_limit_delay,
+        )
+
+    def iter_cards_for_sets(
+        self,
+        set_ids: Iterable[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        select_fields: str = DEFAULT_SELECT_FIELDS,
+        rate_limit_delay: float = 0.1,
+    ) -> Generator[Dict[str, Optional[str]], None, None]:
+        """Yield every unique card of several sets, set by set in the given order."""
+        unique_ids = [set_id for set_id in dict.fromkeys(set_ids) if set_id]
+        self.prefetch_sets(
+            unique_ids,
+            page_size=page_size,
+            select_fields=select_fields,
+            rate_limit_delay=rate_limit_delay,
+        )
+        for set_id in unique_ids:
+            yield from self.iter_cards_for_set(
+                set_id,
+                page_size=page_size,
+                select_fields=select_fields,
+                rate_limit_delay=rate_limit_delay,
+            )
+
+    def prefetch_sets(
+        self,
+        set_ids: Iterable[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        select_fields: str = DEFAULT_SELECT_FIELDS,
+        rate_limit_delay: float = 0.1,
+    ) -> None:
+        """Fetch several sets' cards ahead of ``iter_cards_for_set``.
+
+        Sets whose cached listing matches their current ``updatedAt`` come
+        from the response cache. The rest are fetched ``sets_per_query`` at a
+        time through one ``q=(set.id:a OR set.id:b ...)`` query, judged
+        complete against that query's own ``totalCount`` like a single set,
+        then split by each card's set. Raises like ``iter_cards_for_set`` if a
+        combined query cannot be fetched completely; sets fetched before the
+        failure stay prefetched.
+        """
+        wanted = [
+            set_id
+            for set_id in dict.fromkeys(set_ids)
+            if set_id and (set_id, select_fields) not in self._prefetched_cards
+        ]
+        if not wanted:
+            return
+
+        updated_at: Dict[str, str] = {}
+        if self.response_cache is not None:
+            try:
+                updated_at = self.set_updated_at(wanted)
+            except PokemonTCGAPIError as exc:
+                logger.warning("[TCG API] set updatedAt lookup failed; skipping the response cache: %s", exc)
+            for set_id in wanted:
+                cached = self.response_cache.load(set_id, updated_at.get(set_id), select_fields)
+                if cached is not None:
+                    self._prefetched_cards[(set_id, select_fields)] = cached
+
+        missing = [set_id for set_id in wanted if (set_id, select_fields) not in self._prefetched_cards]
+        if len(missing) < len(wanted):
+            logger.info(
+                "[TCG API] response cache served %d of %d set(s)",
+                len(wanted) - len(missing), len(wanted),
+            )
+
+        # Splitting a combined listing needs each card's set.
+        per_query = self.sets_per_query if "set" in select_fields.split(",") else 1
+        for start in range(0, len(missing), per_query):
+            chunk = missing[start:start + per_query]
+            if len(chunk) == 1:
+                query = f"set.id:{chunk[0]}"
+            else:
+                query = "(" + " OR ".join(f"set.id:{set_id}" for set_id in chunk) + ")"
+
+            cards_by_set: Dict[str, List[Dict[str, Optional[str]]]] = {set_id: [] for set_id in chunk}
+            for card in self._iter_cards(
+                query,
+                ",".join(chunk),
+                page_size=page_size,
+                select_fields=select_fields,
+                rate_limit_delay=rate_limit_delay,
+            ):
+                owner = chunk[0] if len(chunk) == 1 else card.get("set_id")
+                cards_by_set.setdefault(owner, []).append(card)
+
+            for set_id in chunk:
+                cards = cards_by_set[set_id]
+                self._prefetched_cards[(set_id, select_fields)] = cards
+                if self.response_cache is not None:
+                    self.response_cache.save(set_id, updated_at.get(set_id), select_fields, cards)
+
+    def set_updated_at(self, set_ids: Sequence[str]) -> Dict[str, str]:
+        """The API's ``updatedAt`` per set id, one ``/sets`` request per chunk."""
+        updated_at: Dict[str, str] = {}
+        for start in range(0, len(set_ids), DEFAULT_PAGE_SIZE):
+            chunk = list(set_ids[start:start + DEFAULT_PAGE_SIZE])
+            response = self._request_json(
+                "/sets",
+                {
+                    "q": " OR ".join(f"id:{set_id}" for set_id in chunk),
+                    "select": "id,updatedAt",
+                    "pageSize": len(chunk),
+                },
+            )
+            for item in response.get("data") or []:
+                if item.get("id") and item.get("updatedAt"):
+                    updated_at[item["id"]] = item["updatedAt"]
+        return updated_at
+
+    def _page_responses(
+        self,
+        query: str,
+        strategy: PaginationStrategy,
+        select_fields: str,
+        rate_limit_delay: float,
+    ) -> Iterator[Dict[str, object]]:
+        """Each page's response in page order, fetched as the caller advances.
+
+        Page one goes alone because it reports ``totalCount``. With
+        ``page_concurrency`` above one, the rest of the pages that total
+        implies are then requested up to ``page_concurrency`` at a time, with
+        ``rate_limit_delay`` spacing the request starts; responses are still
+        handed back in order and a failed page raises when its turn comes.
+        Pages past that total (the caller only asks when pages came back short
+        or overlapping) are walked one by one again.
+        """
+
+        def fetch(page: int) -> Dict[str, object]:
+            params: Dict[str, object] = {
+                "q": query,
+                "page": page,
+                "pageSize": strategy.page_size,
+                "select": select_fields,
+            }
+            if strategy.order_by:
+                params["orderBy"] = strategy.order_by
+            return self._request_json("/cards", params, page=page, page_size=strategy.page_size)
+
+        first = fetch(1)
+        yield first
+
+        page = 1
+        total_count = first.get("totalCount") or 0
+        last_page = math.ceil(total_count / strategy.page_size) if total_count else 1
+        if self.page_concurrency > 1 and last_page > 2:
+            with ThreadPoolExecutor(
+                max_workers=min(self.page_concurrency, last_page - 1),
+                thread_name_prefix="pokemon-tcg-page",
+            ) as executor:
+                pending = deque()
+                next_page = 2
+                try:
+                    while next_page <= last_page or pending:
+                        while next_page <= last_page and len(pending) < self.page_concurrency:
+                            if rate_limit_delay > 0:
+                                self._sleep(rate_limit_delay)
+                            pending.append(executor.submit(fetch, next_page))
+                            next_page += 1
+                        yield pending.popleft().result()
+                finally:
+                    for future in pending:
+                        future.cancel()
+            page = last_page
+
+        while True:
+            page += 1
+            if rate_limit_delay > 0:
+                self._sleep(rate_limit_delay)
+            yield fetch(page)
+
+    def _iter_cards(
+        self,
+        query: str,
+        label: str,
+        *,
+        page_size: int,
+        select_fields: str,
+        rate_limit_delay: float,
+    ) -> Generator[Dict[str, Optional[str]], None, None]:
+        """Yield every unique card matching ``query``, or raise.
+
         Completeness is judged against the API's own ``totalCount``. A strategy
         that stalls below that total is treated as failed, and the next bounded
         strategy restarts from page one; ``seen_ids`` is carried across restarts
@@ -244,117 +490,108 @@ class PokemonTCGAPIClient:
             page = 1
             strategy_complete = False
             strategy_failed_reason: Optional[str] = None
+            pages = self._page_responses(query, strategy, select_fields, rate_limit_delay)
 
-            while True:
-                params: Dict[str, object] = {
-                    "q": f"set.id:{set_id}",
-                    "page": page,
-                    "pageSize": strategy.page_size,
-                    "select": select_fields,
-                }
-                if strategy.order_by:
-                    params["orderBy"] = strategy.order_by
-
-                try:
-                    response = self._request_json(
-                        "/cards", params, page=page, page_size=strategy.page_size
-                    )
-                except PokemonTCGAPIError as exc:
-                    strategy_failed_reason = (
-                        f"page {page} failed after {exc.attempts} attempt(s): {exc}"
-                    )
-                    break
-
-                pages_requested += 1
-
-                raw_cards = response.get("data") or []
-                page_total_count = response.get("totalCount") or 0
-
-                if known_total_count is None and page_total_count:
-                    known_total_count = page_total_count
+            try:
+                while True:
+                    try:
+                        response = next(pages)
+                    except PokemonTCGAPIError as exc:
+                        strategy_failed_reason = (
+                            f"page {page} failed after {exc.attempts} attempt(s): {exc}"
+                        )
+                        break
 
-                # Safety limit is recomputed per strategy because it depends on
-                # the active page size.
-                max_pages = (
-                    math.ceil(known_total_count / strategy.page_size) + 5
-                    if known_total_count
-                    else None
-                )
+                    pages_requested += 1
 
-                new_cards = []
-                duplicates_this_page = 0
-                for card in raw_cards:
-                    card_id = card.get("id")
-                    if card_id and card_id in seen_ids:
-                        duplicates_this_page += 1
-                        continue
-                    if card_id:
-                        seen_ids.add(card_id)
-                    new_cards.append(card)
+                    raw_cards = response.get("data") or []
+                    page_total_count = response.get("totalCount") or 0
 
-                duplicates_suppressed += duplicates_this_page
+                    if known_total_count is None and page_total_count:
+                        known_total_count = page_total_count
 
-                first_id = raw_cards[0].get("id") if raw_cards else None
-                last_id = raw_cards[-1].get("id") if raw_cards else None
+                    # Safety limit is recomputed per strategy because it depends on
+                    # the active page size.
+                    max_pages = (
+                        math.ceil(known_total_count / strategy.page_size) + 5
+                        if known_total_count
+                        else None
+                    )
 
-                logger.info(
-                    "[TCG API] set=%r page=%d pageSize=%d strategy=%r returned=%d new_unique=%d "
-                    "unique_total=%d totalCount=%s duplicates=%d first=%r last=%r",
-                    set_id, page, strategy.page_size, strategy.label, len(raw_cards),
-                    len(new_cards), len(seen_ids), page_total_count, duplicates_this_page,
-                    first_id, last_id,
-                )
-                print(
-                    f"[TCG API] set={set_id!r} page={page} pageSize={strategy.page_size} "
-                    f"strategy={strategy.label!r} returned={len(raw_cards)} "
-                    f"new_unique={len(new_cards)} unique_total={len(seen_ids)} "
-                    f"totalCount={page_total_count} duplicates={duplicates_this_page} "
-                    f"first={first_id!r} last={last_id!r}"
-                )
+                    new_cards = []
+                    duplicates_this_page = 0
+                    for card in raw_cards:
+                        card_id = card.get("id")
+                        if card_id and card_id in seen_ids:
+                            duplicates_this_page += 1
+                            continue
+                        if card_id:
+                            seen_ids.add(card_id)
+                        new_cards.append(card)
+
+                    duplicates_suppressed += duplicates_this_page
+
+                    first_id = raw_cards[0].get("id") if raw_cards else None
+                    last_id = raw_cards[-1].get("id") if raw_cards else None
+
+                    logger.info(
+                        "[TCG API] set=%r page=%d pageSize=%d strategy=%r returned=%d new_unique=%d "
+                        "unique_total=%d totalCount=%s duplicates=%d first=%r last=%r",
+                        label, page, strategy.page_size, strategy.label, len(raw_cards),
+                        len(new_cards), len(seen_ids), page_total_count, duplicates_this_page,
+                        first_id, last_id,
+                    )
+                    print(
+                        f"[TCG API] set={label!r} page={page} pageSize={strategy.page_size} "
+                        f"strategy={strategy.label!r} returned={len(raw_cards)} "
+                        f"new_unique={len(new_cards)} unique_total={len(seen_ids)} "
+                        f"totalCount={page_total_count} duplicates={duplicates_this_page} "
+                        f"first={first_id!r} last={last_id!r}"
+                    )
 
-                for card in new_cards:
-                    yield self._normalize_card(card)
+                    for card in new_cards:
+                        yield self._normalize_card(card)
 
-                # Complete: we hold every unique card the API says exists.
-                if known_total_count and len(seen_ids) >= known_total_count:
-                    strategy_complete = True
-                    break
+                    # Complete: we hold every unique card the API says exists.
+                    if known_total_count and len(seen_ids) >= known_total_count:
+                        strategy_complete = True
+                        break
 
-                # The set is genuinely empty.
-                if not known_total_count and not raw_cards:
-                    strategy_complete = True
-                    break
+                    # The set is genuinely empty.
+                    if not known_total_count and not raw_cards:
+                        strategy_complete = True
+                        break
 
-                # Ran out of rows below the reported total: this strategy stalled.
-                if not raw_cards or len(raw_cards) < strategy.page_size:
-                    strategy_failed_reason = (
-                        f"pagination stalled on page {page} with "
-                        f"{len(seen_ids)}/{known_total_count} unique cards"
-                    )
-                    break
+                    # Ran out of rows below the reported total: this strategy stalled.
+                    if not raw_cards or len(raw_cards) < strategy.page_size:
+                        strategy_failed_reason = (
+                            f"pagination stalled on page {page} with "
+                            f"{len(seen_ids)}/{known_total_count} unique cards"
+                        )
+                        break
 
-                if max_pages is not None and page >= max_pages:
-                    strategy_failed_reason = (
-                        f"page safety guard hit at page {page} (max {max_pages}) with "
-                        f"{len(seen_ids)}/{known_total_count} unique cards"
-                    )
-                    break
+                    if max_pages is not None and page >= max_pages:
+                        strategy_failed_reason = (
+                            f"page safety guard hit at page {page} (max {max_pages}) with "
+                            f"{len(seen_ids)}/{known_total_count} unique cards"
+                        )
+                        break
 
-                page += 1
-                if rate_limit_delay > 0:
-                    self._sleep(rate_limit_delay)
+                    page += 1
+            finally:
+                pages.close()
 
             if strategy_complete:
                 logger.info(
                     "[TCG API] completed set=%r unique_cards=%d reported_total=%s "
                     "pages_requested=%d request_retries=%d pagination_strategy=%r "
                     "duplicates_suppressed=%d",
-                    set_id, len(seen_ids), known_total_count, pages_requested,
+                    label, len(seen_ids), known_total_count, pages_requested,
                     self.request_retries - retries_at_start, strategy.label,
                     duplicates_suppressed,
                 )
                 print(
-                    f"[TCG API] completed set={set_id!r} unique_cards={len(seen_ids)} "
+                    f"[TCG API] completed set={label!r} unique_cards={len(seen_ids)} "
                     f"reported_total={known_total_count} pages_requested={pages_requested} "
                     f"request_retries={self.request_retries - retries_at_start} "
                     f"pagination_strategy={strategy.label!r} "
@@ -366,16 +603,16 @@ class PokemonTCGAPIClient:
             logger.warning(
                 "[TCG API] strategy failed set=%r strategy=%r unique_so_far=%d "
                 "reported_total=%s reason=%s",
-                set_id, strategy.label, len(seen_ids), known_total_count, strategy_failed_reason,
+                label, strategy.label, len(seen_ids), known_total_count, strategy_failed_reason,
             )
 
         raise PokemonTCGAPIError(
-            f"Could not fetch all cards for set {set_id!r}: "
+            f"Could not fetch all cards for set {label!r}: "
             f"{len(seen_ids)}/{known_total_count} unique cards after trying "
             f"{len(attempted_labels)} pagination strategies "
             f"[{'; '.join(attempted_labels)}]. Final cause: {last_failure}",
             path="/cards",
-            params={"q": f"set.id:{set_id}"},
+            params={"q": query},
             attempts=len(attempted_labels),
             retryable=True,
         )
@@ -519,7 +756,8 @@ class PokemonTCGAPIClient:
             else:
                 delay = self._retry_delay(attempt)
 
-            self.request_retries += 1
+            with self._retries_lock:
+                self.request_retries += 1
             logger.warning(
                 "[TCG API] retrying path=%s page=%s pageSize=%s error=%s "
                 "attempt=%d/%d next_delay=%.2fs",
@@ -0,0 +1,83 @@
+"""On-disk Pokemon TCG API card listings keyed by set and ``updatedAt``.
+
+A full catalog image sync pages through every set's cards although almost all
+of them have not changed since the previous run. The API stamps each set with
+an ``updatedAt``; with a cache directory configured
+(POKEMON_TCG_RESPONSE_CACHE_DIR) the client keeps each set's normalized cards
+next to the ``updatedAt`` and select fields they were fetched under, and serves
+them again while the set's ``updatedAt`` is unchanged.
+
+One ``<sha1(set id)>.json`` per set, rewritten through a staging file.
+Anything missing, unreadable or recorded for another ``updatedAt`` or field
+selection is ignored, which degrades to a normal fetch.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_VERSION = 1
+RESPONSE_CACHE_DIR_ENV = "POKEMON_TCG_RESPONSE_CACHE_DIR"
+
+
+class PokemonTCGResponseCache:
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    @classmethod
+    def from_env(cls) -> Optional["PokemonTCGResponseCache"]:
+        root = os.getenv(RESPONSE_CACHE_DIR_ENV)
+        return cls(Path(root)) if root else None
+
+    def _path(self, set_id: str) -> Path:
+        return self.root / f"{hashlib.sha1(set_id.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, set_id: str, updated_at: Optional[str], select_fields: str) -> Optional[List[Dict[str, Any]]]:
+        if not updated_at:
+            return None
+        path = self._path(set_id)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("[TCG API cache] unreadable entry %s; ignoring it", path)
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != RESPONSE_CACHE_VERSION
+            or entry.get("setId") != set_id
+            or entry.get("updatedAt") != updated_at
+            or entry.get("selectFields") != select_fields
+            or not isinstance(entry.get("cards"), list)
+        ):
+            return None
+        return entry["cards"]
+
+    def save(self, set_id: str, updated_at: Optional[str], select_fields: str, cards: List[Dict[str, Any]]) -> None:
+        if not updated_at:
+            return
+        path = self._path(set_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_suffix(".json.tmp")
+        staging.write_text(
+            json.dumps(
+                {
+                    "version": RESPONSE_CACHE_VERSION,
+                    "setId": set_id,
+                    "updatedAt": updated_at,
+                    "selectFields": select_fields,
+                    "cards": cards,
+                },
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+            newline="\n",
+        )
+        staging.replace(path)
@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 
 from dotenv import load_dotenv
-from supabase import ClientOptions, create_client
+from supabase import AsyncClient, AsyncClientOptions, ClientOptions, create_client
 
 
 def _has_malformed_quoted_value(line: str) -> bool:
@@ -166,6 +166,37 @@ def create_public_read_client():
     )
 
 
+def create_async_public_read_client():
+    """Non-blocking twin of `create_public_read_client` for `async def` routes.
+
+    Built with the plain constructor rather than `acreate_client`: that
+    coroutine only adds a GoTrue session lookup, and the public read path
+    authenticates with the key alone. Nothing here touches the network; the
+    httpx.AsyncClient underneath connects on the first awaited request.
+    """
+    return AsyncClient(
+        SUPABASE_URL,
+        SUPABASE_KEY,
+        options=AsyncClientOptions(postgrest_client_timeout=_PUBLIC_READ_TIMEOUT_SECONDS),
+    )
+
+
+_async_public_read_client = None
+
+
+def get_async_public_read_client():
+    """The process-wide async public read client, created on first use.
+
+    Lazy on purpose: an httpx.AsyncClient belongs to the event loop that first
+    drives it, so it must not be built at import time, before uvicorn's loop
+    exists.
+    """
+    global _async_public_read_client
+    if _async_public_read_client is None:
+        _async_public_read_client = create_async_public_read_client()
+    return _async_public_read_client
+
+
 def reset_service_role_auth():
     auth_header = f"Bearer {SUPABASE_KEY}"
     # If auth is already the service-role key, skip tearing down the PostgREST
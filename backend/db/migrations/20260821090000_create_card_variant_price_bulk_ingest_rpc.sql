@@ -0,0 +1,235 @@
+-- Set-level bulk ingestion of card variants, external identities and daily
+-- price observations.
+--
+-- The row-at-a-time path resolves variants, links identities and classifies
+-- same-day price rows with one PostgREST round trip each (or per chunk). This
+-- RPC takes one chunk of a set as two columnar payloads (one array per column,
+-- positions aligned) and does the same work set-wise in one transaction:
+--
+--   p_variants: card_id, printing_type, special_type, edition,
+--               identity_provider, identity_product_id, identity_variant_key,
+--               identity_catalog_key, identity_source_reference,
+--               identity_source_payload
+--   p_prices:   variant_position, condition_id, source, captured_at,
+--               market_price, high_price, low_price, currency
+--
+-- Semantics match the Python path: an external identity that maps to a
+-- missing or different variant is a conflict and its position (and prices)
+-- are skipped; same-day duplicates within the payload keep the first row;
+-- an existing same-day observation is updated only when a price changed.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION public.ingest_card_variant_prices_bulk(
+    p_variants JSONB,
+    p_prices JSONB
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_variant_count INTEGER := COALESCE(jsonb_array_length(p_variants->'card_id'), 0);
+    v_price_count INTEGER := COALESCE(jsonb_array_length(p_prices->'variant_position'), 0);
+    v_variants_inserted INTEGER := 0;
+    v_identities_linked INTEGER := 0;
+    v_attempted INTEGER := 0;
+    v_unique INTEGER := 0;
+    v_inserted_ids JSONB := '[]'::jsonb;
+    v_updated INTEGER := 0;
+    v_changed JSONB := '[]'::jsonb;
+BEGIN
+    CREATE TEMP TABLE _bulk_variants ON COMMIT DROP AS
+    SELECT
+        i AS position,
+        v.card_id, v.printing_type, v.special_type, v.edition,
+        lower(btrim(x.provider)) AS provider,
+        btrim(x.external_product_id) AS external_product_id,
+        btrim(x.external_variant_key) AS external_variant_key,
+        x.external_catalog_key, x.source_reference, x.source_payload,
+        NULL::uuid AS mapped_variant_id,
+        NULL::uuid AS card_variant_id,
+        NULL::text AS conflict
+    FROM generate_series(0, v_variant_count - 1) AS i
+    CROSS JOIN LATERAL jsonb_populate_record(NULL::public.card_variants, jsonb_build_object(
+        'card_id', p_variants->'card_id'->i,
+        'printing_type', p_variants->'printing_type'->i,
+        'special_type', p_variants->'special_type'->i,
+        'edition', p_variants->'edition'->i
+    )) AS v
+    CROSS JOIN LATERAL jsonb_populate_record(NULL::public.card_variant_external_identities, jsonb_build_object(
+        'provider', p_variants->'identity_provider'->i,
+        'external_product_id', p_variants->'identity_product_id'->i,
+        'external_variant_key', p_variants->'identity_variant_key'->i,
+        'external_catalog_key', p_variants->'identity_catalog_key'->i,
+        'source_reference', p_variants->'identity_source_reference'->i,
+        'source_payload', COALESCE(p_variants->'identity_source_payload'->i, '{}'::jsonb)
+    )) AS x;
+
+    -- Existing identities decide the variant; they must agree with the payload.
+    UPDATE _bulk_variants b
+    SET mapped_variant_id = identity.card_variant_id
+    FROM public.card_variant_external_identities identity
+    WHERE identity.provider = b.provider
+      AND identity.external_product_id = b.external_product_id
+      AND identity.external_variant_key = b.external_variant_key;
+
+    UPDATE _bulk_variants b
+    SET conflict = CASE
+        WHEN variant.id IS NULL THEN
+            format('external identity maps to missing variant %s', b.mapped_variant_id)
+        ELSE format(
+            'external identity contradicts incoming variant: expected=(%s, %s, %s, %s), actual=(%s, %s, %s, %s)',
+            b.card_id, b.printing_type, b.special_type, b.edition,
+            variant.card_id, variant.printing_type, variant.special_type, variant.edition)
+        END
+    FROM _bulk_variants mapped
+    LEFT JOIN public.card_variants variant ON variant.id = mapped.mapped_variant_id
+    WHERE mapped.position = b.position
+      AND b.mapped_variant_id IS NOT NULL
+      AND (
+          variant.id IS NULL
+          OR variant.card_id IS DISTINCT FROM b.card_id
+          OR variant.printing_type IS DISTINCT FROM b.printing_type
+          OR variant.special_type IS DISTINCT FROM b.special_type
+          OR variant.edition IS DISTINCT FROM b.edition
+      );
+
+    WITH inserted AS (
+        INSERT INTO public.card_variants (card_id, printing_type, special_type, edition)
+        SELECT DISTINCT card_id, printing_type, special_type, edition
+        FROM _bulk_variants
+        WHERE mapped_variant_id IS NULL AND conflict IS NULL
+        ON CONFLICT DO NOTHING
+        RETURNING id
+    )
+    SELECT count(*) INTO v_variants_inserted FROM inserted;
+
+    UPDATE _bulk_variants b
+    SET card_variant_id = COALESCE(b.mapped_variant_id, variant.id)
+    FROM _bulk_variants unresolved
+    LEFT JOIN public.card_variants variant
+        ON variant.card_id = unresolved.card_id
+       AND variant.printing_type IS NOT DISTINCT FROM unresolved.printing_type
+       AND variant.special_type IS NOT DISTINCT FROM unresolved.special_type
+       AND variant.edition IS NOT DISTINCT FROM unresolved.edition
+    WHERE unresolved.position = b.position
+      AND b.conflict IS NULL;
+
+    WITH linked AS (
+        INSERT INTO public.card_variant_external_identities (
+            card_variant_id, provider, external_product_id, external_variant_key,
+            external_catalog_key, source_reference, source_payload
+        )
+        SELECT DISTINCT ON (provider, external_product_id, external_variant_key)
+            card_variant_id, provider, external_product_id, external_variant_key,
+            external_catalog_key, source_reference, source_payload
+        FROM _bulk_variants
+        WHERE provider IS NOT NULL
+          AND mapped_variant_id IS NULL
+          AND conflict IS NULL
+          AND card_variant_id IS NOT NULL
+        ORDER BY provider, external_product_id, external_variant_key, position
+        ON CONFLICT (provider, external_product_id, external_variant_key) DO NOTHING
+        RETURNING id
+    )
+    SELECT count(*) INTO v_identities_linked FROM linked;
+
+    -- An identity linked concurrently (or twice in this payload) to another
+    -- variant is the same conflict the row-at-a-time path raises.
+    UPDATE _bulk_variants b
+    SET conflict = format('%s product %s is already linked to variant %s, not %s',
+                          b.provider, b.external_product_id, identity.card_variant_id, b.card_variant_id)
+    FROM public.card_variant_external_identities identity
+    WHERE b.conflict IS NULL
+      AND b.provider IS NOT NULL
+      AND identity.provider = b.provider
+      AND identity.external_product_id = b.external_product_id
+      AND identity.external_variant_key = b.external_variant_key
+      AND identity.card_variant_id IS DISTINCT FROM b.card_variant_id;
+
+    CREATE TEMP TABLE _bulk_prices ON COMMIT DROP AS
+    SELECT
+        i AS position,
+        variant.card_variant_id,
+        p.condition_id,
+        COALESCE(NULLIF(p.source, ''), 'UNKNOWN') AS source,
+        p.captured_at,
+        p.captured_at::date AS captured_date,
+        p.market_price, p.high_price, p.low_price,
+        COALESCE(NULLIF(p.currency, ''), 'USD') AS currency
+    FROM generate_series(0, v_price_count - 1) AS i
+    CROSS JOIN LATERAL jsonb_populate_record(NULL::public.card_variant_price_observations, jsonb_build_object(
+        'condition_id', p_prices->'condition_id'->i,
+        'source', p_prices->'source'->i,
+        'captured_at', p_prices->'captured_at'->i,
+        'market_price', p_prices->'market_price'->i,
+        'high_price', p_prices->'high_price'->i,
+        'low_price', p_prices->'low_price'->i,
+        'currency', p_prices->'currency'->i
+    )) AS p
+    JOIN _bulk_variants variant
+        ON variant.position = (p_prices->'variant_position'->>i)::integer
+    WHERE variant.conflict IS NULL
+      AND variant.card_variant_id IS NOT NULL;
+
+    SELECT count(*) INTO v_attempted FROM _bulk_prices;
+
+    CREATE TEMP TABLE _bulk_unique_prices ON COMMIT DROP AS
+    SELECT DISTINCT ON (card_variant_id, condition_id, source, captured_date) *
+    FROM _bulk_prices
+    ORDER BY card_variant_id, condition_id, source, captured_date, position;
+
+    SELECT count(*) INTO v_unique FROM _bulk_unique_prices;
+
+    WITH upserted AS (
+        INSERT INTO public.card_variant_price_observations AS existing (
+            card_variant_id, condition_id, source, captured_at,
+            market_price, high_price, low_price, currency
+        )
+        SELECT card_variant_id, condition_id, source, captured_at,
+               market_price, high_price, low_price, currency
+        FROM _bulk_unique_prices
+        ORDER BY position
+        ON CONFLICT (card_variant_id, condition_id, source, captured_date) DO UPDATE
+        SET market_price = EXCLUDED.market_price,
+            high_price = EXCLUDED.high_price,
+            low_price = EXCLUDED.low_price
+        WHERE (existing.market_price, existing.high_price, existing.low_price)
+              IS DISTINCT FROM (EXCLUDED.market_price, EXCLUDED.high_price, EXCLUDED.low_price)
+        RETURNING existing.id, existing.card_variant_id, existing.captured_date, (xmax = 0) AS was_inserted
+    )
+    SELECT
+        COALESCE(jsonb_agg(id) FILTER (WHERE was_inserted), '[]'::jsonb),
+        count(*) FILTER (WHERE NOT was_inserted),
+        COALESCE(jsonb_agg(jsonb_build_object('card_variant_id', card_variant_id, 'captured_at', captured_date)), '[]'::jsonb)
+    INTO v_inserted_ids, v_updated, v_changed
+    FROM upserted;
+
+    RETURN jsonb_build_object(
+        'variant_ids', (
+            SELECT COALESCE(jsonb_agg(CASE WHEN conflict IS NULL THEN card_variant_id END ORDER BY position), '[]'::jsonb)
+            FROM _bulk_variants
+        ),
+        'conflicts', (
+            SELECT COALESCE(jsonb_agg(jsonb_build_object('position', position, 'message', conflict) ORDER BY position), '[]'::jsonb)
+            FROM _bulk_variants
+            WHERE conflict IS NOT NULL
+        ),
+        'variants_inserted', v_variants_inserted,
+        'identities_linked', v_identities_linked,
+        'attempted_rows', v_attempted,
+        'inserted_ids', v_inserted_ids,
+        'updated_count', v_updated,
+        'skipped_existing_duplicates', v_unique - jsonb_array_length(v_inserted_ids) - v_updated,
+        'duplicate_rows_in_batch', v_attempted - v_unique,
+        'changed_rows', v_changed
+    );
+END;
+$$;
+
+REVOKE ALL ON FUNCTION public.ingest_card_variant_prices_bulk(JSONB, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.ingest_card_variant_prices_bulk(JSONB, JSONB) TO service_role;
+
+COMMIT;
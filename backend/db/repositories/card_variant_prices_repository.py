@@ -517,3 +517,118 @@ def insert_card_variant_prices_batch_with_stats(price_rows: List[Dict[str, Any]]
         "price_read_operations": price_read_ops,
         "price_write_operations": price_write_ops,
     }
+
+
+BULK_INGEST_RPC = "ingest_card_variant_prices_bulk"
+BULK_INGEST_CHUNK_SIZE = 1000
+_BULK_VARIANT_COLUMNS = ("card_id", "printing_type", "special_type", "edition")
+_BULK_IDENTITY_COLUMNS = (
+    ("identity_provider", "provider"),
+    ("identity_product_id", "external_product_id"),
+    ("identity_variant_key", "external_variant_key"),
+    ("identity_catalog_key", "external_catalog_key"),
+    ("identity_source_reference", "source_reference"),
+    ("identity_source_payload", "source_payload"),
+)
+_BULK_PRICE_COLUMNS = (
+    "condition_id", "source", "captured_at", "market_price", "high_price", "low_price", "currency",
+)
+
+
+class BulkIngestRpcUnavailable(RuntimeError):
+    """The bulk ingest RPC is not deployed; callers fall back to the row path."""
+
+
+def _bulk_ingest_payloads(
+    items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]], List[Dict[str, Any]]]],
+) -> Tuple[Dict[str, List[Any]], Dict[str, List[Any]]]:
+    """Columnar `p_variants` / `p_prices` payloads for one chunk of work items."""
+    variants: Dict[str, List[Any]] = {column: [] for column in _BULK_VARIANT_COLUMNS}
+    variants.update({column: [] for column, _field in _BULK_IDENTITY_COLUMNS})
+    prices: Dict[str, List[Any]] = {"variant_position": []}
+    prices.update({column: [] for column in _BULK_PRICE_COLUMNS})
+    for position, (variant_data, identity, price_rows) in enumerate(items):
+        for column in _BULK_VARIANT_COLUMNS:
+            variants[column].append(variant_data.get(column))
+        for column, field in _BULK_IDENTITY_COLUMNS:
+            variants[column].append(identity.get(field) if identity else None)
+        for row in price_rows:
+            normalized = _normalize_price_row(row)
+            prices["variant_position"].append(position)
+            for column in _BULK_PRICE_COLUMNS:
+                prices[column].append(normalized.get(column))
+    return variants, prices
+
+
+def ingest_card_variants_and_prices_bulk(
+    items: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]], List[Dict[str, Any]]]],
+) -> Dict[str, Any]:
+    """
+    Resolve variants, link identities and upsert daily prices for a whole set
+    through `ingest_card_variant_prices_bulk`, BULK_INGEST_CHUNK_SIZE work
+    items per call.
+
+    Each item is `(variant_data, external_identity_or_None, price_rows)`.
+    Returns `variant_ids` (aligned with `items`, None on conflict),
+    `conflicts` as `(item_index, message)` pairs, and the price stats of
+    `insert_card_variant_prices_batch_with_stats`. Raises
+    BulkIngestRpcUnavailable when the RPC is not deployed and nothing was
+    written.
+    """
+    stats: Dict[str, Any] = {
+        "variant_ids": [],
+        "conflicts": [],
+        "variants_inserted": 0,
+        "identities_linked": 0,
+        "rpc_operations": 0,
+        "attempted_rows": 0,
+        "inserted_count": 0,
+        "inserted_ids": [],
+        "updated_count": 0,
+        "skipped_duplicates": 0,
+        "skipped_existing_duplicates": 0,
+        "duplicate_rows_in_batch": 0,
+        "db_batch_operations": 0,
+        "price_read_operations": 0,
+        "price_write_operations": 0,
+    }
+    changed_rows: List[Dict[str, Any]] = []
+
+    for offset in range(0, len(items), BULK_INGEST_CHUNK_SIZE):
+        chunk = items[offset:offset + BULK_INGEST_CHUNK_SIZE]
+        variants, prices = _bulk_ingest_payloads(chunk)
+        try:
+            # The RPC is idempotent (ON CONFLICT throughout), so a transient
+            # retry re-applies the chunk; its counts then describe the retry.
+            response = run_supabase_with_transient_retry(
+                lambda client, _attempt: client.rpc(
+                    BULK_INGEST_RPC, {"p_variants": variants, "p_prices": prices}).execute(),
+                operation_name=f"{BULK_INGEST_RPC}_chunk_{offset // BULK_INGEST_CHUNK_SIZE}",
+            )
+        except Exception as exc:
+            if offset == 0 and _is_missing_rpc(exc):
+                raise BulkIngestRpcUnavailable(str(exc)) from exc
+            raise
+        result = response.data if response is not None else None
+        if not isinstance(result, dict):
+            raise RuntimeError(f"{BULK_INGEST_RPC} returned no result")
+
+        stats["rpc_operations"] += 1
+        stats["variant_ids"].extend(result.get("variant_ids") or [None] * len(chunk))
+        stats["conflicts"].extend(
+            (offset + int(conflict["position"]), conflict.get("message"))
+            for conflict in result.get("conflicts") or []
+        )
+        for key in ("variants_inserted", "identities_linked", "attempted_rows", "updated_count",
+                    "skipped_existing_duplicates", "duplicate_rows_in_batch"):
+            stats[key] += int(result.get(key) or 0)
+        stats["inserted_ids"].extend(result.get("inserted_ids") or [])
+        changed_rows.extend(result.get("changed_rows") or [])
+
+    stats["inserted_count"] = len(stats["inserted_ids"])
+    stats["skipped_duplicates"] = stats["skipped_existing_duplicates"] + stats["duplicate_rows_in_batch"]
+    stats["db_batch_operations"] = stats["rpc_operations"]
+    stats["price_write_operations"] = stats["rpc_operations"]
+
+    _refresh_pokemon_set_value_history_for_price_rows(changed_rows)
+    return stats
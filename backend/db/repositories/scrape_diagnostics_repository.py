@@ -17,6 +17,7 @@ import time
 from typing import Any, Dict, List, Optional
 
 from ..clients.supabase_client import supabase
+from .scrape_write_behind import active_scrape_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -83,8 +84,18 @@ def update_scrape_job_run(run_id: str, run_data: Dict[str, Any]) -> Optional[Dic
                   to change; un-mentioned columns retain their existing values.
 
     Returns:
-        The updated row dict, or ``None`` if the update failed.
+        The updated row dict, or ``None`` if the update failed. While a
+        write-behind buffer is active the update is queued there (coalesced
+        with the run's other pending updates) and ``None`` is returned.
     """
+    buffer = active_scrape_write_behind()
+    if buffer is not None:
+        buffer.update_run(run_id, run_data)
+        return None
+    return _write_scrape_job_run_update(run_id, run_data)
+
+
+def _write_scrape_job_run_update(run_id: str, run_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     try:
         result = (
             supabase.table("scrape_job_runs")
@@ -174,10 +185,19 @@ def insert_scrape_job_run_failures(rows: List[Dict[str, Any]]) -> Optional[List[
         rows: List of failure row dicts.
 
     Returns:
-        Inserted rows, or ``None`` if the insert failed.
+        Inserted rows, or ``None`` if the insert failed. While a write-behind
+        buffer is active the rows are queued there and ``[]`` is returned.
     """
     if not rows:
         return []
+    buffer = active_scrape_write_behind()
+    if buffer is not None:
+        buffer.add_failure_rows(rows)
+        return []
+    return _write_scrape_job_run_failures(rows)
+
+
+def _write_scrape_job_run_failures(rows: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
     try:
         result = supabase.table("scrape_job_run_failures").insert(rows).execute()
         if result and result.data:
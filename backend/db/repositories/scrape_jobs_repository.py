@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
 
 from ..clients.supabase_client import supabase
+from .scrape_write_behind import active_scrape_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -392,8 +393,14 @@ def heartbeat_scrape_job(
     job_id: int,
     worker_id: Optional[str] = None,
     lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    *,
+    raise_errors: bool = False,
 ) -> Optional[Dict[str, Any]]:
-    """Extend a running job's lease. Returns None if the job is no longer running."""
+    """Extend a running job's lease. Returns None if the job is no longer running.
+
+    A failed call also returns None unless `raise_errors`; heartbeat loops
+    pass it so a transient error is retried instead of read as a lost job.
+    """
     try:
         result = supabase.rpc(
             "heartbeat_scrape_job",
@@ -407,6 +414,8 @@ def heartbeat_scrape_job(
         return row
     except Exception as exc:
         logger.warning("%s heartbeat_scrape_job failed for job id=%s: %s", _JOB_TAG, job_id, exc)
+        if raise_errors:
+            raise
         return None
 
 
@@ -456,10 +465,32 @@ def finalize_scrape_job(
     backoff. On permanent failure it writes a durable local recovery record and
     returns ``{"ok": False, ...}`` rather than silently swallowing the error, so
     the caller can alert and the lease watchdog can reconcile.
+
+    With a write-behind buffer active, the job's lease stops being renewed and
+    the diagnostic writes buffered for its run are flushed first; any the flush
+    cannot make are kept in a recovery record the same way.
     """
     if final_status not in ("completed", "failed"):
         raise ValueError(f"finalize_scrape_job: invalid final_status {final_status!r}")
 
+    buffer = active_scrape_write_behind()
+    if buffer is not None:
+        buffer.untrack_heartbeat(job_id)
+        unflushed = buffer.flush_run(diag_run_id) if diag_run_id else {}
+        if unflushed:
+            recovery_path = _write_finalization_recovery_record({
+                "job_id": job_id,
+                "diag_run_id": diag_run_id,
+                "final_status": final_status,
+                "unflushed_writes": unflushed,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+            })
+            logger.error(
+                "%s buffered diagnostics could not be written before finalizing job id=%s "
+                "(recovery record: %s)",
+                _JOB_TAG, job_id, recovery_path,
+            )
+
     params = {
         "p_job_id": job_id,
         "p_diag_run_id": diag_run_id,
@@ -0,0 +1,282 @@
+"""Write-behind buffering of scrape heartbeats and diagnostic writes.
+
+A dispatcher job makes several small PostgREST calls besides the scrape
+itself: lease heartbeats (one thread per running job), ``scrape_job_runs``
+progress updates and the ``scrape_job_run_failures`` insert. Each one blocks
+its caller for a round trip, so a slow database stalls the worker in the
+middle of a job.
+
+With SCRAPE_WRITE_BEHIND_ENABLED=true the dispatcher installs one
+``ScrapeWriteBehindBuffer`` for the process. The diagnostics repository then
+queues run updates (coalesced per run, later columns win) and failure rows
+(batched across runs) instead of writing them, and running jobs register
+their lease with the buffer instead of starting a heartbeat thread. One
+background thread flushes every SCRAPE_WRITE_BEHIND_FLUSH_SECONDS and renews
+the leases that are due.
+
+``finalize_scrape_job`` flushes the job's own run before its transactional
+RPC, so a job's diagnostics always land before the job is finalized. Writes
+that still fail are retried on later flushes; whatever a finalization flush
+cannot write for its run is handed back to be kept in a local recovery
+record, as a failed finalization is. Other runs' writes stay queued. A lease
+renewal that fails is retried on the next flush; only a heartbeat that finds
+the job no longer running stops tracking it.
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_TAG = "[scrape-write-behind]"
+
+WRITE_BEHIND_ENABLED_ENV = "SCRAPE_WRITE_BEHIND_ENABLED"
+WRITE_BEHIND_FLUSH_SECONDS_ENV = "SCRAPE_WRITE_BEHIND_FLUSH_SECONDS"
+DEFAULT_FLUSH_SECONDS = 5.0
+DEFAULT_MAX_BATCH_ROWS = 500
+
+# Flushes a write may fail before it is dropped (and logged) outside finalization.
+_MAX_FLUSH_ATTEMPTS = 3
+
+
+class ScrapeWriteBehindBuffer:
+    def __init__(
+        self,
+        *,
+        heartbeat: Callable[..., Optional[Dict[str, Any]]],
+        write_run_update: Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]],
+        write_failure_rows: Callable[[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]],
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._heartbeat = heartbeat
+        self._write_run_update = write_run_update
+        self._write_failure_rows = write_failure_rows
+        self.flush_seconds = flush_seconds
+        self.max_batch_rows = max(1, max_batch_rows)
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._leases: Dict[int, Dict[str, Any]] = {}
+        self._run_updates: Dict[str, Dict[str, Any]] = {}
+        self._update_attempts: Dict[str, int] = {}
+        self._failure_rows: List[Dict[str, Any]] = []
+        self._failure_attempts = 0
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["ScrapeWriteBehindBuffer"]:
+        if os.getenv(WRITE_BEHIND_ENABLED_ENV, "false").strip().lower() != "true":
+            return None
+        try:
+            flush_seconds = float(os.getenv(WRITE_BEHIND_FLUSH_SECONDS_ENV, str(DEFAULT_FLUSH_SECONDS)))
+        except ValueError:
+            logger.warning("%s invalid %s; using %s", _TAG, WRITE_BEHIND_FLUSH_SECONDS_ENV, DEFAULT_FLUSH_SECONDS)
+            flush_seconds = DEFAULT_FLUSH_SECONDS
+
+        from .scrape_diagnostics_repository import _write_scrape_job_run_failures, _write_scrape_job_run_update
+        from .scrape_jobs_repository import heartbeat_scrape_job
+
+        return cls(
+            heartbeat=partial(heartbeat_scrape_job, raise_errors=True),
+            write_run_update=_write_scrape_job_run_update,
+            write_failure_rows=_write_scrape_job_run_failures,
+            flush_seconds=flush_seconds if flush_seconds > 0 else DEFAULT_FLUSH_SECONDS,
+        )
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def track_heartbeat(self, job_id: int, worker_id: Optional[str], lease_seconds: int) -> None:
+        """Renew the job's lease every third of it until it is untracked."""
+        interval = max(30, lease_seconds // 3)
+        with self._lock:
+            self._leases[job_id] = {
+                "worker_id": worker_id,
+                "lease_seconds": lease_seconds,
+                "interval": interval,
+                "due": self._clock() + interval,
+            }
+
+    def untrack_heartbeat(self, job_id: int) -> None:
+        with self._lock:
+            self._leases.pop(job_id, None)
+
+    def update_run(self, run_id: str, run_data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._run_updates.setdefault(run_id, {}).update(run_data)
+
+    def add_failure_rows(self, rows: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._failure_rows.extend(rows)
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _renew_due_leases(self) -> None:
+        now = self._clock()
+        with self._lock:
+            due = [(job_id, dict(lease)) for job_id, lease in self._leases.items() if lease["due"] <= now]
+            for job_id, lease in due:
+                self._leases[job_id]["due"] = now + lease["interval"]
+        for job_id, lease in due:
+            try:
+                row = self._heartbeat(job_id, worker_id=lease["worker_id"], lease_seconds=lease["lease_seconds"])
+            except Exception as exc:
+                logger.warning("%s heartbeat failed for job id=%s; retrying next flush: %s", _TAG, job_id, exc)
+                with self._lock:
+                    if job_id in self._leases:
+                        self._leases[job_id]["due"] = now
+                continue
+            if row is None:
+                logger.warning("%s heartbeat lost job id=%s worker=%s", _TAG, job_id, lease["worker_id"])
+                self.untrack_heartbeat(job_id)
+
+    def flush(self, *, final: bool = False) -> Dict[str, Any]:
+        """Write everything queued; return what could not be written.
+
+        Outside a final flush, failed writes stay queued for the next flush
+        (up to a few attempts) and the result is empty unless they were
+        dropped. A final flush returns every write it could not make.
+        """
+        with self._flush_lock:
+            with self._lock:
+                run_updates, self._run_updates = self._run_updates, {}
+                failure_rows, self._failure_rows = self._failure_rows, []
+
+            failed_updates: Dict[str, Dict[str, Any]] = {}
+            for run_id, run_data in run_updates.items():
+                if self._write_run_update(run_id, run_data) is None:
+                    failed_updates[run_id] = run_data
+
+            failed_rows: List[Dict[str, Any]] = []
+            for start in range(0, len(failure_rows), self.max_batch_rows):
+                chunk = failure_rows[start:start + self.max_batch_rows]
+                if self._write_failure_rows(chunk) is None:
+                    failed_rows.extend(chunk)
+
+            if final:
+                return self._unflushed(failed_updates, failed_rows)
+            return self._requeue(failed_updates, failed_rows)
+
+    def flush_run(self, run_id: str) -> Dict[str, Any]:
+        """Write everything queued for `run_id`; return what could not be written.
+
+        Used when the run's job is finalized: nothing for the run is requeued,
+        and other runs' queued writes are left for the regular flushes.
+        """
+        with self._flush_lock:
+            with self._lock:
+                run_update = self._run_updates.pop(run_id, None)
+                self._update_attempts.pop(run_id, None)
+                failure_rows = [row for row in self._failure_rows if row.get("run_id") == run_id]
+                self._failure_rows = [row for row in self._failure_rows if row.get("run_id") != run_id]
+
+            failed_updates: Dict[str, Dict[str, Any]] = {}
+            if run_update is not None and self._write_run_update(run_id, run_update) is None:
+                failed_updates[run_id] = run_update
+
+            failed_rows: List[Dict[str, Any]] = []
+            for start in range(0, len(failure_rows), self.max_batch_rows):
+                chunk = failure_rows[start:start + self.max_batch_rows]
+                if self._write_failure_rows(chunk) is None:
+                    failed_rows.extend(chunk)
+
+            return self._unflushed(failed_updates, failed_rows)
+
+    def _requeue(self, failed_updates: Dict[str, Dict[str, Any]], failed_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        dropped_updates: Dict[str, Dict[str, Any]] = {}
+        dropped_rows: List[Dict[str, Any]] = []
+        with self._lock:
+            for run_id in list(self._update_attempts):
+                if run_id not in failed_updates:
+                    self._update_attempts.pop(run_id)
+            for run_id, run_data in failed_updates.items():
+                attempts = self._update_attempts.get(run_id, 0) + 1
+                if attempts >= _MAX_FLUSH_ATTEMPTS:
+                    self._update_attempts.pop(run_id, None)
+                    dropped_updates[run_id] = run_data
+                    continue
+                self._update_attempts[run_id] = attempts
+                # Columns queued since the swap are newer than the failed ones.
+                self._run_updates[run_id] = {**run_data, **self._run_updates.get(run_id, {})}
+
+            self._failure_attempts = self._failure_attempts + 1 if failed_rows else 0
+            if self._failure_attempts >= _MAX_FLUSH_ATTEMPTS:
+                self._failure_attempts = 0
+                dropped_rows = failed_rows
+            else:
+                self._failure_rows[:0] = failed_rows
+
+        if dropped_updates or dropped_rows:
+            logger.error(
+                "%s dropped %d run update(s) and %d failure row(s) after %d failed flushes",
+                _TAG, len(dropped_updates), len(dropped_rows), _MAX_FLUSH_ATTEMPTS,
+            )
+        return self._unflushed(dropped_updates, dropped_rows)
+
+    def _unflushed(self, updates: Dict[str, Dict[str, Any]], rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if not updates and not rows:
+            return {}
+        return {"run_updates": updates, "failure_rows": rows}
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_seconds):
+            try:
+                self._renew_due_leases()
+                self.flush()
+            except Exception:  # pragma: no cover - the flush thread must outlive one bad write
+                logger.exception("%s background flush failed", _TAG)
+
+    def start(self) -> "ScrapeWriteBehindBuffer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="scrape-write-behind", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> Dict[str, Any]:
+        """Stop the flush thread and write whatever is still queued."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(5.0, self.flush_seconds * 2))
+        unflushed = self.flush(final=True)
+        if unflushed:
+            logger.error(
+                "%s %d run update(s) and %d failure row(s) could not be written at shutdown",
+                _TAG, len(unflushed["run_updates"]), len(unflushed["failure_rows"]),
+            )
+        return unflushed
+
+
+_active_buffer: Optional[ScrapeWriteBehindBuffer] = None
+
+
+def active_scrape_write_behind() -> Optional[ScrapeWriteBehindBuffer]:
+    return _active_buffer
+
+
+@contextmanager
+def scrape_write_behind_scope(buffer: Optional[ScrapeWriteBehindBuffer]) -> Iterator[Optional[ScrapeWriteBehindBuffer]]:
+    """Buffer scrape heartbeats and diagnostic writes through `buffer` while open."""
+    global _active_buffer
+    previous = _active_buffer
+    if buffer is not None:
+        buffer.start()
+    _active_buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _active_buffer = previous
+        if buffer is not None:
+            buffer.close()
@@ -1,7 +1,16 @@
 """
-Generic multiprocessing batch processor for database ingestion services.
+Generic batch processor for database ingestion services.
 Provides reusable orchestration for parallel batch processing with sequential shipping.
 
+Batch work is almost entirely PostgREST round trips, so it runs on threads:
+a process pool only added pickling, process spawn and a fresh Supabase client
+per batch. `process_and_ship_pipelined` chains the stages through bounded
+queues - prepare -> process (variant/product writes, MAX_WORKERS threads) ->
+ship prices (one thread, in batch order) - so shipping batch N overlaps
+processing batch N+1. Each stage thread keeps one persistence session, and
+with it one pooled HTTP client, for its lifetime. Per-stage throughput lands
+in `results['pipeline_metrics']`. Set USE_PROCESS_POOL for CPU-bound workers.
+
 Usage:
     Subclass BatchProcessor and implement:
     - _process_batch_worker(batch_data, batch_id)
@@ -10,7 +19,10 @@ Usage:
 
 import sys
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from abc import ABC, abstractmethod
 
 from backend.db.services.supabase_persistence_retry import scraper_persistence_session
@@ -29,7 +41,9 @@ class BatchProcessor(ABC):
     WORK_BATCH_SIZE = 300
     PRICE_BATCH_SIZE = 500
     PROCESS_TIMEOUT = 300  # 5 minutes
-    USE_MULTIPROCESSING = True  # Set to False to skip multiprocessing and use sequential processing
+    USE_MULTIPROCESSING = True  # Set to False to skip parallelism and use sequential processing
+    USE_PROCESS_POOL = False  # Process workers in child processes (CPU-bound workers only)
+    PIPELINE_QUEUE_DEPTH = 2  # Batches buffered per worker between pipeline stages
 
     def _resolve_max_workers(self):
         hard_cap = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "5"))
@@ -58,8 +72,9 @@ class BatchProcessor(ABC):
     
     def process_batches_in_parallel(self, batches, prepare_batch_data_fn):
         """
-        Process batches in parallel using multiprocessing (if enabled).
-        Falls back to sequential processing if USE_MULTIPROCESSING is False.
+        Process batches in parallel on a thread pool (a process pool when
+        USE_PROCESS_POOL is set). Falls back to sequential processing if
+        USE_MULTIPROCESSING is False.
         
         Args:
             batches: List of work batches to process
@@ -90,11 +105,12 @@ class BatchProcessor(ABC):
                     all_errors.append(error_msg)
             return batch_results, all_errors
         
-        # Parallel multiprocessing
+        # Parallel processing
         max_workers = self._resolve_max_workers()
         print(f"\n[INFO] Processing {len(batches)} batches in parallel with {max_workers} workers...")
         
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        executor_class = ProcessPoolExecutor if self.USE_PROCESS_POOL else ThreadPoolExecutor
+        with executor_class(max_workers=max_workers) as executor:
             futures = {}
             next_batch_id = 0
 
@@ -133,6 +149,126 @@ class BatchProcessor(ABC):
         
         return batch_results, all_errors
     
+    def process_and_ship_pipelined(self, batches, prepare_batch_data_fn, results_accumulator):
+        """
+        Process and ship batches as one pipeline of bounded queues.
+
+        prepare (caller thread) -> process (worker threads) -> ship (one thread,
+        batch_id order). Each queue holds at most PIPELINE_QUEUE_DEPTH batches
+        per worker, so a slow stage back-pressures the one before it. Shipping
+        order, accumulation and error reporting match
+        process_batches_in_parallel followed by ship_results_sequentially,
+        which this falls back to for sequential runs, single batches and
+        USE_PROCESS_POOL.
+
+        Returns:
+            Tuple of (prices_expected, prices_shipped, all_errors)
+        """
+        if not self.USE_MULTIPROCESSING or self.USE_PROCESS_POOL or len(batches) <= 1:
+            batch_results, all_errors = self.process_batches_in_parallel(batches, prepare_batch_data_fn)
+            prices_expected, prices_shipped, ship_errors = self.ship_results_sequentially(
+                batch_results, results_accumulator)
+            return prices_expected, prices_shipped, all_errors + ship_errors
+
+        max_workers = self._resolve_max_workers()
+        depth = max(1, int(self.PIPELINE_QUEUE_DEPTH)) * max_workers
+        work_queue = queue.Queue(maxsize=depth)
+        result_queue = queue.Queue(maxsize=depth)
+        stages = {name: {'batches': 0, 'items': 0, 'busyMs': 0.0} for name in ('prepare', 'process', 'ship')}
+        stage_lock = threading.Lock()
+        all_errors = []
+        process_errors = {}
+        totals = {'expected': 0, 'shipped': 0}
+
+        def record(stage, items, started):
+            with stage_lock:
+                stages[stage]['batches'] += 1
+                stages[stage]['items'] += items
+                stages[stage]['busyMs'] += (time.perf_counter() - started) * 1000
+
+        def process_stage():
+            with scraper_persistence_session():
+                while True:
+                    entry = work_queue.get()
+                    if entry is None:
+                        return
+                    batch_id, batch_data, item_count = entry
+                    started = time.perf_counter()
+                    try:
+                        outcome = (batch_id, self._process_batch_worker(batch_data, batch_id), None)
+                        print(f"[INFO] Batch {batch_id} processing complete")
+                    except Exception as e:
+                        error_msg = f"Batch {batch_id} processing failed: {e}"
+                        print(f"[ERROR] {error_msg}")
+                        outcome = (batch_id, None, error_msg)
+                    record('process', item_count, started)
+                    result_queue.put(outcome)
+
+        def ship_stage():
+            pending = {}
+            next_batch_id = 0
+            with scraper_persistence_session():
+                while True:
+                    outcome = result_queue.get()
+                    if outcome is None:
+                        return
+                    pending[outcome[0]] = outcome
+                    while next_batch_id in pending:
+                        _batch_id, batch_result, error_msg = pending.pop(next_batch_id)
+                        next_batch_id += 1
+                        if batch_result is None:
+                            process_errors[_batch_id] = error_msg
+                            continue
+                        prices = len(batch_result.get('prices_to_ship', []))
+                        started = time.perf_counter()
+                        try:
+                            totals['expected'] += prices
+                            totals['shipped'] += self._ship_batch_result(batch_result, results_accumulator, all_errors)
+                        except Exception as e:
+                            error_msg = f"[SHIP] Batch {_batch_id}: FAILED - {prices} prices lost: {e}"
+                            print(f"[ERROR] {error_msg}")
+                            all_errors.append(error_msg)
+                        record('ship', prices, started)
+
+        print(f"\n[INFO] Pipelining {len(batches)} batches through {max_workers} workers and one shipper...")
+        pipeline_started = time.perf_counter()
+        workers = [threading.Thread(target=process_stage, name=f"batch-process-{index}", daemon=True)
+                   for index in range(max_workers)]
+        shipper = threading.Thread(target=ship_stage, name="batch-ship", daemon=True)
+        for thread in (*workers, shipper):
+            thread.start()
+        try:
+            for batch_id, batch in enumerate(batches):
+                started = time.perf_counter()
+                try:
+                    batch_data = prepare_batch_data_fn(batch, batch_id)
+                except Exception as e:
+                    # Keep the shipper's batch_id order moving past the failed batch.
+                    batch_data = None
+                    result_queue.put((batch_id, None, f"Batch {batch_id} processing failed: {e}"))
+                record('prepare', len(batch), started)
+                if batch_data is not None:
+                    work_queue.put((batch_id, batch_data, len(batch)))
+        finally:
+            for _worker in workers:
+                work_queue.put(None)
+            for worker in workers:
+                worker.join()
+            result_queue.put(None)
+            shipper.join()
+
+        elapsed_seconds = max(time.perf_counter() - pipeline_started, 1e-9)
+        for metrics in stages.values():
+            metrics['busyMs'] = round(metrics['busyMs'], 3)
+            metrics['itemsPerSecond'] = round(metrics['items'] / elapsed_seconds, 3)
+        stages['wallMs'] = round(elapsed_seconds * 1000, 3)
+        stages['workers'] = max_workers
+        results_accumulator['pipeline_metrics'] = stages
+
+        all_errors = [process_errors[batch_id] for batch_id in sorted(process_errors)] + all_errors
+        self._append_price_discrepancy(totals['expected'], totals['shipped'], all_errors)
+        return totals['expected'], totals['shipped'], all_errors
+
     def ship_results_sequentially(self, batch_results, results_accumulator):
         """
         Ship batch results sequentially (one batch at a time).
@@ -160,110 +296,125 @@ class BatchProcessor(ABC):
         
         with scraper_persistence_session():
             for batch_result in batch_results:
-                batch_id = batch_result['batch_id']
-                prices_to_ship = batch_result.get('prices_to_ship', [])
-                batch_size = self.PRICE_BATCH_SIZE
-            
-                if prices_to_ship:
-                    print(f"[SHIP] Batch {batch_id}: Preparing {len(prices_to_ship)} prices for shipping")
-            
-            # Ship prices in sub-batches
-                for sub_batch_idx, i in enumerate(range(0, len(prices_to_ship), batch_size)):
-                    price_batch = prices_to_ship[i:i + batch_size]
-                    batch_expected = len(price_batch)
-                
-                    try:
-                        ship_result = self._ship_batch_prices(price_batch, batch_id)
-                        if isinstance(ship_result, dict):
-                            batch_shipped = int(ship_result.get('inserted_count', 0))
-                            batch_covered = (
-                                batch_shipped
-                                + int(ship_result.get('updated_count', 0))
-                                + int(ship_result.get('skipped_duplicates', 0))
-                            )
-                            results_accumulator['price_rows_attempted'] = (
-                                results_accumulator.get('price_rows_attempted', 0)
-                                + int(ship_result.get('attempted_rows', batch_expected))
-                            )
-                            results_accumulator['price_rows_skipped_duplicates'] = (
-                                results_accumulator.get('price_rows_skipped_duplicates', 0)
-                                + int(ship_result.get('skipped_duplicates', 0))
-                            )
-                            results_accumulator['price_rows_updated'] = (
-                                results_accumulator.get('price_rows_updated', 0)
-                                + int(ship_result.get('updated_count', 0))
-                            )
-                            results_accumulator['price_batch_operations'] = (
-                                results_accumulator.get('price_batch_operations', 0)
-                                + int(ship_result.get('db_batch_operations', 0))
-                            )
-                            results_accumulator['price_read_operations'] = (
-                                results_accumulator.get('price_read_operations', 0)
-                                + int(ship_result.get('price_read_operations', 0))
-                            )
-                            results_accumulator['price_write_operations'] = (
-                                results_accumulator.get('price_write_operations', 0)
-                                + int(ship_result.get('price_write_operations', 0))
-                            )
-                            results_accumulator['price_persistence_ms'] = (
-                                results_accumulator.get('price_persistence_ms', 0.0)
-                                + float(ship_result.get('price_persistence_ms', 0.0))
-                            )
-                            results_accumulator['transport_retry_count'] = (
-                                results_accumulator.get('transport_retry_count', 0)
-                                + int(ship_result.get('transport_retry_count', 0))
-                            )
-                        else:
-                            batch_shipped = int(ship_result)
-                            batch_covered = batch_shipped
-                            results_accumulator['price_rows_attempted'] = (
-                                results_accumulator.get('price_rows_attempted', 0) + batch_expected
-                            )
-                            results_accumulator['price_batch_operations'] = (
-                                results_accumulator.get('price_batch_operations', 0) + 1
-                            )
-
-                        results_accumulator['inserted_prices'] += batch_shipped
-                        prices_shipped += batch_covered
-                        if batch_covered != batch_expected:
-                            warning_msg = f"[SHIP] Batch {batch_id} sub-batch {sub_batch_idx}: Expected {batch_expected} but only {batch_covered} persisted (LOSS: {batch_expected - batch_covered})"
-                            print(warning_msg)
-                            all_errors.append(warning_msg)
-                        elif sub_batch_idx == 0 or sub_batch_idx % 5 == 0:
-                            print(f"[SHIP] Batch {batch_id} sub-batch {sub_batch_idx}: Shipped {batch_shipped} prices [OK]")
-                        
-                    except Exception as e:
-                        error_msg = f"[SHIP] Batch {batch_id} sub-batch {sub_batch_idx}: FAILED - {len(price_batch)} prices lost: {e}"
-                        print(f"[ERROR] {error_msg}")
-                        all_errors.append(error_msg)
-            
-            # Accumulate item-specific results
-                for key in ['inserted_items', 'inserted_products', 'inserted_variants', 'external_identities_linked']:
-                    if key in batch_result:
-                        results_accumulator[key] = results_accumulator.get(key, 0) + batch_result[key]
-                persistence_metrics = batch_result.get('persistence_metrics') or {}
-                aggregate = results_accumulator.setdefault('persistence_metrics', {})
-                for key, value in persistence_metrics.items():
-                    aggregate[key] = aggregate.get(key, 0) + value
-            
-            # Accumulate errors
-                if 'errors' in batch_result:
-                    results_accumulator['errors'].extend(batch_result['errors'])
-                if 'error_codes' in batch_result:
-                    existing_codes = results_accumulator.setdefault('error_codes', [])
-                    for code in batch_result['error_codes']:
-                        if code not in existing_codes:
-                            existing_codes.append(code)
+                prices_shipped += self._ship_batch_result(batch_result, results_accumulator, all_errors)
         
         # Check for discrepancies
+        self._append_price_discrepancy(prices_expected, prices_shipped, all_errors)
+        
+        return prices_expected, prices_shipped, all_errors
+    
+    def _ship_batch_result(self, batch_result, results_accumulator, all_errors):
+        """
+        Ship one processed batch's prices and accumulate its results.
+
+        Returns:
+            Number of price rows covered (inserted, updated or skipped as unchanged)
+        """
+        shipped = 0
+        batch_id = batch_result['batch_id']
+        prices_to_ship = batch_result.get('prices_to_ship', [])
+        batch_size = self.PRICE_BATCH_SIZE
+    
+        if prices_to_ship:
+            print(f"[SHIP] Batch {batch_id}: Preparing {len(prices_to_ship)} prices for shipping")
+    
+        # Ship prices in sub-batches
+        for sub_batch_idx, i in enumerate(range(0, len(prices_to_ship), batch_size)):
+            price_batch = prices_to_ship[i:i + batch_size]
+            batch_expected = len(price_batch)
+        
+            try:
+                ship_result = self._ship_batch_prices(price_batch, batch_id)
+                if isinstance(ship_result, dict):
+                    batch_shipped = int(ship_result.get('inserted_count', 0))
+                    batch_covered = (
+                        batch_shipped
+                        + int(ship_result.get('updated_count', 0))
+                        + int(ship_result.get('skipped_duplicates', 0))
+                    )
+                    results_accumulator['price_rows_attempted'] = (
+                        results_accumulator.get('price_rows_attempted', 0)
+                        + int(ship_result.get('attempted_rows', batch_expected))
+                    )
+                    results_accumulator['price_rows_skipped_duplicates'] = (
+                        results_accumulator.get('price_rows_skipped_duplicates', 0)
+                        + int(ship_result.get('skipped_duplicates', 0))
+                    )
+                    results_accumulator['price_rows_updated'] = (
+                        results_accumulator.get('price_rows_updated', 0)
+                        + int(ship_result.get('updated_count', 0))
+                    )
+                    results_accumulator['price_batch_operations'] = (
+                        results_accumulator.get('price_batch_operations', 0)
+                        + int(ship_result.get('db_batch_operations', 0))
+                    )
+                    results_accumulator['price_read_operations'] = (
+                        results_accumulator.get('price_read_operations', 0)
+                        + int(ship_result.get('price_read_operations', 0))
+                    )
+                    results_accumulator['price_write_operations'] = (
+                        results_accumulator.get('price_write_operations', 0)
+                        + int(ship_result.get('price_write_operations', 0))
+                    )
+                    results_accumulator['price_persistence_ms'] = (
+                        results_accumulator.get('price_persistence_ms', 0.0)
+                        + float(ship_result.get('price_persistence_ms', 0.0))
+                    )
+                    results_accumulator['transport_retry_count'] = (
+                        results_accumulator.get('transport_retry_count', 0)
+                        + int(ship_result.get('transport_retry_count', 0))
+                    )
+                else:
+                    batch_shipped = int(ship_result)
+                    batch_covered = batch_shipped
+                    results_accumulator['price_rows_attempted'] = (
+                        results_accumulator.get('price_rows_attempted', 0) + batch_expected
+                    )
+                    results_accumulator['price_batch_operations'] = (
+                        results_accumulator.get('price_batch_operations', 0) + 1
+                    )
+
+                results_accumulator['inserted_prices'] += batch_shipped
+                shipped += batch_covered
+                if batch_covered != batch_expected:
+                    warning_msg = f"[SHIP] Batch {batch_id} sub-batch {sub_batch_idx}: Expected {batch_expected} but only {batch_covered} persisted (LOSS: {batch_expected - batch_covered})"
+                    print(warning_msg)
+                    all_errors.append(warning_msg)
+                elif sub_batch_idx == 0 or sub_batch_idx % 5 == 0:
+                    print(f"[SHIP] Batch {batch_id} sub-batch {sub_batch_idx}: Shipped {batch_shipped} prices [OK]")
+                
+            except Exception as e:
+                error_msg = f"[SHIP] Batch {batch_id} sub-batch {sub_batch_idx}: FAILED - {len(price_batch)} prices lost: {e}"
+                print(f"[ERROR] {error_msg}")
+                all_errors.append(error_msg)
+    
+        # Accumulate item-specific results
+        for key in ['inserted_items', 'inserted_products', 'inserted_variants', 'external_identities_linked']:
+            if key in batch_result:
+                results_accumulator[key] = results_accumulator.get(key, 0) + batch_result[key]
+        persistence_metrics = batch_result.get('persistence_metrics') or {}
+        aggregate = results_accumulator.setdefault('persistence_metrics', {})
+        for key, value in persistence_metrics.items():
+            aggregate[key] = aggregate.get(key, 0) + value
+    
+        # Accumulate errors
+        if 'errors' in batch_result:
+            results_accumulator['errors'].extend(batch_result['errors'])
+        if 'error_codes' in batch_result:
+            existing_codes = results_accumulator.setdefault('error_codes', [])
+            for code in batch_result['error_codes']:
+                if code not in existing_codes:
+                    existing_codes.append(code)
+
+        return shipped
+
+    def _append_price_discrepancy(self, prices_expected, prices_shipped, all_errors):
         if prices_shipped != prices_expected:
             discrepancy = prices_expected - prices_shipped
             discrepancy_msg = f"\n[WARNING] PRICE INSERTION DISCREPANCY: Expected {prices_expected}, Shipped {prices_shipped} (MISSING: {discrepancy} rows)"
             print(discrepancy_msg)
             all_errors.append(discrepancy_msg)
-        
-        return prices_expected, prices_shipped, all_errors
-    
+
     @abstractmethod
     def _process_batch_worker(self, batch_data, batch_id):
         """
@@ -13,13 +13,17 @@ from backend.db.repositories.card_variant_repository import (insert_card_variant
     external_identity_key, variant_natural_key, ExternalVariantIdentityConflict)
 from backend.utils.debug_output import debug_print
 from backend.db.repositories.card_variant_prices_repository import (
+    BulkIngestRpcUnavailable,
+    ingest_card_variants_and_prices_bulk,
     insert_card_variant_price,
     insert_card_variant_prices_batch,
     insert_card_variant_prices_batch_with_stats,
 )
 from backend.db.repositories.conditions_repository import get_all_conditions, get_condition_by_name
 from backend.db.services.batch_processor import BatchProcessor
+from backend.db.services.evr_input_cache import record_evr_price_ingestion
 from backend.db.services.supabase_persistence_retry import (
+    active_scraper_persistence_session,
     get_transport_retry_count,
     reset_transport_retry_count,
     scraper_persistence_session,
@@ -33,10 +37,10 @@ class CardsService(BatchProcessor):
     """
     Service layer for card business logic.
     Orchestrates writes across cards, card_variants, and card_variant_price_observations tables.
-    Uses multiprocessing for parallel batch processing.
+    Uses a threaded pipeline for parallel batch processing and price shipping.
     """
     
-    # Multiprocessing configuration
+    # Batch pipeline configuration
     MAX_WORKERS = 4
     WORK_BATCH_SIZE = 400  # Optimized for 1265-2000 card sets (better load balancing)
     PRICE_BATCH_SIZE = 100
@@ -44,6 +48,10 @@ class CardsService(BatchProcessor):
     # Thread pool size for concurrent card data preparation
     THREAD_POOL_SIZE = 10
 
+    # Opt-in: resolve variants and ship prices for the whole set through the
+    # ingest_card_variant_prices_bulk RPC instead of phases 2 and 3.
+    BULK_INGEST_ENV = "CARD_BULK_INGEST_RPC"
+
     def __init__(self):
         """Initialize service and cache conditions"""
         self._conditions_cache = None
@@ -131,10 +139,10 @@ class CardsService(BatchProcessor):
         return printing_type, special_type, edition
 
     def _process_batch_worker(self, batch_data, batch_id):
-        # This wrapper executes inside the child process. The client is created
-        # there and never passed through ProcessPool serialization.
+        # Reuse the calling pipeline thread's session (and its pooled client)
+        # when there is one; a process-pool child creates its own.
         try:
-            with scraper_persistence_session():
+            with scraper_persistence_session(active_scraper_persistence_session()):
                 return self._process_batch_worker_with_session(batch_data, batch_id)
         except ExternalVariantIdentityConflict as exc:
             # Preserve deterministic identity classification even when the
@@ -154,7 +162,7 @@ class CardsService(BatchProcessor):
         """
         Worker function that processes a single batch of work items.
         Implements BatchProcessor abstract method.
-        This runs in a separate process - minimal shared state.
+        This runs on a pipeline worker thread - minimal shared state.
         
         Args:
             batch_data: Tuple of (work_items, card_key_to_id)
@@ -325,6 +333,72 @@ class CardsService(BatchProcessor):
         result['transport_retry_count'] = get_transport_retry_count()
         return result
     
+    def _bulk_ingest_enabled(self):
+        return os.getenv(self.BULK_INGEST_ENV, "false").strip().lower() == "true"
+
+    def _ingest_work_items_bulk(self, work_items, results):
+        """
+        Phases 2 and 3 for the whole set in a few RPC calls.
+
+        Sends every work item's variant, external identity and prices as
+        columnar payloads to `ingest_card_variant_prices_bulk`, which resolves
+        or creates the variants, links identities and upserts same-day prices
+        server-side with the row path's conflict and duplicate semantics.
+
+        Returns the errors to report, or None when the RPC is not deployed so
+        the caller runs the row path instead.
+        """
+        items = []
+        for variant_data, price_data_list, _card_key in work_items:
+            variant_row = {key: value for key, value in variant_data.items() if key != '_external_identity'}
+            items.append((variant_row, variant_data.get('_external_identity'), price_data_list))
+
+        print(f"\n[INFO] Bulk ingesting {len(items)} variants through the bulk ingest RPC...")
+        reset_transport_retry_count()
+        started = time.perf_counter()
+        try:
+            with scraper_persistence_session():
+                stats = ingest_card_variants_and_prices_bulk(items)
+        except BulkIngestRpcUnavailable as exc:
+            print(f"[WARNING] Bulk ingest RPC unavailable, using batch processing: {exc}")
+            return None
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        errors = []
+        conflicted = set()
+        for item_index, message in stats['conflicts']:
+            conflicted.add(item_index)
+            errors.append(f"Bulk ingest error on item {item_index}: {message}")
+        if conflicted:
+            results['error_codes'].append(ERROR_EXTERNAL_VARIANT_IDENTITY_CONFLICT)
+
+        results['inserted_variants'] += stats['variants_inserted']
+        results['external_identities_linked'] += sum(
+            1 for index, (_variant, identity, _prices) in enumerate(items)
+            if identity and index not in conflicted)
+        results['inserted_prices'] += stats['inserted_count']
+        results['price_rows_attempted'] += stats['attempted_rows']
+        results['price_rows_skipped_duplicates'] += stats['skipped_duplicates']
+        results['price_rows_updated'] += stats['updated_count']
+        results['price_batch_operations'] += stats['db_batch_operations']
+        results['price_read_operations'] = results.get('price_read_operations', 0) + stats['price_read_operations']
+        results['price_write_operations'] = results.get('price_write_operations', 0) + stats['price_write_operations']
+        results['price_persistence_ms'] = results.get('price_persistence_ms', 0.0) + elapsed_ms
+        results['transport_retry_count'] = results.get('transport_retry_count', 0) + get_transport_retry_count()
+        results.setdefault('persistence_metrics', {})['payloadVariantCount'] = len(items)
+
+        expected = sum(len(prices) for index, (_variant, _identity, prices) in enumerate(items)
+                       if index not in conflicted)
+        covered = stats['inserted_count'] + stats['updated_count'] + stats['skipped_duplicates']
+        if covered != expected:
+            errors.append(
+                f"[WARNING] PRICE INSERTION DISCREPANCY: Expected {expected}, Shipped {covered} "
+                f"(MISSING: {expected - covered} rows)")
+        print(f"[INFO] Bulk ingest complete in {stats['rpc_operations']} RPC call(s): "
+              f"{stats['variants_inserted']} variants, {stats['inserted_count']} inserted / "
+              f"{stats['updated_count']} updated / {stats['skipped_duplicates']} unchanged prices")
+        return errors
+
     def _prepare_card_data(self, card_key, card_id, card_list):
         """
         Prepare (parse and validate) card data WITHOUT database writes.
@@ -673,23 +747,28 @@ class CardsService(BatchProcessor):
         for item_list in prepared_items:
             work_items.extend(item_list)
         
-        # Phase 2: Parallel batch processing with multiprocessing
-        print(f"\n[INFO] Phase 2: Dividing {len(work_items)} items into batches...")
-        
-        batches = self.divide_work_into_batches(work_items, batch_size=self.WORK_BATCH_SIZE)
-        print(f"[INFO] Created {len(batches)} batches for parallel processing")
-        
-        # Define function to prepare batch data for workers
-        def prepare_batch_data(batch, batch_id):
-            return (batch, card_key_to_id)
-        
-        # Process batches in parallel using BatchProcessor
-        batch_results, phase_2_errors = self.process_batches_in_parallel(batches, prepare_batch_data)
-        all_errors.extend(phase_2_errors)
-        
-        # Phase 3: Sequential batch shipping
-        prices_expected, prices_shipped, phase_3_errors = self.ship_results_sequentially(batch_results, results)
-        all_errors.extend(phase_3_errors)
+        bulk_errors = self._ingest_work_items_bulk(work_items, results) if self._bulk_ingest_enabled() else None
+        if bulk_errors is not None:
+            all_errors.extend(bulk_errors)
+        else:
+            # Phase 2: Parallel batch processing
+            print(f"\n[INFO] Phase 2: Dividing {len(work_items)} items into batches...")
+
+            batches = self.divide_work_into_batches(work_items, batch_size=self.WORK_BATCH_SIZE)
+            print(f"[INFO] Created {len(batches)} batches for parallel processing")
+
+            # Define function to prepare batch data for workers
+            def prepare_batch_data(batch, batch_id):
+                return (batch, card_key_to_id)
+
+            # Phases 2 and 3: process batches on worker threads while shipping
+            # completed batches' prices in order
+            prices_expected, prices_shipped, pipeline_errors = self.process_and_ship_pipelined(
+                batches, prepare_batch_data, results)
+            all_errors.extend(pipeline_errors)
+
+        # New price observations make any cached EVR input snapshot of this set stale.
+        record_evr_price_ingestion(set_id)
         
         results['errors'].extend(all_errors)
 
@@ -720,6 +799,8 @@ class CardsService(BatchProcessor):
             'identityReadOperations', 'variantReadOperations', 'identityWriteOperations',
             'variantWriteOperations', 'priceReadOperations', 'priceWriteOperations'))
         results['ingestion_efficiency']['persistence_metrics'] = dict(persistence)
+        if 'pipeline_metrics' in results:
+            results['ingestion_efficiency']['pipeline_metrics'] = results['pipeline_metrics']
         
         print(f"[INFO] All batch processing and shipping complete. Inserted {results['inserted_variants']} variants, {results['inserted_prices']} prices")
         
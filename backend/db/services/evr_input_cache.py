@@ -0,0 +1,197 @@
+"""On-disk snapshots of prepared EVR inputs per set and market date.
+
+`EVRInputPreparationService.prepare_for_set` queries cards, variants, latest
+prices and sealed prices for a set and shapes them into the calculator
+DataFrame plus ETB/booster-box pricing inputs. The daily run, replays and
+simulation research scripts repeat that identical fan-out for the same set on
+the same day.
+
+With EVR_INPUT_CACHE_DIR set, the prepared payload is pickled under a key of
+(canonical set key, market date, input fingerprint) and served again instead
+of re-querying. The market date is the America/Phoenix business day the
+scrapes are dated by. The input fingerprint hashes the set config the
+transformer shapes rows with and a price watermark read on every call - the
+set's newest card and sealed price observations and its latest set value
+history refresh - so prices ingested by any worker, on any host, change the
+key. The watermark is read BEFORE the inputs are, so a price that lands mid
+preparation leaves the older watermark stored and the next call re-queries.
+
+Price ingestion in a process that shares the cache directory also records an
+``ingested`` marker (``record_evr_price_ingestion``); a snapshot prepared
+before the set's latest marker is dropped on read. ``refresh=True``
+(``--refresh-inputs`` on the runner) bypasses the read and rewrites the
+snapshot.
+
+Each entry keeps the DB input diagnostics of the preparation it holds, so a
+hit re-emits them instead of silently dropping them.
+
+Layout: ``entries/<sha1(key)>.pkl`` rewritten through a staging file, and
+``ingested/<sha1(set id)>.json``. Anything missing, unreadable or recorded
+under another schema version is ignored, which degrades to a normal
+preparation. Only point EVR_INPUT_CACHE_DIR at a directory this service
+owns: entries are pickles.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.Scraper.helpers.market_date_helper import resolve_phoenix_market_date
+
+logger = logging.getLogger(__name__)
+
+INPUT_CACHE_VERSION = 2
+INPUT_CACHE_DIR_ENV = "EVR_INPUT_CACHE_DIR"
+
+
+def current_market_date() -> str:
+    return resolve_phoenix_market_date()
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-able form of a config value with a process-independent ordering."""
+    if isinstance(value, Mapping):
+        return sorted(([_canonical(key), _canonical(item)] for key, item in value.items()), key=repr)
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item) for item in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def config_fingerprint(config: Any) -> str:
+    """Hash of the config's public constants (the inputs the transformer reads)."""
+    constants = {
+        name: _canonical(getattr(config, name))
+        for name in dir(config)
+        if name.isupper() and not callable(getattr(config, name))
+    }
+    encoded = json.dumps(constants, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def input_fingerprint(config: Any, price_watermark: Mapping[str, Any]) -> str:
+    """Hash of the config fingerprint and the set's price watermark."""
+    encoded = json.dumps(
+        {"config": config_fingerprint(config), "prices": _canonical(price_watermark)}, sort_keys=True, default=repr
+    ).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class EVRInputCache:
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    @classmethod
+    def from_env(cls) -> Optional["EVRInputCache"]:
+        root = os.getenv(INPUT_CACHE_DIR_ENV)
+        return cls(Path(root)) if root else None
+
+    def _entry_path(self, canonical_key: str, market_date: str, fingerprint: str) -> Path:
+        key = f"{canonical_key}|{market_date}|{fingerprint}"
+        return self.root / "entries" / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.pkl"
+
+    def _ingested_path(self, set_id: str) -> Path:
+        return self.root / "ingested" / f"{hashlib.sha1(str(set_id).encode('utf-8')).hexdigest()}.json"
+
+    def _last_ingested_at(self, set_id: str) -> Optional[float]:
+        path = self._ingested_path(set_id)
+        if not path.exists():
+            return None
+        try:
+            marker = json.loads(path.read_text(encoding="utf-8"))
+            return float(marker["ingested_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("[EVR input cache] unreadable ingestion marker %s; treating the set as re-ingested", path)
+            return float("inf")
+
+    def load(self, canonical_key: str, market_date: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """The stored entry: its ``payload`` and the ``diagnostics`` of its preparation."""
+        path = self._entry_path(canonical_key, market_date, fingerprint)
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as handle:
+                entry = pickle.load(handle)
+        except Exception:
+            logger.warning("[EVR input cache] unreadable entry %s; ignoring it", path)
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != INPUT_CACHE_VERSION
+            or entry.get("canonical_key") != canonical_key
+            or entry.get("market_date") != market_date
+            or entry.get("fingerprint") != fingerprint
+            or not isinstance(entry.get("payload"), dict)
+            or not isinstance(entry.get("diagnostics"), dict)
+        ):
+            return None
+
+        ingested_at = self._last_ingested_at(entry.get("set_id"))
+        if ingested_at is not None and ingested_at >= entry.get("prepared_at", 0.0):
+            logger.info("[EVR input cache] %s %s invalidated by price ingestion", canonical_key, market_date)
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def save(
+        self,
+        canonical_key: str,
+        market_date: str,
+        fingerprint: str,
+        *,
+        set_id: str,
+        prepared_at: float,
+        payload: Dict[str, Any],
+        diagnostics: Dict[str, Any],
+    ) -> None:
+        """Store `payload`; `prepared_at` is when its queries started."""
+        path = self._entry_path(canonical_key, market_date, fingerprint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_suffix(".pkl.tmp")
+        with staging.open("wb") as handle:
+            pickle.dump(
+                {
+                    "version": INPUT_CACHE_VERSION,
+                    "canonical_key": canonical_key,
+                    "market_date": market_date,
+                    "fingerprint": fingerprint,
+                    "set_id": set_id,
+                    "prepared_at": prepared_at,
+                    "payload": payload,
+                    "diagnostics": diagnostics,
+                },
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        staging.replace(path)
+
+    def record_ingestion(self, set_id: str, ingested_at: Optional[float] = None) -> None:
+        path = self._ingested_path(set_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_suffix(".json.tmp")
+        staging.write_text(
+            json.dumps({"set_id": str(set_id), "ingested_at": time.time() if ingested_at is None else ingested_at}),
+            encoding="utf-8",
+            newline="\n",
+        )
+        staging.replace(path)
+
+
+def record_evr_price_ingestion(set_id: Any) -> None:
+    """Mark prepared EVR inputs for `set_id` stale; a no-op without a cache dir."""
+    cache = EVRInputCache.from_env()
+    if cache is None or not set_id:
+        return
+    try:
+        cache.record_ingestion(str(set_id))
+    except OSError as exc:
+        logger.warning("[EVR input cache] could not record price ingestion for set %s: %s", set_id, exc)
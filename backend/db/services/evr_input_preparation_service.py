@@ -1,13 +1,15 @@
 import json
 import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 
 from backend.calculations.utils.rarity_classification import normalize_rarity_key
 from backend.calculations.utils.special_type_normalization import derive_pattern_key, normalize_special_type_key
+from backend.db.services.evr_input_cache import EVRInputCache, current_market_date, input_fingerprint
 from backend.db.services.evr_input_repository import EVRInputRepository
 from backend.db.services.evr_input_transformer import EVRInputTransformer
 from backend.utils.debug_output import debug_print
@@ -18,18 +20,79 @@ class EVRInputPreparationService:
 
     REQUIRED_REVERSE_PRICE_COLUMN = "Reverse Variant Price ($)"
 
-    def __init__(self, repository: EVRInputRepository | None = None, transformer: EVRInputTransformer | None = None):
+    def __init__(
+        self,
+        repository: EVRInputRepository | None = None,
+        transformer: EVRInputTransformer | None = None,
+        cache: EVRInputCache | None = None,
+    ):
         self.repository = repository or EVRInputRepository()
         self.transformer = transformer or EVRInputTransformer()
+        self.cache = cache if cache is not None else EVRInputCache.from_env()
+
+    def prepare_for_set(
+        self,
+        config: Any,
+        canonical_key: str,
+        set_name: str,
+        *,
+        refresh_inputs: bool = False,
+    ) -> Dict[str, Any]:
+        """Prepared calculator inputs, from the EVR input cache when one is configured.
 
-    def prepare_for_set(self, config: Any, canonical_key: str, set_name: str) -> Dict[str, Any]:
-        set_identity = {
+        `refresh_inputs` re-queries the database and rewrites the cached snapshot.
+        """
+        if self.cache is None:
+            return self._prepare_from_db(config, canonical_key, set_name)[0]
+
+        set_identity = self._set_identity(config, canonical_key, set_name)
+        try:
+            set_id = self.repository.resolve_set_id(set_identity)
+            price_watermark = self.repository.load_price_watermark(set_id) if set_id else None
+        except Exception as exc:
+            print(f"[EVR_INPUT_CACHE] skipped=watermark_error:{type(exc).__name__}:{str(exc)}")
+            return self._prepare_from_db(config, canonical_key, set_name)[0]
+        if price_watermark is None:
+            return self._prepare_from_db(config, canonical_key, set_name)[0]
+
+        market_date = current_market_date()
+        fingerprint = input_fingerprint(config, price_watermark)
+        if not refresh_inputs:
+            cached = self.cache.load(canonical_key, market_date, fingerprint)
+            if cached is not None:
+                debug_print(f"[EVR_INPUT_CACHE] hit set={canonical_key} market_date={market_date}")
+                self._emit_cached_diagnostics(cached["diagnostics"])
+                return cached["payload"]
+
+        prepared_at = time.time()
+        prepared, resolved_set_id, diagnostics = self._prepare_from_db(config, canonical_key, set_name)
+        try:
+            self.cache.save(
+                canonical_key,
+                market_date,
+                fingerprint,
+                set_id=str(resolved_set_id or set_id),
+                prepared_at=prepared_at,
+                payload=prepared,
+                diagnostics=diagnostics,
+            )
+        except OSError as exc:
+            print(f"[EVR_INPUT_CACHE] skipped=write_error:{type(exc).__name__}:{str(exc)}")
+        return prepared
+
+    def _set_identity(self, config: Any, canonical_key: str, set_name: str) -> Dict[str, Any]:
+        return {
             "canonical_key": canonical_key,
             "set_id": getattr(config, "SET_ID", None),
             "set_name": getattr(config, "SET_NAME", None) or set_name,
         }
 
-        repository_payload = self.repository.load_inputs(set_identity)
+    def _prepare_from_db(
+        self, config: Any, canonical_key: str, set_name: str
+    ) -> Tuple[Dict[str, Any], Any, Dict[str, Any]]:
+        """Query and shape the set's inputs; also return the resolved DB set id
+        and the diagnostics emitted along the way."""
+        repository_payload = self.repository.load_inputs(self._set_identity(config, canonical_key, set_name))
         internal_payload = self.transformer.transform(repository_payload, config)
         compatibility_payload = self.transformer.to_legacy_calculator_payload(internal_payload)
         diagnostics_summary = self._emit_diagnostics(repository_payload, compatibility_payload)
@@ -42,7 +105,18 @@ class EVRInputPreparationService:
             internal_payload=internal_payload,
         )
         self._validate_required_inputs(compatibility_payload, set_name)
-        return compatibility_payload
+        return (
+            compatibility_payload,
+            ((repository_payload or {}).get("set") or {}).get("id"),
+            {"diagnostics_summary": diagnostics_summary, "row_audit_summary": row_audit_summary},
+        )
+
+    def _emit_cached_diagnostics(self, diagnostics: Dict[str, Any]) -> None:
+        """Replay the diagnostics of the preparation a cache hit serves."""
+        debug_print(f"[DB_INPUT_DIAGNOSTICS] {json.dumps(diagnostics.get('diagnostics_summary') or {}, sort_keys=True)}")
+        row_audit_summary = diagnostics.get("row_audit_summary") or {}
+        if row_audit_summary:
+            debug_print(f"[DB_INPUT_ROW_AUDIT] {json.dumps(row_audit_summary, sort_keys=True)}")
 
     def _emit_diagnostics(self, repository_payload: Dict[str, Any], transformed_payload: Dict[str, Any]) -> Dict[str, Any]:
         repo_diag = (repository_payload or {}).get("diagnostics") or {}
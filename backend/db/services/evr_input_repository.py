@@ -144,6 +144,52 @@ class EVRInputRepository:
             },
         }
 
+    def resolve_set_id(self, set_identity: Dict[str, Any]) -> Optional[str]:
+        set_row, _ = self._resolve_set_row(set_identity)
+        if not set_row or set_row.get("id") is None:
+            return None
+        return str(set_row["id"])
+
+    def load_price_watermark(self, set_id: str) -> Dict[str, Optional[str]]:
+        """Newest price writes for a set: one row from each observation table,
+        plus the set value history, which price ingestion refreshes for same-day
+        rewrites that keep an observation's captured_at."""
+        card_rows = (
+            supabase.table("card_variant_price_observations")
+            .select("captured_at,card_variants!inner(cards!inner(set_id))")
+            .eq("card_variants.cards.set_id", set_id)
+            .order("captured_at", desc=True)
+            .limit(1)
+            .execute()
+            .data
+            or []
+        )
+        sealed_rows = (
+            supabase.table("sealed_product_price_observations")
+            .select("captured_at,sealed_products!inner(set_id)")
+            .eq("sealed_products.set_id", set_id)
+            .order("captured_at", desc=True)
+            .limit(1)
+            .execute()
+            .data
+            or []
+        )
+        history_rows = (
+            supabase.table("pokemon_set_value_daily_history")
+            .select("updated_at")
+            .eq("set_id", set_id)
+            .order("updated_at", desc=True)
+            .limit(1)
+            .execute()
+            .data
+            or []
+        )
+        return {
+            "card_price_captured_at": (card_rows[0] if card_rows else {}).get("captured_at"),
+            "sealed_price_captured_at": (sealed_rows[0] if sealed_rows else {}).get("captured_at"),
+            "set_value_history_updated_at": (history_rows[0] if history_rows else {}).get("updated_at"),
+        }
+
     def _resolve_set_row(self, set_identity: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
         canonical_key = (set_identity.get("canonical_key") or "").strip()
         api_set_id = (set_identity.get("set_id") or "").strip()
@@ -0,0 +1,159 @@
+"""Per-set contribution cache for incremental Explore rankings builds.
+
+`get_rip_statistics_targets_payload` re-reads every ranked set's enrichment
+sources on every build, although between two builds on the same market day
+usually only the sets whose simulation re-ran have anything new. The two
+expensive per-set reads - the Top 10 Card Value (every canonical card price of
+every ranked set, paged) and the Rankings Top Chase (every set page payload) -
+are kept here between runs, each entry stored with the fingerprint of the
+source generations it was read from:
+
+- Top 10 Card Value: the set's Cards snapshot generation. The canonical price
+  layer is only refreshed immediately before a coordinated Cards build, so a
+  new selected price always arrives with a new Cards generation.
+- Rankings Top Chase: the target's calculation run and the set page snapshot's
+  `updated_at`.
+
+A later build reads only those stamps (two small set-wide queries), reuses
+every entry whose fingerprint still matches, and reads the sources for the
+changed sets alone. Everything cohort-relative - ranks, tiers, relative scores,
+the public contracts - is still derived from the full cohort on every build.
+
+An entry without a fingerprint is never stored or reused, and a failed source
+read is never cached, so a missing stamp or a failed read always means "read
+again". The cache is a local JSON file; deleting it forces a full read.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from backend.desirability.collector_appeal_fingerprint import fingerprint_assumptions
+
+
+logger = logging.getLogger(__name__)
+
+RANKINGS_CONTRIBUTION_CACHE_VERSION = 1
+REPO_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_RANKINGS_CONTRIBUTION_CACHE_PATH = REPO_ROOT / "backend" / ".cache" / "explore_rankings_contributions.json"
+
+TOP_10_CARD_VALUE_CONTRIBUTION = "top_10_card_value"
+RANKINGS_TOP_CHASE_CONTRIBUTION = "rankings_top_chase"
+
+
+@dataclass
+class RankingsContributionCache:
+    path: Optional[Path] = None
+    entries: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+    dirty: bool = False
+    reused: Dict[str, int] = field(default_factory=dict)
+    recomputed: Dict[str, int] = field(default_factory=dict)
+
+    def lookup(self, family: str, key: str, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        """The cached entry for `key`, or None when it must be read again."""
+        if fingerprint is None:
+            return None
+        entry = self.entries.get(family, {}).get(key)
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+            return None
+        return entry
+
+    def store(self, family: str, key: str, fingerprint: Optional[str], contribution: Any) -> None:
+        if fingerprint is None:
+            return
+        self.entries.setdefault(family, {})[key] = {"fingerprint": fingerprint, "contribution": contribution}
+        self.dirty = True
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            family: {"reused": self.reused.get(family, 0), "recomputed": self.recomputed.get(family, 0)}
+            for family in sorted(set(self.reused) | set(self.recomputed))
+        }
+
+
+def contribution_fingerprint(family: str, **sources: Any) -> Optional[str]:
+    """Hash of the stamps one contribution was read under; None if any is unknown."""
+    if any(value is None for value in sources.values()):
+        return None
+    return fingerprint_assumptions(
+        {"family": family, "version": RANKINGS_CONTRIBUTION_CACHE_VERSION, "sources": sources}
+    )
+
+
+def load_with_contribution_cache(
+    cache: RankingsContributionCache,
+    family: str,
+    fingerprints: Dict[str, Optional[str]],
+    load: Callable[[List[str]], Dict[str, Any]],
+    *,
+    load_succeeded: Callable[[], bool],
+) -> Dict[str, Any]:
+    """Reuse every still-current contribution and `load` only the rest.
+
+    `load(keys)` returns {key: contribution} for the keys it could read; a key
+    it leaves out is not cached (it is read again next build). Nothing from a
+    load that `load_succeeded()` reports failed is cached.
+    """
+    lookup: Dict[str, Any] = {}
+    changed: List[str] = []
+    for key, fingerprint in fingerprints.items():
+        entry = cache.lookup(family, key, fingerprint)
+        if entry is None:
+            changed.append(key)
+        elif entry.get("contribution") is not None:
+            lookup[key] = entry["contribution"]
+    cache.reused[family] = cache.reused.get(family, 0) + len(fingerprints) - len(changed)
+    cache.recomputed[family] = cache.recomputed.get(family, 0) + len(changed)
+    if not changed:
+        return lookup
+    loaded = load(changed)
+    if load_succeeded():
+        for key in changed:
+            if key in loaded:
+                cache.store(family, key, fingerprints[key], loaded[key])
+    lookup.update(loaded)
+    return lookup
+
+
+def load_contribution_cache(path: Path = DEFAULT_RANKINGS_CONTRIBUTION_CACHE_PATH) -> RankingsContributionCache:
+    cache = RankingsContributionCache(path=path)
+    if not path.exists():
+        return cache
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("[rankings-cache] unreadable contribution cache %s; starting empty", path, exc_info=True)
+        return cache
+    if not isinstance(data, dict) or data.get("version") != RANKINGS_CONTRIBUTION_CACHE_VERSION:
+        logger.info("[rankings-cache] contribution cache %s has another version; starting empty", path)
+        return cache
+    entries = data.get("entries")
+    if isinstance(entries, dict):
+        cache.entries = {str(family): dict(rows) for family, rows in entries.items() if isinstance(rows, dict)}
+    return cache
+
+
+def save_contribution_cache(cache: RankingsContributionCache) -> None:
+    if not cache.dirty or cache.path is None:
+        return
+    cache.path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": RANKINGS_CONTRIBUTION_CACHE_VERSION, "entries": cache.entries}
+    # Written beside the target and renamed over it, so an interrupted build
+    # never leaves a truncated cache behind.
+    staging = cache.path.with_suffix(cache.path.suffix + ".tmp")
+    staging.write_text(json.dumps(payload, sort_keys=True, default=str), encoding="utf-8", newline="\n")
+    staging.replace(cache.path)
+    logger.info("[rankings-cache] contribution cache write: %s", cache.path)
+    cache.dirty = False
+
+
+def stamp_lookup(rows: Iterable[Dict[str, Any]], key_field: str, stamp_field: str) -> Dict[str, Optional[str]]:
+    return {
+        str(row.get(key_field)): (str(row.get(stamp_field)) if row.get(stamp_field) is not None else None)
+        for row in rows
+        if row.get(key_field)
+    }
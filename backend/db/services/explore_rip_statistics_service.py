@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import json
 import logging
-import math
 import time
 from datetime import date, timedelta
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
+import numpy as np
+
 from backend.db.clients.supabase_client import public_read_client
 from backend.db.services.collector_appeal_service import get_collector_appeal_bundle
+from backend.db.services.explore_rankings_contribution_cache import (
+    RANKINGS_TOP_CHASE_CONTRIBUTION,
+    TOP_10_CARD_VALUE_CONTRIBUTION,
+    RankingsContributionCache,
+    contribution_fingerprint,
+    load_with_contribution_cache,
+    stamp_lookup,
+)
 from backend.db.services.public_read_retry import run_batch_read_with_retry
 from backend.db.services.rip_desirability_comparison import build_rip_desirability_comparison_payload
 from backend.db.services.universal_set_desirability_service import (
@@ -554,6 +563,66 @@ def _build_set_order_key(target_id: str, set_row: Dict[str, Any]) -> tuple[int,
     )
 
 
+_TIER_LABELS: Tuple[str, ...] = ("S", "A", "B", "C", "D", "F")
+# Cumulative share of the ranked population that closes each tier above F.
+_TIER_CUTOFFS: Tuple[float, ...] = (0.05, 0.15, 0.30, 0.50, 0.75)
+
+
+def _rank_score_columns(
+    target_ids: List[str], columns: Mapping[str, List[Optional[float]]]
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Rank and tier several score columns over the same targets in one pass.
+
+    Every column is ranked independently - highest score is rank 1, exact ties
+    broken on the target id, rows without a score unranked - but the sort, the
+    rank assignment and the tier buckets run over the whole (target x metric)
+    matrix at once instead of once per metric. Returns, per column, a mapping of
+    target_id to {rank, tier, cohortSize}.
+    """
+    names = list(columns)
+    count = len(target_ids)
+    if not names:
+        return {}
+    if count == 0:
+        return {name: {} for name in names}
+
+    scores = np.array(
+        [[np.nan if value is None else value for value in columns[name]] for name in names],
+        dtype=float,
+    ).T
+    valid = ~np.isnan(scores)
+    # The id tie-break as an integer key, so the sort stays numeric.
+    id_position = np.empty(count, dtype=np.int64)
+    id_position[sorted(range(count), key=target_ids.__getitem__)] = np.arange(count)
+    # Unscored rows sort after every scored row of their column.
+    sort_key = np.where(valid, -scores, np.inf)
+    order = np.lexsort((np.broadcast_to(id_position[:, None], scores.shape), sort_key, ~valid), axis=0)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, count + 1)[:, None], axis=0)
+
+    totals = valid.sum(axis=0)
+    # Same float arithmetic as ceil(total * cutoff) per metric.
+    thresholds = np.maximum(1, np.ceil(totals[None, :] * np.array(_TIER_CUTOFFS)[:, None]))
+    tier_index = (ranks[None, :, :] > thresholds[:, None, :]).sum(axis=0)
+
+    ranked: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for column, name in enumerate(names):
+        total = int(totals[column])
+        result: Dict[str, Dict[str, Any]] = {}
+        for row in order[:, column]:
+            target_id = target_ids[row]
+            if valid[row, column]:
+                result[target_id] = {
+                    "rank": int(ranks[row, column]),
+                    "tier": _TIER_LABELS[int(tier_index[row, column])],
+                    "cohortSize": total,
+                }
+            elif target_id not in result:
+                result[target_id] = {"rank": None, "tier": None, "cohortSize": total}
+        ranked[name] = result
+    return ranked
+
+
 def _calculate_score_ranks_and_tiers(
     rows: List[Dict[str, Any]], score_key: str
 ) -> Dict[str, Dict[str, Any]]:
@@ -566,57 +635,20 @@ def _calculate_score_ranks_and_tiers(
     Returns:
         Dict mapping target_id to {rank, tier} for that score
     """
-    result: Dict[str, Dict[str, Any]] = {}
-    
-    # Sort rows by score descending (highest score = rank 1)
-    scored_rows = [
-        (str(row.get("target_id")), _to_optional_float(row.get(score_key)))
-        for row in rows
-        if row.get("target_id")
-    ]
-    scored_rows_with_valid_scores = [
-        (target_id, score) for target_id, score in scored_rows if score is not None
-    ]
-    
-    if not scored_rows_with_valid_scores:
-        # All rows have null scores for this score_key
-        for target_id, _ in scored_rows:
-            result[target_id] = {"rank": None, "tier": None, "cohortSize": 0}
-        return result
-    
-    # Sort by score descending, breaking exact ties on the target id.
+    # Sorted by score descending (highest score = rank 1), breaking exact ties
+    # on the target id.
     #
     # Without the tie-break the order of equal scores was whatever order the
     # rows arrived in, so two sets on an identical score could swap ranks
     # between two runs over unchanged data - a rank that moves with no input
     # change is indistinguishable, to a reader, from a real movement. The
-    # tie-break cannot reorder any pair with different scores.
-    scored_rows_with_valid_scores.sort(key=lambda item: (-item[1], item[0]))
-    total = len(scored_rows_with_valid_scores)
-    
-    # Assign ranks and calculate rank-bucket tiers (mirrors DB view semantics)
-    for rank, (target_id, score) in enumerate(scored_rows_with_valid_scores, start=1):
-        if rank <= max(1, math.ceil(total * 0.05)):
-            tier = "S"
-        elif rank <= max(1, math.ceil(total * 0.15)):
-            tier = "A"
-        elif rank <= max(1, math.ceil(total * 0.30)):
-            tier = "B"
-        elif rank <= max(1, math.ceil(total * 0.50)):
-            tier = "C"
-        elif rank <= max(1, math.ceil(total * 0.75)):
-            tier = "D"
-        else:
-            tier = "F"
-        
-        result[target_id] = {"rank": rank, "tier": tier, "cohortSize": total}
-    
-    # Rows without scores get None
-    for target_id, _ in scored_rows:
-        if target_id not in result:
-            result[target_id] = {"rank": None, "tier": None, "cohortSize": total}
-    
-    return result
+    # tie-break cannot reorder any pair with different scores. Tiers are
+    # rank buckets (mirrors DB view semantics).
+    ranked_rows = [row for row in rows if row.get("target_id")]
+    return _rank_score_columns(
+        [str(row.get("target_id")) for row in ranked_rows],
+        {score_key: [_to_optional_float(row.get(score_key)) for row in ranked_rows]},
+    )[score_key]
 
 
 def _resolve_desirability_key(target: Mapping[str, Any]) -> Optional[str]:
@@ -1192,15 +1224,17 @@ def _attach_public_rip_contract(
 
 def _rank_within_cohort(cohort_rows: List[Dict[str, Any]], *, cohort_size: int) -> None:
     """Rank and tier every publicly-exposed metric across the fixed cohort."""
-    for extractor_name, contract_key in PUBLIC_RANKED_METRICS:
-        extractor = globals()[extractor_name]
-        scratch = [
-            {"target_id": row.get("target_id"), "_score": extractor(row)}
-            for row in cohort_rows
-        ]
-        ranked = _calculate_score_ranks_and_tiers(scratch, "_score")
+    ranked_rows = [row for row in cohort_rows if row.get("target_id")]
+    ranked = _rank_score_columns(
+        [str(row.get("target_id")) for row in ranked_rows],
+        {
+            contract_key: [_to_optional_float(globals()[extractor_name](row)) for row in ranked_rows]
+            for extractor_name, contract_key in PUBLIC_RANKED_METRICS
+        },
+    )
+    for _extractor_name, contract_key in PUBLIC_RANKED_METRICS:
         for row in cohort_rows:
-            entry = ranked.get(str(row.get("target_id"))) or {}
+            entry = ranked[contract_key].get(str(row.get("target_id"))) or {}
             _apply_rank(row, contract_key, entry, cohort_size=cohort_size)
     _attach_relative_scores(cohort_rows)
     _attach_cohort_fingerprint(cohort_rows)
@@ -1621,12 +1655,98 @@ def _load_rankings_top_chase_lookup(
     return lookup
 
 
+def _load_contribution_stamps(
+    table_name: str, columns: str, set_ids: List[str], *, stamp_field: str
+) -> Dict[str, Optional[str]]:
+    """One stamp per set, read set-wide. A failed read stamps nothing, which
+    makes every dependent contribution read again."""
+    stamps: Dict[str, Optional[str]] = {}
+    try:
+        for chunk in _chunks(sorted(set(set_ids)), _SET_VALUE_HISTORY_CHUNK_SIZE):
+            result = public_read_client.table(table_name).select(columns).in_("set_id", chunk).execute()
+            stamps.update(stamp_lookup(result.data or [], "set_id", stamp_field))
+    except Exception as exc:
+        logger.warning("[rip-statistics-targets] contribution stamp read failed table=%s: %s", table_name, exc)
+        return {}
+    return stamps
+
+
+def _load_rankings_top_chase_lookup_incremental(
+    ranked_rows: List[Dict[str, Any]],
+    contribution_cache: RankingsContributionCache,
+    *,
+    sources: Dict[str, str],
+    warnings: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    rows_by_set_id = {str(row.get("set_id")): row for row in ranked_rows if row.get("set_id")}
+    page_updated_at = _load_contribution_stamps(
+        "pokemon_set_page_snapshot_latest", "set_id,updated_at", list(rows_by_set_id), stamp_field="updated_at"
+    )
+    fingerprints = {
+        set_id: contribution_fingerprint(
+            RANKINGS_TOP_CHASE_CONTRIBUTION,
+            calculation_run_id=_to_optional_str(row.get("calculation_run_id")),
+            set_page_updated_at=page_updated_at.get(set_id),
+        )
+        for set_id, row in rows_by_set_id.items()
+    }
+    lookup = load_with_contribution_cache(
+        contribution_cache,
+        RANKINGS_TOP_CHASE_CONTRIBUTION,
+        fingerprints,
+        lambda set_ids: _load_rankings_top_chase_lookup(
+            [rows_by_set_id[set_id] for set_id in set_ids], sources=sources, warnings=warnings
+        ),
+        load_succeeded=lambda: sources.get("rankings_top_chase") in {"OK", "PARTIAL"},
+    )
+    sources.setdefault("rankings_top_chase", "CACHED")
+    return lookup
+
+
+def _load_top_10_card_value_lookup_incremental(
+    set_ids: List[str],
+    contribution_cache: RankingsContributionCache,
+    *,
+    sources: Dict[str, str],
+    warnings: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    cards_generation_ids = _load_contribution_stamps(
+        "pokemon_set_cards_snapshot_latest",
+        "set_id,generation_id:payload_json->meta->snapshot->>generationId",
+        set_ids,
+        stamp_field="generation_id",
+    )
+    fingerprints = {
+        set_id: contribution_fingerprint(
+            TOP_10_CARD_VALUE_CONTRIBUTION, cards_generation_id=cards_generation_ids.get(set_id)
+        )
+        for set_id in sorted(set(set_ids))
+    }
+    lookup = load_with_contribution_cache(
+        contribution_cache,
+        TOP_10_CARD_VALUE_CONTRIBUTION,
+        fingerprints,
+        lambda changed_ids: _load_top_10_card_value_lookup(changed_ids, sources=sources, warnings=warnings),
+        load_succeeded=lambda: sources.get("pokemon_canonical_card_market_prices_latest") == "OK",
+    )
+    sources.setdefault("pokemon_canonical_card_market_prices_latest", "CACHED")
+    return lookup
+
+
 def get_rip_statistics_targets_payload(
     limit: Any = DEFAULT_TARGETS_LIMIT,
     *,
     include_rankings_top_chase: bool = True,
+    contribution_cache: Optional[RankingsContributionCache] = None,
 ) -> Dict[str, Any]:
-    """Return available RIP targets and the best default target from persisted data."""
+    """Return available RIP targets and the best default target from persisted data.
+
+    With a `contribution_cache` (incremental mode) the Top 10 Card Value and
+    Rankings Top Chase of a set are reused from the cache while that set's
+    source stamps are unchanged, and read only for the sets that changed. The
+    cohort-relative ranks, tiers and contracts are derived from every target
+    either way.
+    """
     total_started = time.perf_counter()
     clamped_limit = _sanitize_limit(limit, default=DEFAULT_TARGETS_LIMIT, max_value=MAX_TARGETS_LIMIT)
 
@@ -1672,7 +1792,14 @@ def get_rip_statistics_targets_payload(
 
     ranked_rows = sorted(raw_rows, key=_build_rank_sort_key)
 
-    if include_rankings_top_chase:
+    if include_rankings_top_chase and contribution_cache is not None:
+        rankings_top_chase_lookup = _load_rankings_top_chase_lookup_incremental(
+            ranked_rows,
+            contribution_cache,
+            sources=sources,
+            warnings=warnings,
+        )
+    elif include_rankings_top_chase:
         rankings_top_chase_lookup = _load_rankings_top_chase_lookup(
             ranked_rows,
             sources=sources,
@@ -1767,11 +1894,19 @@ def get_rip_statistics_targets_payload(
     desirability_ms = (time.perf_counter() - desirability_started) * 1000
 
     top_10_started = time.perf_counter()
-    top_10_card_value_lookup = _load_top_10_card_value_lookup(
-        set_value_lookup_ids,
-        sources=sources,
-        warnings=warnings,
-    )
+    if contribution_cache is not None:
+        top_10_card_value_lookup = _load_top_10_card_value_lookup_incremental(
+            set_value_lookup_ids,
+            contribution_cache,
+            sources=sources,
+            warnings=warnings,
+        )
+    else:
+        top_10_card_value_lookup = _load_top_10_card_value_lookup(
+            set_value_lookup_ids,
+            sources=sources,
+            warnings=warnings,
+        )
     top_10_ms = (time.perf_counter() - top_10_started) * 1000
 
     era_ids = sorted(
@@ -2226,6 +2361,8 @@ def get_rip_statistics_targets_payload(
     )
 
     total_ms = (time.perf_counter() - total_started) * 1000
+    if contribution_cache is not None:
+        logger.info("[rip-statistics-targets] contribution cache %s", contribution_cache.stats())
     return {
         "targets": targets,
         "default_target": {
@@ -0,0 +1,477 @@
+"""Local columnar copy of `card_variant_price_observations`, one file per set and month.
+
+Market dashboards, Card Movers, Top Chase histories and the Cards movement
+baselines each re-read months of observations from PostgREST for every set
+they build. The observations only ever grow at the end, one market day at a
+time, so this store keeps them on disk instead: `sync_set` appends whatever
+arrived since the set's last synced market date, and the builders read it
+back without a network round trip.
+
+Layout under the store root::
+
+    <set_id>/manifest.json      variants, history start, synced-through date
+    <set_id>/<YYYY-MM>.npz      one month of observations as parallel arrays
+
+Each partition is a plain `.npz` of numpy arrays (no pickled objects): the
+variant, condition and source ids, the raw `captured_at` text and its UTC
+timestamp, the observation id and the price. A month is rewritten whole when
+a sync touches it, through a staging file renamed over the old one.
+
+`read` serves an observation query only when the store provably holds every
+row the network would return: every requested variant belongs to a synced
+set, the lower bound is inside the synced history and the upper bound is not
+past the synced market date. An open-ended read's upper bound is now, so only
+a store synced through today serves it. Anything else returns None and the
+caller reads the network as before, so a stale or partial store can never
+silently shorten a history. `price_observation_history_reader.local_price_history_scope`
+installs a store for the duration of a build.
+
+`daily_price_matrix` turns any `PriceObservationHistory` into the (variant x
+day) price matrix - latest capture of each day wins, carried forward - that
+the vectorized window queries (`latest_prices`, `window_deltas`) run on.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.db.services.price_observation_history_reader import (
+    DEFAULT_OBSERVATION_CHUNK_SIZE,
+    PriceObservationHistory,
+    read_price_observation_history,
+)
+
+
+logger = logging.getLogger(__name__)
+
+LOCAL_PRICE_HISTORY_STORE_VERSION = 1
+REPO_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_LOCAL_PRICE_HISTORY_ROOT = REPO_ROOT / "backend" / ".cache" / "price_history"
+DEFAULT_LOCAL_PRICE_HISTORY_DAYS = 400
+# Every column a partition carries, and so every field `read` can serve.
+LOCAL_PRICE_HISTORY_FIELDS = ("id", "card_variant_id", "condition_id", "market_price", "source", "captured_at")
+_TEXT_COLUMNS = ("card_variant_id", "condition_id", "source", "captured_at")
+
+
+def _utc_timestamp(value: Any) -> np.datetime64:
+    if value is None:
+        return np.datetime64("NaT", "us")
+    text = value.isoformat() if isinstance(value, (date, datetime)) else str(value).strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return np.datetime64("NaT", "us")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(parsed, "us")
+
+
+def _partition_rows(rows: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    ids = [row.get("id") for row in rows]
+    numeric_ids = all(isinstance(value, int) and not isinstance(value, bool) for value in ids)
+    return {
+        **{
+            name: np.array([str(row.get(name) or "") for row in rows], dtype=str)
+            for name in _TEXT_COLUMNS
+        },
+        "captured_ts": np.array([_utc_timestamp(row.get("captured_at")) for row in rows], dtype="datetime64[us]"),
+        "id": np.array(ids, dtype=np.int64) if numeric_ids else np.array([str(value) for value in ids], dtype=str),
+        "market_price": np.array(
+            [np.nan if row.get("market_price") is None else float(row["market_price"]) for row in rows],
+            dtype=np.float64,
+        ),
+    }
+
+
+def _empty_partition() -> Dict[str, np.ndarray]:
+    return _partition_rows([])
+
+
+def _concat(partitions: Iterable[Mapping[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    parts = list(partitions)
+    if not parts:
+        return _empty_partition()
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def _take(partition: Mapping[str, np.ndarray], mask: np.ndarray) -> Dict[str, np.ndarray]:
+    return {name: values[mask] for name, values in partition.items()}
+
+
+def _month_key(timestamp: np.datetime64) -> str:
+    return str(timestamp.astype("datetime64[M]"))
+
+
+def _none_if_blank(values: np.ndarray) -> np.ndarray:
+    column = values.astype(object)
+    column[values == ""] = None
+    return column
+
+
+@dataclass(frozen=True)
+class SetPriceHistoryManifest:
+    set_id: str
+    variant_ids: Tuple[str, ...]
+    # None means the set was synced with its whole history.
+    history_start: Optional[str]
+    synced_through: str
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "version": LOCAL_PRICE_HISTORY_STORE_VERSION,
+            "set_id": self.set_id,
+            "variant_ids": list(self.variant_ids),
+            "history_start": self.history_start,
+            "synced_through": self.synced_through,
+        }
+
+
+class LocalPriceHistoryStore:
+    def __init__(
+        self,
+        root: Path = DEFAULT_LOCAL_PRICE_HISTORY_ROOT,
+        *,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.root = Path(root)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._manifests: Optional[Dict[str, SetPriceHistoryManifest]] = None
+        self._partitions: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+
+    # -- manifests -----------------------------------------------------------------
+
+    def _set_dir(self, set_id: str) -> Path:
+        return self.root / set_id
+
+    def manifests(self) -> Dict[str, SetPriceHistoryManifest]:
+        with self._lock:
+            if self._manifests is None:
+                self._manifests = {}
+                for path in sorted(self.root.glob("*/manifest.json")) if self.root.exists() else []:
+                    try:
+                        data = json.loads(path.read_text(encoding="utf-8"))
+                    except (OSError, ValueError):
+                        logger.warning("[price-history-store] unreadable manifest %s; ignoring set", path)
+                        continue
+                    if data.get("version") != LOCAL_PRICE_HISTORY_STORE_VERSION:
+                        continue
+                    manifest = SetPriceHistoryManifest(
+                        set_id=str(data["set_id"]),
+                        variant_ids=tuple(str(value) for value in data.get("variant_ids") or []),
+                        history_start=data.get("history_start"),
+                        synced_through=str(data["synced_through"]),
+                    )
+                    self._manifests[manifest.set_id] = manifest
+            return dict(self._manifests)
+
+    def _write_manifest(self, manifest: SetPriceHistoryManifest) -> None:
+        path = self._set_dir(manifest.set_id) / "manifest.json"
+        staging = path.with_suffix(".json.tmp")
+        staging.write_text(json.dumps(manifest.to_json(), sort_keys=True), encoding="utf-8", newline="\n")
+        staging.replace(path)
+        with self._lock:
+            if self._manifests is not None:
+                self._manifests[manifest.set_id] = manifest
+
+    # -- partitions ----------------------------------------------------------------
+
+    def _partition_path(self, set_id: str, month: str) -> Path:
+        return self._set_dir(set_id) / f"{month}.npz"
+
+    def _load_partition(self, set_id: str, month: str) -> Dict[str, np.ndarray]:
+        key = (set_id, month)
+        with self._lock:
+            cached = self._partitions.get(key)
+        if cached is not None:
+            return cached
+        path = self._partition_path(set_id, month)
+        if not path.exists():
+            return _empty_partition()
+        with np.load(path, allow_pickle=False) as data:
+            partition = {name: data[name] for name in data.files}
+        with self._lock:
+            self._partitions[key] = partition
+        return partition
+
+    def _write_partition(self, set_id: str, month: str, partition: Mapping[str, np.ndarray]) -> None:
+        path = self._partition_path(set_id, month)
+        staging = path.with_suffix(".npz.tmp")
+        with staging.open("wb") as handle:
+            np.savez(handle, **partition)
+        staging.replace(path)
+        with self._lock:
+            self._partitions[(set_id, month)] = dict(partition)
+
+    def _months(self, set_id: str) -> List[str]:
+        return sorted(path.stem for path in self._set_dir(set_id).glob("*.npz"))
+
+    # -- sync ----------------------------------------------------------------------
+
+    def sync_set(
+        self,
+        client: Any,
+        set_id: str,
+        variant_ids: Sequence[str],
+        *,
+        through: date,
+        history_days: Optional[int] = DEFAULT_LOCAL_PRICE_HISTORY_DAYS,
+    ) -> int:
+        """Bring one set's observations up to the `through` market date.
+
+        An existing set with the same variants only re-reads from its last
+        synced day (that day may have been captured again since); a new set, a
+        changed variant list or a wider history window reads the whole window.
+        Returns the number of observations read.
+        """
+
+        variants = tuple(sorted({str(value) for value in variant_ids if value}))
+        history_start = (
+            (through - timedelta(days=max(int(history_days), 1) - 1)).isoformat() if history_days else None
+        )
+        previous = self.manifests().get(set_id)
+        incremental = (
+            previous is not None
+            and previous.variant_ids == variants
+            and (previous.history_start is None or (history_start is not None and previous.history_start <= history_start))
+            and previous.synced_through <= through.isoformat()
+        )
+        read_from = previous.synced_through if incremental else history_start
+        history = read_price_observation_history(
+            client,
+            variant_ids=variants,
+            fields=LOCAL_PRICE_HISTORY_FIELDS,
+            captured_from=read_from,
+            captured_before=(through + timedelta(days=1)).isoformat(),
+        )
+        fresh = _partition_rows(history.rows())
+        self._set_dir(set_id).mkdir(parents=True, exist_ok=True)
+
+        replace_from = _utc_timestamp(read_from) if read_from is not None else None
+        months = set(self._months(set_id)) if incremental else set()
+        months |= {_month_key(value) for value in fresh["captured_ts"] if not np.isnat(value)}
+        if replace_from is not None and incremental:
+            months = {month for month in months if month >= _month_key(replace_from)}
+        for month in sorted(months):
+            kept = self._load_partition(set_id, month) if incremental else _empty_partition()
+            if replace_from is not None and len(kept["id"]):
+                kept = _take(kept, kept["captured_ts"] < replace_from)
+            in_month = fresh["captured_ts"].astype("datetime64[M]") == np.datetime64(month, "M")
+            self._write_partition(set_id, month, _concat([kept, _take(fresh, in_month)]))
+        if not incremental:
+            for month in set(self._months(set_id)) - months:
+                self._partition_path(set_id, month).unlink()
+                with self._lock:
+                    self._partitions.pop((set_id, month), None)
+
+        self._write_manifest(
+            SetPriceHistoryManifest(
+                set_id=set_id,
+                variant_ids=variants,
+                history_start=(previous.history_start if incremental else history_start),
+                synced_through=through.isoformat(),
+            )
+        )
+        logger.info(
+            "[price-history-store] synced set_id=%s variants=%s rows=%s through=%s mode=%s",
+            set_id,
+            len(variants),
+            len(history),
+            through.isoformat(),
+            "incremental" if incremental else "full",
+        )
+        return len(history)
+
+    # -- reads ---------------------------------------------------------------------
+
+    def read(
+        self,
+        *,
+        variant_ids: Sequence[str],
+        condition_ids: Sequence[str] = (),
+        condition_by_variant: Optional[Mapping[str, str]] = None,
+        captured_from: Optional[str] = None,
+        captured_before: Optional[str] = None,
+        captured_through: Optional[str] = None,
+        positive_prices_only: bool = False,
+        fields: Sequence[str] = (),
+        chunk_size: int = DEFAULT_OBSERVATION_CHUNK_SIZE,
+    ) -> Optional[PriceObservationHistory]:
+        """The observations the network query would return, or None when the
+        store cannot prove it holds all of them."""
+
+        ordered_variant_ids = list(dict.fromkeys(str(value) for value in variant_ids if value))
+        selected_fields = tuple(dict.fromkeys(("id", "card_variant_id", *fields)))
+        if not ordered_variant_ids or any(name not in LOCAL_PRICE_HISTORY_FIELDS for name in selected_fields):
+            return None
+        set_by_variant = {
+            variant_id: manifest.set_id
+            for manifest in self.manifests().values()
+            for variant_id in manifest.variant_ids
+        }
+        set_ids = {set_by_variant.get(variant_id) for variant_id in ordered_variant_ids}
+        if None in set_ids:
+            return None
+        lower = _utc_timestamp(captured_from) if captured_from is not None else None
+        upper_exclusive = min(
+            [
+                bound
+                for bound in (
+                    _utc_timestamp(captured_before) if captured_before is not None else None,
+                    _utc_timestamp(captured_through) + np.timedelta64(1, "us") if captured_through is not None else None,
+                )
+                if bound is not None
+            ],
+            default=None,
+        )
+        # An open-ended read wants everything up to now.
+        required_until = upper_exclusive if upper_exclusive is not None else _utc_timestamp(self._clock())
+        manifests = self.manifests()
+        for set_id in set_ids:
+            manifest = manifests[set_id]
+            if manifest.history_start is not None and (lower is None or lower < _utc_timestamp(manifest.history_start)):
+                return None
+            synced_until = _utc_timestamp(manifest.synced_through) + np.timedelta64(1, "D")
+            if required_until > synced_until:
+                return None
+
+        partition = _concat(
+            self._load_partition(set_id, month)
+            for set_id in sorted(set_ids)
+            for month in self._months(set_id)
+            if (lower is None or month >= _month_key(lower))
+            and (upper_exclusive is None or month <= _month_key(upper_exclusive))
+        )
+        position_by_variant = {variant_id: index for index, variant_id in enumerate(ordered_variant_ids)}
+        variant_position = np.array(
+            [position_by_variant.get(value, -1) for value in partition["card_variant_id"].tolist()], dtype=np.int64
+        )
+        mask = variant_position >= 0
+        if condition_ids:
+            mask &= np.isin(partition["condition_id"], np.array(list(condition_ids), dtype=str))
+        if condition_by_variant is not None:
+            mask &= np.array(
+                [
+                    condition_by_variant.get(variant_id) is not None
+                    and condition_id == str(condition_by_variant[variant_id])
+                    for variant_id, condition_id in zip(
+                        partition["card_variant_id"].tolist(), partition["condition_id"].tolist()
+                    )
+                ],
+                dtype=bool,
+            )
+        if positive_prices_only:
+            mask &= partition["market_price"] > 0
+        if lower is not None:
+            mask &= partition["captured_ts"] >= lower
+        if upper_exclusive is not None:
+            mask &= partition["captured_ts"] < upper_exclusive
+        selected = _take(partition, mask)
+        variant_position = variant_position[mask]
+        # The network reader's order: variant chunks in request order, each in
+        # ascending (captured_at, id).
+        order = np.lexsort(
+            (selected["id"], selected["captured_ts"], variant_position // max(1, int(chunk_size)))
+        )
+        selected = {name: values[order] for name, values in selected.items()}
+        prices = selected["market_price"]
+        price_column = prices.astype(object)
+        price_column[np.isnan(prices)] = None
+        columns = {
+            "id": selected["id"].astype(object),
+            "card_variant_id": selected["card_variant_id"].astype(object),
+            "condition_id": _none_if_blank(selected["condition_id"]),
+            "source": _none_if_blank(selected["source"]),
+            "captured_at": _none_if_blank(selected["captured_at"]),
+            "market_price": price_column,
+        }
+        return PriceObservationHistory(
+            variant_ids=tuple(ordered_variant_ids),
+            fields=selected_fields,
+            columns={name: columns[name] for name in selected_fields},
+            arrays={
+                "variant_index": variant_position[order].astype(np.int32),
+                "day": selected["captured_ts"].astype("datetime64[D]"),
+                "price": prices,
+                "captured_at": columns["captured_at"],
+            },
+        )
+
+
+@dataclass(frozen=True)
+class DailyPriceMatrix:
+    """Prices as a (variant x day) matrix: `prices[v, d]` is the price in force
+    for `variant_ids[v]` on `days[d]` (NaN before its first observation), and
+    `observed[v, d]` is True where that day had an observation of its own."""
+
+    variant_ids: Tuple[str, ...]
+    days: np.ndarray
+    prices: np.ndarray
+    observed: np.ndarray
+
+
+def daily_price_matrix(history: PriceObservationHistory, *, start: date, end: date) -> DailyPriceMatrix:
+    """Pivot observations into the daily matrix for [start, end], inclusive.
+
+    The latest capture of a day wins; a day without an observation carries the
+    previous price forward, including prices observed before `start`.
+    """
+
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + np.timedelta64(1, "D"))
+    variant_count = len(history.variant_ids)
+    if not len(days):
+        empty = np.empty((variant_count, 0))
+        return DailyPriceMatrix(history.variant_ids, days, empty, empty.astype(bool))
+    valid = ~np.isnat(history.day) & ~np.isnan(history.price) & (history.day <= days[-1])
+    first_day = min(days[0], history.day[valid].min()) if valid.any() else days[0]
+    span = int((days[-1] - first_day).astype(int)) + 1
+    prices = np.full((variant_count, span), np.nan)
+    observed = np.zeros((variant_count, span), dtype=bool)
+
+    rows = history.variant_index[valid]
+    columns = (history.day[valid] - first_day).astype(int)
+    timestamps = np.array([_utc_timestamp(value) for value in history.captured_at[valid]], dtype="datetime64[us]")
+    # Ascending capture time, so the last write into a cell is the day's
+    # latest capture.
+    order = np.lexsort((timestamps, columns, rows))
+    prices[rows[order], columns[order]] = history.price[valid][order]
+    observed[rows, columns] = True
+
+    positions = np.where(observed, np.arange(span)[None, :], -1)
+    np.maximum.accumulate(positions, axis=1, out=positions)
+    filled = np.where(positions >= 0, np.take_along_axis(prices, np.maximum(positions, 0), axis=1), np.nan)
+    offset = span - len(days)
+    return DailyPriceMatrix(history.variant_ids, days, filled[:, offset:], observed[:, offset:])
+
+
+def latest_prices(matrix: DailyPriceMatrix) -> np.ndarray:
+    """The price in force on the matrix's last day, per variant (NaN if none)."""
+    if matrix.prices.shape[1] == 0:
+        return np.full(len(matrix.variant_ids), np.nan)
+    return matrix.prices[:, -1]
+
+
+def window_deltas(matrix: DailyPriceMatrix, window_days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(amount, percent) change from `window_days` before the last day to the
+    last day, per variant. NaN where either end has no price or the start
+    price is zero."""
+
+    day_count = matrix.prices.shape[1]
+    if day_count == 0:
+        empty = np.full(len(matrix.variant_ids), np.nan)
+        return empty, empty.copy()
+    start_index = max(day_count - 1 - int(window_days), 0)
+    start = matrix.prices[:, start_index]
+    end = matrix.prices[:, -1]
+    amount = end - start
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent = np.where(start > 0, amount / start * 100.0, np.nan)
+    return amount, percent
@@ -15,7 +15,7 @@ separate and is intended for Market Movers eligibility.
 """
 
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 WINDOW_CONVENTION = "inclusive_calendar_dates_v1"
@@ -65,30 +65,41 @@ def _number(value: Any) -> Optional[float]:
     return parsed if parsed > 0 else None
 
 
+def usable_observation(observation: Dict[str, Any], index: int) -> Optional[Tuple[str, float, Tuple[str, int]]]:
+    """(UTC source date, positive price, same-date sort key) of one observation,
+    or None when it has no date or no usable price. Of several observations on
+    one date, the one with the greatest sort key is that date's value."""
+    source_date = utc_date_key(
+        observation.get("captured_at")
+        or observation.get("capturedAt")
+        or observation.get("source_date")
+        or observation.get("sourceDate")
+        or observation.get("date")
+    )
+    price = _number(
+        observation.get("market_price")
+        if "market_price" in observation
+        else observation.get("marketPrice", observation.get("price"))
+    )
+    if not source_date or price is None:
+        return None
+    timestamp = _text(observation.get("captured_at") or observation.get("capturedAt")) or source_date
+    return source_date, price, (timestamp, index)
+
+
 def _observation_rows(observations: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Collapse observations to the latest usable value on each UTC date."""
     by_date: Dict[str, Dict[str, Any]] = {}
     for index, observation in enumerate(observations or []):
-        source_date = utc_date_key(
-            observation.get("captured_at")
-            or observation.get("capturedAt")
-            or observation.get("source_date")
-            or observation.get("sourceDate")
-            or observation.get("date")
-        )
-        price = _number(
-            observation.get("market_price")
-            if "market_price" in observation
-            else observation.get("marketPrice", observation.get("price"))
-        )
-        if not source_date or price is None:
+        usable = usable_observation(observation, index)
+        if usable is None:
             continue
-        timestamp = _text(observation.get("captured_at") or observation.get("capturedAt")) or source_date
+        source_date, price, sort_key = usable
         candidate = {
             **observation,
             "market_price": price,
             "source_date": source_date,
-            "_sort": (timestamp, index),
+            "_sort": sort_key,
         }
         existing = by_date.get(source_date)
         if existing is None or candidate["_sort"] >= existing["_sort"]:
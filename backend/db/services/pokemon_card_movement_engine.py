@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+"""Set-wide, array-based evaluation of the public card market-delta contract.
+
+`calculate_pokemon_card_market_delta` is evaluated card by card: every call
+re-collapses that card's observations to one value per UTC date and scans
+them for the window's baseline, and a Market Movers build repeats that for
+every card of the set in every window.
+
+Here a set's observations are collapsed once into a (variant x UTC day)
+matrix ending on the shared latest market date (`build_card_movement_matrix`),
+with the index of the last observed day at or before every day and of the
+next observed day at or after it. A window is then a handful of array lookups
+over every card at once (`calculate_card_market_deltas`): the end point, the
+baseline on or before the target start date (or the earliest point inside a
+partial window), coverage, the history-span bounds and the guardrails. The
+per-card delta dicts are built only at the end and are identical to what
+`calculate_pokemon_card_market_delta` returns for the same inputs; the
+same-date collapse and every threshold come from that module.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.db.services.pokemon_card_market_delta_contract import (
+    MAX_ABSOLUTE_PERCENT,
+    MAX_HISTORY_SPAN_DAYS,
+    MIN_ABSOLUTE_CHANGE,
+    MIN_CURRENT_PRICE,
+    MIN_HISTORY_SPAN_DAYS,
+    WINDOW_CONVENTION,
+    _number,
+    _text,
+    usable_observation,
+    utc_date_key,
+)
+
+
+@dataclass(frozen=True)
+class CardMovementMatrix:
+    """One value per variant and UTC day, `days[0]` .. `end_date` inclusive.
+
+    `prices[v, d]` is the collapsed observation of that day (NaN when none).
+    `last_observed[v, d]` is the latest observed day index <= d (-1 when none)
+    and `next_observed[v, d]` the earliest one >= d (len(days) when none).
+    A final all-empty row stands for variants without any observation.
+    """
+
+    end_date: str
+    days: np.ndarray
+    row_by_variant: Mapping[str, int]
+    prices: np.ndarray
+    sources: np.ndarray
+    last_observed: np.ndarray
+    next_observed: np.ndarray
+    history_point_count: np.ndarray
+
+    def row(self, variant_id: Optional[str]) -> int:
+        return self.row_by_variant.get(variant_id or "", self.prices.shape[0] - 1)
+
+
+def build_card_movement_matrix(
+    observations_by_variant: Mapping[str, Sequence[Dict[str, Any]]],
+    *,
+    latest_market_date: Any,
+) -> CardMovementMatrix:
+    end_date = utc_date_key(latest_market_date)
+    if not end_date:
+        raise ValueError("latest_market_date is required for the card movement matrix")
+
+    variant_ids = sorted(str(variant_id) for variant_id in observations_by_variant)
+    chosen: Dict[Tuple[int, str], Tuple[Tuple[str, int], float, Dict[str, Any]]] = {}
+    for row_index, variant_id in enumerate(variant_ids):
+        for index, observation in enumerate(observations_by_variant.get(variant_id) or []):
+            usable = usable_observation(observation, index)
+            if usable is None or usable[0] > end_date:
+                continue
+            source_date, price, sort_key = usable
+            existing = chosen.get((row_index, source_date))
+            if existing is None or sort_key >= existing[0]:
+                chosen[(row_index, source_date)] = (sort_key, price, observation)
+
+    last_day = np.datetime64(end_date, "D")
+    cell_days = np.array([source_date for _row, source_date in chosen], dtype="datetime64[D]")
+    first_day = min(last_day, cell_days.min()) if len(cell_days) else last_day
+    day_count = int((last_day - first_day).astype(int)) + 1
+    row_count = len(variant_ids) + 1
+
+    prices = np.full((row_count, day_count), np.nan)
+    sources = np.full((row_count, day_count), None, dtype=object)
+    if chosen:
+        cell_rows = np.array([row_index for row_index, _date in chosen], dtype=np.int64)
+        cell_columns = (cell_days - first_day).astype(np.int64)
+        prices[cell_rows, cell_columns] = [price for _sort, price, _row in chosen.values()]
+        sources[cell_rows, cell_columns] = [row.get("source") for _sort, _price, row in chosen.values()]
+    observed = ~np.isnan(prices)
+    positions = np.arange(day_count)
+    last_observed = np.maximum.accumulate(np.where(observed, positions, -1), axis=1)
+    next_observed = np.minimum.accumulate(np.where(observed, positions, day_count)[:, ::-1], axis=1)[:, ::-1]
+
+    return CardMovementMatrix(
+        end_date=end_date,
+        days=np.arange(first_day, last_day + np.timedelta64(1, "D")),
+        row_by_variant={variant_id: row_index for row_index, variant_id in enumerate(variant_ids)},
+        prices=prices,
+        sources=sources,
+        last_observed=last_observed,
+        next_observed=next_observed,
+        history_point_count=observed.sum(axis=1),
+    )
+
+
+def _lookup(table: np.ndarray, rows: np.ndarray, columns: np.ndarray, fallback: float) -> np.ndarray:
+    """table[rows, columns] where 0 <= column < width, else `fallback`."""
+    width = table.shape[1]
+    inside = (columns >= 0) & (columns < width)
+    return np.where(inside, table[rows, np.clip(columns, 0, width - 1)], fallback)
+
+
+def _round_each(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    # Python's round, element by element: the public amounts must match the
+    # scalar contract to the cent, and numpy's rounding differs on ties.
+    return np.array(
+        [round(float(value), 2) if keep else np.nan for value, keep in zip(values.tolist(), mask.tolist())],
+        dtype=np.float64,
+    )
+
+
+def calculate_card_market_deltas(
+    matrix: CardMovementMatrix,
+    selections: Sequence[Mapping[str, Any]],
+    *,
+    requested_window_days: int,
+) -> List[Dict[str, Any]]:
+    """The contract delta of every selection for one window, in input order.
+
+    Each selection carries the `calculate_pokemon_card_market_delta` inputs:
+    `variant_id`, `condition_id`, `current_price`, `current_source_date` and
+    `current_source`.
+    """
+
+    window_days = max(1, int(requested_window_days))
+    card_count = len(selections)
+    last_column = matrix.prices.shape[1] - 1
+    rows = np.array([matrix.row(_text(selection.get("variant_id"))) for selection in selections], dtype=np.int64)
+    selected_price = np.array(
+        [_number(selection.get("current_price")) or np.nan for selection in selections], dtype=np.float64
+    )
+    selected = ~np.isnan(selected_price)
+
+    # The selected price is the endpoint on the market date; without one the
+    # last observation on or before it is.
+    end = np.where(selected, last_column, matrix.last_observed[rows, last_column])
+    has_end = end >= 0
+    current_price = np.where(selected, selected_price, _lookup(matrix.prices, rows, end, np.nan))
+
+    if window_days == 1:
+        baseline = _lookup(matrix.last_observed, rows, end - 1, -1)
+        full_window = has_end & (baseline >= 0)
+        start = np.where(full_window, baseline, -1)
+        target = start
+    else:
+        target = end - (window_days - 1)
+        on_or_before = _lookup(matrix.last_observed, rows, target, -1)
+        inside = _lookup(matrix.next_observed, rows, np.maximum(target + 1, 0), last_column + 1)
+        full_window = has_end & (on_or_before >= 0)
+        start = np.where(
+            ~has_end, -1, np.where(full_window, on_or_before, np.where(inside < end, inside, -1))
+        )
+    has_start = start >= 0
+    has_target = has_end & (has_start if window_days == 1 else True)
+    start_price = _lookup(matrix.prices, rows, start, np.nan)
+    coverage_days = np.where(has_start & has_end, end - start, -1)
+
+    has_usable_pair = has_start & has_end & (start < end)
+    is_partial_window = has_usable_pair & ~full_window
+    min_span = MIN_HISTORY_SPAN_DAYS.get(window_days, max(1, window_days // 2))
+    max_span = MAX_HISTORY_SPAN_DAYS.get(window_days, window_days + 15)
+    enough_history = has_usable_pair & full_window & (coverage_days >= min_span) & (coverage_days <= max_span)
+    change_amount = _round_each(current_price - start_price, has_usable_pair)
+    change_percent = _round_each(
+        np.divide(change_amount, start_price, out=np.zeros(card_count), where=has_usable_pair) * 100,
+        has_usable_pair,
+    )
+    with np.errstate(invalid="ignore"):
+        reliable = (
+            enough_history
+            & (current_price >= MIN_CURRENT_PRICE)
+            & (np.abs(change_amount) >= MIN_ABSOLUTE_CHANGE)
+            & (np.abs(change_percent) <= MAX_ABSOLUTE_PERCENT)
+        )
+    reliability = np.select(
+        [reliable, is_partial_window, ~has_usable_pair, ~enough_history],
+        ["reliable", "partial_window", "unavailable", "insufficient_history"],
+        default="guardrailed",
+    )
+
+    first_day = matrix.days[0]
+    end_keys = np.datetime_as_string(first_day + np.maximum(end, 0))
+    start_keys = np.datetime_as_string(first_day + np.maximum(start, 0))
+    target_keys = np.datetime_as_string(first_day + np.where(has_end, target, 0))
+
+    deltas: List[Dict[str, Any]] = []
+    for position, selection in enumerate(selections):
+        row = rows[position]
+        end_date = str(end_keys[position]) if has_end[position] else matrix.end_date
+        if not has_end[position]:
+            end_source_date = None
+            source = None
+        elif selected[position]:
+            end_source_date = utc_date_key(selection.get("current_source_date")) or end_date
+            source = _text(selection.get("current_source"))
+        else:
+            end_source_date = end_date
+            source = _text(matrix.sources[row, end[position]])
+        start_date = str(start_keys[position]) if has_start[position] else None
+        target_start_date = str(target_keys[position]) if has_target[position] else None
+        usable = bool(has_usable_pair[position])
+        deltas.append(
+            {
+                "window": f"{window_days}D",
+                "windowDays": window_days,
+                "windowConvention": WINDOW_CONVENTION,
+                "targetStartDate": target_start_date,
+                "startDate": start_date,
+                "endDate": end_date,
+                "startingPrice": round(float(start_price[position]), 2) if has_start[position] else None,
+                "currentPrice": round(float(current_price[position]), 2) if has_end[position] else None,
+                "changeAmount": float(change_amount[position]) if usable else None,
+                "changePercent": float(change_percent[position]) if usable else None,
+                "fullWindowCoverage": bool(full_window[position]),
+                "isPartialWindow": bool(is_partial_window[position]),
+                "windowCoverageDays": int(coverage_days[position]) if has_start[position] and has_end[position] else None,
+                "requestedWindowDays": window_days,
+                "enoughHistory": bool(enough_history[position]),
+                "reliable": bool(reliable[position]),
+                "reliability": str(reliability[position]),
+                "startSourceDate": start_date,
+                "endSourceDate": end_source_date,
+                "cardVariantId": _text(selection.get("variant_id")),
+                "conditionId": _text(selection.get("condition_id")),
+                "historyPointCount": int(matrix.history_point_count[row]),
+                "startCarriedForward": bool(start_date and target_start_date and start_date < target_start_date),
+                "endCarriedForward": bool(end_source_date and end_date and end_source_date < end_date),
+                "source": source,
+            }
+        )
+    return deltas
@@ -5,10 +5,12 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any, Iterable, Mapping, Sequence
 
+import numpy as np
+
 from backend.desirability.public_analytics_policy import is_public_analytics_eligible
 from backend.domain.pokemon.market_index import (
-    CHASE_INDEX_KEY, INDEX_KEYS, MARKET_INDEX_CONTRACT_VERSION, MARKET_INDEX_METHODOLOGY_VERSION,
-    RAW_INDEX_KEY, build_chain_linked_history, compute_strict_window_movements, deterministic_fingerprint,
+    CHASE_INDEX_KEY, INDEX_KEYS, MARKET_INDEX_BASE_VALUE, MARKET_INDEX_CONTRACT_VERSION, MARKET_INDEX_METHODOLOGY_VERSION,
+    RAW_INDEX_KEY, MarketIndexError, compute_strict_window_movements, deterministic_fingerprint,
 )
 
 TABLE = "pokemon_market_index_daily_history"
@@ -45,13 +47,13 @@ def _paged_source_rows(client: Any, set_ids: Sequence[str]) -> list[dict[str, An
         offset += PAGE_SIZE
 
 
-def build_index_rows(sets: Sequence[Mapping[str, Any]], source_rows: Iterable[Mapping[str, Any]], *, through_date: str | None = None, accepted_dates: Iterable[str] | None = None) -> list[dict[str, Any]]:
-    # BLOCKER 1: quality filtering happens HERE, before any observation is
-    # assembled and therefore before build_chain_linked_history runs. A
-    # DEGRADED date must contribute zero mathematical influence to later
-    # dates; filtering persisted output afterwards would still have chained
-    # Aug 19's daily return off Aug 18.
-    accepted = None if accepted_dates is None else {str(day)[:10] for day in accepted_dates}
+def _scope_arrays(source_rows: Iterable[Mapping[str, Any]], set_ids: Sequence[str], *, through_date: str | None, accepted: set[str] | None):
+    """Source rows pivoted to one (date x set) value, count and row array per scope.
+
+    The last row of a (scope, date, set) wins, as it always has; a date is
+    kept when any scope row survives the quality and through-date filters.
+    """
+    column = {set_id: position for position, set_id in enumerate(set_ids)}
     by_scope_date_set: dict[tuple[str, str, str], Mapping[str, Any]] = {}
     all_dates: set[str] = set()
     for row in source_rows:
@@ -61,40 +63,86 @@ def build_index_rows(sets: Sequence[Mapping[str, Any]], source_rows: Iterable[Ma
         if scope in ("standard", "top10") and (through_date is None or day <= through_date):
             by_scope_date_set[(scope, day, set_id)] = row
             all_dates.add(day)
+    dates = sorted(all_dates)
+    row_of_date = {day: position for position, day in enumerate(dates)}
+    arrays = {scope: (np.zeros((len(dates), len(set_ids))), np.zeros((len(dates), len(set_ids)), dtype=np.int64),
+                      np.full((len(dates), len(set_ids)), None, dtype=object)) for scope in ("standard", "top10")}
+    for (scope, day, set_id), row in by_scope_date_set.items():
+        if set_id not in column:
+            continue
+        values, counts, sources = arrays[scope]
+        cell = (row_of_date[day], column[set_id])
+        values[cell] = float(row.get("set_value") or 0)
+        counts[cell] = int(row.get("priced_card_count") or 0)
+        sources[cell] = row
+    return dates, arrays
+
+
+def build_index_rows(sets: Sequence[Mapping[str, Any]], source_rows: Iterable[Mapping[str, Any]], *, through_date: str | None = None, accepted_dates: Iterable[str] | None = None) -> list[dict[str, Any]]:
+    """Both index families for every date at once, on (date x set) arrays.
+
+    Equivalent to assembling one complete-cohort observation per date and
+    chaining them with `build_chain_linked_history`: a date is an observation
+    when every released set has a positive value and count in the scope; its
+    basket is the cohort sum, its return the common-cohort ratio to the
+    previous observation, and the index the running product of those returns.
+    The sums add in the same order as the per-date loop did, so the values
+    are bit-for-bit the same.
+    """
+    # BLOCKER 1: quality filtering happens HERE, before any observation is
+    # assembled and therefore before the chain-link math runs. A DEGRADED
+    # date must contribute zero mathematical influence to later dates;
+    # filtering persisted output afterwards would still have chained Aug 19's
+    # daily return off Aug 18.
+    accepted = None if accepted_dates is None else {str(day)[:10] for day in accepted_dates}
+    set_ids = [str(row["id"]) for row in sets]
+    if len(set(set_ids)) != len(set_ids):
+        raise MarketIndexError("constituents require unique set ids and finite positive values")
+    dates, arrays = _scope_arrays(source_rows, set_ids, through_date=through_date, accepted=accepted)
+    release = np.array([str(row.get("release_date") or "")[:10] for row in sets], dtype="U10")
+    active = (release[None, :] == "") | (release[None, :] <= np.array(dates, dtype="U10")[:, None])
+    # The common cohort is summed in set id order, the basket in `sets` order.
+    by_id = np.argsort(np.array(set_ids, dtype=str), kind="stable").tolist()
     built: list[dict[str, Any]] = []
     for index_key in INDEX_KEYS:
-        scope = "standard" if index_key == RAW_INDEX_KEY else "top10"
-        observations = []
-        for day in sorted(all_dates):
-            active = [row for row in sets if not row.get("release_date") or str(row["release_date"])[:10] <= day]
-            if not active:
-                continue
+        values, counts, sources = arrays["standard" if index_key == RAW_INDEX_KEY else "top10"]
+        present = (values > 0) & (counts > 0)
+        complete = active.any(axis=1) & (present | ~active).all(axis=1)
+        positions = np.flatnonzero(complete).tolist()
+        if not positions:
+            continue
+        members = active[positions]
+        cohort_values = np.where(members, values[positions], 0.0)
+        if not np.isfinite(cohort_values).all():
+            raise MarketIndexError("constituents require unique set ids and finite positive values")
+        baskets = np.cumsum(cohort_values, axis=1)[:, -1]
+        common = members[1:] & members[:-1]
+        if not common.any(axis=1).all():
+            gap = int(np.flatnonzero(~common.any(axis=1))[0])
+            raise MarketIndexError(f"{dates[positions[gap + 1]]} has no common cohort with {dates[positions[gap]]}")
+        previous_common = np.cumsum(np.where(common, cohort_values[:-1], 0.0)[:, by_id], axis=1)[:, -1]
+        current_common = np.cumsum(np.where(common, cohort_values[1:], 0.0)[:, by_id], axis=1)[:, -1]
+        returns = current_common / previous_common - 1.0
+        levels = np.cumprod(np.concatenate(([MARKET_INDEX_BASE_VALUE], 1.0 + returns)))
+        for step, position in enumerate(positions):
+            day = dates[position]
             constituents = []
-            complete = True
-            for pokemon_set in active:
-                source = by_scope_date_set.get((scope, day, str(pokemon_set["id"])))
-                value = float(source.get("set_value") or 0) if source else 0
-                count = int(source.get("priced_card_count") or 0) if source else 0
-                if not source or value <= 0 or count <= 0:
-                    complete = False
-                    break
-                constituents.append({"setId": str(pokemon_set["id"]), "canonicalKey": pokemon_set.get("canonical_key"),
-                    "setValue": value, "includedCardCount": count, "sourceSnapshotDate": day,
-                    "source": source.get("source"), "sourceUpdatedAt": source.get("updated_at")})
-            if complete:
-                observations.append({"marketDate": day, "indexKey": index_key, "constituents": constituents})
-        history = build_chain_linked_history(observations)
-        for row in history:
-            constituents = row["constituents"]
+            for column in (column for column in by_id if members[step, column]):
+                pokemon_set, source = sets[column], sources[position, column]
+                constituents.append({"setId": set_ids[column], "canonicalKey": pokemon_set.get("canonical_key"),
+                    "setValue": float(values[position, column]), "includedCardCount": int(counts[position, column]),
+                    "sourceSnapshotDate": day, "source": source.get("source"), "sourceUpdatedAt": source.get("updated_at")})
             cohort_fp = deterministic_fingerprint([item["setId"] for item in constituents])
             source_fp = deterministic_fingerprint([{key: item.get(key) for key in ("setId", "setValue", "includedCardCount", "sourceSnapshotDate", "source", "sourceUpdatedAt")} for item in constituents])
-            built.append({"tcg": "pokemon", "index_key": index_key, "market_date": row["marketDate"],
+            built.append({"tcg": "pokemon", "index_key": index_key, "market_date": day,
                 "contract_version": MARKET_INDEX_CONTRACT_VERSION, "methodology_version": MARKET_INDEX_METHODOLOGY_VERSION,
-                "basket_value": row["basketValue"], "normalized_index_value": row["normalizedIndexValue"],
-                "daily_return": row["dailyReturn"], "previous_market_date": row["previousMarketDate"],
+                "basket_value": float(baskets[step]), "normalized_index_value": float(levels[step]),
+                "daily_return": float(returns[step - 1]) if step else None,
+                "previous_market_date": dates[positions[step - 1]] if step else None,
                 "set_count": len(constituents), "card_count": sum(int(item["includedCardCount"]) for item in constituents),
                 "cohort_fingerprint": cohort_fp, "source_generation_fingerprint": source_fp,
-                "constituents_json": constituents, "diagnostics_json": {"commonSetIds": row["commonSetIds"]}})
+                "constituents_json": constituents,
+                "diagnostics_json": {"commonSetIds": [set_ids[column] for column in by_id if step and common[step - 1, column]]}})
     return sorted(built, key=lambda row: (row["market_date"], row["index_key"]))
 
 
@@ -0,0 +1,335 @@
+"""Non-blocking readers for the set-page fan-out routes.
+
+A set page requests shell, page, overview and the cards page together. As
+sync routes each of those holds a threadpool worker for the whole PostgREST
+wait, so one page view pins several threads while doing no work. These twins
+await the same queries on the async public read client instead, and issue the
+reads that do not depend on each other concurrently.
+
+They deliberately share the query builders and payload assembly of
+pokemon_public_snapshot_service: the sync readers remain the ones used by the
+snapshot builders and scripts, and both paths must serve byte-identical
+payloads for the same row.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from backend.db.clients.supabase_client import get_async_public_read_client
+from backend.db.services.explore_page_service import ExplorePageError
+from backend.db.services.pokemon_public_snapshot_service import (
+    DEFAULT_CARDS_PAGE_SIZE,
+    DEFAULT_DASHBOARD_WINDOW,
+    _build_cards_page_payload,
+    _build_missing_set_page_snapshot_payload,
+    _build_missing_shell_snapshot_payload,
+    _cards_page_snapshot_query,
+    _finish_overview_snapshot_payload,
+    _finish_shell_snapshot_payload,
+    _first_row,
+    _log_cards_page_snapshot_read_failure,
+    _log_missing_set_page_snapshot,
+    _log_missing_shell_snapshot,
+    _log_overview_snapshot_read_failure,
+    _log_peer_movement_snapshot_meta_failure,
+    _log_shell_set_value_history_failure,
+    _looks_like_uuid,
+    _movement_generation_from_peer_metas,
+    _movement_snapshot_meta,
+    _normalize_market_dashboard_window_key,
+    _overview_snapshot_query,
+    _peer_movement_snapshot_meta_query,
+    _raise_set_page_snapshot_read_failed,
+    _raise_shell_snapshot_read_failed,
+    _sanitize_cards_page_params,
+    _set_page_payload_from_result,
+    _set_page_snapshot_query,
+    _shell_set_value_history_from_rows,
+    _shell_set_value_history_query,
+    _shell_snapshot_query,
+    _to_optional_str,
+)
+from backend.db.services.pokemon_set_cards_service import PokemonSetCardsError
+from backend.db.services.pokemon_set_market_service import (
+    PokemonSetMarketError,
+    resolve_pokemon_set_identifier_async,
+)
+from backend.db.services.public_read_coalescing import coalescing_key, run_coalesced_read_async
+
+logger = logging.getLogger(__name__)
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+async def _resolve_set_id(resolved: str, client: Any) -> tuple[str, Optional[Dict[str, Any]], Optional[float]]:
+    """UUIDs skip the lookup entirely, exactly like the sync readers."""
+    if _looks_like_uuid(resolved):
+        return resolved, None, None
+    t_resolve = time.perf_counter()
+    set_row = await resolve_pokemon_set_identifier_async(resolved, client=client)
+    return str(set_row["id"]), set_row, _elapsed_ms(t_resolve)
+
+
+async def _lazy_set_row(resolved_set_id: str, client: Any) -> Dict[str, Any]:
+    try:
+        return await resolve_pokemon_set_identifier_async(resolved_set_id, client=client)
+    except Exception:
+        return {"id": resolved_set_id}
+
+
+async def get_pokemon_set_page_snapshot_payload_async(set_id: str) -> Dict[str, Any]:
+    """Async twin of get_pokemon_set_page_snapshot_payload."""
+    started = time.perf_counter()
+    resolved = _to_optional_str(set_id)
+    if not resolved:
+        raise ExplorePageError(400, "set_id is required", "POKEMON_SET_PAGE_ID_REQUIRED")
+    client = get_async_public_read_client()
+    resolved_set_id, set_row, set_resolve_ms = await _resolve_set_id(resolved, client)
+    return await run_coalesced_read_async(
+        coalescing_key("set_page", resolved_set_id),
+        lambda: _read_set_page_snapshot(client, resolved_set_id, set_row, set_resolve_ms, started),
+    )
+
+
+async def _read_set_page_snapshot(
+    client: Any,
+    resolved_set_id: str,
+    set_row: Optional[Dict[str, Any]],
+    set_resolve_ms: Optional[float],
+    started: float,
+) -> Dict[str, Any]:
+    try:
+        t_query = time.perf_counter()
+        result = await _set_page_snapshot_query(client, resolved_set_id).execute()
+        payload = _set_page_payload_from_result(
+            result,
+            resolved_set_id=resolved_set_id,
+            started=started,
+            set_resolve_ms=set_resolve_ms,
+            query_ms=_elapsed_ms(t_query),
+        )
+        if payload is not None:
+            return payload
+    except Exception as exc:
+        _raise_set_page_snapshot_read_failed(exc, resolved_set_id=resolved_set_id, started=started)
+
+    elapsed_ms = _log_missing_set_page_snapshot(resolved_set_id, started)
+    if set_row is None:
+        set_row = await _lazy_set_row(resolved_set_id, client)
+    return _build_missing_set_page_snapshot_payload(set_row, elapsed_ms)
+
+
+async def get_pokemon_set_shell_snapshot_payload_async(set_id: str) -> Dict[str, Any]:
+    """Async twin of get_pokemon_set_shell_snapshot_payload.
+
+    The shell row and the title-card set value history live in different
+    tables keyed by the same set id, so both are read at once. The history is
+    discarded when the shell row turns out to be missing.
+    """
+    started = time.perf_counter()
+    resolved = _to_optional_str(set_id)
+    if not resolved:
+        raise ExplorePageError(400, "set_id is required", "POKEMON_SET_SHELL_ID_REQUIRED")
+    client = get_async_public_read_client()
+    resolved_set_id, set_row, set_resolve_ms = await _resolve_set_id(resolved, client)
+    return await run_coalesced_read_async(
+        coalescing_key("set_shell", resolved_set_id),
+        lambda: _read_set_shell_snapshot(client, resolved_set_id, set_row, set_resolve_ms, started),
+    )
+
+
+async def _read_set_shell_snapshot(
+    client: Any,
+    resolved_set_id: str,
+    set_row: Optional[Dict[str, Any]],
+    set_resolve_ms: Optional[float],
+    started: float,
+) -> Dict[str, Any]:
+    t_query = time.perf_counter()
+    shell_result, history_result = await asyncio.gather(
+        _shell_snapshot_query(client, resolved_set_id).execute(),
+        _shell_set_value_history_query(client, resolved_set_id).execute(),
+        return_exceptions=True,
+    )
+    query_ms = _elapsed_ms(t_query)
+    if isinstance(shell_result, Exception):
+        _raise_shell_snapshot_read_failed(shell_result, resolved_set_id=resolved_set_id, started=started)
+    row = _first_row(shell_result)
+
+    if row:
+        if isinstance(history_result, Exception):
+            _log_shell_set_value_history_failure(history_result, resolved_set_id)
+            set_value_histories_by_scope: Dict[str, Any] = {}
+        else:
+            set_value_histories_by_scope = _shell_set_value_history_from_rows(history_result.data or [])
+        return _finish_shell_snapshot_payload(
+            row,
+            set_value_histories_by_scope=set_value_histories_by_scope,
+            resolved_set_id=resolved_set_id,
+            started=started,
+            set_resolve_ms=set_resolve_ms,
+            query_ms=query_ms,
+            # Read concurrently with the shell row, so it shares its wall time.
+            set_value_ms=query_ms,
+        )
+
+    elapsed_ms = _log_missing_shell_snapshot(resolved_set_id, started)
+    if set_row is None:
+        set_row = await _lazy_set_row(resolved_set_id, client)
+    return _build_missing_shell_snapshot_payload(set_row, elapsed_ms)
+
+
+async def get_pokemon_set_overview_snapshot_payload_async(
+    set_id: str,
+    window: str = DEFAULT_DASHBOARD_WINDOW,
+) -> Dict[str, Any]:
+    """Async twin of get_pokemon_set_overview_snapshot_payload."""
+    started = time.perf_counter()
+    resolved = _to_optional_str(set_id)
+    if not resolved:
+        raise PokemonSetMarketError(400, "set_id is required", "POKEMON_SET_MARKET_ID_REQUIRED")
+    resolved_window = _normalize_market_dashboard_window_key(window)
+    client = get_async_public_read_client()
+    resolved_set_id, set_row, _set_resolve_ms = await _resolve_set_id(resolved, client)
+    return await run_coalesced_read_async(
+        coalescing_key("set_overview", resolved_set_id, (resolved_window,)),
+        lambda: _read_set_overview_snapshot(client, resolved_set_id, set_row, resolved_window, started),
+    )
+
+
+async def _read_set_overview_snapshot(
+    client: Any,
+    resolved_set_id: str,
+    set_row: Optional[Dict[str, Any]],
+    resolved_window: str,
+    started: float,
+) -> Dict[str, Any]:
+    t_query = time.perf_counter()
+    row: Optional[Dict[str, Any]] = None
+    try:
+        row = _first_row(await _overview_snapshot_query(client, resolved_set_id, resolved_window).execute())
+    except Exception as exc:
+        _log_overview_snapshot_read_failure(exc, resolved_set_id, resolved_window)
+        row = None
+    return _finish_overview_snapshot_payload(
+        row,
+        set_row=set_row,
+        resolved_set_id=resolved_set_id,
+        resolved_window=resolved_window,
+        query_ms=_elapsed_ms(t_query),
+        started=started,
+    )
+
+
+async def get_pokemon_set_cards_page_snapshot_payload_async(
+    set_id: str,
+    page: Any = 1,
+    page_size: Any = DEFAULT_CARDS_PAGE_SIZE,
+    sort: Any = "set-number",
+    query: Any = None,
+    rarity: Any = None,
+    movement_filter: Any = None,
+    movement_sort: Any = None,
+    sort_direction: Any = None,
+    section: Any = None,
+    movement_metric: Any = None,
+) -> Dict[str, Any]:
+    """Async twin of get_pokemon_set_cards_page_snapshot_payload.
+
+    The cards row and the market-dashboard movement generation metadata are
+    read together. Only when the cards row read itself FAILED is the cards
+    peer metadata read afterwards, matching the sync reader, which re-reads it
+    whenever the row is unknown.
+    """
+    started = time.perf_counter()
+    resolved = _to_optional_str(set_id)
+    if not resolved:
+        raise PokemonSetCardsError(400, "set_id is required", "POKEMON_SET_CARDS_ID_REQUIRED")
+    client = get_async_public_read_client()
+    resolved_set_id, set_row, _set_resolve_ms = await _resolve_set_id(resolved, client)
+
+    params = _sanitize_cards_page_params(
+        page=page,
+        page_size=page_size,
+        sort=sort,
+        query=query,
+        rarity=rarity,
+        movement_filter=movement_filter,
+        movement_sort=movement_sort,
+        sort_direction=sort_direction,
+        section=section,
+        movement_metric=movement_metric,
+    )
+    return await run_coalesced_read_async(
+        coalescing_key("set_cards_page", resolved_set_id, tuple(sorted(params.items()))),
+        lambda: _read_set_cards_page_snapshot(client, resolved_set_id, set_row, params, started),
+    )
+
+
+async def _read_set_cards_page_snapshot(
+    client: Any,
+    resolved_set_id: str,
+    set_row: Optional[Dict[str, Any]],
+    params: Dict[str, Any],
+    started: float,
+) -> Dict[str, Any]:
+    t_query = time.perf_counter()
+    cards_result, dashboard_result = await asyncio.gather(
+        _cards_page_snapshot_query(client, resolved_set_id).execute(),
+        _peer_movement_snapshot_meta_query(client, resolved_set_id, surface="dashboard").execute(),
+        return_exceptions=True,
+    )
+    query_ms = _elapsed_ms(t_query)
+
+    row: Optional[Dict[str, Any]] = None
+    cards_read_failed = isinstance(cards_result, Exception)
+    if cards_read_failed:
+        _log_cards_page_snapshot_read_failure(cards_result, resolved_set_id)
+    else:
+        row = _first_row(cards_result)
+
+    if isinstance(dashboard_result, Exception):
+        _log_peer_movement_snapshot_meta_failure(resolved_set_id, "dashboard")
+        dashboard_meta: Dict[str, Any] = {}
+        dashboard_exists = False
+    else:
+        dashboard_row = _first_row(dashboard_result)
+        dashboard_meta, dashboard_exists = _movement_snapshot_meta(dashboard_row or {}), bool(dashboard_row)
+
+    if row:
+        cards_meta, cards_exists = _movement_snapshot_meta(row), True
+    elif cards_read_failed:
+        try:
+            peer_row = _first_row(
+                await _peer_movement_snapshot_meta_query(client, resolved_set_id, surface="cards").execute()
+            )
+            cards_meta, cards_exists = _movement_snapshot_meta(peer_row or {}), bool(peer_row)
+        except Exception:
+            _log_peer_movement_snapshot_meta_failure(resolved_set_id, "cards")
+            cards_meta, cards_exists = {}, False
+    else:
+        # The row read succeeded and found nothing; the peer read would hit the
+        # same missing row of the same table.
+        cards_meta, cards_exists = {}, False
+
+    movement_generation = _movement_generation_from_peer_metas(
+        cards_meta,
+        cards_exists=cards_exists,
+        dashboard_meta=dashboard_meta,
+        dashboard_exists=dashboard_exists,
+    )
+    return _build_cards_page_payload(
+        row,
+        set_row=set_row,
+        resolved_set_id=resolved_set_id,
+        params=params,
+        movement_generation=movement_generation,
+        query_ms=query_ms,
+        started=started,
+    )
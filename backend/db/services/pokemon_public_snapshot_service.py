@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from backend.db.clients.supabase_client import create_public_read_client, create_service_role_client, public_read_client
 from backend.db.services.chase_economics_service import read_chase_economics_snapshot
 from backend.db.services.data_service_health import is_transient_data_service_error
+from backend.db.services.public_read_coalescing import coalescing_key, run_coalesced_read
 from backend.db.services.public_read_retry import run_public_read_with_retry
 from backend.db.services.public_rip_publication_contract import (
     canonical_publication_identity,
@@ -46,6 +47,7 @@ from backend.db.services.pokemon_set_market_service import (
     get_pokemon_set_value_history_payload,
     resolve_pokemon_set_identifier,
 )
+from backend.utils.metrics_registry import CACHE_LOOKUPS
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +120,47 @@ def _first_row(result: Any) -> Optional[Dict[str, Any]]:
     return None
 
 
+_PAYLOAD_SECTION_ALIAS_PREFIX = "payload_section__"
+
+
+def _payload_section_columns(base_columns: str, sections: Tuple[Tuple[str, ...], ...]) -> str:
+    """Select list reading only the named `payload_json` sections.
+
+    Each section is a key path into payload_json, pushed down to PostgREST as
+    `payload_section__a__b:payload_json->a->b` so Postgres extracts it
+    server-side and the rest of the blob is never transferred or decoded.
+    """
+    return ",".join(
+        [
+            base_columns,
+            *(
+                f"{_PAYLOAD_SECTION_ALIAS_PREFIX}{'__'.join(path)}:payload_json->{'->'.join(path)}"
+                for path in sections
+            ),
+        ]
+    )
+
+
+def _payload_from_section_row(row: Dict[str, Any], sections: Tuple[Tuple[str, ...], ...]) -> Dict[str, Any]:
+    """Rebuild the partial payload_json a _payload_section_columns read returned.
+
+    A section absent from the stored payload comes back as SQL NULL and is left
+    out, so `.get()` on the result answers exactly as it would on the full
+    payload for every section that was asked for. payload_json is NOT NULL on
+    the snapshot tables, so a present row always yields a dict.
+    """
+    payload: Dict[str, Any] = {}
+    for path in sections:
+        value = row.get(f"{_PAYLOAD_SECTION_ALIAS_PREFIX}{'__'.join(path)}")
+        if value is None:
+            continue
+        node = payload
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return payload
+
+
 def _sanitize_limit(value: Any, *, default: int, max_value: int) -> int:
     try:
         parsed = int(value)
@@ -1193,27 +1236,37 @@ def _load_shell_checklist_set_value_history(set_id: str) -> Dict[str, Any]:
         return {}
 
     try:
-        result = (
-            public_read_client.table("pokemon_set_market_dashboard_snapshot_latest")
-            # latest_market_date/updated_at are selection inputs for the
-            # freshness tie-breaks below; neither reaches the shell payload.
-            .select("window_key,set_value_histories_json,latest_market_date,updated_at")
-            .eq("set_id", resolved)
-            .in_("window_key", [DEFAULT_TOP_CHASE_DASHBOARD_WINDOW, DEFAULT_DASHBOARD_WINDOW])
-            .execute()
-        )
+        result = _shell_set_value_history_query(public_read_client, resolved).execute()
     except Exception as exc:
-        if _is_missing_snapshot_relation_error(exc):
-            logger.warning(
-                "[pokemon-snapshot] shell checklist set value snapshot relation missing; continuing without enrichment"
-            )
-        else:
-            logger.warning(
-                "[pokemon-snapshot] shell checklist set value history load failed set_id=%s", resolved, exc_info=True
-            )
+        _log_shell_set_value_history_failure(exc, resolved)
         return {}
 
-    rows = result.data or []
+    return _shell_set_value_history_from_rows(result.data or [])
+
+
+def _shell_set_value_history_query(client: Any, resolved_set_id: str) -> Any:
+    return (
+        client.table("pokemon_set_market_dashboard_snapshot_latest")
+        # latest_market_date/updated_at are selection inputs for the
+        # freshness tie-breaks below; neither reaches the shell payload.
+        .select("window_key,set_value_histories_json,latest_market_date,updated_at")
+        .eq("set_id", resolved_set_id)
+        .in_("window_key", [DEFAULT_TOP_CHASE_DASHBOARD_WINDOW, DEFAULT_DASHBOARD_WINDOW])
+    )
+
+
+def _log_shell_set_value_history_failure(exc: Exception, resolved_set_id: str) -> None:
+    if _is_missing_snapshot_relation_error(exc):
+        logger.warning(
+            "[pokemon-snapshot] shell checklist set value snapshot relation missing; continuing without enrichment"
+        )
+    else:
+        logger.warning(
+            "[pokemon-snapshot] shell checklist set value history load failed set_id=%s", resolved_set_id, exc_info=True
+        )
+
+
+def _shell_set_value_history_from_rows(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not rows:
         return {}
 
@@ -1482,6 +1535,76 @@ def _build_missing_set_page_snapshot_payload(set_row: Dict[str, Any], elapsed_ms
     }
 
 
+def _set_page_snapshot_query(client: Any, resolved_set_id: str) -> Any:
+    """The set page snapshot SELECT, unexecuted, so the sync reader and its
+    async twin (pokemon_public_snapshot_async_service) issue the same query."""
+    return (
+        client.table("pokemon_set_page_snapshot_latest")
+        .select("set_id,payload_json,as_of,source_updated_at,updated_at")
+        .eq("set_id", resolved_set_id)
+        .limit(1)
+    )
+
+
+def _set_page_payload_from_result(
+    result: Any,
+    *,
+    resolved_set_id: str,
+    started: float,
+    set_resolve_ms: Optional[float],
+    query_ms: float,
+) -> Optional[Dict[str, Any]]:
+    """Assemble the /page payload from an executed snapshot query, or None when
+    the row is missing or carries no payload_json."""
+    row = _first_row(result)
+    payload_type = type((row or {}).get("payload_json")).__name__
+    logger.info(
+        "[pokemon-snapshot] page snapshot query done set_id=%s query_ms=%s row_present=%s payload_type=%s",
+        resolved_set_id,
+        query_ms,
+        bool(row),
+        payload_type,
+    )
+    if not row or not isinstance(row.get("payload_json"), dict):
+        return None
+    payload = _merge_snapshot_meta(row["payload_json"], row, "pokemon_set_page_snapshot_latest")
+    payload = _mark_missing_simulation_drivers_without_live_repair(payload)
+    timings = dict((payload.get("meta") or {}).get("timings") or {})
+    if set_resolve_ms is not None:
+        timings["set_resolve_ms"] = set_resolve_ms
+    timings["snapshot_query_ms"] = query_ms
+    timings["snapshot_read_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    payload["meta"] = {**(payload.get("meta") or {}), "timings": timings}
+    logger.info(
+        "[pokemon-snapshot] set page snapshot read set_id=%s elapsed_ms=%s",
+        resolved_set_id,
+        timings["snapshot_read_ms"],
+    )
+    return payload
+
+
+def _raise_set_page_snapshot_read_failed(exc: Exception, *, resolved_set_id: str, started: float) -> None:
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    logger.exception(
+        "[pokemon-snapshot] set page snapshot read failed set_id=%s elapsed_ms=%s exc_type=%s exc=%s",
+        resolved_set_id,
+        elapsed_ms,
+        type(exc).__name__,
+        exc,
+    )
+    raise ExplorePageError(500, "Failed to read Pokemon set page snapshot", "POKEMON_SET_PAGE_SNAPSHOT_FAILED")
+
+
+def _log_missing_set_page_snapshot(resolved_set_id: str, started: float) -> float:
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    logger.warning(
+        "[pokemon-snapshot] missing set page snapshot; returning fallback shell set_id=%s elapsed_ms=%s",
+        resolved_set_id,
+        elapsed_ms,
+    )
+    return elapsed_ms
+
+
 def get_pokemon_set_page_snapshot_payload(set_id: str) -> Dict[str, Any]:
     started = time.perf_counter()
     resolved = _to_optional_str(set_id)
@@ -1510,55 +1633,21 @@ def get_pokemon_set_page_snapshot_payload(set_id: str) -> Dict[str, Any]:
     try:
         t_query = time.perf_counter()
         logger.info("[pokemon-snapshot] page snapshot query start set_id=%s", resolved_set_id)
-        result = (
-            public_read_client.table("pokemon_set_page_snapshot_latest")
-            .select("set_id,payload_json,as_of,source_updated_at,updated_at")
-            .eq("set_id", resolved_set_id)
-            .limit(1)
-            .execute()
-        )
+        result = _set_page_snapshot_query(public_read_client, resolved_set_id).execute()
         query_ms = round((time.perf_counter() - t_query) * 1000, 3)
-        row = _first_row(result)
-        payload_type = type((row or {}).get("payload_json")).__name__
-        logger.info(
-            "[pokemon-snapshot] page snapshot query done set_id=%s query_ms=%s row_present=%s payload_type=%s",
-            resolved_set_id,
-            query_ms,
-            bool(row),
-            payload_type,
+        payload = _set_page_payload_from_result(
+            result,
+            resolved_set_id=resolved_set_id,
+            started=started,
+            set_resolve_ms=set_resolve_ms,
+            query_ms=query_ms,
         )
-        if row and isinstance(row.get("payload_json"), dict):
-            payload = _merge_snapshot_meta(row["payload_json"], row, "pokemon_set_page_snapshot_latest")
-            payload = _mark_missing_simulation_drivers_without_live_repair(payload)
-            timings = dict((payload.get("meta") or {}).get("timings") or {})
-            if set_resolve_ms is not None:
-                timings["set_resolve_ms"] = set_resolve_ms
-            timings["snapshot_query_ms"] = query_ms
-            timings["snapshot_read_ms"] = round((time.perf_counter() - started) * 1000, 3)
-            payload["meta"] = {**(payload.get("meta") or {}), "timings": timings}
-            logger.info(
-                "[pokemon-snapshot] set page snapshot read set_id=%s elapsed_ms=%s",
-                resolved_set_id,
-                timings["snapshot_read_ms"],
-            )
+        if payload is not None:
             return payload
     except Exception as exc:
-        elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
-        logger.exception(
-            "[pokemon-snapshot] set page snapshot read failed set_id=%s elapsed_ms=%s exc_type=%s exc=%s",
-            resolved_set_id,
-            elapsed_ms,
-            type(exc).__name__,
-            exc,
-        )
-        raise ExplorePageError(500, "Failed to read Pokemon set page snapshot", "POKEMON_SET_PAGE_SNAPSHOT_FAILED")
+        _raise_set_page_snapshot_read_failed(exc, resolved_set_id=resolved_set_id, started=started)
 
-    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
-    logger.warning(
-        "[pokemon-snapshot] missing set page snapshot; returning fallback shell set_id=%s elapsed_ms=%s",
-        resolved_set_id,
-        elapsed_ms,
-    )
+    elapsed_ms = _log_missing_set_page_snapshot(resolved_set_id, started)
     if set_row is None:
         try:
             t_lazy = time.perf_counter()
@@ -1724,6 +1813,67 @@ def _build_missing_shell_snapshot_payload(set_row: Dict[str, Any], elapsed_ms: f
     }
 
 
+def _shell_snapshot_query(client: Any, resolved_set_id: str) -> Any:
+    return (
+        client.table("pokemon_set_page_snapshot_latest")
+        .select(_SHELL_SNAPSHOT_COLUMNS)
+        .eq("set_id", resolved_set_id)
+        .limit(1)
+    )
+
+
+def _raise_shell_snapshot_read_failed(exc: Exception, *, resolved_set_id: str, started: float) -> None:
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    logger.exception(
+        "[pokemon-snapshot] shell snapshot read failed set_id=%s elapsed_ms=%s exc_type=%s exc=%s",
+        resolved_set_id,
+        elapsed_ms,
+        type(exc).__name__,
+        exc,
+    )
+    raise ExplorePageError(500, "Failed to read Pokemon set shell snapshot", "POKEMON_SET_SHELL_SNAPSHOT_FAILED")
+
+
+def _finish_shell_snapshot_payload(
+    row: Dict[str, Any],
+    *,
+    set_value_histories_by_scope: Dict[str, Any],
+    resolved_set_id: str,
+    started: float,
+    set_resolve_ms: Optional[float],
+    query_ms: float,
+    set_value_ms: float,
+) -> Dict[str, Any]:
+    payload = _build_shell_payload_from_row(row, set_value_histories_by_scope=set_value_histories_by_scope)
+    meta = dict(payload.get("meta") or {})
+    snapshot_meta = _snapshot_meta(row, "pokemon_set_page_snapshot_latest")
+    meta["snapshot"] = {"source": snapshot_meta["source"], **snapshot_meta["snapshot"]}
+    payload["meta"] = meta
+    timings = dict((payload.get("meta") or {}).get("timings") or {})
+    if set_resolve_ms is not None:
+        timings["set_resolve_ms"] = set_resolve_ms
+    timings["snapshot_query_ms"] = query_ms
+    timings["set_value_history_query_ms"] = set_value_ms
+    timings["snapshot_read_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    payload["meta"] = {**(payload.get("meta") or {}), "timings": timings}
+    logger.info(
+        "[pokemon-snapshot] shell snapshot read set_id=%s elapsed_ms=%s",
+        resolved_set_id,
+        timings["snapshot_read_ms"],
+    )
+    return payload
+
+
+def _log_missing_shell_snapshot(resolved_set_id: str, started: float) -> float:
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    logger.warning(
+        "[pokemon-snapshot] missing shell snapshot; returning fallback shell set_id=%s elapsed_ms=%s",
+        resolved_set_id,
+        elapsed_ms,
+    )
+    return elapsed_ms
+
+
 def get_pokemon_set_shell_snapshot_payload(set_id: str) -> Dict[str, Any]:
     """Return the lightweight header/title-card snapshot for a Pokemon set.
 
@@ -1757,55 +1907,27 @@ def get_pokemon_set_shell_snapshot_payload(set_id: str) -> Dict[str, Any]:
 
     try:
         t_query = time.perf_counter()
-        result = (
-            public_read_client.table("pokemon_set_page_snapshot_latest")
-            .select(_SHELL_SNAPSHOT_COLUMNS)
-            .eq("set_id", resolved_set_id)
-            .limit(1)
-            .execute()
-        )
+        result = _shell_snapshot_query(public_read_client, resolved_set_id).execute()
         query_ms = round((time.perf_counter() - t_query) * 1000, 3)
         row = _first_row(result)
     except Exception as exc:
-        elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
-        logger.exception(
-            "[pokemon-snapshot] shell snapshot read failed set_id=%s elapsed_ms=%s exc_type=%s exc=%s",
-            resolved_set_id,
-            elapsed_ms,
-            type(exc).__name__,
-            exc,
-        )
-        raise ExplorePageError(500, "Failed to read Pokemon set shell snapshot", "POKEMON_SET_SHELL_SNAPSHOT_FAILED")
+        _raise_shell_snapshot_read_failed(exc, resolved_set_id=resolved_set_id, started=started)
 
     if row:
         t_set_value = time.perf_counter()
         set_value_histories_by_scope = _load_shell_checklist_set_value_history(resolved_set_id)
         set_value_ms = round((time.perf_counter() - t_set_value) * 1000, 3)
-        payload = _build_shell_payload_from_row(row, set_value_histories_by_scope=set_value_histories_by_scope)
-        meta = dict(payload.get("meta") or {})
-        snapshot_meta = _snapshot_meta(row, "pokemon_set_page_snapshot_latest")
-        meta["snapshot"] = {"source": snapshot_meta["source"], **snapshot_meta["snapshot"]}
-        payload["meta"] = meta
-        timings = dict((payload.get("meta") or {}).get("timings") or {})
-        if set_resolve_ms is not None:
-            timings["set_resolve_ms"] = set_resolve_ms
-        timings["snapshot_query_ms"] = query_ms
-        timings["set_value_history_query_ms"] = set_value_ms
-        timings["snapshot_read_ms"] = round((time.perf_counter() - started) * 1000, 3)
-        payload["meta"] = {**(payload.get("meta") or {}), "timings": timings}
-        logger.info(
-            "[pokemon-snapshot] shell snapshot read set_id=%s elapsed_ms=%s",
-            resolved_set_id,
-            timings["snapshot_read_ms"],
+        return _finish_shell_snapshot_payload(
+            row,
+            set_value_histories_by_scope=set_value_histories_by_scope,
+            resolved_set_id=resolved_set_id,
+            started=started,
+            set_resolve_ms=set_resolve_ms,
+            query_ms=query_ms,
+            set_value_ms=set_value_ms,
         )
-        return payload
 
-    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
-    logger.warning(
-        "[pokemon-snapshot] missing shell snapshot; returning fallback shell set_id=%s elapsed_ms=%s",
-        resolved_set_id,
-        elapsed_ms,
-    )
+    elapsed_ms = _log_missing_shell_snapshot(resolved_set_id, started)
     if set_row is None:
         try:
             set_row = _resolve_set_row(resolved_set_id)
@@ -1881,6 +2003,12 @@ def _rankings_publication_identity_mismatches(payload: Dict[str, Any]) -> List[D
     ]
 
 
+def _last_successful_rankings_payload(clamped_limit: int) -> Optional[Dict[str, Any]]:
+    cached = _LAST_SUCCESSFUL_RANKINGS_PAYLOADS.get(clamped_limit)
+    CACHE_LOOKUPS.inc(cache="rankings_last_successful", result="hit" if cached else "miss")
+    return cached
+
+
 def _stale_rankings_fallback(cached: Dict[str, Any], reason: str) -> Dict[str, Any]:
     """A previously served compatible payload, explicitly labelled as stale."""
     fallback = deepcopy(cached)
@@ -1941,6 +2069,16 @@ def upgrade_rankings_set_rip_contract_if_needed(payload: Dict[str, Any]) -> Dict
 
 def get_pokemon_explore_rankings_snapshot_payload(limit: Any = DEFAULT_RANKINGS_LIMIT) -> Dict[str, Any]:
     clamped_limit = _sanitize_limit(limit, default=DEFAULT_RANKINGS_LIMIT, max_value=MAX_RANKINGS_LIMIT)
+    # Every Explore visitor opens the rankings first; concurrent identical
+    # requests share one read, one legacy-contract upgrade and one enrichment
+    # instead of repeating the whole assembly per request.
+    return run_coalesced_read(
+        coalescing_key("explore_rankings", None, (clamped_limit,)),
+        lambda: _read_pokemon_explore_rankings_snapshot_payload(clamped_limit),
+    )
+
+
+def _read_pokemon_explore_rankings_snapshot_payload(clamped_limit: int) -> Dict[str, Any]:
     try:
         row = run_public_read_with_retry(
             _load_pokemon_explore_rankings_snapshot_row,
@@ -1951,7 +2089,7 @@ def get_pokemon_explore_rankings_snapshot_payload(limit: Any = DEFAULT_RANKINGS_
     except Exception as exc:
         logger.exception("[pokemon-snapshot] explore rankings snapshot read failed")
         if is_transient_data_service_error(exc):
-            cached = _LAST_SUCCESSFUL_RANKINGS_PAYLOADS.get(clamped_limit)
+            cached = _last_successful_rankings_payload(clamped_limit)
             if cached:
                 return _stale_rankings_fallback(cached, "transient_data_service_failure")
             raise ExploreRipStatisticsTargetsError(
@@ -1983,7 +2121,7 @@ def get_pokemon_explore_rankings_snapshot_payload(limit: Any = DEFAULT_RANKINGS_
                     for item in mismatches
                 ),
             )
-            cached = _LAST_SUCCESSFUL_RANKINGS_PAYLOADS.get(clamped_limit)
+            cached = _last_successful_rankings_payload(clamped_limit)
             if cached:
                 return _stale_rankings_fallback(cached, "incompatible_publication_identity")
             # Deliberately NOT the live builder: it was measured at ~3.8s warm
@@ -2279,31 +2417,39 @@ def _read_peer_movement_snapshot_meta(
     surface: str,
 ) -> tuple[Dict[str, Any], bool]:
     try:
-        if surface == "cards":
-            query = (
-                public_read_client.table("pokemon_set_cards_snapshot_latest")
-                .select("snapshot_meta:payload_json->meta->snapshot")
-                .eq("set_id", set_id)
-            )
-        else:
-            query = (
-                public_read_client.table("pokemon_set_market_dashboard_snapshot_latest")
-                .select("snapshot_meta:payload_json->meta->snapshot")
-                .eq("set_id", set_id)
-                .eq("window_key", DEFAULT_DASHBOARD_WINDOW)
-            )
-        row = _first_row(query.limit(1).execute())
+        row = _first_row(_peer_movement_snapshot_meta_query(public_read_client, set_id, surface=surface).execute())
         return _movement_snapshot_meta(row or {}), bool(row)
     except Exception:
-        logger.warning(
-            "[pokemon-snapshot] movement generation peer read failed set_id=%s surface=%s",
-            set_id,
-            surface,
-            exc_info=True,
-        )
+        _log_peer_movement_snapshot_meta_failure(set_id, surface)
         return {}, False
 
 
+def _peer_movement_snapshot_meta_query(client: Any, set_id: str, *, surface: str) -> Any:
+    if surface == "cards":
+        query = (
+            client.table("pokemon_set_cards_snapshot_latest")
+            .select("snapshot_meta:payload_json->meta->snapshot")
+            .eq("set_id", set_id)
+        )
+    else:
+        query = (
+            client.table("pokemon_set_market_dashboard_snapshot_latest")
+            .select("snapshot_meta:payload_json->meta->snapshot")
+            .eq("set_id", set_id)
+            .eq("window_key", DEFAULT_DASHBOARD_WINDOW)
+        )
+    return query.limit(1)
+
+
+def _log_peer_movement_snapshot_meta_failure(set_id: str, surface: str) -> None:
+    logger.warning(
+        "[pokemon-snapshot] movement generation peer read failed set_id=%s surface=%s",
+        set_id,
+        surface,
+        exc_info=True,
+    )
+
+
 def _movement_generation_metadata(
     set_id: str,
     *,
@@ -2320,7 +2466,21 @@ def _movement_generation_metadata(
         cards_meta, cards_exists = _read_peer_movement_snapshot_meta(set_id, surface="cards")
     if not dashboard_known:
         dashboard_meta, dashboard_exists = _read_peer_movement_snapshot_meta(set_id, surface="dashboard")
+    return _movement_generation_from_peer_metas(
+        cards_meta,
+        cards_exists=cards_exists,
+        dashboard_meta=dashboard_meta,
+        dashboard_exists=dashboard_exists,
+    )
+
 
+def _movement_generation_from_peer_metas(
+    cards_meta: Dict[str, Any],
+    *,
+    cards_exists: bool,
+    dashboard_meta: Dict[str, Any],
+    dashboard_exists: bool,
+) -> Dict[str, Any]:
     cards_generation = _to_optional_str(cards_meta.get("generationId"))
     dashboard_generation = _to_optional_str(dashboard_meta.get("generationId"))
     if cards_generation and dashboard_generation:
@@ -2784,38 +2944,115 @@ def get_pokemon_set_cards_page_snapshot_payload(
         set_row = _resolve_set_row(resolved)
         resolved_set_id = str(set_row["id"])
 
-    page_value = _sanitize_cards_page(page)
-    page_size_value = _sanitize_cards_page_size(page_size)
-    sort_value = _sanitize_cards_sort(sort)
-    movement_sort_value = _sanitize_cards_movement_sort(movement_sort)
-    sort_direction_value = _sanitize_cards_sort_direction(sort_direction) if _to_optional_str(sort_direction) else None
-    movement_filter_value = _sanitize_cards_movement_filter(movement_filter)
-    movement_metric_value = _sanitize_cards_movement_metric(movement_metric)
-    section_value = _sanitize_cards_section(section)
-    query_value = _to_optional_str(query)
-    rarity_value = _to_optional_str(rarity)
+    params = _sanitize_cards_page_params(
+        page=page,
+        page_size=page_size,
+        sort=sort,
+        query=query,
+        rarity=rarity,
+        movement_filter=movement_filter,
+        movement_sort=movement_sort,
+        sort_direction=sort_direction,
+        section=section,
+        movement_metric=movement_metric,
+    )
 
     t_query = time.perf_counter()
     row: Optional[Dict[str, Any]] = None
     try:
-        result = (
-            public_read_client.table("pokemon_set_cards_snapshot_latest")
-            .select(_CARDS_PAGE_SNAPSHOT_COLUMNS)
-            .eq("set_id", resolved_set_id)
-            .limit(1)
-            .execute()
-        )
-        row = _first_row(result)
+        row = _first_row(_cards_page_snapshot_query(public_read_client, resolved_set_id).execute())
     except Exception as exc:
-        logger.warning(
-            "[pokemon-snapshot] cards page snapshot read failed set_id=%s exc=%s",
-            resolved_set_id,
-            exc,
-            exc_info=True,
-        )
+        _log_cards_page_snapshot_read_failure(exc, resolved_set_id)
         row = None
     query_ms = round((time.perf_counter() - t_query) * 1000, 3)
 
+    movement_generation = _movement_generation_metadata(
+        resolved_set_id,
+        cards_snapshot=_movement_snapshot_meta(row or {}) if row else None,
+    )
+    return _build_cards_page_payload(
+        row,
+        set_row=set_row,
+        resolved_set_id=resolved_set_id,
+        params=params,
+        movement_generation=movement_generation,
+        query_ms=query_ms,
+        started=started,
+    )
+
+
+def _sanitize_cards_page_params(
+    *,
+    page: Any,
+    page_size: Any,
+    sort: Any,
+    query: Any,
+    rarity: Any,
+    movement_filter: Any,
+    movement_sort: Any,
+    sort_direction: Any,
+    section: Any,
+    movement_metric: Any,
+) -> Dict[str, Any]:
+    return {
+        "page": _sanitize_cards_page(page),
+        "page_size": _sanitize_cards_page_size(page_size),
+        "sort": _sanitize_cards_sort(sort),
+        "movement_sort": _sanitize_cards_movement_sort(movement_sort),
+        "sort_direction": _sanitize_cards_sort_direction(sort_direction) if _to_optional_str(sort_direction) else None,
+        "movement_filter": _sanitize_cards_movement_filter(movement_filter),
+        "movement_metric": _sanitize_cards_movement_metric(movement_metric),
+        "section": _sanitize_cards_section(section),
+        "query": _to_optional_str(query),
+        "rarity": _to_optional_str(rarity),
+    }
+
+
+def _cards_page_snapshot_query(client: Any, resolved_set_id: str) -> Any:
+    return (
+        client.table("pokemon_set_cards_snapshot_latest")
+        .select(_CARDS_PAGE_SNAPSHOT_COLUMNS)
+        .eq("set_id", resolved_set_id)
+        .limit(1)
+    )
+
+
+def _log_cards_page_snapshot_read_failure(exc: Exception, resolved_set_id: str) -> None:
+    logger.warning(
+        "[pokemon-snapshot] cards page snapshot read failed set_id=%s exc=%s",
+        resolved_set_id,
+        exc,
+        exc_info=True,
+    )
+
+
+def _build_cards_page_payload(
+    row: Optional[Dict[str, Any]],
+    *,
+    set_row: Optional[Dict[str, Any]],
+    resolved_set_id: str,
+    params: Dict[str, Any],
+    movement_generation: Dict[str, Any],
+    query_ms: float,
+    started: float,
+) -> Dict[str, Any]:
+    """Slice/filter/sort a cards snapshot row into the /cards/page payload.
+
+    Pure: every read this needs (the row itself and the peer movement
+    generation) has already happened, so the sync reader and its async twin
+    share it unchanged.
+    """
+    page_value = params["page"]
+    page_size_value = params["page_size"]
+    sort_value = params["sort"]
+    movement_sort_value = params["movement_sort"]
+    sort_direction_value = params["sort_direction"]
+    movement_filter_value = params["movement_filter"]
+    movement_metric_value = params["movement_metric"]
+    section_value = params["section"]
+    query_value = params["query"]
+    rarity_value = params["rarity"]
+
     raw_cards = row.get("cards_json") if row and isinstance(row.get("cards_json"), list) else []
     resolved_row_set_id = _to_optional_str((row or {}).get("set_id")) or resolved_set_id
     identity_row = set_row or {"id": resolved_row_set_id}
@@ -2902,10 +3139,7 @@ def get_pokemon_set_cards_page_snapshot_payload(
                 "updatedAt": _to_optional_str((row or {}).get("updated_at")),
                 "isStaleFallback": bool(row),
             },
-            "movementGeneration": _movement_generation_metadata(
-                resolved_set_id,
-                cards_snapshot=_movement_snapshot_meta(row or {}) if row else None,
-            ),
+            "movementGeneration": movement_generation,
             "timings": timings,
         },
     }
@@ -2924,7 +3158,22 @@ def get_pokemon_set_cards_page_snapshot_payload(
 DEFAULT_CARD_VALIDATION_MAX_CARDS = 300
 MAX_CARD_VALIDATION_MAX_CARDS = 500
 CARD_VALIDATION_PAYLOAD_BUDGET_BYTES = 250_000
-_CARD_VALIDATION_SNAPSHOT_COLUMNS = "set_id,payload_json,card_count,updated_at"
+# Only the sections the validation contract is built from. `cards` is still
+# the full checklist array - it is the only source of supertype/printedNumber
+# (see _card_validation_supertype_lookup) - but the rest of the cards payload
+# (market movers, chase and dashboard sections) is no longer transferred.
+_CARD_VALIDATION_PAYLOAD_SECTIONS: Tuple[Tuple[str, ...], ...] = (
+    ("cards",),
+    ("cardDesirabilityValidation",),
+    ("card_desirability_validation",),
+    ("cardAppealMarketPriceCorrelation",),
+    ("card_appeal_market_price_correlation",),
+    ("meta", "cardAppealMarketPriceCorrelation"),
+    ("meta", "card_appeal_market_price_correlation"),
+)
+_CARD_VALIDATION_SNAPSHOT_COLUMNS = _payload_section_columns(
+    "set_id,card_count,updated_at", _CARD_VALIDATION_PAYLOAD_SECTIONS
+)
 
 
 def _sanitize_card_validation_max_cards(value: Any) -> int:
@@ -3106,6 +3355,8 @@ def get_pokemon_set_card_validation_snapshot_payload(
             .execute()
         )
         row = _first_row(result)
+        if row:
+            row["payload_json"] = _payload_from_section_row(row, _CARD_VALIDATION_PAYLOAD_SECTIONS)
     except Exception as exc:
         logger.warning(
             "[pokemon-snapshot] card validation snapshot read failed set_id=%s exc=%s",
@@ -4398,26 +4649,50 @@ def get_pokemon_set_overview_snapshot_payload(
     t_query = time.perf_counter()
     row: Optional[Dict[str, Any]] = None
     try:
-        result = (
-            public_read_client.table("pokemon_set_market_dashboard_snapshot_latest")
-            .select(_OVERVIEW_SNAPSHOT_COLUMNS)
-            .eq("set_id", resolved_set_id)
-            .eq("window_key", resolved_window)
-            .limit(1)
-            .execute()
-        )
-        row = _first_row(result)
+        row = _first_row(_overview_snapshot_query(public_read_client, resolved_set_id, resolved_window).execute())
     except Exception as exc:
-        logger.warning(
-            "[pokemon-snapshot] overview snapshot read failed set_id=%s window=%s exc=%s",
-            resolved_set_id,
-            resolved_window,
-            exc,
-            exc_info=True,
-        )
+        _log_overview_snapshot_read_failure(exc, resolved_set_id, resolved_window)
         row = None
     query_ms = round((time.perf_counter() - t_query) * 1000, 3)
+    return _finish_overview_snapshot_payload(
+        row,
+        set_row=set_row,
+        resolved_set_id=resolved_set_id,
+        resolved_window=resolved_window,
+        query_ms=query_ms,
+        started=started,
+    )
+
 
+def _overview_snapshot_query(client: Any, resolved_set_id: str, resolved_window: str) -> Any:
+    return (
+        client.table("pokemon_set_market_dashboard_snapshot_latest")
+        .select(_OVERVIEW_SNAPSHOT_COLUMNS)
+        .eq("set_id", resolved_set_id)
+        .eq("window_key", resolved_window)
+        .limit(1)
+    )
+
+
+def _log_overview_snapshot_read_failure(exc: Exception, resolved_set_id: str, resolved_window: str) -> None:
+    logger.warning(
+        "[pokemon-snapshot] overview snapshot read failed set_id=%s window=%s exc=%s",
+        resolved_set_id,
+        resolved_window,
+        exc,
+        exc_info=True,
+    )
+
+
+def _finish_overview_snapshot_payload(
+    row: Optional[Dict[str, Any]],
+    *,
+    set_row: Optional[Dict[str, Any]],
+    resolved_set_id: str,
+    resolved_window: str,
+    query_ms: float,
+    started: float,
+) -> Dict[str, Any]:
     if not row:
         elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
         logger.info(
@@ -6036,7 +6311,50 @@ def get_pokemon_set_pull_rates_snapshot_payload(set_id: str) -> Dict[str, Any]:
     return payload
 
 
-_INSIGHTS_SNAPSHOT_COLUMNS = "set_id,payload_json,updated_at"
+# Each Insights reader transfers only the payload_json sections it serves;
+# the page payload also carries cards, market and pull-rate sections owned by
+# other routes.
+_INSIGHTS_SECONDARY_PAYLOAD_SECTIONS: Tuple[Tuple[str, ...], ...] = (
+    ("rip_statistics",),
+    ("percentiles",),
+    ("distribution_bins",),
+    ("threshold_bins",),
+    ("top_hits",),
+    ("rankings",),
+    ("history_trend",),
+    ("openingDesirability",),
+    ("opening_desirability",),
+)
+_INSIGHTS_CRITICAL_PAYLOAD_SECTIONS: Tuple[Tuple[str, ...], ...] = (
+    ("summary",),
+    ("interpretation",),
+    ("ripDecision",),
+    ("rip",),
+    ("ripCore",),
+    ("financialRipV3",),
+    ("overallRipV5",),
+    ("publicRipContractV5",),
+    ("overallRipV6",),
+    ("publicRipContractV6",),
+    ("overallRipV7",),
+    ("overallRipV8",),
+    ("publicRipContractV7",),
+    ("publicRipContractV8",),
+    ("overallRipV9",),
+    ("publicRipContractV9",),
+    ("overallRipV10",),
+    ("publicRipContractV10",),
+    ("openingExperience",),
+    ("publicAnalyticsCohort",),
+    ("publicAnalyticsStatus",),
+)
+_INSIGHTS_PAYLOAD_SECTIONS: Tuple[Tuple[str, ...], ...] = (
+    ("summary",),
+    ("interpretation",),
+    ("ripDecision",),
+    *_INSIGHTS_SECONDARY_PAYLOAD_SECTIONS,
+)
+_INSIGHTS_SNAPSHOT_COLUMNS = _payload_section_columns("set_id,updated_at", _INSIGHTS_PAYLOAD_SECTIONS)
 INSIGHTS_PAYLOAD_BUDGET_BYTES = 400_000
 # Ordered largest-first-ish; history_trend (~365 daily points) is the section
 # most likely to ever need trimming in practice.
@@ -6130,8 +6448,8 @@ def get_pokemon_set_insights_snapshot_payload(set_id: str) -> Dict[str, Any]:
     """Return the slim Insights-tab snapshot (camelCase only) for a Pokemon set.
 
     Reads only pokemon_set_page_snapshot_latest.payload_json (there is no
-    split column for Insights fields yet) and extracts just the sections the
-    Insights tab renders: summary, interpretation (recommendation badge +
+    split column for Insights fields yet), selecting server-side just the
+    sections (_INSIGHTS_PAYLOAD_SECTIONS) the Insights tab renders: summary, interpretation (recommendation badge +
     pillar/section metas the RIP breakdown and evidence panels read),
     rip_statistics (pack paths/normal pack states), percentiles/
     distribution_bins/threshold_bins (opening outcomes chart), top_hits
@@ -6173,6 +6491,8 @@ def get_pokemon_set_insights_snapshot_payload(set_id: str) -> Dict[str, Any]:
             .execute()
         )
         row = _first_row(result)
+        if row:
+            row["payload_json"] = _payload_from_section_row(row, _INSIGHTS_PAYLOAD_SECTIONS)
     except Exception as exc:
         logger.warning(
             "[pokemon-snapshot] insights snapshot read failed set_id=%s exc=%s",
@@ -6288,13 +6608,17 @@ def get_pokemon_set_insights_snapshot_payload(set_id: str) -> Dict[str, Any]:
     return payload
 
 
-def _fetch_insights_snapshot_row(set_id: str):
+def _fetch_insights_snapshot_row(set_id: str, sections: Tuple[Tuple[str, ...], ...]):
     """Shared row-fetch step for the full/critical/secondary Insights
     payloads below — one indexed read against pokemon_set_page_snapshot_latest,
     keyed by set_id. Extracted so the critical/secondary split shares it
     instead of duplicating the query logic; the full payload above is left
     inlined and untouched to keep its blast radius at zero.
 
+    Only `sections` of payload_json are read (see _payload_section_columns):
+    critical and secondary are split server-side, not by discarding half of
+    one full-blob read in Python. `row["payload_json"]` holds just those.
+
     Returns (row, set_row, resolved_set_id, query_ms, started). `row` is None
     when the snapshot is missing/unreadable — callers fall back to their own
     empty-payload shape in that case.
@@ -6317,12 +6641,14 @@ def _fetch_insights_snapshot_row(set_id: str):
     try:
         result = (
             public_read_client.table("pokemon_set_page_snapshot_latest")
-            .select(_INSIGHTS_SNAPSHOT_COLUMNS)
+            .select(_payload_section_columns("set_id,updated_at", sections))
             .eq("set_id", resolved_set_id)
             .limit(1)
             .execute()
         )
         row = _first_row(result)
+        if row:
+            row["payload_json"] = _payload_from_section_row(row, sections)
     except Exception as exc:
         logger.warning(
             "[pokemon-snapshot] insights snapshot read failed set_id=%s exc=%s",
@@ -6420,7 +6746,9 @@ def get_pokemon_set_insights_critical_snapshot_payload(set_id: str) -> Dict[str,
     docstring; this is a strict subset of the same fields, none of which are
     ever budget-trimmed (see _INSIGHTS_TRIMMABLE_LIST_PATHS).
     """
-    row, set_row, resolved_set_id, query_ms, started = _fetch_insights_snapshot_row(set_id)
+    row, set_row, resolved_set_id, query_ms, started = _fetch_insights_snapshot_row(
+        set_id, _INSIGHTS_CRITICAL_PAYLOAD_SECTIONS
+    )
 
     if not row or not isinstance(row.get("payload_json"), dict):
         logger.info(
@@ -6637,7 +6965,9 @@ def get_pokemon_set_insights_secondary_snapshot_payload(set_id: str) -> Dict[str
     (historyTrend, rarityContribution, simulationDrivers, outcomeDistribution.*)
     already fall entirely inside this payload.
     """
-    row, set_row, resolved_set_id, query_ms, started = _fetch_insights_snapshot_row(set_id)
+    row, set_row, resolved_set_id, query_ms, started = _fetch_insights_snapshot_row(
+        set_id, _INSIGHTS_SECONDARY_PAYLOAD_SECTIONS
+    )
 
     if not row or not isinstance(row.get("payload_json"), dict):
         logger.info(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import re
@@ -7,12 +8,22 @@ import time
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from backend.db.clients.supabase_client import create_public_read_client, public_read_client
-from backend.db.services.public_read_retry import run_public_read_with_retry
+from backend.db.clients.supabase_client import (
+    create_async_public_read_client,
+    create_public_read_client,
+    get_async_public_read_client,
+    public_read_client,
+)
+from backend.db.services.pokemon_card_movement_engine import (
+    CardMovementMatrix,
+    build_card_movement_matrix,
+    calculate_card_market_deltas,
+)
+from backend.db.services.price_observation_history_reader import read_price_observation_history
+from backend.db.services.public_read_retry import run_public_read_with_retry, run_public_read_with_retry_async
 from backend.db.services.data_service_health import is_transient_data_service_error
 from backend.db.services.pokemon_card_market_delta_contract import (
     WINDOW_CONVENTION,
-    calculate_pokemon_card_market_delta,
     utc_date_key,
 )
 
@@ -24,6 +35,9 @@ DEFAULT_SET_VALUE_HISTORY_DAYS = 7
 MAX_SET_VALUE_HISTORY_DAYS = 1825
 DEFAULT_TOP_CHASE_HISTORY_DAYS = 365
 MAX_TOP_CHASE_HISTORY_DAYS = 365
+# Read this much history before the chase trend window, so the window can end
+# on a slightly stale last observation and still have a carried-forward seed.
+TOP_CHASE_HISTORY_LOOKBACK_DAYS = 30
 DEFAULT_CARD_MOVERS_WINDOW_DAYS = 30
 DEFAULT_CARD_MOVERS_LIMIT = 5
 CARD_MOVERS_HISTORY_LOOKBACK_DAYS = 45
@@ -248,6 +262,30 @@ def _looks_like_uuid(value: str) -> bool:
     return bool(_UUID_RE.match(value))
 
 
+_SET_IDENTIFIER_LOOKUP_FIELDS = ("id", "canonical_key", "pokemon_api_set_id")
+
+
+def _match_normalized_set_row(
+    rows: Iterable[Dict[str, Any]], resolved: str, normalized_resolved: str
+) -> Optional[Dict[str, Any]]:
+    for row in list(rows):
+        candidate_keys = (
+            row.get("id"),
+            row.get("name"),
+            row.get("canonical_key"),
+            row.get("pokemon_api_set_id"),
+        )
+        if any(_normalise_set_lookup_key(candidate) == normalized_resolved for candidate in candidate_keys):
+            logger.info(
+                "[pokemon-set-market] resolved set identifier by normalized slug raw=%s canonical_set_id=%s canonical_key=%s",
+                resolved,
+                row.get("id"),
+                row.get("canonical_key"),
+            )
+            return row
+    return None
+
+
 def _resolve_pokemon_set_identifier_once(active_client: Any, set_id: str) -> Dict[str, Any]:
     """One resolution attempt against one client. See the public wrapper below."""
     t0 = time.perf_counter()
@@ -285,7 +323,7 @@ def _resolve_pokemon_set_identifier_once(active_client: Any, set_id: str) -> Dic
             return row
         raise PokemonSetMarketError(404, "Pokemon set not found", "POKEMON_SET_NOT_FOUND")
 
-    for field in ("id", "canonical_key", "pokemon_api_set_id"):
+    for field in _SET_IDENTIFIER_LOOKUP_FIELDS:
         try:
             result = (
                 active_client.table("sets")
@@ -310,21 +348,9 @@ def _resolve_pokemon_set_identifier_once(active_client: Any, set_id: str) -> Dic
                 .select("id,name,canonical_key,pokemon_api_set_id")
                 .execute()
             )
-            for row in list(result.data or []):
-                candidate_keys = (
-                    row.get("id"),
-                    row.get("name"),
-                    row.get("canonical_key"),
-                    row.get("pokemon_api_set_id"),
-                )
-                if any(_normalise_set_lookup_key(candidate) == normalized_resolved for candidate in candidate_keys):
-                    logger.info(
-                        "[pokemon-set-market] resolved set identifier by normalized slug raw=%s canonical_set_id=%s canonical_key=%s",
-                        resolved,
-                        row.get("id"),
-                        row.get("canonical_key"),
-                    )
-                    return row
+            row = _match_normalized_set_row(result.data or [], resolved, normalized_resolved)
+            if row:
+                return row
         except Exception as exc:
             if is_transient_data_service_error(exc):
                 raise
@@ -370,6 +396,96 @@ def resolve_pokemon_set_identifier(set_id: str, *, client: Any = None) -> Dict[s
     )
 
 
+async def _resolve_pokemon_set_identifier_once_async(active_client: Any, set_id: str) -> Dict[str, Any]:
+    """Async twin of `_resolve_pokemon_set_identifier_once`.
+
+    Same identifier forms, same precedence, same error mapping. The difference
+    is the non-UUID path: the exact-match lookups on id, canonical_key and
+    pokemon_api_set_id are independent, so they are issued together and the
+    first hit in precedence order wins, instead of paying up to three serial
+    round trips before the normalized-slug fallback.
+    """
+    t0 = time.perf_counter()
+    resolved = _to_optional_str(set_id)
+    if not resolved:
+        raise PokemonSetMarketError(400, "set_id is required", "POKEMON_SET_ID_REQUIRED")
+
+    def _lookup(field: str):
+        return (
+            active_client.table("sets")
+            .select("id,name,canonical_key,pokemon_api_set_id")
+            .eq(field, resolved)
+            .limit(1)
+            .execute()
+        )
+
+    if _looks_like_uuid(resolved):
+        try:
+            row = _first_row(await _lookup("id"))
+        except Exception as exc:
+            logger.exception(
+                "[pokemon-set-market] set id lookup failed set_id=%s elapsed_ms=%.1f exc_type=%s",
+                resolved,
+                (time.perf_counter() - t0) * 1000,
+                type(exc).__name__,
+            )
+            if is_transient_data_service_error(exc):
+                raise
+            raise PokemonSetMarketError(500, "Set lookup failed", "POKEMON_SET_LOOKUP_FAILED") from exc
+        if row:
+            return row
+        raise PokemonSetMarketError(404, "Pokemon set not found", "POKEMON_SET_NOT_FOUND")
+
+    results = await asyncio.gather(
+        *(_lookup(field) for field in _SET_IDENTIFIER_LOOKUP_FIELDS),
+        return_exceptions=True,
+    )
+    for field, result in zip(_SET_IDENTIFIER_LOOKUP_FIELDS, results):
+        if isinstance(result, Exception):
+            if is_transient_data_service_error(result):
+                raise result
+            logger.warning("[pokemon-set-market] set lookup failed field=%s set_id=%s", field, resolved)
+            continue
+        row = _first_row(result)
+        if row:
+            return row
+
+    normalized_resolved = _normalise_set_lookup_key(resolved)
+    if normalized_resolved:
+        try:
+            result = await (
+                active_client.table("sets")
+                .select("id,name,canonical_key,pokemon_api_set_id")
+                .execute()
+            )
+            row = _match_normalized_set_row(result.data or [], resolved, normalized_resolved)
+            if row:
+                return row
+        except Exception as exc:
+            if is_transient_data_service_error(exc):
+                raise
+            logger.warning("[pokemon-set-market] normalized set lookup failed set_id=%s", resolved)
+
+    raise PokemonSetMarketError(404, "Pokemon set not found", "POKEMON_SET_NOT_FOUND")
+
+
+async def resolve_pokemon_set_identifier_async(set_id: str, *, client: Any = None) -> Dict[str, Any]:
+    """Non-blocking `resolve_pokemon_set_identifier` for `async def` routes.
+
+    Runs under `run_public_read_with_retry_async`, so a dead pooled socket gets
+    the same single fresh-client retry — and shares the same circuit — as the
+    threadpool routes. `client` defaults to the process-wide async public read
+    client.
+    """
+    active_client = client if client is not None else get_async_public_read_client()
+    return await run_public_read_with_retry_async(
+        lambda attempt_client: _resolve_pokemon_set_identifier_once_async(attempt_client, set_id),
+        operation_name="pokemon_set.resolve_identifier",
+        initial_client=active_client,
+        client_factory=create_async_public_read_client,
+    )
+
+
 def _resolve_set_row(set_id: str) -> Dict[str, Any]:
     # Internal call sites in this module always use this module's own
     # public_read_client (picked up by resolve_pokemon_set_identifier's
@@ -550,48 +666,18 @@ def _load_price_observation_rows_for_window(
         return []
 
     active_client = client if client is not None else public_read_client
-    rows: List[Dict[str, Any]] = []
-    seen: set[Tuple[Any, ...]] = set()
-    safe_page_size = max(1, int(page_size))
-    for variant_id_chunk in _chunk(variant_ids, size=CARD_MOVERS_OBSERVATION_CHUNK_SIZE):
-        start = 0
-        while True:
-            result = (
-                active_client.table("card_variant_price_observations")
-                .select("id,card_variant_id,condition_id,market_price,source,captured_at")
-                .in_("card_variant_id", variant_id_chunk)
-                .eq("condition_id", condition_id)
-                .gt("market_price", 0)
-                .gte("captured_at", start_date.isoformat())
-                .lt("captured_at", end_date.isoformat())
-                .order("captured_at", desc=False)
-                .order("id", desc=False)
-                .range(start, start + safe_page_size - 1)
-                .execute()
-            )
-            page = list(result.data or [])
-            for row in page:
-                dedupe_key = (
-                    ("id", row.get("id"))
-                    if row.get("id") is not None
-                    else (
-                        "value",
-                        row.get("card_variant_id"),
-                        row.get("condition_id"),
-                        row.get("market_price"),
-                        row.get("source"),
-                        row.get("captured_at"),
-                    )
-                )
-                if dedupe_key in seen:
-                    continue
-                seen.add(dedupe_key)
-                rows.append(row)
-            if len(page) < safe_page_size:
-                break
-            start += safe_page_size
+    history = read_price_observation_history(
+        active_client,
+        variant_ids=variant_ids,
+        condition_ids=[condition_id],
+        captured_from=start_date.isoformat(),
+        captured_before=end_date.isoformat(),
+        positive_prices_only=True,
+        page_size=page_size,
+        chunk_size=CARD_MOVERS_OBSERVATION_CHUNK_SIZE,
+    )
     sources[source_key] = "OK"
-    return rows
+    return history.rows()
 
 
 def _load_conditioned_latest_price_rows(
@@ -644,56 +730,18 @@ def _load_conditioned_price_observation_rows(
 
     active_client = client if client is not None else public_read_client
     since = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-    rows: List[Dict[str, Any]] = []
-    seen: set[Tuple[Any, ...]] = set()
-    condition_ids = sorted(set(condition_by_variant.values()))
-    safe_page_size = max(1, int(page_size))
-    for variant_id_chunk in _chunk(variant_ids, size=CARD_MOVERS_OBSERVATION_CHUNK_SIZE):
-        start = 0
-        while True:
-            query = (
-                active_client.table("card_variant_price_observations")
-                .select("id,card_variant_id,condition_id,market_price,source,captured_at")
-                .in_("card_variant_id", variant_id_chunk)
-                .gte("captured_at", since)
-                .order("captured_at", desc=False)
-                .order("id", desc=False)
-            )
-            if condition_ids:
-                query = query.in_("condition_id", condition_ids)
-            result = query.range(start, start + safe_page_size - 1).execute()
-            page = list(result.data or [])
-            if diagnostics is not None:
-                diagnostics["observationQueryCount"] = diagnostics.get("observationQueryCount", 0) + 1
-                diagnostics["observationPageCount"] = diagnostics.get("observationPageCount", 0) + 1
-            for row in page:
-                variant_id = _to_optional_str(row.get("card_variant_id"))
-                condition_id = _to_optional_str(row.get("condition_id"))
-                if not variant_id or condition_id != condition_by_variant.get(variant_id):
-                    continue
-                dedupe_key = (
-                    ("id", row.get("id"))
-                    if row.get("id") is not None
-                    else (
-                        "value",
-                        variant_id,
-                        condition_id,
-                        row.get("market_price"),
-                        row.get("source"),
-                        row.get("captured_at"),
-                    )
-                )
-                if dedupe_key in seen:
-                    continue
-                seen.add(dedupe_key)
-                rows.append(row)
-            if len(page) < safe_page_size:
-                break
-            start += safe_page_size
+    history = read_price_observation_history(
+        active_client,
+        variant_ids=variant_ids,
+        condition_ids=sorted(set(condition_by_variant.values())),
+        condition_by_variant=condition_by_variant,
+        captured_from=since,
+        page_size=page_size,
+        chunk_size=CARD_MOVERS_OBSERVATION_CHUNK_SIZE,
+        diagnostics=diagnostics,
+    )
     sources["card_variant_price_observations_for_movers"] = "OK"
-    if diagnostics is not None:
-        diagnostics["observationRowsLoaded"] = len(rows)
-    return rows
+    return history.rows()
 
 
 def _build_market_context(
@@ -1203,7 +1251,14 @@ def _build_card_movements_from_context(
     diagnostics: Optional[Dict[str, int]] = None,
     observations_by_variant: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     latest_market_date: Optional[str] = None,
+    movement_matrix: Optional[CardMovementMatrix] = None,
 ) -> List[Dict[str, Any]]:
+    """Every selected card's movement for one window.
+
+    The deltas are evaluated set-wide on a (variant x day) matrix; pass
+    `movement_matrix` (built for `latest_market_date`) to share one across
+    windows.
+    """
     selected_by_card = dict(context.get("selected_price_by_canonical_id") or {})
     if not selected_by_card:
         return _build_legacy_card_movements_from_context(
@@ -1253,7 +1308,8 @@ def _build_card_movements_from_context(
     if not resolved_latest_market_date:
         return []
 
-    movements: List[Dict[str, Any]] = []
+    cards: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    selections: List[Dict[str, Any]] = []
     for canonical_id, selected_price in selected_by_card.items():
         canonical_card = (context.get("canonical_by_id") or {}).get(canonical_id)
         variant_id = _to_optional_str(selected_price.get("card_variant_id"))
@@ -1261,24 +1317,25 @@ def _build_card_movements_from_context(
         current_price = _to_optional_float(selected_price.get("market_price"))
         if not canonical_card or not variant_id or not condition_id or current_price is None:
             continue
-        delta = calculate_pokemon_card_market_delta(
-            observations=grouped_observations.get(variant_id, []),
-            selected_current_price=current_price,
-            selected_variant_id=variant_id,
-            selected_condition_id=condition_id,
-            latest_market_date=resolved_latest_market_date,
-            requested_window_days=window_days,
-            selected_current_source_date=selected_price.get("captured_at"),
-            selected_current_source=selected_price.get("source"),
-        )
-        movements.append(
-            _canonical_public_card_movement(
-                canonical_card=canonical_card,
-                selected_price=selected_price,
-                delta=delta,
-            )
+        cards.append((canonical_card, selected_price))
+        selections.append(
+            {
+                "variant_id": variant_id,
+                "condition_id": condition_id,
+                "current_price": current_price,
+                "current_source_date": selected_price.get("captured_at"),
+                "current_source": selected_price.get("source"),
+            }
         )
-    return movements
+    matrix = movement_matrix or build_card_movement_matrix(
+        grouped_observations,
+        latest_market_date=resolved_latest_market_date,
+    )
+    deltas = calculate_card_market_deltas(matrix, selections, requested_window_days=window_days)
+    return [
+        _canonical_public_card_movement(canonical_card=canonical_card, selected_price=selected_price, delta=delta)
+        for (canonical_card, selected_price), delta in zip(cards, deltas)
+    ]
 
 
 def _movement_payload_for_window(
@@ -1439,6 +1496,12 @@ def build_pokemon_set_card_movements_by_window_payload(
         diagnostics["latestMarketDateSource"] = (
             "coordinated_override" if latest_market_date else "selected_price_cohort"
         )
+        # One (variant x day) matrix serves every window.
+        movement_matrix = (
+            build_card_movement_matrix(observations_by_variant, latest_market_date=resolved_latest_market_date)
+            if resolved_latest_market_date
+            else None
+        )
         for requested_days in resolved_windows:
             movements = _build_card_movements_from_context(
                 context,
@@ -1448,6 +1511,7 @@ def build_pokemon_set_card_movements_by_window_payload(
                 client=active_client,
                 observations_by_variant=observations_by_variant,
                 latest_market_date=resolved_latest_market_date,
+                movement_matrix=movement_matrix,
             )
             key = f"{requested_days}D"
             payloads_by_window[key] = _movement_payload_for_window(
@@ -1810,60 +1874,57 @@ def _load_variant_price_history(
     matching_observation_count_by_variant: Dict[str, int] = {}
     matching_observation_dates: List[date] = []
     condition_ids = sorted(set(condition_by_variant.values()))
+    since = (datetime.now(timezone.utc) - timedelta(days=days + TOP_CHASE_HISTORY_LOOKBACK_DAYS)).isoformat()
     try:
-        for variant_id_chunk in _chunk(variant_ids):
-            query = (
-                public_read_client.table("card_variant_price_observations")
-                .select("card_variant_id,condition_id,market_price,source,captured_at")
-                .in_("card_variant_id", variant_id_chunk)
-                .order("captured_at", desc=True)
-                .limit(5000)
-            )
-            if condition_ids:
-                query = query.in_("condition_id", condition_ids)
-            result = query.execute()
-            for row in result.data or []:
-                variant_id = _to_optional_str(row.get("card_variant_id"))
-                condition_id = _to_optional_str(row.get("condition_id"))
-                price = _to_optional_float(row.get("market_price"))
-                date_key = _parse_date(row.get("captured_at"))
-                expected_condition_id = condition_by_variant.get(variant_id or "")
-                if (
-                    not variant_id
-                    or not expected_condition_id
-                    or condition_id != expected_condition_id
-                    or price is None
-                    or not date_key
-                ):
-                    continue
-                try:
-                    parsed_observation_date = date.fromisoformat(date_key)
-                except ValueError:
-                    continue
-                matching_observation_count_by_variant[variant_id] = matching_observation_count_by_variant.get(variant_id, 0) + 1
-                matching_observation_dates.append(parsed_observation_date)
-                existing = history_by_variant.setdefault(variant_id, {}).get(date_key)
-                captured_at = _to_optional_str(row.get("captured_at"))
-                captured_dt = _parse_datetime(captured_at)
-                existing_dt = _parse_datetime((existing or {}).get("captured_at"))
-                if existing is None or (
-                    captured_dt is not None
-                    and (existing_dt is None or captured_dt > existing_dt)
-                ):
-                    history_by_variant[variant_id][date_key] = {
-                        "date": date_key,
-                        "price": round(price, 2),
-                        "marketPrice": round(price, 2),
-                        "conditionId": condition_id,
-                        "condition_id": condition_id,
-                        "source": _to_optional_str(row.get("source")),
-                        "provider": _to_optional_str(row.get("source")),
-                        "captured_at": captured_at,
-                        "isCarriedForward": False,
-                        "is_carried_forward": False,
-                        "sourceDate": date_key,
-                        "source_date": date_key,
-                    }
+        history = read_price_observation_history(
+            public_read_client,
+            variant_ids=variant_ids,
+            condition_ids=condition_ids,
+            captured_from=since,
+            chunk_size=_IN_CHUNK_SIZE,
+        )
+        for row in history.rows():
+            variant_id = _to_optional_str(row.get("card_variant_id"))
+            condition_id = _to_optional_str(row.get("condition_id"))
+            price = _to_optional_float(row.get("market_price"))
+            date_key = _parse_date(row.get("captured_at"))
+            expected_condition_id = condition_by_variant.get(variant_id or "")
+            if (
+                not variant_id
+                or not expected_condition_id
+                or condition_id != expected_condition_id
+                or price is None
+                or not date_key
+            ):
+                continue
+            try:
+                parsed_observation_date = date.fromisoformat(date_key)
+            except ValueError:
+                continue
+            matching_observation_count_by_variant[variant_id] = matching_observation_count_by_variant.get(variant_id, 0) + 1
+            matching_observation_dates.append(parsed_observation_date)
+            existing = history_by_variant.setdefault(variant_id, {}).get(date_key)
+            captured_at = _to_optional_str(row.get("captured_at"))
+            captured_dt = _parse_datetime(captured_at)
+            existing_dt = _parse_datetime((existing or {}).get("captured_at"))
+            if existing is None or (
+                captured_dt is not None
+                and (existing_dt is None or captured_dt > existing_dt)
+            ):
+                history_by_variant[variant_id][date_key] = {
+                    "date": date_key,
+                    "price": round(price, 2),
+                    "marketPrice": round(price, 2),
+                    "conditionId": condition_id,
+                    "condition_id": condition_id,
+                    "source": _to_optional_str(row.get("source")),
+                    "provider": _to_optional_str(row.get("source")),
+                    "captured_at": captured_at,
+                    "isCarriedForward": False,
+                    "is_carried_forward": False,
+                    "sourceDate": date_key,
+                    "source_date": date_key,
+                }
         sources["card_variant_price_observations_for_chase_trends"] = "OK"
     except Exception as exc:
         if is_transient_data_service_error(exc):
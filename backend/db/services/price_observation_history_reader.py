@@ -0,0 +1,340 @@
+"""Bulk, keyset-paginated reader for `card_variant_price_observations`.
+
+Every history consumer - the Card Movers windows, the Top Chase histories, the
+Cards price-movement baselines - used to page through the observations with
+`.range(offset, ...)` over one `.in_()` variant chunk after another, then drop
+the rows a shifted offset had returned twice through a Python `seen` set.
+Offsets make every later page re-scan every earlier one, and the chunks were
+read strictly one after another.
+
+Here each chunk pages on the `(captured_at, id)` key instead: a page asks for
+the rows strictly after the last key it saw, which the
+(card_variant_id, condition_id, captured_at) index serves without re-reading
+earlier pages, and which can never return a row twice. Chunks are independent,
+so they are read concurrently on a small thread pool and concatenated back in
+chunk order; within a chunk the rows stay in ascending `(captured_at, id)`.
+
+The result serves both views: `rows()` for the row consumers, and one integer
+variant index, one UTC day and one price per observation as numpy arrays for
+the daily price matrix. The arrays are built only when first used.
+
+Inside `local_price_history_scope(store)` every read is first offered to a
+`LocalPriceHistoryStore`; only a read the store cannot fully serve goes to the
+network.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+PRICE_OBSERVATION_TABLE = "card_variant_price_observations"
+DEFAULT_OBSERVATION_PAGE_SIZE = 1000
+DEFAULT_OBSERVATION_CHUNK_SIZE = 50
+DEFAULT_OBSERVATION_READ_WORKERS = 4
+# Always selected: the keyset needs `id` and `captured_at`, the arrays need the
+# variant and the price.
+_REQUIRED_FIELDS = ("id", "card_variant_id", "captured_at", "market_price")
+
+# The `LocalPriceHistoryStore` reads are offered to first, if any.
+_local_store: Optional[Any] = None
+
+
+@contextmanager
+def local_price_history_scope(store: Optional[Any]) -> Iterator[None]:
+    """Serve observation reads from `store` where it can, for the block's duration."""
+    global _local_store
+    previous = _local_store
+    _local_store = store
+    try:
+        yield
+    finally:
+        _local_store = previous
+
+
+class PriceObservationHistory:
+    """Observations of `variant_ids`, as rows and as parallel columns.
+
+    `variant_index[i]` indexes `variant_ids`; `day[i]` is the UTC capture day
+    (NaT when `captured_at` is unparseable); `price[i]` is NaN when the stored
+    price is not a number. `fields` names the columns the rows were selected
+    with, which is exactly the key set `rows()` reproduces.
+
+    A network read keeps the rows it read and builds the arrays only when one
+    is first asked for, so the row consumers pay for no array work; a
+    `LocalPriceHistoryStore` read is columnar already and builds rows on
+    `rows()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        variant_ids: Tuple[str, ...],
+        fields: Tuple[str, ...],
+        rows: Optional[List[Dict[str, Any]]] = None,
+        columns: Optional[Mapping[str, np.ndarray]] = None,
+        arrays: Optional[Mapping[str, np.ndarray]] = None,
+    ) -> None:
+        if (rows is None) == (columns is None):
+            raise ValueError("PriceObservationHistory takes exactly one of rows or columns")
+        self.variant_ids = tuple(variant_ids)
+        self.fields = tuple(fields)
+        self._rows = rows
+        self._columns = columns
+        self._arrays = dict(arrays) if arrays is not None else None
+
+    def __len__(self) -> int:
+        if self._rows is not None:
+            return len(self._rows)
+        return int(next(iter(self._columns.values())).shape[0]) if self._columns else 0
+
+    def rows(self) -> List[Dict[str, Any]]:
+        if self._rows is not None:
+            return list(self._rows)
+        column_values = {name: self._columns[name].tolist() for name in self.fields}
+        return [
+            {name: column_values[name][position] for name in self.fields}
+            for position in range(len(self))
+        ]
+
+    def _array(self, name: str) -> np.ndarray:
+        if self._arrays is None:
+            rows = self._rows or []
+            index_by_variant = {variant_id: position for position, variant_id in enumerate(self.variant_ids)}
+            self._arrays = {
+                "variant_index": np.array(
+                    [index_by_variant[str(row.get("card_variant_id"))] for row in rows], dtype=np.int32
+                ),
+                "day": np.array([_utc_day(row.get("captured_at")) for row in rows], dtype="datetime64[D]"),
+                "price": np.array([_price(row.get("market_price")) for row in rows], dtype=np.float64),
+                "captured_at": np.array([row.get("captured_at") for row in rows], dtype=object),
+            }
+        return self._arrays[name]
+
+    @property
+    def variant_index(self) -> np.ndarray:
+        return self._array("variant_index")
+
+    @property
+    def day(self) -> np.ndarray:
+        return self._array("day")
+
+    @property
+    def price(self) -> np.ndarray:
+        return self._array("price")
+
+    @property
+    def captured_at(self) -> np.ndarray:
+        return self._array("captured_at")
+
+    def reversed(self) -> "PriceObservationHistory":
+        """The same observations newest-first (descending `(captured_at, id)`)."""
+        arrays = (
+            {name: values[::-1] for name, values in self._arrays.items()} if self._arrays is not None else None
+        )
+        if self._rows is not None:
+            return PriceObservationHistory(
+                variant_ids=self.variant_ids, fields=self.fields, rows=self._rows[::-1], arrays=arrays
+            )
+        return PriceObservationHistory(
+            variant_ids=self.variant_ids,
+            fields=self.fields,
+            columns={name: values[::-1] for name, values in self._columns.items()},
+            arrays=arrays,
+        )
+
+
+def _chunks(values: Sequence[str], size: int) -> Iterable[List[str]]:
+    for start in range(0, len(values), size):
+        yield list(values[start : start + size])
+
+
+def _utc_day(value: Any) -> Any:
+    if isinstance(value, datetime):
+        utc_value = value.astimezone(timezone.utc) if value.tzinfo is not None else value
+        return np.datetime64(utc_value.date().isoformat(), "D")
+    if isinstance(value, date):
+        return np.datetime64(value.isoformat(), "D")
+    text = str(value or "").strip()
+    if len(text) >= 10 and text[4] == "-" and text[7] == "-":
+        text = text[:10]
+    try:
+        return np.datetime64(date.fromisoformat(text).isoformat(), "D")
+    except ValueError:
+        return np.datetime64("NaT", "D")
+
+
+def _price(value: Any) -> float:
+    try:
+        return float(value) if value is not None and not isinstance(value, bool) else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def keyset_after_filter(captured_at: Any, observation_id: Any) -> str:
+    """PostgREST `or` filter for rows strictly after `(captured_at, id)`.
+
+    PostgREST has no row comparison, so the tuple order is spelled out. The
+    timestamp is quoted because it carries reserved characters (`:`, `+`).
+    """
+    return f'captured_at.gt."{captured_at}",and(captured_at.eq."{captured_at}",id.gt.{observation_id})'
+
+
+def _read_chunk(
+    client: Any,
+    variant_chunk: List[str],
+    *,
+    select_fields: str,
+    condition_ids: Sequence[str],
+    captured_from: Optional[str],
+    captured_before: Optional[str],
+    captured_through: Optional[str],
+    positive_prices_only: bool,
+    page_size: int,
+) -> Tuple[List[Dict[str, Any]], int]:
+    requested = set(variant_chunk)
+    rows: List[Dict[str, Any]] = []
+    cursor: Optional[Tuple[Any, Any]] = None
+    page_count = 0
+    while True:
+        query = client.table(PRICE_OBSERVATION_TABLE).select(select_fields).in_("card_variant_id", variant_chunk)
+        if len(condition_ids) == 1:
+            query = query.eq("condition_id", condition_ids[0])
+        elif condition_ids:
+            query = query.in_("condition_id", list(condition_ids))
+        if positive_prices_only:
+            query = query.gt("market_price", 0)
+        if captured_from is not None:
+            query = query.gte("captured_at", captured_from)
+        if captured_before is not None:
+            query = query.lt("captured_at", captured_before)
+        if captured_through is not None:
+            query = query.lte("captured_at", captured_through)
+        if cursor is not None:
+            query = query.or_(keyset_after_filter(*cursor))
+        page = list(
+            query.order("captured_at", desc=False).order("id", desc=False).limit(page_size).execute().data or []
+        )
+        page_count += 1
+        page_start = cursor
+        for row in page:
+            key = (row.get("captured_at"), row.get("id"))
+            # The key only ever moves forward; a key at or before the cursor is
+            # a row this chunk already holds.
+            if _at_or_before(key, cursor):
+                continue
+            if key[1] is not None:
+                cursor = key
+            if str(row.get("card_variant_id") or "") in requested:
+                rows.append(row)
+        if len(page) < page_size:
+            return rows, page_count
+        if cursor is None or cursor == page_start:
+            raise ValueError(
+                f"{PRICE_OBSERVATION_TABLE} keyset pagination did not advance; every row needs captured_at and id"
+            )
+
+
+def _at_or_before(key: Tuple[Any, Any], cursor: Optional[Tuple[Any, Any]]) -> bool:
+    if cursor is None or key[1] is None:
+        return False
+    try:
+        return key <= cursor
+    except TypeError:
+        return False
+
+
+def read_price_observation_history(
+    client: Any,
+    *,
+    variant_ids: Sequence[str],
+    condition_ids: Sequence[str] = (),
+    condition_by_variant: Optional[Mapping[str, str]] = None,
+    captured_from: Optional[str] = None,
+    captured_before: Optional[str] = None,
+    captured_through: Optional[str] = None,
+    positive_prices_only: bool = False,
+    fields: Sequence[str] = ("condition_id", "market_price", "source", "captured_at"),
+    page_size: int = DEFAULT_OBSERVATION_PAGE_SIZE,
+    chunk_size: int = DEFAULT_OBSERVATION_CHUNK_SIZE,
+    max_workers: int = DEFAULT_OBSERVATION_READ_WORKERS,
+    diagnostics: Optional[Dict[str, int]] = None,
+) -> PriceObservationHistory:
+    """Read every matching observation of `variant_ids` as columns.
+
+    `condition_ids` filters in the query; `condition_by_variant` additionally
+    keeps only each variant's own condition (the query can only filter on the
+    union of conditions). `captured_from` is inclusive, `captured_before`
+    exclusive and `captured_through` inclusive. A failed chunk read propagates
+    the first error; callers keep their existing handling of a failed read.
+    """
+
+    store = _local_store
+    if store is not None:
+        local_history = store.read(
+            variant_ids=variant_ids,
+            condition_ids=condition_ids,
+            condition_by_variant=condition_by_variant,
+            captured_from=captured_from,
+            captured_before=captured_before,
+            captured_through=captured_through,
+            positive_prices_only=positive_prices_only,
+            fields=fields,
+            chunk_size=chunk_size,
+        )
+        if local_history is not None:
+            if diagnostics is not None:
+                diagnostics["observationLocalReadCount"] = diagnostics.get("observationLocalReadCount", 0) + 1
+                diagnostics["observationRowsLoaded"] = (
+                    diagnostics.get("observationRowsLoaded", 0) + len(local_history)
+                )
+            return local_history
+
+    ordered_variant_ids = list(dict.fromkeys(str(variant_id) for variant_id in variant_ids if variant_id))
+    selected_fields = tuple(dict.fromkeys(("id", "card_variant_id", *fields)))
+    select_fields = ",".join(dict.fromkeys((*selected_fields, *_REQUIRED_FIELDS)))
+    safe_page_size = max(1, int(page_size))
+    chunks = list(_chunks(ordered_variant_ids, max(1, int(chunk_size))))
+
+    def read(variant_chunk: List[str]) -> Tuple[List[Dict[str, Any]], int]:
+        return _read_chunk(
+            client,
+            variant_chunk,
+            select_fields=select_fields,
+            condition_ids=list(condition_ids),
+            captured_from=captured_from,
+            captured_before=captured_before,
+            captured_through=captured_through,
+            positive_prices_only=positive_prices_only,
+            page_size=safe_page_size,
+        )
+
+    workers = max(1, min(int(max_workers), len(chunks)))
+    if workers <= 1:
+        chunk_results = [read(variant_chunk) for variant_chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="price-observations") as pool:
+            chunk_results = list(pool.map(read, chunks))
+
+    field_set = set(selected_fields)
+    rows: List[Dict[str, Any]] = []
+    for chunk_rows, _page_count in chunk_results:
+        for row in chunk_rows:
+            if condition_by_variant is not None:
+                expected_condition_id = condition_by_variant.get(str(row.get("card_variant_id") or ""))
+                if expected_condition_id is None or str(row.get("condition_id") or "") != str(expected_condition_id):
+                    continue
+            # Drop the keyset/array columns the caller did not ask for.
+            rows.append(row if row.keys() == field_set else {name: row.get(name) for name in selected_fields})
+    if diagnostics is not None:
+        pages = sum(page_count for _rows, page_count in chunk_results)
+        diagnostics["observationQueryCount"] = diagnostics.get("observationQueryCount", 0) + pages
+        diagnostics["observationPageCount"] = diagnostics.get("observationPageCount", 0) + pages
+        diagnostics["observationRowsLoaded"] = diagnostics.get("observationRowsLoaded", 0) + len(rows)
+
+    return PriceObservationHistory(variant_ids=tuple(ordered_variant_ids), fields=selected_fields, rows=rows)
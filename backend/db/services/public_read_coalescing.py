@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+"""Single-flight coalescing of identical concurrent public snapshot reads.
+
+A set page opens several routes at once, and a popular set is opened by many
+visitors at once, so the same snapshot row is routinely requested several times
+within one PostgREST round trip. Each of those requests used to issue its own
+read and assemble its own payload. Here the first request for a key becomes the
+leader and performs the read; every identical request that arrives while it is
+in flight waits for, and is answered with, the leader's result - including its
+exception.
+
+This is NOT a cache. The key is released the moment the leader settles, so a
+request that arrives afterwards always reads again and never sees an older row
+than an uncoalesced request would.
+
+Keys are (route family, resolved set id, normalized params). The set id must be
+the RESOLVED one: "ascendedHeroes", its slug and its UUID are the same row.
+Params must be the sanitized values the reader actually uses, so that two
+requests whose raw params sanitize identically share one read.
+
+Followers receive the SAME payload object as the leader, so coalesced readers
+must return payloads their callers treat as read-only (the API routes only
+serialize them).
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from backend.utils.metrics_registry import CACHE_LOOKUPS
+
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+CoalescingKey = Tuple[str, Optional[str], Hashable]
+
+
+@dataclass
+class _InFlightRead:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class _FamilyCounters:
+    executed: int = 0
+    coalesced: int = 0
+
+
+_LOCK = threading.Lock()
+_IN_FLIGHT: Dict[CoalescingKey, _InFlightRead] = {}
+# Async reads are keyed by their event loop as well: a task can only be
+# awaited from the loop that owns it.
+_IN_FLIGHT_ASYNC: Dict[Tuple[int, CoalescingKey], "asyncio.Task[Any]"] = {}
+_COUNTERS: Dict[str, _FamilyCounters] = {}
+
+
+def coalescing_key(route_family: str, resolved_set_id: Optional[str], params: Hashable = ()) -> CoalescingKey:
+    return (route_family, resolved_set_id, params)
+
+
+def _record(route_family: str, *, coalesced: bool) -> None:
+    # Callers hold _LOCK.
+    counters = _COUNTERS.setdefault(route_family, _FamilyCounters())
+    if coalesced:
+        counters.coalesced += 1
+    else:
+        counters.executed += 1
+    CACHE_LOOKUPS.inc(cache=f"single_flight:{route_family}", result="hit" if coalesced else "miss")
+
+
+def run_coalesced_read(key: CoalescingKey, operation: Callable[[], T]) -> T:
+    """Run `operation` once for all threads concurrently asking for `key`."""
+
+    route_family = key[0]
+    with _LOCK:
+        in_flight = _IN_FLIGHT.get(key)
+        leader = in_flight is None
+        if leader:
+            in_flight = _IN_FLIGHT[key] = _InFlightRead()
+        _record(route_family, coalesced=not leader)
+
+    if not leader:
+        in_flight.done.wait()
+        logger.debug("[public-read] coalesced %s set_id=%s onto an in-flight read", route_family, key[1])
+        if in_flight.error is not None:
+            raise in_flight.error
+        return in_flight.result
+
+    try:
+        in_flight.result = operation()
+        return in_flight.result
+    except BaseException as exc:
+        in_flight.error = exc
+        raise
+    finally:
+        with _LOCK:
+            _IN_FLIGHT.pop(key, None)
+        in_flight.done.set()
+
+
+async def run_coalesced_read_async(key: CoalescingKey, operation: Callable[[], Awaitable[T]]) -> T:
+    """Await `operation` once for all coroutines concurrently asking for `key`.
+
+    The read runs as its own task and every caller awaits it through a shield,
+    so a leader whose client disconnects does not cancel the read out from
+    under the followers still waiting on it.
+    """
+
+    route_family = key[0]
+    loop = asyncio.get_running_loop()
+    loop_key = (id(loop), key)
+    with _LOCK:
+        task = _IN_FLIGHT_ASYNC.get(loop_key)
+        leader = task is None
+        if leader:
+            task = loop.create_task(operation())
+            _IN_FLIGHT_ASYNC[loop_key] = task
+        _record(route_family, coalesced=not leader)
+
+    if leader:
+
+        def _release(_task: "asyncio.Task[Any]") -> None:
+            with _LOCK:
+                if _IN_FLIGHT_ASYNC.get(loop_key) is _task:
+                    del _IN_FLIGHT_ASYNC[loop_key]
+            if not _task.cancelled():
+                # Mark the exception retrieved; every waiter re-raises it itself.
+                _task.exception()
+
+        task.add_done_callback(_release)
+    else:
+        logger.debug("[public-read] coalesced %s set_id=%s onto an in-flight read", route_family, key[1])
+
+    return await asyncio.shield(task)
+
+
+def get_public_read_coalescing_stats() -> Dict[str, Dict[str, int]]:
+    """Per route family: reads actually executed, and requests served by one."""
+
+    with _LOCK:
+        return {
+            family: {"executed": counters.executed, "coalesced": counters.coalesced}
+            for family, counters in sorted(_COUNTERS.items())
+        }
+
+
+def _reset_public_read_coalescing_for_tests() -> None:
+    """Reset process-local state so unit tests do not influence one another."""
+
+    with _LOCK:
+        _IN_FLIGHT.clear()
+        _IN_FLIGHT_ASYNC.clear()
+        _COUNTERS.clear()
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 """Bounded retries and circuit breaking for live public PostgREST reads."""
 
+import asyncio
 import logging
 import random
+import re
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, TypeVar
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
-from backend.db.clients.supabase_client import create_public_read_client
+from backend.db.clients.supabase_client import create_async_public_read_client, create_public_read_client
 from backend.db.services.data_service_health import classify_data_service_error
+from backend.utils.metrics_registry import PUBLIC_READ_RETRIES
 
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,13 @@ T = TypeVar("T")
 
 _CIRCUIT_OPEN_SECONDS = 4.0
 _MAX_ELAPSED_BEFORE_RETRY_SECONDS = 1.0
+# Batch operation names carry a page index (`table.page[3]`); the metric label
+# keeps only the operation so one paginated read is one series.
+_OPERATION_PAGE_SUFFIX = re.compile(r"\[\d+\]$")
+
+
+def _record_retry(path: str, operation_name: str) -> None:
+    PUBLIC_READ_RETRIES.inc(path=path, operation=_OPERATION_PAGE_SUFFIX.sub("", operation_name))
 
 
 class PublicReadCircuitOpenError(RuntimeError):
@@ -106,11 +116,91 @@ def run_batch_read_with_retry(
             )
             if final:
                 raise
+            _record_retry("batch", operation_name)
             base_delay = min(4.0, 0.5 * (2 ** (attempt - 1)))
             sleep(max(0.0, base_delay + jitter(0.0, base_delay * 0.5)))
     raise AssertionError("unreachable")
 
 
+def _claim_or_log_blocked(started: float, operation_name: str) -> bool:
+    try:
+        return _claim_request_slot(started)
+    except PublicReadCircuitOpenError as exc:
+        failure = classify_data_service_error(exc)
+        logger.warning(
+            "public read blocked operation=%s attempt=0/0 error_type=%s "
+            "error_code=%s status=%s circuit=open",
+            operation_name,
+            failure.error_type,
+            failure.code,
+            failure.status_code,
+        )
+        raise
+
+
+def _after_failed_attempt(
+    exc: Exception,
+    *,
+    operation_name: str,
+    attempt: int,
+    attempts: int,
+    started: float,
+    half_open_probe: bool,
+    jitter: Callable[[float, float], float],
+    monotonic: Callable[[], float],
+) -> Optional[float]:
+    """Log one failed live attempt and return the retry delay.
+
+    Returns None when the failure is final; the caller re-raises. Shared by the
+    sync and async live paths so both trip and close the same circuit on the
+    same evidence.
+    """
+    failure = classify_data_service_error(exc)
+    elapsed = monotonic() - started
+    retry_budget_exhausted = elapsed >= _MAX_ELAPSED_BEFORE_RETRY_SECONDS
+    final = (
+        half_open_probe
+        or attempt >= attempts
+        or not failure.transient
+        or retry_budget_exhausted
+    )
+    logger.log(
+        logging.ERROR if final else logging.WARNING,
+        "public read failed operation=%s attempt=%s/%s error_type=%s "
+        "error_code=%s status=%s transient=%s final=%s",
+        operation_name,
+        attempt,
+        attempts,
+        failure.error_type,
+        failure.code,
+        failure.status_code,
+        failure.transient,
+        str(final).lower(),
+    )
+    if final:
+        if failure.transient:
+            _open_circuit(monotonic())
+        elif half_open_probe:
+            # A semantic/application error proves PostgREST is reachable.
+            _close_circuit()
+        return None
+
+    _record_retry("live", operation_name)
+    delay = max(0.0, jitter(0.25, 0.5))
+    logger.warning(
+        "public read retry operation=%s attempt=%s/%s error_type=%s "
+        "error_code=%s status=%s delay=%.3fs",
+        operation_name,
+        attempt,
+        attempts,
+        failure.error_type,
+        failure.code,
+        failure.status_code,
+        delay,
+    )
+    return delay
+
+
 def run_public_read_with_retry(
     operation: Callable[[Any], T],
     *,
@@ -130,19 +220,7 @@ def run_public_read_with_retry(
     """
 
     started = monotonic()
-    try:
-        half_open_probe = _claim_request_slot(started)
-    except PublicReadCircuitOpenError as exc:
-        failure = classify_data_service_error(exc)
-        logger.warning(
-            "public read blocked operation=%s attempt=0/0 error_type=%s "
-            "error_code=%s status=%s circuit=open",
-            operation_name,
-            failure.error_type,
-            failure.code,
-            failure.status_code,
-        )
-        raise
+    half_open_probe = _claim_or_log_blocked(started, operation_name)
 
     attempts = 1 if half_open_probe else max(1, min(int(max_attempts), 2))
     for attempt in range(1, attempts + 1):
@@ -150,50 +228,89 @@ def run_public_read_with_retry(
         try:
             result = operation(client)
         except Exception as exc:
-            failure = classify_data_service_error(exc)
-            elapsed = monotonic() - started
-            retry_budget_exhausted = elapsed >= _MAX_ELAPSED_BEFORE_RETRY_SECONDS
-            final = (
-                half_open_probe
-                or attempt >= attempts
-                or not failure.transient
-                or retry_budget_exhausted
+            delay = _after_failed_attempt(
+                exc,
+                operation_name=operation_name,
+                attempt=attempt,
+                attempts=attempts,
+                started=started,
+                half_open_probe=half_open_probe,
+                jitter=jitter,
+                monotonic=monotonic,
             )
-            logger.log(
-                logging.ERROR if final else logging.WARNING,
-                "public read failed operation=%s attempt=%s/%s error_type=%s "
-                "error_code=%s status=%s transient=%s final=%s",
-                operation_name,
-                attempt,
-                attempts,
-                failure.error_type,
-                failure.code,
-                failure.status_code,
-                failure.transient,
-                str(final).lower(),
-            )
-            if final:
-                if failure.transient:
-                    _open_circuit(monotonic())
-                elif half_open_probe:
-                    # A semantic/application error proves PostgREST is reachable.
-                    _close_circuit()
+            if delay is None:
                 raise
+            sleep(delay)
+            continue
 
-            delay = max(0.0, jitter(0.25, 0.5))
-            logger.warning(
-                "public read retry operation=%s attempt=%s/%s error_type=%s "
-                "error_code=%s status=%s delay=%.3fs",
-                operation_name,
-                attempt,
-                attempts,
-                failure.error_type,
-                failure.code,
-                failure.status_code,
-                delay,
+        _close_circuit()
+        return result
+
+    raise AssertionError("unreachable")
+
+
+async def _close_attempt_client(client: Any) -> None:
+    """Release the connection pool of a client built for a single attempt."""
+    # A supabase AsyncClient owns its httpx pool through the PostgREST client,
+    # which only exists once a request has been built.
+    closable = getattr(client, "_postgrest", None) or client
+    aclose = getattr(closable, "aclose", None)
+    if aclose is None:
+        return
+    try:
+        await aclose()
+    except Exception:
+        logger.debug("[public-read-retry] closing a retry client failed", exc_info=True)
+
+
+async def run_public_read_with_retry_async(
+    operation: Callable[[Any], Awaitable[T]],
+    *,
+    operation_name: str,
+    initial_client: Any = None,
+    max_attempts: int = 2,
+    client_factory: Callable[[], Any] = create_async_public_read_client,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    jitter: Callable[[float, float], float] = random.uniform,
+    monotonic: Callable[[], float] = time.monotonic,
+) -> T:
+    """Async twin of :func:`run_public_read_with_retry` for `async def` routes.
+
+    Same retry budget, same fresh-client rule and the SAME circuit breaker: a
+    PostgREST outage observed by a threadpool route must also suppress the
+    duplicate requests of an async route, and vice versa. Only the waiting
+    differs — the operation and the backoff are awaited, so no worker thread is
+    held while PostgREST answers. A client built for one attempt is closed when
+    that attempt ends; `initial_client` belongs to the caller and is left open.
+    """
+
+    started = monotonic()
+    half_open_probe = _claim_or_log_blocked(started, operation_name)
+
+    attempts = 1 if half_open_probe else max(1, min(int(max_attempts), 2))
+    for attempt in range(1, attempts + 1):
+        fresh_client = half_open_probe or attempt > 1 or initial_client is None
+        client = client_factory() if fresh_client else initial_client
+        try:
+            result = await operation(client)
+        except Exception as exc:
+            delay = _after_failed_attempt(
+                exc,
+                operation_name=operation_name,
+                attempt=attempt,
+                attempts=attempts,
+                started=started,
+                half_open_probe=half_open_probe,
+                jitter=jitter,
+                monotonic=monotonic,
             )
-            sleep(delay)
+            if delay is None:
+                raise
+            await sleep(delay)
             continue
+        finally:
+            if fresh_client:
+                await _close_attempt_client(client)
 
         _close_circuit()
         return result
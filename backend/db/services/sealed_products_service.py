@@ -12,16 +12,17 @@ from backend.db.repositories.sealed_product_prices_repository import (
     insert_sealed_product_prices_batch_with_stats,
 )
 from backend.db.services.batch_processor import BatchProcessor
+from backend.db.services.evr_input_cache import record_evr_price_ingestion
 from backend.db.services.orchestrators.data_preparation_orchestrator import DataPreparationOrchestrator
 
 class SealedProductsService(BatchProcessor):
     """
     Service layer for sealed product business logic.
     Orchestrates writes to sealed_products and sealed_product_price_observations tables.
-    Uses multiprocessing for parallel batch processing.
+    Uses a threaded pipeline for parallel batch processing and price shipping.
     """
     
-    # Multiprocessing configuration
+    # Batch pipeline configuration
     MAX_WORKERS = 4
     WORK_BATCH_SIZE = 10  # Smaller batches: ~3 batches of 10-11 items each for 31 products
     PRICE_BATCH_SIZE = 50
@@ -90,7 +91,7 @@ class SealedProductsService(BatchProcessor):
         """
         Worker function that processes a single batch of sealed product items.
         Implements BatchProcessor abstract method.
-        This runs in a separate process - minimal shared state.
+        This runs on a pipeline worker thread - minimal shared state.
         
         Args:
             batch_data: Tuple of (work_items, set_id)
@@ -107,7 +108,7 @@ class SealedProductsService(BatchProcessor):
             'prices_to_ship': []  # Prices that need to be inserted (after batch completes)
         }
         
-        # Local product cache for this process
+        # Local product cache for this batch
         product_cache = {}
         
         print(f"[Batch {batch_id}] Processing {len(work_items)} sealed products...")
@@ -330,7 +331,7 @@ class SealedProductsService(BatchProcessor):
         # Convert prepared items format
         work_items = [item for item in prepared_items if item]  # Filter out None entries
         
-        # Phase 2: Parallel batch processing with multiprocessing
+        # Phase 2: Parallel batch processing
         print(f"\n[INFO] Phase 2: Dividing {len(work_items)} items into batches...")
         
         batches = self.divide_work_into_batches(work_items, batch_size=self.WORK_BATCH_SIZE)
@@ -340,13 +341,14 @@ class SealedProductsService(BatchProcessor):
         def prepare_batch_data(batch, batch_id):
             return (batch, set_id)
         
-        # Process batches in parallel using BatchProcessor
-        batch_results, phase_2_errors = self.process_batches_in_parallel(batches, prepare_batch_data)
-        all_errors.extend(phase_2_errors)
-        
-        # Phase 3: Sequential batch shipping
-        prices_expected, prices_shipped, phase_3_errors = self.ship_results_sequentially(batch_results, results)
-        all_errors.extend(phase_3_errors)
+        # Phases 2 and 3: process batches on worker threads while shipping
+        # completed batches' prices in order
+        prices_expected, prices_shipped, pipeline_errors = self.process_and_ship_pipelined(
+            batches, prepare_batch_data, results)
+        all_errors.extend(pipeline_errors)
+
+        # New price observations make any cached EVR input snapshot of this set stale.
+        record_evr_price_ingestion(set_id)
         
         results['errors'].extend(all_errors)
 
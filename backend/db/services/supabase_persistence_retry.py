@@ -90,6 +90,11 @@ class ScraperPersistenceSession:
         self._client = None
 
 
+def active_scraper_persistence_session() -> Optional[ScraperPersistenceSession]:
+    """The session installed in the current context, if any."""
+    return _persistence_session.get()
+
+
 @contextmanager
 def scraper_persistence_session(
     session: Optional[ScraperPersistenceSession] = None,
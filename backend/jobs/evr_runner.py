@@ -479,7 +479,14 @@ def _emit_config_trace(*, phase: str, set_key: str, config: Any, calc_config_id:
 class EVRRunOrchestrator:
     """Owner of end-to-end EVR run orchestration for manual/scheduled invocations."""
 
-    def run(self, *, target_set_identifier: str, input_source: str, run_metadata: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    def run(
+        self,
+        *,
+        target_set_identifier: str,
+        input_source: str,
+        run_metadata: Dict[str, Any] | None = None,
+        refresh_inputs: bool = False,
+    ) -> Dict[str, Any]:
         effective_input_mode = str(input_source).strip().lower()
         if effective_input_mode != "db":
             raise ValueError("input_source must be 'db' for the active backend runtime")
@@ -497,7 +504,12 @@ class EVRRunOrchestrator:
         etb_enabled = _is_etb_enabled(config)
         set_name = str(getattr(config, "SET_NAME", canonical_key))
 
-        prepared = EVRInputPreparationService().prepare_for_set(config, canonical_key, set_name)
+        prepared = EVRInputPreparationService().prepare_for_set(
+            config,
+            canonical_key,
+            set_name,
+            refresh_inputs=refresh_inputs,
+        )
         calculation_input = prepared["dataframe"]
         etb_price = prepared.get("etb_price")
         etb_promo_card_price = prepared.get("etb_promo_card_price")
@@ -745,6 +757,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Optional run label for traceability.",
     )
+    parser.add_argument(
+        "--refresh-inputs",
+        action="store_true",
+        help="Re-query EVR inputs from the database and rewrite the cached snapshot (EVR_INPUT_CACHE_DIR).",
+    )
     return parser
 
 
@@ -775,6 +792,7 @@ def main() -> int:
                 "trigger": args.trigger,
                 "run_label": args.run_label,
             },
+            refresh_inputs=args.refresh_inputs,
         )
         return 0
     except Exception as exc:
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+"""Resumable progress for long date-range backfills.
+
+A multi-year backfill across every set can run for hours, and an interrupted
+run used to start over from the first date. A checkpoint records, per key (a
+set, or the whole run), the last date range that was committed; a re-run with
+the same parameters skips everything at or before it.
+
+The checkpoint is a small local JSON file holding the run's parameters next
+to its progress. Progress recorded under other parameters (another date
+range, another methodology) is ignored rather than trusted, and the file is
+rewritten through a staging file after every committed range, so an
+interruption loses at most the range in flight. Deleting the file starts the
+backfill from the beginning.
+"""
+
+import json
+import logging
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHECKPOINT_VERSION = 1
+
+
+class BackfillCheckpoint:
+    def __init__(self, path: Optional[Path], scope: Mapping[str, Any]) -> None:
+        self.path = path
+        self.scope = dict(scope)
+        self.progress: Dict[str, str] = {}
+
+    def completed_through(self, key: str) -> Optional[str]:
+        return self.progress.get(key)
+
+    def record(self, key: str, through: str) -> None:
+        self.progress[key] = through
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": BACKFILL_CHECKPOINT_VERSION, "scope": self.scope, "progress": self.progress}
+        staging = self.path.with_suffix(self.path.suffix + ".tmp")
+        staging.write_text(json.dumps(payload, sort_keys=True, default=str), encoding="utf-8", newline="\n")
+        staging.replace(self.path)
+
+
+def load_backfill_checkpoint(path: Optional[Path], scope: Mapping[str, Any]) -> BackfillCheckpoint:
+    checkpoint = BackfillCheckpoint(path, scope)
+    if path is None or not path.exists():
+        return checkpoint
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("[backfill-checkpoint] unreadable checkpoint %s; starting from the beginning", path)
+        return checkpoint
+    if not isinstance(data, dict) or data.get("version") != BACKFILL_CHECKPOINT_VERSION:
+        return checkpoint
+    if json.loads(json.dumps(checkpoint.scope, sort_keys=True, default=str)) != data.get("scope"):
+        logger.info("[backfill-checkpoint] %s was recorded for other parameters; starting from the beginning", path)
+        return checkpoint
+    progress = data.get("progress")
+    if isinstance(progress, dict):
+        checkpoint.progress = {str(key): str(value) for key, value in progress.items()}
+    logger.info("[backfill-checkpoint] resuming from %s (%s key(s) in progress)", path, len(checkpoint.progress))
+    return checkpoint
+
+
+def date_ranges(start_date: str, end_date: str, range_days: int) -> Iterator[Tuple[str, str]]:
+    """Consecutive inclusive [start, end] ranges of at most `range_days` days."""
+    step = max(1, int(range_days))
+    current = date.fromisoformat(start_date)
+    last = date.fromisoformat(end_date)
+    while current <= last:
+        range_end = min(current + timedelta(days=step - 1), last)
+        yield current.isoformat(), range_end.isoformat()
+        current = range_end + timedelta(days=1)
+
+
+def chunk_rows_by_date(rows: List[Mapping[str, Any]], date_field: str, range_days: int) -> Iterator[List[Mapping[str, Any]]]:
+    """Rows sorted by `date_field`, grouped into consecutive `range_days`-day ranges."""
+    ordered = sorted(rows, key=lambda row: str(row[date_field])[:10])
+    if not ordered:
+        return
+    first, last = str(ordered[0][date_field])[:10], str(ordered[-1][date_field])[:10]
+    position = 0
+    for _range_start, range_end in date_ranges(first, last, range_days):
+        chunk: List[Mapping[str, Any]] = []
+        while position < len(ordered) and str(ordered[position][date_field])[:10] <= range_end:
+            chunk.append(ordered[position])
+            position += 1
+        if chunk:
+            yield chunk
@@ -15,6 +15,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from backend.db.clients.supabase_client import create_service_role_client
+from backend.scripts.backfill_checkpoint import date_ranges, load_backfill_checkpoint
 
 
 logger = logging.getLogger("backfill_pokemon_set_value_daily_history")
@@ -61,6 +62,18 @@ def parse_args() -> argparse.Namespace:
         "--end-date",
         help="Optional last snapshot date to refresh, YYYY-MM-DD.",
     )
+    parser.add_argument(
+        "--range-days",
+        type=int,
+        help=(
+            "Refresh each set one date range of N days per RPC call instead of the whole range at once. "
+            "Requires --start-date and --end-date."
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Record each committed set/date range in this file and skip ranges it already holds on a re-run.",
+    )
     parser.add_argument(
         "--commit",
         action="store_true",
@@ -172,6 +185,21 @@ def main() -> int:
     end_date = validate_date(args.end_date, "--end-date")
     if start_date and end_date and start_date > end_date:
         raise SystemExit("--start-date must be on or before --end-date")
+    if args.range_days and not (start_date and end_date):
+        raise SystemExit("--range-days requires --start-date and --end-date")
+    ranges = (
+        list(date_ranges(start_date, end_date, args.range_days))
+        if args.range_days
+        else [(start_date, end_date)]
+    )
+    checkpoint = (
+        load_backfill_checkpoint(
+            Path(args.checkpoint),
+            {"job": "pokemon_set_value_daily_history", "startDate": start_date, "endDate": end_date},
+        )
+        if args.checkpoint and args.commit
+        else None
+    )
 
     client = create_service_role_client()
     targets = [resolve_set(client, args.set_key)] if args.set_key else fetch_all_sets(client)
@@ -203,11 +231,21 @@ def main() -> int:
                 processed += 1
                 continue
 
+            row_count = 0
             try:
-                row_count = refresh_set(client, target, start_date, end_date)
+                for range_start, range_end in ranges:
+                    # An open-ended range sorts after every dated one.
+                    range_key = range_end or "9999-12-31"
+                    done_through = checkpoint.completed_through(target.id) if checkpoint else None
+                    if done_through is not None and done_through >= range_key:
+                        continue
+                    row_count += refresh_set(client, target, range_start, range_end)
+                    if checkpoint:
+                        checkpoint.record(target.id, range_key)
             except Exception as exc:
                 failed.append(f"{label}: {exc}")
                 processed += 1
+                total_rows += row_count
                 logger.exception("Failed to refresh %s (%s); continuing", target.name, label)
                 continue
             total_rows += row_count
@@ -9,6 +9,11 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from backend.db.services.explore_rankings_contribution_cache import (
+    DEFAULT_RANKINGS_CONTRIBUTION_CACHE_PATH,
+    load_contribution_cache,
+    save_contribution_cache,
+)
 from backend.db.services.publication_gate import (
     add_publication_gate_args,
     enforce_cli_publication_gate,
@@ -33,6 +38,20 @@ def build_parser() -> argparse.ArgumentParser:
     mode_group.add_argument("--dry-run", action="store_true", help="Build and log without writing")
     mode_group.add_argument("--commit", action="store_true", help="Upsert snapshot row")
     parser.add_argument("--limit", type=int, default=DEFAULT_RANKINGS_LIMIT)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Reuse cached per-set Top 10 Card Value and Top Chase contributions whose source stamps "
+            "are unchanged; only changed sets are read again. Ranks and tiers are always re-derived."
+        ),
+    )
+    parser.add_argument(
+        "--contribution-cache",
+        type=Path,
+        default=DEFAULT_RANKINGS_CONTRIBUTION_CACHE_PATH,
+        help="Contribution cache file used by --incremental",
+    )
     add_publication_gate_args(parser)
     return parser
 
@@ -55,9 +74,15 @@ def main() -> None:
     if not gate.proceed:
         raise SystemExit(gate.exit_code)
 
+    contribution_cache = load_contribution_cache(args.contribution_cache) if args.incremental else None
+    cache_kwargs = {"contribution_cache": contribution_cache} if contribution_cache is not None else {}
     publish_explore_rip_rankings_snapshot(
-        client, limit=args.limit, market_date=args.market_date, commit=commit
+        client, limit=args.limit, market_date=args.market_date, commit=commit, **cache_kwargs
     )
+    # Saved only after a successful publish: a refused or failed build leaves
+    # the previous cache in place.
+    if contribution_cache is not None:
+        save_contribution_cache(contribution_cache)
 
 
 if __name__ == "__main__":
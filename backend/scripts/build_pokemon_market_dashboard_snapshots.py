@@ -10,6 +10,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from backend.db.services.local_price_history_store import LocalPriceHistoryStore
 from backend.db.services.pokemon_set_market_service import PokemonSetMarketError
 from backend.db.services.data_service_health import is_transient_data_service_error
 from backend.db.services.market_publication_gate import (
@@ -19,8 +20,15 @@ from backend.db.services.publication_gate import (
     add_publication_gate_args,
     enforce_cli_publication_gate,
 )
+from backend.db.services.price_observation_history_reader import local_price_history_scope
 from backend.db.services.set_publication_revalidation import notify_set_publication
+from backend.scripts.snapshot_input_fingerprint import (
+    coordinated_market_input_fingerprint,
+    coordinated_market_snapshots_are_current,
+    stamp_input_fingerprint,
+)
 from backend.scripts.snapshot_query_retry import run_snapshot_operation_with_retry
+from backend.scripts.snapshot_set_fanout import DEFAULT_FANOUT_UPSERT_BATCH_SIZE, run_coordinated_market_fanout
 from backend.scripts.pokemon_snapshot_builders import (
     DEFAULT_DASHBOARD_DAYS,
     DEFAULT_DASHBOARD_WINDOW,
@@ -55,6 +63,36 @@ def build_parser() -> argparse.ArgumentParser:
         default=3,
         help="Stop an --all build after this many consecutive exhausted transient failures",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Build up to N sets concurrently with per-set retries and batched upserts "
+            "(default 1: one set at a time, paced by --delay-seconds)"
+        ),
+    )
+    parser.add_argument(
+        "--upsert-batch-size",
+        type=int,
+        default=DEFAULT_FANOUT_UPSERT_BATCH_SIZE,
+        help="Sets per Cards/Dashboard upsert request when --workers > 1",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "After the canonical price refresh, skip the build and write of any set whose stored "
+            "Cards and dashboard rows already carry the fingerprint of its current inputs"
+        ),
+    )
+    parser.add_argument(
+        "--price-history-store",
+        help=(
+            "Read price observations from this local store (see sync_local_price_history.py) "
+            "wherever it holds the full requested window; everything else is read from the database"
+        ),
+    )
     add_publication_gate_args(parser)
     return parser
 
@@ -84,6 +122,12 @@ def _error_message(exc: Exception) -> str:
 def main() -> int:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = build_parser().parse_args()
+    store = LocalPriceHistoryStore(Path(args.price_history_store)) if args.price_history_store else None
+    with local_price_history_scope(store):
+        return _build(args)
+
+
+def _build(args: argparse.Namespace) -> int:
     commit = should_commit(args)
 
     # Market Date Quality is the authority for Market artifacts. It is
@@ -104,6 +148,7 @@ def main() -> int:
         return gate.exit_code
 
     built_count = 0
+    unchanged_count = 0
     skipped_count = 0
     failed_count = 0
     revalidated: set[str] = set()
@@ -116,6 +161,11 @@ def main() -> int:
     consecutive_transient_failures = 0
     transient_threshold = max(1, int(args.max_consecutive_transient_failures))
 
+    if args.workers > 1:
+        return _build_in_parallel(
+            target_sets, args, commit=commit, transient_threshold=transient_threshold
+        )
+
     for index, set_row in enumerate(target_sets):
         logging.info("building market dashboard snapshot %s", _set_label(set_row))
         try:
@@ -126,12 +176,23 @@ def main() -> int:
                         str(set_row["id"]),
                         commit=commit,
                     )
+                    fingerprint = None
+                    if args.skip_unchanged:
+                        fingerprint = coordinated_market_input_fingerprint(
+                            fresh_client, set_row, days=args.days, window=args.window
+                        )
+                        if coordinated_market_snapshots_are_current(
+                            fresh_client, str(set_row["id"]), fingerprint, window=args.window
+                        ):
+                            return False
                     cards_row, dashboard_row, top_chase_history_rows = build_coordinated_set_market_snapshot_rows(
                         set_row,
                         days=args.days,
                         window=args.window,
                         client=fresh_client,
                     )
+                    cards_row = stamp_input_fingerprint(cards_row, fingerprint)
+                    dashboard_row = stamp_input_fingerprint(dashboard_row, fingerprint)
                     upsert_row(
                         fresh_client,
                         "pokemon_set_cards_snapshot_latest",
@@ -153,19 +214,25 @@ def main() -> int:
                         on_conflict="set_id,window_key",
                         commit=commit,
                     )
+                return True
 
-            run_snapshot_operation_with_retry(
+            written = run_snapshot_operation_with_retry(
                 build_and_write,
                 operation_name="build market dashboard snapshot",
                 set_id=str(set_row.get("id") or ""),
                 client_factory=get_client,
             )
-            built_count += 1
             consecutive_transient_failures = 0
-            # Cards + Top Chase history + dashboard all committed for this set:
-            # invalidate the frontend seed cache exactly once, and never on a
-            # dry-run or after a partial coordinated write.
-            notify_set_publication(set_row, window=args.window, commit=commit, seen=revalidated)
+            if written:
+                built_count += 1
+                # Cards + Top Chase history + dashboard all committed for this set:
+                # invalidate the frontend seed cache exactly once, and never on a
+                # dry-run or after a partial coordinated write.
+                notify_set_publication(set_row, window=args.window, commit=commit, seen=revalidated)
+            else:
+                # Nothing was written, so there is nothing to revalidate.
+                unchanged_count += 1
+                logging.info("market dashboard snapshot unchanged %s", _set_label(set_row))
         except Exception as exc:
             if _is_missing_data_error(exc):
                 skipped_count += 1
@@ -198,7 +265,72 @@ def main() -> int:
         if args.all and index < len(target_sets) - 1 and args.delay_seconds > 0:
             time.sleep(max(0.0, float(args.delay_seconds)))
 
-    summary = f"market dashboard snapshot summary built={built_count} skipped={skipped_count} failed={failed_count}"
+    return _report_summary(
+        built_count=built_count,
+        unchanged_count=unchanged_count,
+        skipped_count=skipped_count,
+        failed_count=failed_count,
+    )
+
+
+def _build_in_parallel(
+    target_sets: list[dict], args: argparse.Namespace, *, commit: bool, transient_threshold: int
+) -> int:
+    outcomes = run_coordinated_market_fanout(
+        target_sets,
+        days=args.days,
+        window=args.window,
+        commit=commit,
+        workers=args.workers,
+        batch_size=args.upsert_batch_size,
+        max_consecutive_transient_failures=transient_threshold if args.all else None,
+        client_factory=get_client,
+        skip_unchanged=args.skip_unchanged,
+    )
+    built_count = 0
+    unchanged_count = 0
+    skipped_count = 0
+    failed_count = 0
+    revalidated: set[str] = set()
+    for outcome in outcomes:
+        set_row = outcome.set_row
+        if outcome.unchanged:
+            unchanged_count += 1
+            logging.info("market dashboard snapshot unchanged %s", _set_label(set_row))
+        elif outcome.built:
+            built_count += 1
+            notify_set_publication(set_row, window=args.window, commit=commit, seen=revalidated)
+        elif outcome.error is not None and _is_missing_data_error(outcome.error):
+            skipped_count += 1
+            logging.warning(
+                "skipping market dashboard snapshot %s code=%s message=%s",
+                _set_label(set_row),
+                _error_code(outcome.error),
+                _error_message(outcome.error),
+            )
+        elif outcome.error is not None:
+            failed_count += 1
+            logging.error(
+                "failed market dashboard snapshot %s code=%s message=%s",
+                _set_label(set_row),
+                _error_code(outcome.error),
+                _error_message(outcome.error),
+                exc_info=outcome.error,
+            )
+    return _report_summary(
+        built_count=built_count,
+        unchanged_count=unchanged_count,
+        skipped_count=skipped_count,
+        failed_count=failed_count,
+    )
+
+
+def _report_summary(*, built_count: int, unchanged_count: int, skipped_count: int, failed_count: int) -> int:
+    # `unchanged` sets were neither rebuilt nor rewritten (--skip-unchanged).
+    summary = (
+        f"market dashboard snapshot summary built={built_count} skipped={skipped_count} "
+        f"failed={failed_count} unchanged={unchanged_count}"
+    )
     logging.info(summary)
     print(summary)
     # Graceful skips (documented missing-data sets) keep the run successful;
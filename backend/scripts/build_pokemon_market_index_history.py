@@ -14,24 +14,41 @@ from backend.db.services.market_publication_gate import (
 )
 from backend.db.services.pokemon_market_index_service import build_market_index_history, persist_index_rows, resolve_eligible_sets
 from backend.domain.pokemon.market_index import CHASE_INDEX_KEY, INDEX_KEYS, MARKET_INDEX_CONTRACT_VERSION, MARKET_INDEX_METHODOLOGY_VERSION, RAW_INDEX_KEY
+from backend.scripts.backfill_checkpoint import chunk_rows_by_date, load_backfill_checkpoint
 from backend.scripts.pokemon_snapshot_builders import get_client
 
+DEFAULT_CHUNK_DAYS = 31
+
 
 def parser():
     p = argparse.ArgumentParser(description="Build chain-linked Pokemon Market index history")
     mode = p.add_mutually_exclusive_group(required=True); mode.add_argument("--dry-run", action="store_true"); mode.add_argument("--commit", action="store_true")
     p.add_argument("--market-date"); p.add_argument("--backfill", action="store_true"); p.add_argument("--from-date")
+    p.add_argument("--chunk-days", type=int, help=f"Upsert the rows one market-date range of N days per request (default with --checkpoint: {DEFAULT_CHUNK_DAYS})")
+    p.add_argument("--checkpoint", help="Record each committed date range in this file and skip ranges it already holds on a re-run")
     add_market_gate_args(p)
     p.add_argument("--force-publish", action="store_true",
                    help="Rejected for Market publication; Market Date Quality cannot be overridden")
     return p
 
 
-def build(client, *, market_date=None, backfill=False, from_date=None, commit=False, accepted_dates=None):
+def persist_in_ranges(client, rows, *, chunk_days, checkpoint):
+    """Upsert one date range per request, oldest first, recording each committed range."""
+    done_through = checkpoint.completed_through("index") if checkpoint else None
+    persisted = 0
+    for chunk in chunk_rows_by_date([row for row in rows if not done_through or row["market_date"] > done_through], "market_date", chunk_days):
+        persisted += persist_index_rows(client, chunk)
+        if checkpoint: checkpoint.record("index", chunk[-1]["market_date"])
+    return persisted
+
+
+def build(client, *, market_date=None, backfill=False, from_date=None, commit=False, accepted_dates=None, chunk_days=None, checkpoint=None):
     rows = build_market_index_history(client, through_date=market_date, accepted_dates=accepted_dates)
     if from_date: rows = [row for row in rows if row["market_date"] >= from_date]
     if market_date and not backfill: rows = [row for row in rows if row["market_date"] == market_date]
-    persisted = persist_index_rows(client, rows) if commit else 0
+    if not commit: persisted = 0
+    elif chunk_days or checkpoint: persisted = persist_in_ranges(client, rows, chunk_days=chunk_days or DEFAULT_CHUNK_DAYS, checkpoint=checkpoint)
+    else: persisted = persist_index_rows(client, rows)
     latest = {key: next((row for row in reversed(rows) if row["index_key"] == key), None) for key in INDEX_KEYS}
     source_fp = "|".join(str(latest[key].get("source_generation_fingerprint")) for key in INDEX_KEYS if latest[key])
     return {"contractVersion": MARKET_INDEX_CONTRACT_VERSION, "methodologyVersion": MARKET_INDEX_METHODOLOGY_VERSION,
@@ -72,10 +89,15 @@ def main():
         raise SystemExit(3) from exc
     if gate.decision.market_date:
         accepted.add(str(gate.decision.market_date)[:10])
+    # The chain-link history is always rebuilt whole (it is cheap); only the
+    # writes resume, so a checkpoint from another date scope is not reused.
+    checkpoint = load_backfill_checkpoint(Path(args.checkpoint), {
+        "job": "pokemon_market_index_history", "methodologyVersion": MARKET_INDEX_METHODOLOGY_VERSION,
+        "marketDate": args.market_date, "fromDate": args.from_date, "backfill": bool(args.backfill)}) if args.checkpoint else None
     try:
         summary = build(client, market_date=args.market_date, backfill=args.backfill,
                         from_date=args.from_date, commit=args.commit,
-                        accepted_dates=accepted)
+                        accepted_dates=accepted, chunk_days=args.chunk_days, checkpoint=checkpoint)
     except Exception as exc:
         print(json.dumps({"errors": [str(exc)]}, sort_keys=True)); raise SystemExit(1) from exc
     summary["marketQualityStatus"] = gate.decision.status
@@ -4,7 +4,11 @@ import argparse
 import logging
 import subprocess
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
@@ -25,24 +29,71 @@ def build_parser() -> argparse.ArgumentParser:
     mode_group.add_argument("--commit", action="store_true", help="Write snapshot rows")
     parser.add_argument("--days", type=int, default=365, help="Market dashboard history days")
     parser.add_argument("--window", default="365d", help="Market dashboard window key")
+    parser.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=1,
+        help="Run up to N independent steps concurrently (default 1: one at a time, in declaration order)",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "Forward --skip-unchanged to the per-set builders: sets whose stored snapshots already "
+            "carry the fingerprint of their current inputs are neither rebuilt nor rewritten"
+        ),
+    )
     add_publication_gate_args(parser)
     return parser
 
 
+def _positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return parsed
+
+
+@dataclass(frozen=True)
+class SnapshotStep:
+    """One child build. `inputs` / `outputs` name the snapshot artifacts it
+    reads and publishes; an input is a real dependency on whichever step
+    declares it as an output, and the runner derives its edges from them."""
+
+    label: str
+    args: Tuple[str, ...]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+
+@dataclass
+class StepOutcome:
+    label: str
+    exit_code: int
+    started: float = 0.0
+    finished: float = 0.0
+    # Set when the step never ran because an upstream producer deferred.
+    deferred_by: Optional[str] = None
+
+    @property
+    def seconds(self) -> float:
+        return max(0.0, self.finished - self.started)
+
+
 def _run_step(label: str, args: list[str]) -> int:
     """Run one snapshot step. Returns its process exit code; never raises.
 
-    The steps are ordered but NOT dependent: Explore rankings reads the RIP
-    statistics view and the desirability component rows, and set pages read their
-    own sources. None of them read the market dashboard. Aborting the pipeline on
-    the first non-zero exit therefore let one older set's market dashboard failure
-    withhold the rankings and set-page snapshots entirely - which is what happened:
-    the run died at rankings and set pages never executed at all.
+    A FAILED step does not stop the pipeline, not even its dependents: a builder
+    that fails on one older set has still published every other set, and
+    aborting on the first non-zero exit once let one set's market dashboard
+    failure withhold the rankings and set-page snapshots entirely - the run died
+    at rankings and set pages never executed at all.
 
     So each step runs regardless, and the pipeline reports a non-zero exit at the
     end. Failing loudly and failing early are different things; only the first is
     wanted here. A child that DEFERS on a closed gate (exit 3) is reported
-    distinctly from a genuine build failure.
+    distinctly from a genuine build failure, and - unlike a failure - it wrote
+    nothing, so the runner skips the steps that declared its outputs as inputs.
     """
     logging.info("snapshot step start: %s", label)
     result = subprocess.run([sys.executable, *args], cwd=REPO_ROOT)
@@ -59,6 +110,217 @@ def _run_step(label: str, args: list[str]) -> int:
     return result.returncode
 
 
+def step_dependencies(steps: Sequence[SnapshotStep]) -> Dict[str, List[str]]:
+    """Map each step label to the labels of the steps producing its inputs.
+
+    Every input must be produced by a step declared EARLIER, so declaration
+    order is always a valid serial order and the graph cannot contain a cycle.
+    """
+    producers: Dict[str, str] = {}
+    dependencies: Dict[str, List[str]] = {}
+    for step in steps:
+        if step.label in dependencies:
+            raise ValueError(f"duplicate snapshot step: {step.label}")
+        upstream: List[str] = []
+        for artifact in step.inputs:
+            producer = producers.get(artifact)
+            if producer is None:
+                raise ValueError(f"snapshot step {step.label!r} reads {artifact!r}, which no earlier step produces")
+            if producer not in upstream:
+                upstream.append(producer)
+        dependencies[step.label] = upstream
+        for artifact in step.outputs:
+            producers[artifact] = step.label
+    return dependencies
+
+
+def _timed_step(step: SnapshotStep) -> StepOutcome:
+    started = time.monotonic()
+    exit_code = _run_step(step.label, list(step.args))
+    return StepOutcome(step.label, exit_code, started=started, finished=time.monotonic())
+
+
+def run_pipeline(steps: Sequence[SnapshotStep], *, max_workers: int = 1) -> List[StepOutcome]:
+    """Run `steps` with up to `max_workers` children at once. Returns outcomes in
+    declaration order.
+
+    A step starts once every producer of its inputs has finished; ready steps
+    start in declaration order, so max_workers=1 reproduces the serial pipeline
+    exactly. A step whose producer deferred (directly or transitively) is not
+    run and is reported as deferred itself.
+    """
+    dependencies = step_dependencies(steps)
+    outcomes: Dict[str, StepOutcome] = {}
+    pending = list(steps)
+    running: Dict[Future, SnapshotStep] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="snapshot-step") as pool:
+        while pending or running:
+            progressed = True
+            while progressed:
+                progressed = False
+                for step in list(pending):
+                    upstream = dependencies[step.label]
+                    if any(label not in outcomes for label in upstream):
+                        continue
+                    deferred_by = next(
+                        (label for label in upstream if outcomes[label].exit_code == GATE_DEFERRED_EXIT_CODE),
+                        None,
+                    )
+                    if deferred_by is not None:
+                        now = time.monotonic()
+                        outcomes[step.label] = StepOutcome(
+                            step.label, GATE_DEFERRED_EXIT_CODE, started=now, finished=now, deferred_by=deferred_by
+                        )
+                        logging.warning(
+                            "snapshot step SKIPPED: %s (upstream step deferred: %s)", step.label, deferred_by
+                        )
+                        pending.remove(step)
+                        progressed = True
+                    elif len(running) < max_workers:
+                        running[pool.submit(_timed_step, step)] = step
+                        pending.remove(step)
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                outcome = future.result()
+                outcomes[outcome.label] = outcome
+    return [outcomes[step.label] for step in steps]
+
+
+def critical_path(
+    outcomes: Sequence[StepOutcome], dependencies: Dict[str, List[str]]
+) -> Tuple[float, List[str]]:
+    """The chain of dependent steps with the largest summed duration.
+
+    That sum, not the total step time, is the floor for the pipeline's wall
+    time however many workers run it.
+    """
+    by_label = {outcome.label: outcome for outcome in outcomes}
+    cost: Dict[str, float] = {}
+    via: Dict[str, Optional[str]] = {}
+    for outcome in outcomes:
+        upstream = [label for label in dependencies.get(outcome.label, []) if label in cost]
+        slowest = max(upstream, key=lambda label: cost[label], default=None)
+        cost[outcome.label] = outcome.seconds + (cost[slowest] if slowest else 0.0)
+        via[outcome.label] = slowest
+    if not cost:
+        return 0.0, []
+    tail: Optional[str] = max(cost, key=lambda label: cost[label])
+    total = cost[tail]
+    chain: List[str] = []
+    while tail is not None and tail in by_label:
+        chain.append(tail)
+        tail = via[tail]
+    return total, list(reversed(chain))
+
+
+def _log_timing_report(
+    outcomes: Sequence[StepOutcome], dependencies: Dict[str, List[str]], wall_seconds: float
+) -> None:
+    path_seconds, path = critical_path(outcomes, dependencies)
+    logging.info(
+        "snapshot pipeline timing: wall=%.1fs step_total=%.1fs critical_path=%.1fs (%s)",
+        wall_seconds,
+        sum(outcome.seconds for outcome in outcomes),
+        path_seconds,
+        " -> ".join(path) or "none",
+    )
+    for outcome in outcomes:
+        logging.info(
+            "snapshot step timing: %s %.1fs%s",
+            outcome.label,
+            outcome.seconds,
+            " (skipped)" if outcome.deferred_by else "",
+        )
+
+
+def build_steps(
+    *,
+    mode_flag: str,
+    days: int,
+    window: str,
+    gate_forward: Sequence[str],
+    skip_unchanged: bool = False,
+) -> List[SnapshotStep]:
+    # Only the per-set builders fingerprint their inputs; the global steps are
+    # one row each and always rebuild.
+    skip_forward = ("--skip-unchanged",) if skip_unchanged else ()
+    return [
+        SnapshotStep(
+            "set sealed market snapshots",
+            ("backend/scripts/build_pokemon_set_sealed_market_snapshots.py", "--all", mode_flag),
+            outputs=("sealed_market_snapshots",),
+        ),
+        SnapshotStep(
+            "coordinated set cards and market dashboards",
+            (
+                "backend/scripts/build_pokemon_set_market_snapshots.py",
+                "--all",
+                mode_flag,
+                "--days",
+                str(days),
+                "--window",
+                window,
+                *skip_forward,
+                *gate_forward,
+            ),
+            outputs=("set_cards_snapshots", "market_dashboard_snapshots"),
+        ),
+        SnapshotStep(
+            # MUST follow the coordinated dashboard step: the global Set Value
+            # aggregate validates every candidate against those prepared 365d
+            # dashboard histories, so running it earlier would validate against
+            # the previous generation. Without this step a full public build
+            # could publish every surrounding artifact and still leave /Market's
+            # Set Value ladder empty.
+            "global market set value",
+            ("backend/scripts/build_pokemon_explore_set_value_snapshot.py", mode_flag, *gate_forward),
+            inputs=("market_dashboard_snapshots",),
+            outputs=("set_value_snapshot",),
+        ),
+        SnapshotStep(
+            # Reads the RIP statistics view and the desirability component rows,
+            # never the market dashboard.
+            "explore rankings",
+            ("backend/scripts/build_pokemon_explore_rankings_snapshot.py", "--all", mode_flag, *gate_forward),
+            outputs=("rankings_snapshot",),
+        ),
+        SnapshotStep(
+            # Reads the prepared dashboards' Top Chase rows and takes its
+            # eligible set list from the rankings row, so it waits for this
+            # run's rankings; otherwise, with several workers, which generation
+            # it saw would depend on timing.
+            "global explore card movers",
+            ("backend/scripts/build_pokemon_explore_card_movers_snapshot.py", mode_flag, *gate_forward),
+            inputs=("market_dashboard_snapshots", "rankings_snapshot"),
+            outputs=("card_movers_snapshot",),
+        ),
+        SnapshotStep(
+            # Embeds rank context, card appeal validation and dashboard
+            # completeness diagnostics from this run's rankings, cards and
+            # dashboards, and the rip decision built from this run's sealed
+            # market snapshot (also part of its input fingerprint).
+            "set pages",
+            (
+                "backend/scripts/build_pokemon_set_page_snapshots.py",
+                "--all",
+                mode_flag,
+                *skip_forward,
+                *gate_forward,
+            ),
+            inputs=(
+                "sealed_market_snapshots",
+                "rankings_snapshot",
+                "set_cards_snapshots",
+                "market_dashboard_snapshots",
+            ),
+            outputs=("set_page_snapshots",),
+        ),
+    ]
+
+
 def main() -> None:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     args = build_parser().parse_args()
@@ -87,51 +349,19 @@ def main() -> None:
     if args.force_publish:
         gate_forward.append("--force-publish")
 
-    steps: list[tuple[str, list[str]]] = [
-        (
-            "set sealed market snapshots",
-            ["backend/scripts/build_pokemon_set_sealed_market_snapshots.py", "--all", mode_flag],
-        ),
-        (
-            "coordinated set cards and market dashboards",
-            [
-                "backend/scripts/build_pokemon_set_market_snapshots.py",
-                "--all",
-                mode_flag,
-                "--days",
-                str(args.days),
-                "--window",
-                args.window,
-                *gate_forward,
-            ],
-        ),
-        (
-            # MUST follow the coordinated dashboard step: the global Set Value
-            # aggregate validates every candidate against those prepared 365d
-            # dashboard histories, so running it earlier would validate against
-            # the previous generation. Without this step a full public build
-            # could publish every surrounding artifact and still leave /Market's
-            # Set Value ladder empty.
-            "global market set value",
-            ["backend/scripts/build_pokemon_explore_set_value_snapshot.py", mode_flag, *gate_forward],
-        ),
-        (
-            "global explore card movers",
-            ["backend/scripts/build_pokemon_explore_card_movers_snapshot.py", mode_flag, *gate_forward],
-        ),
-        (
-            "explore rankings",
-            ["backend/scripts/build_pokemon_explore_rankings_snapshot.py", "--all", mode_flag, *gate_forward],
-        ),
-        (
-            "set pages",
-            ["backend/scripts/build_pokemon_set_page_snapshots.py", "--all", mode_flag, *gate_forward],
-        ),
-    ]
+    steps = build_steps(
+        mode_flag=mode_flag,
+        days=args.days,
+        window=args.window,
+        gate_forward=gate_forward,
+        skip_unchanged=args.skip_unchanged,
+    )
+    started = time.monotonic()
+    outcomes = run_pipeline(steps, max_workers=args.max_workers)
+    _log_timing_report(outcomes, step_dependencies(steps), time.monotonic() - started)
 
-    results = [(label, _run_step(label, step_args)) for label, step_args in steps]
-    deferred = [label for label, code in results if code == GATE_DEFERRED_EXIT_CODE]
-    failed = [label for label, code in results if code not in (0, GATE_DEFERRED_EXIT_CODE)]
+    deferred = [outcome.label for outcome in outcomes if outcome.exit_code == GATE_DEFERRED_EXIT_CODE]
+    failed = [outcome.label for outcome in outcomes if outcome.exit_code not in (0, GATE_DEFERRED_EXIT_CODE)]
     if deferred:
         logging.warning(
             "snapshot pipeline DEFERRED by publication gate on %s step(s): %s",
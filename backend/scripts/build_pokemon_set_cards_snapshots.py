@@ -11,6 +11,8 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from backend.scripts.pokemon_snapshot_builders import (
+    DEFAULT_DASHBOARD_DAYS,
+    DEFAULT_DASHBOARD_WINDOW,
     add_target_set_args,
     build_coordinated_set_market_snapshot_rows,
     get_client,
@@ -28,6 +30,7 @@ from backend.db.services.publication_gate import (
 )
 from backend.db.services.set_publication_revalidation import notify_set_publication
 from backend.scripts.snapshot_query_retry import run_snapshot_operation_with_retry
+from backend.scripts.snapshot_set_fanout import DEFAULT_FANOUT_UPSERT_BATCH_SIZE, run_coordinated_market_fanout
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -45,6 +48,21 @@ def build_parser() -> argparse.ArgumentParser:
         default=3,
         help="Stop an --all build after this many consecutive exhausted transient failures",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Build up to N sets concurrently with per-set retries and batched upserts "
+            "(default 1: one set at a time, paced by --delay-seconds)"
+        ),
+    )
+    parser.add_argument(
+        "--upsert-batch-size",
+        type=int,
+        default=DEFAULT_FANOUT_UPSERT_BATCH_SIZE,
+        help="Sets per Cards/Dashboard upsert request when --workers > 1",
+    )
     add_publication_gate_args(parser)
     return parser
 
@@ -76,6 +94,11 @@ def main() -> int:
     consecutive_transient_failures = 0
     transient_threshold = max(1, int(args.max_consecutive_transient_failures))
 
+    if args.workers > 1:
+        return _build_in_parallel(
+            target_sets, args, commit=commit, transient_threshold=transient_threshold
+        )
+
     for index, set_row in enumerate(target_sets):
         logging.info("building cards snapshot set_id=%s name=%s", set_row.get("id"), set_row.get("name"))
         try:
@@ -140,6 +163,38 @@ def main() -> int:
         if args.all and index < len(target_sets) - 1 and args.delay_seconds > 0:
             time.sleep(max(0.0, float(args.delay_seconds)))
 
+    return _report_summary(built_count=built_count, failed_count=failed_count)
+
+
+def _build_in_parallel(
+    target_sets: list[dict], args: argparse.Namespace, *, commit: bool, transient_threshold: int
+) -> int:
+    outcomes = run_coordinated_market_fanout(
+        target_sets,
+        days=DEFAULT_DASHBOARD_DAYS,
+        window=DEFAULT_DASHBOARD_WINDOW,
+        commit=commit,
+        workers=args.workers,
+        batch_size=args.upsert_batch_size,
+        max_consecutive_transient_failures=transient_threshold if args.all else None,
+        client_factory=get_client,
+    )
+    built_count = 0
+    failed_count = 0
+    revalidated: set[str] = set()
+    for outcome in outcomes:
+        if outcome.built:
+            built_count += 1
+            notify_set_publication(outcome.set_row, commit=commit, seen=revalidated)
+        elif outcome.error is not None:
+            failed_count += 1
+            logging.error(
+                "failed cards snapshot set_id=%s", outcome.set_row.get("id"), exc_info=outcome.error
+            )
+    return _report_summary(built_count=built_count, failed_count=failed_count)
+
+
+def _report_summary(*, built_count: int, failed_count: int) -> int:
     summary = f"cards snapshot summary built={built_count} failed={failed_count}"
     logging.info(summary)
     print(summary)
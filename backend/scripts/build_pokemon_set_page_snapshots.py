@@ -19,15 +19,47 @@ from backend.scripts.pokemon_snapshot_builders import (
     add_target_set_args,
     build_set_page_snapshot_row,
     get_client,
+    prefetch_set_page_build_context,
     resolve_target_sets,
     should_commit,
     upsert_row,
+    upsert_rows,
 )
+from backend.scripts.snapshot_input_fingerprint import (
+    set_page_input_fingerprint,
+    set_page_snapshot_is_current,
+    stamp_input_fingerprint,
+)
+from backend.scripts.snapshot_query_retry import run_snapshot_operation_with_retry
+from backend.scripts.snapshot_set_fanout import DEFAULT_FANOUT_UPSERT_BATCH_SIZE, run_set_fanout
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Build page-ready Pokemon set page snapshots")
     add_target_set_args(parser)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Build up to N sets concurrently from inputs prefetched once per run, with per-set "
+            "retries and batched upserts (default 1: one set at a time)"
+        ),
+    )
+    parser.add_argument(
+        "--upsert-batch-size",
+        type=int,
+        default=DEFAULT_FANOUT_UPSERT_BATCH_SIZE,
+        help="Set page rows per upsert request when --workers > 1",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "Skip the build and write of any set whose stored page already carries the "
+            "fingerprint of its current inputs"
+        ),
+    )
     add_publication_gate_args(parser)
     return parser
 
@@ -72,7 +104,11 @@ def main() -> int:
     if not gate.proceed:
         return gate.exit_code
 
+    if args.workers > 1:
+        return _build_set_pages_in_parallel(client, args, commit=commit)
+
     built_count = 0
+    unchanged_count = 0
     skipped_count = 0
     failed_count = 0
     revalidated: set[str] = set()
@@ -80,7 +116,12 @@ def main() -> int:
     for set_row in resolve_target_sets(client, args):
         logging.info("building set page snapshot %s", _set_label(set_row))
         try:
-            row = build_set_page_snapshot_row(set_row, client=client)
+            fingerprint = set_page_input_fingerprint(client, set_row) if args.skip_unchanged else None
+            if set_page_snapshot_is_current(client, str(set_row["id"]), fingerprint):
+                unchanged_count += 1
+                logging.info("set page snapshot unchanged %s", _set_label(set_row))
+                continue
+            row = stamp_input_fingerprint(build_set_page_snapshot_row(set_row, client=client), fingerprint)
             upsert_row(
                 client,
                 "pokemon_set_page_snapshot_latest",
@@ -126,7 +167,97 @@ def main() -> int:
                 _error_message(exc),
             )
 
-    summary = f"set page snapshot summary built={built_count} skipped={skipped_count} failed={failed_count}"
+    return _report_summary(
+        built_count=built_count,
+        unchanged_count=unchanged_count,
+        skipped_count=skipped_count,
+        failed_count=failed_count,
+    )
+
+
+def _build_set_pages_in_parallel(client, args: argparse.Namespace, *, commit: bool) -> int:
+    """--workers mode: the rankings leaderboard and snapshot timestamp every set
+    page embeds are read once, then the sets are built concurrently."""
+    target_sets = resolve_target_sets(client, args)
+    context = run_snapshot_operation_with_retry(
+        prefetch_set_page_build_context,
+        operation_name="prefetch set page inputs",
+        client_factory=get_client,
+    )
+
+    def write_batch(fresh_client, rows: list[dict]) -> None:
+        upsert_rows(
+            fresh_client,
+            "pokemon_set_page_snapshot_latest",
+            rows,
+            on_conflict="set_id",
+            commit=commit,
+            batch_size=len(rows),
+        )
+
+    def build_set(set_row: dict, fresh_client) -> dict | None:
+        fingerprint = (
+            set_page_input_fingerprint(fresh_client, set_row, context=context) if args.skip_unchanged else None
+        )
+        if set_page_snapshot_is_current(fresh_client, str(set_row["id"]), fingerprint):
+            return None
+        row = build_set_page_snapshot_row(set_row, client=fresh_client, context=context)
+        return stamp_input_fingerprint(row, fingerprint)
+
+    outcomes = run_set_fanout(
+        target_sets,
+        build_set,
+        write_batch,
+        workers=args.workers,
+        operation_name="build set page snapshot",
+        batch_size=args.upsert_batch_size,
+        client_factory=get_client,
+    )
+
+    built_count = 0
+    unchanged_count = 0
+    skipped_count = 0
+    failed_count = 0
+    revalidated: set[str] = set()
+    for outcome in outcomes:
+        set_row = outcome.set_row
+        if outcome.unchanged:
+            unchanged_count += 1
+            logging.info("set page snapshot unchanged %s", _set_label(set_row))
+        elif outcome.built:
+            built_count += 1
+            notify_set_publication(set_row, commit=commit, seen=revalidated)
+        elif outcome.error is not None and _is_missing_data_error(outcome.error):
+            skipped_count += 1
+            logging.warning(
+                "skipping set page snapshot %s code=%s message=%s",
+                _set_label(set_row),
+                _error_code(outcome.error),
+                _error_message(outcome.error),
+            )
+        elif outcome.error is not None:
+            failed_count += 1
+            logging.error(
+                "failed set page snapshot %s code=%s message=%s",
+                _set_label(set_row),
+                _error_code(outcome.error),
+                _error_message(outcome.error),
+                exc_info=outcome.error,
+            )
+    return _report_summary(
+        built_count=built_count,
+        unchanged_count=unchanged_count,
+        skipped_count=skipped_count,
+        failed_count=failed_count,
+    )
+
+
+def _report_summary(*, built_count: int, unchanged_count: int, skipped_count: int, failed_count: int) -> int:
+    # `unchanged` sets were neither rebuilt nor rewritten (--skip-unchanged).
+    summary = (
+        f"set page snapshot summary built={built_count} skipped={skipped_count} failed={failed_count} "
+        f"unchanged={unchanged_count}"
+    )
     logging.info(summary)
     print(summary)
     # A genuine build failure (not a graceful skip) must fail the CLI so a
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -22,6 +24,9 @@ UPSERT_BATCH_SIZE = 100
 REQUEST_DELAY_SECONDS = 0.1
 API_MAX_RETRIES = 3
 API_BACKOFF_SECONDS = 2.0
+# Pages of one set fetched at once after page one reports totalCount; 1 walks
+# the pages sequentially.
+API_PAGE_CONCURRENCY = max(1, int(os.getenv("POKEMON_TCG_PAGE_CONCURRENCY", "1") or 1))
 CANONICAL_TABLE = "pokemon_canonical_cards"
 SET_SELECT = "*"
 
@@ -151,23 +156,26 @@ def fetch_api_set(api_set_id: str) -> Dict[str, Any]:
     return data
 
 
+def fetch_cards_page(api_set_id: str, page: int) -> Dict[str, Any]:
+    return request_json(
+        "/cards",
+        {
+            "q": f"set.id:{api_set_id}",
+            "page": page,
+            "pageSize": API_PAGE_SIZE,
+            "orderBy": "id",
+        },
+    )
+
+
 def fetch_cards_for_api_set(api_set_id: str) -> List[Dict[str, Any]]:
     cards: List[Dict[str, Any]] = []
     seen_ids: Set[str] = set()
-    page = 1
     total_count: Optional[int] = None
     max_pages = 500
 
-    while page <= max_pages:
-        payload = request_json(
-            "/cards",
-            {
-                "q": f"set.id:{api_set_id}",
-                "page": page,
-                "pageSize": API_PAGE_SIZE,
-                "orderBy": "id",
-            },
-        )
+    def absorb(payload: Dict[str, Any]) -> List[Any]:
+        nonlocal total_count
         data = payload.get("data")
         if not isinstance(data, list):
             raise PokemonCanonicalIngestionError(
@@ -197,17 +205,36 @@ def fetch_cards_for_api_set(api_set_id: str) -> List[Dict[str, Any]]:
                 continue
             seen_ids.add(card_id)
             cards.append(card)
+        return data
 
+    def is_done(data: List[Any]) -> bool:
         if not data:
-            break
+            return True
         if total_count is not None and len(cards) >= total_count:
-            break
-        if len(data) < API_PAGE_SIZE and total_count is None:
-            break
+            return True
+        return len(data) < API_PAGE_SIZE and total_count is None
 
+    page = 1
+    data = absorb(fetch_cards_page(api_set_id, page))
+
+    # Page one told us how many pages the set spans; fetch the rest together.
+    if not is_done(data) and total_count and API_PAGE_CONCURRENCY > 1:
+        last_page = min(math.ceil(total_count / API_PAGE_SIZE), max_pages)
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(API_PAGE_CONCURRENCY, last_page - 1)) as executor:
+                for payload in executor.map(
+                    lambda number: fetch_cards_page(api_set_id, number), range(2, last_page + 1)
+                ):
+                    data = absorb(payload)
+            page = last_page
+
+    while not is_done(data):
         page += 1
+        if page > max_pages:
+            break
         if REQUEST_DELAY_SECONDS > 0:
             time.sleep(REQUEST_DELAY_SECONDS)
+        data = absorb(fetch_cards_page(api_set_id, page))
 
     if page > max_pages:
         raise PokemonCanonicalIngestionError(
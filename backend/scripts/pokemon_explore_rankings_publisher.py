@@ -534,9 +534,14 @@ def validate_publication_payload(
 def publish_explore_rip_rankings_snapshot(
     client: Any, *, limit: int = DEFAULT_RANKINGS_LIMIT,
     market_date: Optional[str] = None, commit: bool = True,
+    contribution_cache: Optional[Any] = None,
 ) -> Dict[str, Any]:
-    """Build, validate, enrich, and atomically publish the canonical RIP leaderboard."""
-    row = build_explore_rankings_snapshot_row(limit=limit)
+    """Build, validate, enrich, and atomically publish the canonical RIP leaderboard.
+
+    With a `contribution_cache` the build is incremental: per-set contributions
+    whose source stamps are unchanged are reused instead of read again.
+    """
+    row = build_explore_rankings_snapshot_row(limit=limit, contribution_cache=contribution_cache)
     snapshot, history_rows = publication_contract(row)
     if market_date and snapshot["market_date"] != market_date:
         raise RuntimeError(
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import logging
 import time
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
@@ -19,6 +21,7 @@ from backend.db.services.explore_page_service import (
     get_explore_page_payload,
 )
 from backend.db.services.explore_rip_statistics_service import get_rip_statistics_targets_payload
+from backend.db.services.price_observation_history_reader import read_price_observation_history
 from backend.db.services import rip_decision_service
 from backend.db.services.product_family_rankings_service import build_product_family_rankings
 from backend.db.services.set_rip_service import attach_set_rip_to_targets, build_set_rip
@@ -1253,6 +1256,7 @@ def _load_snapshot_completeness_diagnostics(
     set_id: str,
     payload: Dict[str, Any],
     built_at: str,
+    context: Optional["SetPageBuildContext"] = None,
 ) -> Dict[str, Any]:
     explore_row = _first_row(
         client,
@@ -1269,7 +1273,9 @@ def _load_snapshot_completeness_diagnostics(
         or first_non_empty((explore_row or {}).get("calculation_run_id"))
         or first_non_empty((latest_row or {}).get("calculation_run_id"))
     )
-    rankings_updated_at = _load_rankings_snapshot_updated_at(client)
+    rankings_updated_at = (
+        context.rankings_snapshot_updated_at if context is not None else _load_rankings_snapshot_updated_at(client)
+    )
     input_count = _count_rows(client, "simulation_input_cards", field="calculation_run_id", value=run_id) if run_id else None
     near_mint_count = (
         _count_rows(client, "simulation_input_cards_with_near_mint_price", field="calculation_run_id", value=run_id)
@@ -1303,6 +1309,7 @@ def _finalize_snapshot_completeness(
     set_id: str,
     client: Optional[Any],
     built_at: str,
+    context: Optional["SetPageBuildContext"] = None,
 ) -> Dict[str, Any]:
     if client is None:
         return payload
@@ -1312,6 +1319,7 @@ def _finalize_snapshot_completeness(
         set_id=set_id,
         payload=payload,
         built_at=built_at,
+        context=context,
     )
     meta = dict(payload.get("meta") or {})
     warnings = list(meta.get("warnings") or [])
@@ -1468,7 +1476,68 @@ def _apply_simulation_availability_metadata(
     return payload
 
 
-def build_set_page_snapshot_row(set_row: Dict[str, Any], *, client: Optional[Any] = None) -> Dict[str, Any]:
+def _load_set_page_rankings_payload() -> Dict[str, Any]:
+    rankings_payload = get_rip_statistics_targets_payload(
+        limit=DEFAULT_RANKINGS_LIMIT, include_rankings_top_chase=False
+    )
+    target_rows = rankings_payload.get("targets") or []
+    # Set pages materialize the same production Set RIP block from the same
+    # full canonical cohort used by the global snapshot. This is required
+    # only when a set-page snapshot is normally/explicitly rebuilt.
+    if any((target.get("overallRipV9") or {}).get("rank") is not None for target in target_rows):
+        family_projection = build_product_family_rankings(set_targets=target_rows)
+        page_set_rip = build_set_rip(family_projection, set_targets=target_rows)
+        target_rows = attach_set_rip_to_targets(target_rows, page_set_rip)
+        rankings_payload = {**rankings_payload, "targets": target_rows}
+    return rankings_payload
+
+
+@dataclass(frozen=True)
+class SetPageBuildContext:
+    """The cross-set inputs of `build_set_page_snapshot_row`, read once per run.
+
+    Every set page used to re-read the whole RIP statistics leaderboard (the
+    eligible runs, every ranked target and the Set RIP cohort built from them)
+    and the rankings snapshot timestamp, although both are identical for every
+    set in a run. A failed leaderboard read is kept rather than raised so each
+    set handles it exactly as it would have handled its own failed read.
+    """
+
+    rankings_payload: Optional[Dict[str, Any]]
+    rankings_error: Optional[Exception]
+    rankings_snapshot_updated_at: Optional[str]
+
+
+def prefetch_set_page_build_context(client: Any) -> SetPageBuildContext:
+    try:
+        rankings_payload, rankings_error = _load_set_page_rankings_payload(), None
+    except Exception as exc:
+        if is_transient_data_service_error(exc):
+            raise
+        rankings_payload, rankings_error = None, exc
+    return SetPageBuildContext(
+        rankings_payload=rankings_payload,
+        rankings_error=rankings_error,
+        rankings_snapshot_updated_at=_load_rankings_snapshot_updated_at(client),
+    )
+
+
+def _set_page_rankings_payload(context: Optional[SetPageBuildContext]) -> Dict[str, Any]:
+    if context is None:
+        return _load_set_page_rankings_payload()
+    if context.rankings_error is not None:
+        raise context.rankings_error
+    # Parts of the matching target are lifted into the payload verbatim; a
+    # private copy keeps one set's later edits out of every other set's page.
+    return copy.deepcopy(context.rankings_payload or {})
+
+
+def build_set_page_snapshot_row(
+    set_row: Dict[str, Any],
+    *,
+    client: Optional[Any] = None,
+    context: Optional[SetPageBuildContext] = None,
+) -> Dict[str, Any]:
     built_at = utc_now_iso()
     set_id = str(set_row["id"])
     simulation_available = True
@@ -1493,18 +1562,8 @@ def build_set_page_snapshot_row(set_row: Dict[str, Any], *, client: Optional[Any
         )
     payload = _complete_snapshot_top_hits(payload, set_id=set_id, client=client)
     try:
-        rankings_payload = get_rip_statistics_targets_payload(
-            limit=DEFAULT_RANKINGS_LIMIT, include_rankings_top_chase=False
-        )
+        rankings_payload = _set_page_rankings_payload(context)
         target_rows = rankings_payload.get("targets") or []
-        # Set pages materialize the same production Set RIP block from the same
-        # full canonical cohort used by the global snapshot. This is required
-        # only when a set-page snapshot is normally/explicitly rebuilt.
-        if any((target.get("overallRipV9") or {}).get("rank") is not None for target in target_rows):
-            family_projection = build_product_family_rankings(set_targets=target_rows)
-            page_set_rip = build_set_rip(family_projection, set_targets=target_rows)
-            target_rows = attach_set_rip_to_targets(target_rows, page_set_rip)
-            rankings_payload = {**rankings_payload, "targets": target_rows}
         matching_rankings_target = _find_matching_rankings_target(
             set_id=set_id, set_row=set_row, payload=payload, target_rows=target_rows
         )
@@ -1554,7 +1613,9 @@ def build_set_page_snapshot_row(set_row: Dict[str, Any], *, client: Optional[Any
     payload = with_snapshot_meta(payload, snapshot_type="pokemon_set_page", built_at=built_at)
     existing_row = _load_existing_set_page_snapshot_row(client, set_id) if client is not None else None
     payload = _merge_last_known_good_snapshot_sections(payload, existing_row=existing_row, built_at=built_at)
-    payload = _finalize_snapshot_completeness(payload, set_id=set_id, client=client, built_at=built_at)
+    payload = _finalize_snapshot_completeness(
+        payload, set_id=set_id, client=client, built_at=built_at, context=context
+    )
     payload = _apply_simulation_availability_metadata(
         payload,
         available=simulation_available,
@@ -2092,52 +2153,17 @@ def _load_paginated_top_chase_observation_rows(
     end_date: date,
     page_size: int = CARD_PRICE_OBSERVATION_PAGE_SIZE,
 ) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    seen: set[tuple[Any, ...]] = set()
-    safe_page_size = max(1, int(page_size))
-    for chunk_start in range(0, len(variant_ids), CARD_PRICE_OBSERVATION_CHUNK_SIZE):
-        variant_chunk = variant_ids[chunk_start : chunk_start + CARD_PRICE_OBSERVATION_CHUNK_SIZE]
-        start = 0
-        while True:
-            query = (
-                client.table("card_variant_price_observations")
-                .select("id,card_variant_id,condition_id,captured_at,market_price")
-                .in_("card_variant_id", variant_chunk)
-            )
-            if len(condition_ids) == 1:
-                query = query.eq("condition_id", condition_ids[0])
-            elif condition_ids:
-                query = query.in_("condition_id", condition_ids)
-            result = (
-                query.gt("market_price", 0)
-                .gte("captured_at", start_date.isoformat())
-                .lt("captured_at", end_date.isoformat())
-                .order("captured_at", desc=False)
-                .order("id", desc=False)
-                .range(start, start + safe_page_size - 1)
-                .execute()
-            )
-            page = list(result.data or [])
-            for row in page:
-                dedupe_key = (
-                    ("id", row.get("id"))
-                    if row.get("id") is not None
-                    else (
-                        "value",
-                        row.get("card_variant_id"),
-                        row.get("condition_id"),
-                        row.get("captured_at"),
-                        row.get("market_price"),
-                    )
-                )
-                if dedupe_key in seen:
-                    continue
-                seen.add(dedupe_key)
-                rows.append(row)
-            if len(page) < safe_page_size:
-                break
-            start += safe_page_size
-    return rows
+    return read_price_observation_history(
+        client,
+        variant_ids=variant_ids,
+        condition_ids=condition_ids,
+        captured_from=start_date.isoformat(),
+        captured_before=end_date.isoformat(),
+        positive_prices_only=True,
+        fields=("condition_id", "captured_at", "market_price"),
+        page_size=page_size,
+        chunk_size=CARD_PRICE_OBSERVATION_CHUNK_SIZE,
+    ).rows()
 
 
 def _load_top_chase_histories_from_observations(
@@ -3166,11 +3192,6 @@ def _build_card_appeal_price_index_for_set(
         return {}
 
 
-def _chunks(values: List[str], size: int) -> Iterable[List[str]]:
-    for index in range(0, len(values), size):
-        yield values[index : index + size]
-
-
 def _load_selected_price_observations(
     client: Any,
     *,
@@ -3193,36 +3214,32 @@ def _load_selected_price_observations(
     end_date = date.fromisoformat(latest_market_date)
     start_date = (end_date - timedelta(days=CARD_MOVEMENT_LOOKBACK_DAYS)).isoformat()
     observations_by_card: Dict[str, List[Dict[str, Any]]] = {}
-    for variant_ids in _chunks(sorted(variant_to_card), CARD_PRICE_OBSERVATION_CHUNK_SIZE):
-        condition_ids = sorted({condition_by_variant[variant_id] for variant_id in variant_ids})
-        rows = _query_paginated_rows(
-            client,
-            "card_variant_price_observations",
-            lambda query: query.select("id,card_variant_id,condition_id,market_price,source,captured_at")
-            .in_("card_variant_id", variant_ids)
-            .in_("condition_id", condition_ids)
-            .gte("captured_at", start_date)
-            .lte("captured_at", latest_market_date)
-            .order("captured_at", desc=True)
-            .order("id", desc=True),
-        )
-        for row in rows:
-            variant_id = first_non_empty(row.get("card_variant_id"))
-            condition_id = first_non_empty(row.get("condition_id"))
-            price = to_optional_float(row.get("market_price"))
-            source_date = parse_date_key(row.get("captured_at"))
-            if (
-                not variant_id
-                or not source_date
-                or price is None
-                or condition_id != condition_by_variant.get(variant_id)
-            ):
-                continue
-            card_id = variant_to_card.get(variant_id)
-            if card_id:
-                observations_by_card.setdefault(card_id, []).append(
-                    {**row, "market_price": price, "source_date": source_date}
-                )
+    # Newest first, the order the per-card sort below breaks exact ties in.
+    history = read_price_observation_history(
+        client,
+        variant_ids=sorted(variant_to_card),
+        condition_ids=sorted(set(condition_by_variant.values())),
+        captured_from=start_date,
+        captured_through=latest_market_date,
+        chunk_size=CARD_PRICE_OBSERVATION_CHUNK_SIZE,
+    ).reversed()
+    for row in history.rows():
+        variant_id = first_non_empty(row.get("card_variant_id"))
+        condition_id = first_non_empty(row.get("condition_id"))
+        price = to_optional_float(row.get("market_price"))
+        source_date = parse_date_key(row.get("captured_at"))
+        if (
+            not variant_id
+            or not source_date
+            or price is None
+            or condition_id != condition_by_variant.get(variant_id)
+        ):
+            continue
+        card_id = variant_to_card.get(variant_id)
+        if card_id:
+            observations_by_card.setdefault(card_id, []).append(
+                {**row, "market_price": price, "source_date": source_date}
+            )
     for rows in observations_by_card.values():
         rows.sort(key=lambda row: (row["source_date"], first_non_empty(row.get("captured_at")) or ""))
     return observations_by_card
@@ -3742,10 +3759,16 @@ def attach_daily_rip_rank_movements(
 
 
 def build_explore_rankings_snapshot_row(
-    *, limit: int = DEFAULT_RANKINGS_LIMIT, previous_payload: Optional[Dict[str, Any]] = None
+    *,
+    limit: int = DEFAULT_RANKINGS_LIMIT,
+    previous_payload: Optional[Dict[str, Any]] = None,
+    contribution_cache: Optional[Any] = None,
 ) -> Dict[str, Any]:
     built_at = utc_now_iso()
-    payload = get_rip_statistics_targets_payload(limit=limit)
+    # `contribution_cache` (an incremental build) is only forwarded when given,
+    # so a full build calls the service exactly as before.
+    cache_kwargs = {"contribution_cache": contribution_cache} if contribution_cache is not None else {}
+    payload = get_rip_statistics_targets_payload(limit=limit, **cache_kwargs)
     targets = list(payload.get("targets") or [])
     opening_targets = [target for target in targets if is_opening_set_row(target)]
     meta = dict(payload.get("meta") or {})
@@ -3843,7 +3866,7 @@ def upsert_rows(
     safe_batch_size = max(1, int(batch_size or DEFAULT_UPSERT_BATCH_SIZE))
     for start in range(0, len(rows), safe_batch_size):
         batch = rows[start : start + safe_batch_size]
-        client.table(table).upsert(batch, on_conflict=on_conflict).execute()
+        client.table(table).upsert(batch, on_conflict=on_conflict, returning=ReturnMethod.minimal).execute()
         logger.info(
             "upserted %s/%s rows into %s conflict=%s",
             min(start + len(batch), len(rows)),
@@ -211,6 +211,15 @@ SLOW_QUERY_SECONDS = 5.0          # always log a single SELECT slower than this
 # scalar, so the cards snapshot's (large) payload_json never crosses the wire.
 CARDS_GENERATION_ID_PROJECTION = "generation_id:payload_json->meta->snapshot->>generationId"
 
+# The exact column lists the per-set staleness checks read. Shared with the
+# set-wide planning prefetch, which can only answer a read it fetched verbatim.
+CARDS_SNAPSHOT_PLANNING_COLUMNS = "set_id,cards_json,card_count,payload_json,updated_at"
+MARKET_DASHBOARD_PLANNING_COLUMNS = (
+    "set_id,window_key,payload_json,set_value_histories_json,top_chase_card_histories_json,"
+    "performance_vs_cost_history_json,latest_market_date,updated_at"
+)
+SET_PAGE_PLANNING_COLUMNS = "set_id,payload_json,updated_at"
+
 # HEAVY READS IN THE READ-ONLY PLANNING PHASE — why each large JSON column is
 # fetched, audited because the planner scans the whole published catalog and one
 # needless blob per set is hundreds of megabytes across a run.
@@ -246,7 +255,9 @@ CARDS_GENERATION_ID_PROJECTION = "generation_id:payload_json->meta->snapshot->>g
 #       limited to one row. Nothing to trim.
 #
 # Duplicate REQUESTS (not columns) removed: _latest_run_id_for_set was issued
-# twice per set during planning — see _PLANNING_RUN_ID_CACHE below.
+# twice per set during planning — see _PLANNING_RUN_ID_CACHE below. With the
+# set-wide prefetch the three snapshot payloads above arrive
+# PLANNING_PREFETCH_PAYLOAD_CHUNK_SIZE sets per request instead of one.
 
 
 def _rebuild_with_bounded_retry(operation, *, operation_name: str, set_id: str, client: Any):
@@ -349,6 +360,11 @@ def build_parser() -> argparse.ArgumentParser:
         default=600.0,
         help="Delay between bounded gate re-evaluations (default 600s)",
     )
+    parser.add_argument(
+        "--per-set-planning",
+        action="store_true",
+        help="Plan with one set's reads at a time instead of the set-wide prefetch (same verdicts, many more requests)",
+    )
     return parser
 
 
@@ -535,6 +551,37 @@ def _latest_timestamp(
     timestamp_columns: Sequence[str],
     filters: Sequence[Tuple[str, Any]] = (),
     in_filters: Sequence[Tuple[str, Sequence[Any]]] = (),
+) -> Tuple[Optional[str], List[str]]:
+    index = _PLANNING_SOURCE_INDEX
+    if index is None:
+        return _latest_timestamp_query(
+            client, table=table, timestamp_columns=timestamp_columns, filters=filters, in_filters=in_filters
+        )
+    prefetched = index.latest_timestamp(table, timestamp_columns, filters, in_filters)
+    if prefetched is not None:
+        return prefetched
+    latest, checks = _planning_memo(
+        (
+            "latest_timestamp",
+            table,
+            tuple(timestamp_columns),
+            tuple(filters),
+            tuple((field, tuple(values)) for field, values in in_filters),
+        ),
+        lambda: _latest_timestamp_query(
+            client, table=table, timestamp_columns=timestamp_columns, filters=filters, in_filters=in_filters
+        ),
+    )
+    return latest, list(checks)
+
+
+def _latest_timestamp_query(
+    client: Any,
+    *,
+    table: str,
+    timestamp_columns: Sequence[str],
+    filters: Sequence[Tuple[str, Any]] = (),
+    in_filters: Sequence[Tuple[str, Sequence[Any]]] = (),
 ) -> Tuple[Optional[str], List[str]]:
     checks: List[str] = []
     for column in timestamp_columns:
@@ -566,6 +613,10 @@ def _row_exists(client: Any, *, table: str, field: str, value: Any) -> bool:
 
 
 def _read_snapshot_row(client: Any, table: str, select_fields: str, filters: Sequence[Tuple[str, Any]]) -> Optional[Dict[str, Any]]:
+    index = _PLANNING_SOURCE_INDEX
+    prefetched = index.rows_for(table, select_fields, filters) if index is not None else None
+    if prefetched is not None:
+        return prefetched[0] if prefetched else None
     query = client.table(table).select(select_fields)
     for field, value in filters:
         query = query.eq(field, value)
@@ -602,6 +653,16 @@ def _read_cards_snapshot_generation_id(client: Any, set_id: str) -> CardsGenerat
     PostgREST do the extraction server-side.
     """
     label = "pokemon_set_cards_snapshot_latest.generation_id"
+    index = _PLANNING_SOURCE_INDEX
+    prefetched = (
+        index.rows_for("pokemon_set_cards_snapshot_latest", CARDS_GENERATION_PLANNING_COLUMNS, (("set_id", set_id),))
+        if index is not None
+        else None
+    )
+    if prefetched is not None:
+        if not prefetched:
+            return CardsGenerationRead(None, False, None, [f"{label}: no row"])
+        return CardsGenerationRead(_to_text(prefetched[0].get("generation_id")), True, None, [f"{label}: ok"])
     rows, error = _execute_query(
         label,
         client.table("pokemon_set_cards_snapshot_latest")
@@ -617,23 +678,269 @@ def _read_cards_snapshot_generation_id(client: Any, set_id: str) -> CardsGenerat
     return CardsGenerationRead(_to_text(rows[0].get("generation_id")), True, None, [f"{label}: ok"])
 
 
+# --- set-wide planning prefetch ---------------------------------------------
+# Most per-set planning reads ask one question of a table that holds a small,
+# bounded number of rows per set: "this set's snapshot row", "this set's newest
+# simulation_latest_by_target.updated_at", "this set's card ids". Issued one set
+# at a time that is dozens of round trips per set before anything is rebuilt.
+# `_build_plan` can instead fetch those rows for EVERY set in a handful of
+# set-wide reads (`.in_()` over a chunk of set ids, paged with `.range()`) and
+# answer the per-set questions from memory.
+#
+# The per-set checks themselves are unchanged; only where their rows come from
+# differs. A prefetched answer is used only when it is provably the answer the
+# per-set read would have returned:
+#   * the read must match a prefetched source verbatim (table, column list,
+#     filters), so an unexpected shape simply issues the per-set read;
+#   * a chunk whose set-wide read failed is not indexed at all, so its sets fall
+#     back to per-set reads instead of reading as "row missing" (which would
+#     plan a rebuild of every set in the chunk);
+#   * `_latest_timestamp` orders DESC, where Postgres sorts NULLs FIRST: a set
+#     with any NULL in the column falls through to the next column exactly as
+#     the `order(...).limit(1)` read does.
+# Reads that have no bounded set-wide form (daily histories, price
+# observations, simulation inputs) stay per set but are memoized for the pass,
+# so a question two families share - the variant ids, the price-observation
+# watermark, the rankings snapshot timestamp - is asked once.
+PLANNING_PREFETCH_CHUNK_SIZE = 50          # set ids per narrow set-wide read
+PLANNING_PREFETCH_PAYLOAD_CHUNK_SIZE = 10  # set ids per snapshot-payload read
+PLANNING_PREFETCH_PAGE_SIZE = 1000         # PostgREST's default max rows
+
+CARDS_GENERATION_PLANNING_COLUMNS = f"set_id,{CARDS_GENERATION_ID_PROJECTION}"
+SELECTED_PRICE_PLANNING_COLUMNS = "set_id,canonical_card_id,card_variant_id,market_price"
+
+# table -> (set key column, fixed filters, timestamp columns probed per set)
+_PREFETCHED_TIMESTAMP_SOURCES: Dict[str, Tuple[str, Tuple[Tuple[str, Any], ...], Tuple[str, ...]]] = {
+    "pokemon_canonical_cards": ("set_id", (), ("updated_at", "created_at")),
+    "cards": ("set_id", (), ("updated_at", "created_at")),
+    "pokemon_set_cards_snapshot_latest": ("set_id", (), ("updated_at",)),
+    "pokemon_set_market_dashboard_snapshot_latest": ("set_id", (), ("updated_at",)),
+    "explore_rip_statistics_latest": ("set_id", (), ("updated_at", "run_at", "created_at")),
+    "simulation_latest_by_target": ("target_id", (("target_type", "set"),), ("updated_at", "run_at")),
+}
+
+
+@dataclass(frozen=True)
+class PlanningSource:
+    """One set-wide read: `columns` of `table` for every set id, chunked."""
+
+    table: str
+    columns: str
+    key_field: str = "set_id"
+    static_filters: Tuple[Tuple[str, Any], ...] = ()
+    order_by: Tuple[str, ...] = ()
+    chunk_size: int = PLANNING_PREFETCH_CHUNK_SIZE
+
+
+def _planning_sources(window: str) -> List[PlanningSource]:
+    sources = [
+        PlanningSource("pokemon_set_cards_snapshot_latest", CARDS_SNAPSHOT_PLANNING_COLUMNS, chunk_size=PLANNING_PREFETCH_PAYLOAD_CHUNK_SIZE),
+        PlanningSource(
+            "pokemon_set_market_dashboard_snapshot_latest",
+            MARKET_DASHBOARD_PLANNING_COLUMNS,
+            static_filters=(("window_key", window),),
+            chunk_size=PLANNING_PREFETCH_PAYLOAD_CHUNK_SIZE,
+        ),
+        PlanningSource("pokemon_set_page_snapshot_latest", SET_PAGE_PLANNING_COLUMNS, chunk_size=PLANNING_PREFETCH_PAYLOAD_CHUNK_SIZE),
+        PlanningSource("pokemon_set_cards_snapshot_latest", CARDS_GENERATION_PLANNING_COLUMNS),
+        PlanningSource("cards", "set_id,id", order_by=("id",)),
+        PlanningSource("pokemon_canonical_cards", "set_id,id", order_by=("id",)),
+        PlanningSource("pokemon_canonical_card_market_prices_latest", SELECTED_PRICE_PLANNING_COLUMNS, order_by=("canonical_card_id",)),
+        PlanningSource("explore_rip_statistics_latest", "set_id,calculation_run_id,run_at", order_by=("run_at",)),
+        PlanningSource(
+            "simulation_latest_by_target",
+            "target_id,calculation_run_id,run_at",
+            key_field="target_id",
+            static_filters=(("target_type", "set"),),
+            order_by=("run_at",),
+        ),
+    ]
+    for table, (key_field, static_filters, columns) in _PREFETCHED_TIMESTAMP_SOURCES.items():
+        for column in columns:
+            sources.append(
+                PlanningSource(table, f"{key_field},{column}", key_field=key_field, static_filters=static_filters, order_by=(column,))
+            )
+    return sources
+
+
+def _fetch_planning_source(client: Any, source: PlanningSource, set_ids: Sequence[str]) -> Tuple[Dict[str, List[Dict[str, Any]]], int]:
+    """Rows of one source keyed by set id, for every chunk that read cleanly.
+
+    Pages are ordered by (set key, `order_by`), so a row can only shift across
+    a page boundary among rows with identical ordered values - which can repeat
+    or hide a duplicate, never change a per-set maximum or id set.
+    """
+    rows_by_set: Dict[str, List[Dict[str, Any]]] = {}
+    queries = 0
+    for start in range(0, len(set_ids), source.chunk_size):
+        chunk = list(set_ids[start:start + source.chunk_size])
+        chunk_rows: List[Dict[str, Any]] = []
+        failed = False
+        offset = 0
+        while True:
+            query = client.table(source.table).select(source.columns)
+            for field_name, value in source.static_filters:
+                query = query.eq(field_name, value)
+            query = query.in_(source.key_field, chunk)
+            for column in (source.key_field, *source.order_by):
+                query = query.order(column)
+            rows, error = _execute_query(
+                f"{source.table}.bulk", query.range(offset, offset + PLANNING_PREFETCH_PAGE_SIZE - 1)
+            )
+            queries += 1
+            if error:
+                failed = True
+                break
+            chunk_rows.extend(rows)
+            if len(rows) < PLANNING_PREFETCH_PAGE_SIZE:
+                break
+            offset += PLANNING_PREFETCH_PAGE_SIZE
+        if failed:
+            continue
+        for set_id in chunk:
+            rows_by_set[set_id] = []
+        for row in chunk_rows:
+            key = _to_text(row.get(source.key_field))
+            if key in rows_by_set:
+                rows_by_set[key].append(row)
+    return rows_by_set, queries
+
+
+def _newest_run_row(rows: List[Dict[str, Any]]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """The row `order("run_at", desc=True).limit(1)` returns, if that is decidable.
+
+    Undecidable - NULLs sort first in any order, or two newest rows tie with
+    different runs - means the per-set read is left to answer.
+    """
+    if len(rows) <= 1:
+        return True, (rows[0] if rows else None)
+    parsed = [(_parse_datetime(row.get("run_at")), row) for row in rows]
+    if any(run_at is None for run_at, _row in parsed):
+        return False, None
+    newest = max(run_at for run_at, _row in parsed)
+    newest_rows = [row for run_at, row in parsed if run_at == newest]
+    if len({_to_text(row.get("calculation_run_id")) for row in newest_rows}) > 1:
+        return False, None
+    return True, newest_rows[0]
+
+
+@dataclass
+class PlanningSourceIndex:
+    """Set-wide planning reads, installed for exactly one `_build_plan` pass."""
+
+    sources: Dict[Tuple[str, str], Tuple[PlanningSource, Dict[str, List[Dict[str, Any]]]]] = field(default_factory=dict)
+    memo: Dict[Any, Any] = field(default_factory=dict)
+    bulk_queries: int = 0
+
+    def rows_for(self, table: str, columns: str, filters: Sequence[Tuple[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """The prefetched rows a per-set read would return, or None to read."""
+        entry = self.sources.get((table, columns))
+        if entry is None:
+            return None
+        source, rows_by_set = entry
+        remaining = dict(filters)
+        set_id = _to_text(remaining.pop(source.key_field, None))
+        if set_id is None or remaining != dict(source.static_filters):
+            return None
+        return rows_by_set.get(set_id)
+
+    def latest_timestamp(
+        self,
+        table: str,
+        timestamp_columns: Sequence[str],
+        filters: Sequence[Tuple[str, Any]],
+        in_filters: Sequence[Tuple[str, Sequence[Any]]],
+    ) -> Optional[Tuple[Optional[str], List[str]]]:
+        spec = _PREFETCHED_TIMESTAMP_SOURCES.get(table)
+        if spec is None or in_filters:
+            return None
+        checks: List[str] = []
+        for column in timestamp_columns:
+            rows = self.rows_for(table, f"{spec[0]},{column}", filters)
+            if rows is None:
+                return None
+            checks.append(f"{table}.{column}: ok")
+            values = [_to_text(row.get(column)) for row in rows]
+            if not values or any(value is None for value in values):
+                continue
+            if any(_parse_datetime(value) is None for value in values):
+                return None
+            return _max_datetime_text(*values), checks
+        return None, checks
+
+    def seed_run_ids(self, set_ids: Iterable[str], cache: Dict[str, Optional[str]]) -> None:
+        """Answer `_latest_run_id_for_set` for every set the prefetch decides."""
+        for set_id in set_ids:
+            explore_rows = self.rows_for("explore_rip_statistics_latest", "set_id,calculation_run_id,run_at", (("set_id", set_id),))
+            decided, row = _newest_run_row(explore_rows) if explore_rows is not None else (False, None)
+            if not decided:
+                continue
+            if row and row.get("calculation_run_id"):
+                cache[set_id] = str(row.get("calculation_run_id"))
+                continue
+            simulation_rows = self.rows_for(
+                "simulation_latest_by_target",
+                "target_id,calculation_run_id,run_at",
+                (("target_type", "set"), ("target_id", set_id)),
+            )
+            decided, row = _newest_run_row(simulation_rows) if simulation_rows is not None else (False, None)
+            if decided:
+                cache[set_id] = str(row.get("calculation_run_id")) if row and row.get("calculation_run_id") else None
+
+
+# Installed and TORN DOWN by `_build_plan` alongside _PLANNING_RUN_ID_CACHE, and
+# for the same reason: it is a picture of the sources at planning time, which
+# the write phase must never consult.
+_PLANNING_SOURCE_INDEX: Optional[PlanningSourceIndex] = None
+
+
+def _planning_memo(key: Any, compute: Any) -> Any:
+    """`compute()` once per planning pass for `key`; uncached outside planning."""
+    index = _PLANNING_SOURCE_INDEX
+    if index is None:
+        return compute()
+    if key not in index.memo:
+        index.memo[key] = compute()
+    return index.memo[key]
+
+
+def _prefetch_planning_sources(client: Any, set_ids: Sequence[str], *, window: str) -> PlanningSourceIndex:
+    index = PlanningSourceIndex()
+    for source in _planning_sources(window):
+        rows_by_set, queries = _fetch_planning_source(client, source, set_ids)
+        index.sources[(source.table, source.columns)] = (source, rows_by_set)
+        index.bulk_queries += queries
+    return index
+
+
 def _legacy_card_ids(client: Any, set_id: str) -> List[str]:
-    rows, _error = _execute_query(
-        "cards.ids",
-        client.table("cards").select("id").eq("set_id", set_id),
-    )
+    index = _PLANNING_SOURCE_INDEX
+    rows = index.rows_for("cards", "set_id,id", (("set_id", set_id),)) if index is not None else None
+    if rows is None:
+        rows, _error = _execute_query(
+            "cards.ids",
+            client.table("cards").select("id").eq("set_id", set_id),
+        )
     return [str(row["id"]) for row in rows if row.get("id") is not None]
 
 
 def _canonical_card_ids(client: Any, set_id: str) -> List[str]:
-    rows, _error = _execute_query(
-        "pokemon_canonical_cards.ids",
-        client.table("pokemon_canonical_cards").select("id").eq("set_id", set_id),
-    )
+    index = _PLANNING_SOURCE_INDEX
+    rows = index.rows_for("pokemon_canonical_cards", "set_id,id", (("set_id", set_id),)) if index is not None else None
+    if rows is None:
+        rows, _error = _execute_query(
+            "pokemon_canonical_cards.ids",
+            client.table("pokemon_canonical_cards").select("id").eq("set_id", set_id),
+        )
     return [str(row["id"]) for row in rows if row.get("id") is not None]
 
 
 def _variant_ids_for_set(client: Any, set_id: str) -> List[str]:
+    # Asked by both the Cards and the Market Dashboard dependency reads.
+    return list(_planning_memo(("variant_ids", set_id), lambda: _variant_ids_for_set_uncached(client, set_id)))
+
+
+def _variant_ids_for_set_uncached(client: Any, set_id: str) -> List[str]:
     card_ids = _legacy_card_ids(client, set_id)
     if not card_ids:
         return []
@@ -644,13 +951,38 @@ def _variant_ids_for_set(client: Any, set_id: str) -> List[str]:
     return [str(row["id"]) for row in rows if row.get("id") is not None]
 
 
-def _canonical_selected_variant_ids(client: Any, set_id: str) -> List[str]:
-    rows, _error = _execute_query(
-        "pokemon_canonical_card_market_prices_latest.variant_ids",
+def _canonical_selected_price_rows(client: Any, set_id: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """The set's selected canonical prices: one row per canonical card."""
+    index = _PLANNING_SOURCE_INDEX
+    rows = (
+        index.rows_for("pokemon_canonical_card_market_prices_latest", SELECTED_PRICE_PLANNING_COLUMNS, (("set_id", set_id),))
+        if index is not None
+        else None
+    )
+    if rows is not None:
+        return rows, None
+    return _execute_query(
+        "pokemon_canonical_card_market_prices_latest.coverage",
         client.table("pokemon_canonical_card_market_prices_latest")
-        .select("card_variant_id")
+        .select("canonical_card_id,market_price")
         .eq("set_id", set_id),
     )
+
+
+def _canonical_selected_variant_ids(client: Any, set_id: str) -> List[str]:
+    index = _PLANNING_SOURCE_INDEX
+    rows = (
+        index.rows_for("pokemon_canonical_card_market_prices_latest", SELECTED_PRICE_PLANNING_COLUMNS, (("set_id", set_id),))
+        if index is not None
+        else None
+    )
+    if rows is None:
+        rows, _error = _execute_query(
+            "pokemon_canonical_card_market_prices_latest.variant_ids",
+            client.table("pokemon_canonical_card_market_prices_latest")
+            .select("card_variant_id")
+            .eq("set_id", set_id),
+        )
     return sorted({str(row["card_variant_id"]) for row in rows if row.get("card_variant_id") is not None})
 
 
@@ -1039,6 +1371,7 @@ def _leaderboard_contract_staleness(client: Any) -> Tuple[List[Dict[str, Any]],
 # Installed and TORN DOWN by `_build_plan` in a finally block, so it is scoped to
 # exactly one planning pass and can never carry stale data across runs — nor
 # across the later write/rebuild phase, where a run id may legitimately change.
+# A prefetching pass seeds it for every set the set-wide reads decide.
 _PLANNING_RUN_ID_CACHE: Optional[Dict[str, Optional[str]]] = None
 
 
@@ -1143,7 +1476,7 @@ def _cards_snapshot_staleness(client: Any, set_id: str) -> FreshnessResult:
     row = _read_snapshot_row(
         client,
         "pokemon_set_cards_snapshot_latest",
-        "set_id,cards_json,card_count,payload_json,updated_at",
+        CARDS_SNAPSHOT_PLANNING_COLUMNS,
         (("set_id", set_id),),
     )
     if not row:
@@ -1175,12 +1508,7 @@ def _cards_snapshot_staleness(client: Any, set_id: str) -> FreshnessResult:
         if isinstance(card, dict)
         and isinstance(card.get("movement7d") or card.get("movement_7d"), dict)
     )
-    selected_price_rows, selected_price_error = _execute_query(
-        "pokemon_canonical_card_market_prices_latest.coverage",
-        client.table("pokemon_canonical_card_market_prices_latest")
-        .select("canonical_card_id,market_price")
-        .eq("set_id", set_id),
-    )
+    selected_price_rows, selected_price_error = _canonical_selected_price_rows(client, set_id)
     if selected_price_error:
         checks.append(f"pokemon_canonical_card_market_prices_latest.coverage: {selected_price_error}")
     authoritative_priced_count = sum(1 for price_row in selected_price_rows if price_row.get("market_price") is not None)
@@ -1218,7 +1546,7 @@ def _market_snapshot_staleness(client: Any, set_id: str, window: str) -> Freshne
     row = _read_snapshot_row(
         client,
         "pokemon_set_market_dashboard_snapshot_latest",
-        "set_id,window_key,payload_json,set_value_histories_json,top_chase_card_histories_json,performance_vs_cost_history_json,latest_market_date,updated_at",
+        MARKET_DASHBOARD_PLANNING_COLUMNS,
         (("set_id", set_id), ("window_key", window)),
     )
     if not row:
@@ -1325,7 +1653,7 @@ def _set_page_snapshot_staleness(client: Any, set_id: str) -> FreshnessResult:
     row = _read_snapshot_row(
         client,
         "pokemon_set_page_snapshot_latest",
-        "set_id,payload_json,updated_at",
+        SET_PAGE_PLANNING_COLUMNS,
         (("set_id", set_id),),
     )
     if not row:
@@ -1471,7 +1799,13 @@ def _resolve_sets(client: Any, *, set_id: Optional[str]) -> List[Dict[str, Any]]
     return list_pokemon_sets(client)
 
 
-def _build_plan(client: Any, *, set_rows: List[Dict[str, Any]], window: str) -> Tuple[List[SetRefreshPlan], FreshnessResult, FreshnessResult, int]:
+def _build_plan(
+    client: Any,
+    *,
+    set_rows: List[Dict[str, Any]],
+    window: str,
+    prefetch: bool = False,
+) -> Tuple[List[SetRefreshPlan], FreshnessResult, FreshnessResult, int]:
     """READ-ONLY classification of every snapshot family. Writes nothing.
 
     Progress is logged deterministically because this phase is long, silent and
@@ -1486,8 +1820,13 @@ def _build_plan(client: Any, *, set_rows: List[Dict[str, Any]], window: str) ->
     PostgREST timeout. That timeout — not this interval — is the actual upper
     bound for one blocked PostgREST call. A `[refresh-query] timeout` line names
     the query label and set id when it fires.
+
+    `prefetch` first reads every bounded per-set source for all sets in a
+    handful of set-wide queries (see PlanningSourceIndex), so the per-set loop
+    only issues the reads that have no set-wide form. The verdicts are the
+    same either way.
     """
-    global _PLANNING_RUN_ID_CACHE
+    global _PLANNING_RUN_ID_CACHE, _PLANNING_SOURCE_INDEX
 
     plans: List[SetRefreshPlan] = []
     source_checks = 0
@@ -1496,6 +1835,16 @@ def _build_plan(client: Any, *, set_rows: List[Dict[str, Any]], window: str) ->
     logger.info("[refresh-plan] starting sets=%s", total)
     _PLANNING_RUN_ID_CACHE = {}
     try:
+        if prefetch:
+            set_ids = list(dict.fromkeys(str(set_row["id"]) for set_row in set_rows))
+            _PLANNING_SOURCE_INDEX = _prefetch_planning_sources(client, set_ids, window=window)
+            _PLANNING_SOURCE_INDEX.seed_run_ids(set_ids, _PLANNING_RUN_ID_CACHE)
+            logger.info(
+                "[refresh-plan] prefetched set-wide sources sets=%s queries=%s elapsed=%.2fs",
+                len(set_ids),
+                _PLANNING_SOURCE_INDEX.bulk_queries,
+                time.monotonic() - plan_started,
+            )
         for index, set_row in enumerate(set_rows, start=1):
             set_id = str(set_row["id"])
             canonical_key = str(set_row.get("canonical_key") or set_id)
@@ -1520,6 +1869,7 @@ def _build_plan(client: Any, *, set_rows: List[Dict[str, Any]], window: str) ->
     finally:
         # Dropped on success, on failure and on KeyboardInterrupt alike.
         _PLANNING_RUN_ID_CACHE = None
+        _PLANNING_SOURCE_INDEX = None
     source_checks += len(rankings.dependency_checks) + len(validation.dependency_checks)
     logger.info(
         "[refresh-plan] complete sets=%s elapsed=%.2fs", total, time.monotonic() - plan_started
@@ -2241,7 +2591,9 @@ def main() -> None:
     # PLAN BEFORE WRITE. Nothing below this call writes until _build_plan has
     # classified EVERY set; an interruption or failure during planning therefore
     # leaves production untouched.
-    plans, rankings, validation, source_checks = _build_plan(client, set_rows=set_rows, window=args.window)
+    plans, rankings, validation, source_checks = _build_plan(
+        client, set_rows=set_rows, window=args.window, prefetch=not args.per_set_planning
+    )
     logger.info(
         "[refresh-phase] planning complete; entering %s phase sets=%s",
         "rebuild/write" if commit else "dry-run report",
@@ -164,9 +164,10 @@ def run_single_set(orchestrator, set_key: str, config) -> dict:
         }
 
 
-def run_batch(set_map: dict, *, sleep=time.sleep) -> list:
-    from backend.jobs.evr_runner import EVRRunOrchestrator
-    orchestrator = EVRRunOrchestrator()
+def run_batch(set_map: dict, *, sleep=time.sleep, orchestrator=None) -> list:
+    if orchestrator is None:
+        from backend.jobs.evr_runner import EVRRunOrchestrator
+        orchestrator = EVRRunOrchestrator()
     results: list[dict[str, Any]] = []
     completed_durations: list[float] = []
     total_sets = len(set_map)
@@ -261,6 +262,36 @@ def run_batch(set_map: dict, *, sleep=time.sleep) -> list:
     return results
 
 
+# Long-lived worker processes (run_daily_opening_publication's pool mode).
+#
+# `run_all_v2_sets.py --set <key>` as a fresh subprocess pays interpreter start,
+# the pandas/numpy and simulation-engine imports, the set config maps and the
+# Supabase client setup for every single set. A pool worker pays them once in
+# `warm_simulation_worker` and then runs set after set in the same process.
+_WORKER_ORCHESTRATOR = None
+
+
+def warm_simulation_worker() -> None:
+    """Process-pool initializer: import the engine and build the orchestrator once."""
+    global _WORKER_ORCHESTRATOR
+    from backend.jobs.evr_runner import EVRRunOrchestrator
+
+    _WORKER_ORCHESTRATOR = EVRRunOrchestrator()
+
+
+def run_set_in_worker(set_key: str) -> list:
+    """The in-process equivalent of `run_all_v2_sets.py --set <key>`.
+
+    Returns the same per-set result dicts `run_batch` builds; an exception in
+    the set is already captured there, so one failing set never takes the
+    worker (or the sets queued behind it) down with it.
+    """
+    if _WORKER_ORCHESTRATOR is None:
+        warm_simulation_worker()
+    set_map = filter_v2_enabled_sets(discover_sets(), set_name=set_key)
+    return run_batch(set_map, orchestrator=_WORKER_ORCHESTRATOR)
+
+
 def print_summary(results: list, total_runtime: float):
     if results and all(result.get("dry_run") for result in results):
         print("\n=== Batch Summary ===")
@@ -43,9 +43,13 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import multiprocessing
+import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
@@ -187,17 +191,41 @@ def _run_command(command: Sequence[str], *, dry_run: bool) -> int:
     return int(completed.returncode)
 
 
+def default_simulation_workers() -> int:
+    """Concurrent simulation sets for pool mode: one per core, minus one core
+    left for the orchestrator and the Supabase round trips it waits on."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
 def run_simulations_for_sets(
     set_keys: Sequence[str],
     *,
     python_executable: Optional[str] = None,
     dry_run: bool = False,
+    workers: Optional[int] = None,
 ) -> List[SimulationOutcome]:
     """Run the existing V2 batch runner once per set that needs work.
 
     Per-set invocation is what makes the skip in step 2 meaningful: a set
     already current for the market date is never launched at all.
+
+    `workers=None` launches one `run_all_v2_sets.py --set <key>` subprocess per
+    set, one at a time. `workers=N` dispatches the same per-set run to N
+    long-lived worker processes instead (see `_run_simulations_in_pool`).
     """
+    if workers is None or dry_run or not set_keys:
+        return _run_simulations_in_subprocesses(
+            set_keys, python_executable=python_executable, dry_run=dry_run
+        )
+    return _run_simulations_in_pool(set_keys, workers=workers, python_executable=python_executable)
+
+
+def _run_simulations_in_subprocesses(
+    set_keys: Sequence[str],
+    *,
+    python_executable: Optional[str] = None,
+    dry_run: bool = False,
+) -> List[SimulationOutcome]:
     executable = python_executable or sys.executable
     outcomes: List[SimulationOutcome] = []
     for set_key in set_keys:
@@ -217,6 +245,81 @@ def run_simulations_for_sets(
     return outcomes
 
 
+def _outcome_from_worker_results(set_key: str, results: Sequence[Dict[str, Any]]) -> SimulationOutcome:
+    # Same verdict as the subprocess exit code: every matched set succeeded
+    # (and a key matching no V2 set is the same no-op it is on the CLI).
+    errors = [str(result.get("error") or "unknown error") for result in results if not result.get("success")]
+    return SimulationOutcome(
+        canonical_key=set_key,
+        succeeded=not errors,
+        reason=f"run_all_v2_sets failed: {'; '.join(errors)}" if errors else None,
+        duration_seconds=round(sum(float(result.get("duration") or 0.0) for result in results), 2),
+    )
+
+
+def _run_simulations_in_pool(
+    set_keys: Sequence[str],
+    *,
+    workers: int,
+    python_executable: Optional[str] = None,
+) -> List[SimulationOutcome]:
+    """Dispatch set keys to warm worker processes, up to `workers` sets at once.
+
+    Each worker imports the simulation engine and builds its orchestrator once
+    (run_all_v2_sets.warm_simulation_worker) and then runs set after set. A set
+    that fails is captured inside the worker exactly as the CLI captures it, so
+    it becomes one failed SimulationOutcome and nothing more.
+
+    A worker that DIES (OOM kill, segfault) breaks the whole pool and fails every
+    set still queued on it, including sets it never touched. Those sets are not
+    reported failed on the pool's word: each is re-run in its own subprocess, the
+    original fully isolated path, and reported from that.
+
+    Workers are spawned, not forked, so no Supabase connection or lock held by
+    this process is ever shared with a child.
+    """
+    from backend.scripts import run_all_v2_sets
+
+    worker_count = max(1, min(int(workers), len(set_keys)))
+    print(f"{TAG} simulating {len(set_keys)} set(s) on {worker_count} warm worker process(es)")
+    outcomes: Dict[str, SimulationOutcome] = {}
+    orphaned: List[str] = []
+    with ProcessPoolExecutor(
+        max_workers=worker_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=run_all_v2_sets.warm_simulation_worker,
+    ) as pool:
+        futures = {
+            pool.submit(run_all_v2_sets.run_set_in_worker, set_key): (set_key, time.perf_counter())
+            for set_key in set_keys
+        }
+        for future in as_completed(futures):
+            set_key, submitted = futures[future]
+            try:
+                outcomes[set_key] = _outcome_from_worker_results(set_key, future.result())
+            except BrokenProcessPool:
+                orphaned.append(set_key)
+            except Exception as exc:  # noqa: BLE001 - reported per set, never fatal to the batch
+                outcomes[set_key] = SimulationOutcome(
+                    canonical_key=set_key,
+                    succeeded=False,
+                    reason=f"simulation worker raised {type(exc).__name__}: {exc}",
+                    duration_seconds=round(time.perf_counter() - submitted, 2),
+                )
+
+    if orphaned:
+        # Re-run in the caller's order, not completion order.
+        orphaned_keys = set(orphaned)
+        orphaned = [set_key for set_key in set_keys if set_key in orphaned_keys]
+        print(
+            f"{TAG} simulation worker pool broke; re-running {len(orphaned)} set(s) in isolated "
+            f"subprocesses: {','.join(orphaned)}"
+        )
+        for outcome in _run_simulations_in_subprocesses(orphaned, python_executable=python_executable):
+            outcomes[outcome.canonical_key] = outcome
+    return [outcomes[set_key] for set_key in set_keys]
+
+
 def refresh_public_snapshots(
     *,
     python_executable: Optional[str] = None,
@@ -318,6 +421,7 @@ def orchestrate(
     python_executable: Optional[str] = None,
     gate_wait_attempts: int = 6,
     gate_wait_seconds: int = 600,
+    simulation_workers: Optional[int] = None,
 ) -> PublicationSummary:
     summary = PublicationSummary()
 
@@ -372,7 +476,9 @@ def orchestrate(
     pending = sets_needing_simulation(before)
     print(f"{TAG} market_date={resolved_market_date} eligible={before.eligible_count} pending={len(pending)}")
 
-    outcomes = run_simulations_for_sets(pending, python_executable=python_executable, dry_run=dry_run)
+    outcomes = run_simulations_for_sets(
+        pending, python_executable=python_executable, dry_run=dry_run, workers=simulation_workers
+    )
     summary.simulation_succeeded = sum(1 for outcome in outcomes if outcome.succeeded)
     summary.simulation_failed = sum(1 for outcome in outcomes if not outcome.succeeded)
     for outcome in outcomes:
@@ -836,6 +942,20 @@ def build_parser() -> argparse.ArgumentParser:
         default=600,
         help="Seconds between scrape-cohort gate re-evaluations.",
     )
+    parser.add_argument(
+        "--simulation-pool",
+        action="store_true",
+        help=(
+            "Run simulations on long-lived worker processes (warm imports and clients) instead of "
+            "one fresh run_all_v2_sets.py subprocess per set."
+        ),
+    )
+    parser.add_argument(
+        "--simulation-workers",
+        type=int,
+        default=None,
+        help="Sets simulated concurrently with --simulation-pool. Defaults to CPU count minus one.",
+    )
     parser.add_argument("--json", action="store_true", help="Emit the summary as JSON.")
     return parser
 
@@ -854,6 +974,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         skip_snapshots=args.skip_snapshots,
         gate_wait_attempts=args.gate_wait_attempts,
         gate_wait_seconds=args.gate_wait_seconds,
+        simulation_workers=(
+            max(1, args.simulation_workers or default_simulation_workers()) if args.simulation_pool else None
+        ),
     )
 
     if args.json:
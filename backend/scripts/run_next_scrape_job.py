@@ -5,7 +5,9 @@ import os
 import signal
 import socket
 import sys
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -21,8 +23,15 @@ from backend.db.repositories.scrape_jobs_repository import (
     DEFAULT_LEASE_SECONDS,
     claim_next_scrape_job,
     finalize_scrape_job,
+    heartbeat_scrape_job,
+)
+from backend.db.repositories.scrape_write_behind import (
+    ScrapeWriteBehindBuffer,
+    active_scrape_write_behind,
+    scrape_write_behind_scope,
 )
 from backend.db.repositories.sets_repository import get_set_by_id
+from backend.Scraper.clients.shared_rate_limiter import SharedRateLimiter, shared_rate_limiter_scope
 from backend.db.services.scrape_failure_classification import (
     ERROR_CATALOG_ONLY_NOT_DAILY_ELIGIBLE,
     ERROR_MISSING_CANONICAL_KEY,
@@ -47,6 +56,9 @@ DEFAULT_JOB_REPORT_DIR = Path("backend/constants/tcg/pokemon/scrape_job_reports"
 DEFAULT_DRAIN_MAX_JOBS = 200
 DEFAULT_DRAIN_MAX_RUNTIME_SECONDS = 6 * 60 * 60
 MAX_CONSECUTIVE_EMPTY_REPAIRS = 2
+DEFAULT_DISPATCHER_WORKERS = 1
+DEFAULT_SHARED_REQUESTS_PER_SECOND = 1.0
+DEFAULT_SHARED_REQUEST_BURST = 2
 _stop_after_current_job = False
 
 
@@ -113,7 +125,8 @@ def _request_metrics(report: dict) -> dict:
                    "postconditionMs", "identityReadOperations", "variantReadOperations",
                    "identityWriteOperations", "variantWriteOperations", "priceReadOperations",
                    "priceWriteOperations", "transportRetryCount", "payloadVariantCount",
-                   "totalDbOperations")
+                   "totalDbOperations", "priceGuideUnchanged", "priceGuideParseReused",
+                   "ingestionSkipped")
         metrics.update({key: results[0]["metadata"].get(key) for key in allowed
                         if results[0]["metadata"].get(key) is not None})
     return metrics
@@ -211,6 +224,15 @@ def _positive_env_int(name: str, default: int) -> int:
         return default
 
 
+def _positive_env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, str(default)))
+    except ValueError:
+        logger.warning("%s invalid %s; using %s", DISPATCHER_TAG, name, default)
+        return default
+    return value if value > 0 else default
+
+
 def _request_stop(signum, _frame) -> None:
     global _stop_after_current_job
     _stop_after_current_job = True
@@ -317,28 +339,169 @@ def _process_claimed_job(job: dict, worker_market_date: str) -> None:
     return 0
 
 
-def dispatch_next_scrape_job() -> int:
-    """Drain eligible jobs sequentially under the caller's existing flock.
+def _build_shared_rate_limiter() -> SharedRateLimiter:
+    """One token bucket and one request budget for every worker in the process.
 
-    Defaults permit a normal 167-set batch while bounding the process to 200
-    jobs or six hours. Both guards are configurable through
-    SCRAPE_DRAIN_MAX_JOBS and SCRAPE_DRAIN_MAX_RUNTIME_SECONDS.
+    The budget and the rate-limit streak are the same MAX_HTTP_REQUESTS_PER_RUN
+    and MAX_CONSECUTIVE_RATE_LIMITS a single client enforces, now counted across
+    workers; SCRAPE_SHARED_REQUESTS_PER_SECOND / SCRAPE_SHARED_REQUEST_BURST set
+    the combined pace.
     """
-    global _stop_after_current_job
-    logger.info("%s dispatcher start", DISPATCHER_TAG)
-    _load_backend_env()
-    _apply_safe_runtime_defaults()
-    os.environ.setdefault("SCRAPE_TRIGGER_SOURCE", "scheduled")
+    return SharedRateLimiter(
+        requests_per_second=_positive_env_float(
+            "SCRAPE_SHARED_REQUESTS_PER_SECOND", DEFAULT_SHARED_REQUESTS_PER_SECOND),
+        burst=_positive_env_int("SCRAPE_SHARED_REQUEST_BURST", DEFAULT_SHARED_REQUEST_BURST),
+        max_requests=_positive_env_int("MAX_HTTP_REQUESTS_PER_RUN", 20000),
+        max_consecutive_rate_limits=_positive_env_int("MAX_CONSECUTIVE_RATE_LIMITS", 8),
+    )
 
-    _stop_after_current_job = False
-    _install_signal_handlers()
-    worker_id = _worker_id()
-    lease_seconds = _lease_seconds()
-    worker_market_date = _market_date_iso()
-    max_jobs = _positive_env_int("SCRAPE_DRAIN_MAX_JOBS", DEFAULT_DRAIN_MAX_JOBS)
-    max_runtime = _positive_env_int(
-        "SCRAPE_DRAIN_MAX_RUNTIME_SECONDS", DEFAULT_DRAIN_MAX_RUNTIME_SECONDS)
-    started = time.monotonic()
+
+@contextmanager
+def _job_heartbeat(job_id: int, worker_id: str, lease_seconds: int):
+    """Extend the job's lease every third of it while the job runs.
+
+    Concurrent workers wait on the shared limiter, so a job can run longer
+    than it would alone; the heartbeat keeps the lease watchdog from
+    reclaiming it. A heartbeat that finds the job no longer running stops; a
+    failed heartbeat call is retried on the next interval.
+    Under a write-behind buffer the buffer's flush thread renews the lease
+    instead of a thread per job.
+    """
+    buffer = active_scrape_write_behind()
+    if buffer is not None:
+        buffer.track_heartbeat(job_id, worker_id, lease_seconds)
+        try:
+            yield
+        finally:
+            buffer.untrack_heartbeat(job_id)
+        return
+
+    stopped = threading.Event()
+    interval = max(30, lease_seconds // 3)
+
+    def _beat() -> None:
+        while not stopped.wait(interval):
+            try:
+                row = heartbeat_scrape_job(job_id, worker_id=worker_id, lease_seconds=lease_seconds, raise_errors=True)
+            except Exception:
+                # Already logged; the lease outlives two more intervals.
+                continue
+            if row is None:
+                logger.warning("%s heartbeat lost job id=%s worker=%s", DISPATCHER_TAG, job_id, worker_id)
+                return
+
+    beat = threading.Thread(target=_beat, name=f"scrape-heartbeat-{job_id}", daemon=True)
+    beat.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        beat.join(timeout=5)
+
+
+def _dispatch_concurrently(
+    *,
+    worker_count: int,
+    worker_id: str,
+    lease_seconds: int,
+    worker_market_date: str,
+    max_jobs: int,
+    max_runtime: int,
+    started: float,
+) -> int:
+    """Drain the queue with `worker_count` workers sharing one rate limiter.
+
+    Claims are taken one at a time under a lock, so the max-jobs, runtime,
+    market-date and stop guards are checked exactly as in the sequential
+    loop; only the scrapes themselves overlap. A worker that finds the queue
+    empty ends its round, and once every worker has finished the idle
+    completion check runs (and may start another round after a repair).
+    """
+    limiter = _build_shared_rate_limiter()
+    claim_lock = threading.Lock()
+    state = {"claimed": 0, "queue_empty": False, "error": None}
+
+    def _claim_next(worker_name: str) -> Optional[dict]:
+        with claim_lock:
+            if state["error"] is not None or state["queue_empty"]:
+                return None
+            if _stop_after_current_job or state["claimed"] >= max_jobs:
+                return None
+            if state["claimed"] and time.monotonic() - started >= max_runtime:
+                return None
+            if limiter.exhausted_reason:
+                return None
+            if _market_date_iso() != worker_market_date:
+                logger.warning("%s Phoenix market date changed; stopping before claim", DISPATCHER_TAG)
+                return None
+            job = claim_next_scrape_job(
+                worker_id=worker_name, lease_seconds=lease_seconds,
+                expected_market_date=worker_market_date,
+            )
+            if not job:
+                state["queue_empty"] = True
+                return None
+            state["claimed"] += 1
+            return job
+
+    def _work(worker_name: str) -> None:
+        try:
+            while True:
+                job = _claim_next(worker_name)
+                if not job:
+                    return
+                with _job_heartbeat(int(job["id"]), worker_name, lease_seconds):
+                    _process_claimed_job(job, worker_market_date)
+        except BaseException as exc:  # surfaced by the dispatcher after every worker stops
+            with claim_lock:
+                if state["error"] is None:
+                    state["error"] = exc
+
+    logger.info(
+        "%s concurrent drain workers=%s shared_rps=%.2f shared_request_budget=%s",
+        DISPATCHER_TAG, worker_count, limiter.requests_per_second, limiter.max_requests,
+    )
+    consecutive_empty_repairs = 0
+    with shared_rate_limiter_scope(limiter):
+        while True:
+            state["queue_empty"] = False
+            workers = [
+                threading.Thread(target=_work, args=(f"{worker_id}:w{index}",), name=f"scrape-worker-{index}")
+                for index in range(1, worker_count + 1)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            if state["error"] is not None:
+                raise state["error"]
+            if not state["queue_empty"]:
+                break
+
+            logger.info("%s no pending scrape jobs found", DISPATCHER_TAG)
+            summary = _run_idle_completion_check(worker_market_date) or {}
+            if int(summary.get("requeued") or 0) > 0:
+                consecutive_empty_repairs += 1
+                if consecutive_empty_repairs < MAX_CONSECUTIVE_EMPTY_REPAIRS:
+                    continue
+            break
+
+    logger.info(
+        "%s dispatcher exit jobs_processed=%s shared_limiter=%s",
+        DISPATCHER_TAG, state["claimed"], limiter.snapshot(),
+    )
+    return 0
+
+
+def _dispatch_sequentially(
+    *,
+    worker_id: str,
+    lease_seconds: int,
+    worker_market_date: str,
+    max_jobs: int,
+    max_runtime: int,
+    started: float,
+) -> int:
     jobs_processed = 0
     consecutive_empty_repairs = 0
 
@@ -372,6 +535,49 @@ def dispatch_next_scrape_job() -> int:
     return 0
 
 
+def dispatch_next_scrape_job() -> int:
+    """Drain eligible jobs sequentially under the caller's existing flock.
+
+    Defaults permit a normal 167-set batch while bounding the process to 200
+    jobs or six hours. Both guards are configurable through
+    SCRAPE_DRAIN_MAX_JOBS and SCRAPE_DRAIN_MAX_RUNTIME_SECONDS.
+
+    SCRAPE_DISPATCHER_WORKERS > 1 runs that many workers in this process,
+    paced by one shared rate limiter (see `_dispatch_concurrently`).
+    """
+    global _stop_after_current_job
+    logger.info("%s dispatcher start", DISPATCHER_TAG)
+    _load_backend_env()
+    _apply_safe_runtime_defaults()
+    os.environ.setdefault("SCRAPE_TRIGGER_SOURCE", "scheduled")
+
+    _stop_after_current_job = False
+    _install_signal_handlers()
+    worker_id = _worker_id()
+    lease_seconds = _lease_seconds()
+    worker_market_date = _market_date_iso()
+    max_jobs = _positive_env_int("SCRAPE_DRAIN_MAX_JOBS", DEFAULT_DRAIN_MAX_JOBS)
+    max_runtime = _positive_env_int(
+        "SCRAPE_DRAIN_MAX_RUNTIME_SECONDS", DEFAULT_DRAIN_MAX_RUNTIME_SECONDS)
+    started = time.monotonic()
+
+    worker_count = _positive_env_int("SCRAPE_DISPATCHER_WORKERS", DEFAULT_DISPATCHER_WORKERS)
+    # SCRAPE_WRITE_BEHIND_ENABLED=true moves heartbeats and diagnostic writes
+    # off the workers; the scope's exit flushes whatever is still queued.
+    with scrape_write_behind_scope(ScrapeWriteBehindBuffer.from_env()):
+        if worker_count > 1:
+            return _dispatch_concurrently(
+                worker_count=worker_count, worker_id=worker_id, lease_seconds=lease_seconds,
+                worker_market_date=worker_market_date, max_jobs=max_jobs,
+                max_runtime=max_runtime, started=started,
+            )
+        return _dispatch_sequentially(
+            worker_id=worker_id, lease_seconds=lease_seconds,
+            worker_market_date=worker_market_date, max_jobs=max_jobs,
+            max_runtime=max_runtime, started=started,
+        )
+
+
 def main() -> int:
     try:
         return dispatch_next_scrape_job()
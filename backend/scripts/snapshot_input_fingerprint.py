@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+"""Input fingerprints for the per-set public snapshot builders.
+
+A nightly public build rebuilds every set page and every coordinated Cards +
+Market Dashboard row, although on most nights only the sets whose prices moved
+or whose simulation was re-run have anything new to publish. Each builder
+family here hashes the source content its rows are derived from - the
+calculation run, the selected-price layer and its market date, the ranked
+targets, the Collector Appeal formula identity - into one fingerprint that is
+stored in the published payload under `meta.snapshot.inputFingerprint`. With
+`--skip-unchanged` a builder compares the fingerprint it would build from
+against the stored one and skips the compute and the write entirely when they
+match.
+
+The fingerprint is computed BEFORE the build reads anything, so a source that
+changes while a set is being built leaves the older fingerprint stamped and the
+next run rebuilds that set. Any read failure yields no fingerprint at all, and
+no fingerprint always means "rebuild": skipping is an optimization and must
+never be the reason a set keeps stale data.
+
+Bump SNAPSHOT_INPUT_FINGERPRINT_VERSION whenever a builder would produce
+different output from unchanged inputs (a code change to the payload), so
+every stored fingerprint stops matching once.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from backend.desirability.collector_appeal_fingerprint import current_fingerprint, fingerprint_assumptions
+from backend.scripts.pokemon_snapshot_builders import (
+    DEFAULT_DASHBOARD_WINDOW,
+    MOVEMENT_CONTRACT_VERSION,
+    SetPageBuildContext,
+    first_non_empty,
+    parse_date_key,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INPUT_FINGERPRINT_VERSION = 1
+SET_PAGE_FINGERPRINT_FAMILY = "set_page"
+COORDINATED_MARKET_FINGERPRINT_FAMILY = "coordinated_market"
+INPUT_FINGERPRINT_PROJECTION = "input_fingerprint:payload_json->meta->snapshot->>inputFingerprint"
+GENERATION_ID_PROJECTION = "generation_id:payload_json->meta->snapshot->>generationId"
+# `refreshed_at` is rewritten by every canonical refresh even when no selected
+# price changed, so it is deliberately not part of the selected-price digest.
+SELECTED_PRICE_FINGERPRINT_COLUMNS = (
+    "canonical_card_id,card_variant_id,condition_id,printing_type,market_price,captured_at,source,"
+    "price_selection_reason"
+)
+
+
+@dataclass(frozen=True)
+class SnapshotInputFingerprint:
+    family: str
+    sources: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def value(self) -> str:
+        return fingerprint_assumptions(
+            {"family": self.family, "version": SNAPSHOT_INPUT_FINGERPRINT_VERSION, "sources": self.sources}
+        )
+
+
+def _source_row(client: Any, table_name: str, configure_query) -> Optional[Dict[str, Any]]:
+    # Unlike the builders' diagnostic reads, a failure propagates: a failed
+    # read must not hash the same as a missing row.
+    result = configure_query(client.table(table_name)).limit(1).execute()
+    rows = list(result.data or [])
+    return rows[0] if rows else None
+
+
+def _source_rows(client: Any, table_name: str, configure_query) -> List[Dict[str, Any]]:
+    return list(configure_query(client.table(table_name)).execute().data or [])
+
+
+def _set_identity(set_row: Dict[str, Any]) -> Dict[str, Any]:
+    return {str(key): value for key, value in set_row.items() if not isinstance(value, (dict, list))}
+
+
+def _latest_run(client: Any, set_id: str) -> Dict[str, Optional[str]]:
+    explore_row = _source_row(
+        client,
+        "explore_rip_statistics_latest",
+        lambda query: query.select("calculation_run_id,run_at").eq("set_id", set_id),
+    )
+    latest_row = _source_row(
+        client,
+        "simulation_latest_by_target",
+        lambda query: query.select("calculation_run_id,run_at").eq("target_type", "set").eq("target_id", set_id),
+    )
+    return {
+        "explore_rip_run_id": first_non_empty((explore_row or {}).get("calculation_run_id")),
+        "explore_rip_run_at": first_non_empty((explore_row or {}).get("run_at")),
+        "latest_run_id": first_non_empty((latest_row or {}).get("calculation_run_id")),
+        "latest_run_at": first_non_empty((latest_row or {}).get("run_at")),
+    }
+
+
+def _snapshot_content_identity(
+    client: Any, table_name: str, set_id: str, window: Optional[str] = None
+) -> Dict[str, Optional[str]]:
+    """A coordinated Cards/dashboard row by the inputs it was built from.
+
+    Its generation id is minted per write, so a nightly rebuild from unchanged
+    prices would otherwise change every set page's fingerprint too. Rows
+    written without `--skip-unchanged` carry no input fingerprint; those fall
+    back to the generation id, which only costs a rebuild.
+    """
+
+    def configure(query):
+        query = query.select(f"{INPUT_FINGERPRINT_PROJECTION},{GENERATION_ID_PROJECTION}").eq("set_id", set_id)
+        return query.eq("window_key", window) if window is not None else query
+
+    row = _source_row(client, table_name, configure) or {}
+    input_fingerprint = first_non_empty(row.get("input_fingerprint"))
+    if input_fingerprint is not None:
+        return {"input_fingerprint": input_fingerprint}
+    return {"generation_id": first_non_empty(row.get("generation_id"))}
+
+
+def _rankings_digest(client: Any, context: Optional[SetPageBuildContext]) -> str:
+    """Hash of the ranked targets a set page takes its rank context from.
+
+    Every target is hashed, not only this set's: ranks, tiers and percentiles
+    are relative to the cohort. The snapshot row's `updated_at` moves on every
+    rankings publish whether or not a rank changed, so it is not hashed. With a
+    prefetched context the digest covers exactly the leaderboard the page
+    embeds; a single-set build hashes the published rankings snapshot instead
+    of recomputing the leaderboard just to fingerprint it.
+    """
+
+    if context is not None:
+        if context.rankings_error is not None:
+            raise context.rankings_error
+        targets = (context.rankings_payload or {}).get("targets") or []
+    else:
+        row = _source_row(
+            client,
+            "pokemon_explore_rankings_snapshot_latest",
+            lambda query: query.select("ranking_payload_json").eq("tcg", "pokemon").eq("scope", "rip-statistics"),
+        )
+        targets = ((row or {}).get("ranking_payload_json") or {}).get("targets") or []
+    return fingerprint_assumptions({"targets": list(targets)})
+
+
+def set_page_input_fingerprint(
+    client: Any,
+    set_row: Dict[str, Any],
+    *,
+    context: Optional[SetPageBuildContext] = None,
+) -> Optional[SnapshotInputFingerprint]:
+    """What a set page is built from: the set's latest calculation run, the
+    ranked targets every page embeds its rank context from, the Cards and 365d
+    dashboard rows it validates Card Appeal and completeness against (by their
+    own input fingerprints), the sealed market snapshot, and the Collector
+    Appeal formula."""
+
+    set_id = str(set_row["id"])
+    try:
+        sealed_row = _source_row(
+            client,
+            "pokemon_set_sealed_market_snapshot_latest",
+            lambda query: query.select("market_date,source_generation_fingerprint").eq("set_id", set_id),
+        )
+        sources = {
+            "set": _set_identity(set_row),
+            "run": _latest_run(client, set_id),
+            "rankings": _rankings_digest(client, context),
+            "cards": _snapshot_content_identity(client, "pokemon_set_cards_snapshot_latest", set_id),
+            "dashboard": _snapshot_content_identity(
+                client, "pokemon_set_market_dashboard_snapshot_latest", set_id, DEFAULT_DASHBOARD_WINDOW
+            ),
+            "sealed_market": {
+                "market_date": parse_date_key((sealed_row or {}).get("market_date")),
+                "source_generation_fingerprint": first_non_empty(
+                    (sealed_row or {}).get("source_generation_fingerprint")
+                ),
+            },
+            "collector_appeal_fingerprint": current_fingerprint(),
+        }
+    except Exception:
+        logger.warning("[snapshot-fingerprint] set page inputs unavailable set_id=%s; rebuilding", set_id, exc_info=True)
+        return None
+    return SnapshotInputFingerprint(SET_PAGE_FINGERPRINT_FAMILY, sources)
+
+
+def coordinated_market_input_fingerprint(
+    client: Any,
+    set_row: Dict[str, Any],
+    *,
+    days: int,
+    window: str,
+) -> Optional[SnapshotInputFingerprint]:
+    """What the coordinated Cards + Market Dashboard rows are built from: the
+    canonical selected-price layer (which also fixes the set's market date),
+    the Set Value daily history, and the set's simulation performance history.
+
+    Read AFTER the canonical price refresh, because that refresh is what turns
+    new observations into a changed selected-price layer.
+    """
+
+    set_id = str(set_row["id"])
+    try:
+        selected_rows = _source_rows(
+            client,
+            "pokemon_canonical_card_market_prices_latest",
+            lambda query: query.select(SELECTED_PRICE_FINGERPRINT_COLUMNS).eq("set_id", set_id),
+        )
+        set_value_row = _source_row(
+            client,
+            "pokemon_set_value_daily_history",
+            lambda query: query.select("snapshot_date,updated_at").eq("set_id", set_id).order("updated_at", desc=True),
+        )
+        latest_set_value_row = _source_row(
+            client,
+            "pokemon_set_value_daily_history",
+            lambda query: query.select("snapshot_date").eq("set_id", set_id).order("snapshot_date", desc=True),
+        )
+        performance_row = _source_row(
+            client,
+            "calculation_history_trend",
+            lambda query: query.select("snapshot_date,calculation_run_id")
+            .eq("target_type", "set")
+            .eq("target_id", set_id)
+            .order("snapshot_date", desc=True),
+        )
+        sources = {
+            "set": _set_identity(set_row),
+            "days": int(days),
+            "window": str(window),
+            # Sorted so the digest does not depend on the order PostgREST
+            # happens to return the rows in.
+            "selected_prices": sorted(
+                [str(row.get(column)) for column in SELECTED_PRICE_FINGERPRINT_COLUMNS.split(",")]
+                for row in selected_rows
+            ),
+            "set_value_history": {
+                "latest_snapshot_date": parse_date_key((latest_set_value_row or {}).get("snapshot_date")),
+                "latest_updated_at": first_non_empty((set_value_row or {}).get("updated_at")),
+            },
+            "performance_history": {
+                "latest_snapshot_date": parse_date_key((performance_row or {}).get("snapshot_date")),
+                "calculation_run_id": first_non_empty((performance_row or {}).get("calculation_run_id")),
+            },
+            "run": _latest_run(client, set_id),
+            "movement_contract_version": MOVEMENT_CONTRACT_VERSION,
+        }
+    except Exception:
+        logger.warning(
+            "[snapshot-fingerprint] market inputs unavailable set_id=%s; rebuilding", set_id, exc_info=True
+        )
+        return None
+    return SnapshotInputFingerprint(COORDINATED_MARKET_FINGERPRINT_FAMILY, sources)
+
+
+def stored_input_fingerprint(
+    client: Any, table_name: str, set_id: str, *, window: Optional[str] = None
+) -> Optional[str]:
+    def configure(query):
+        query = query.select(INPUT_FINGERPRINT_PROJECTION).eq("set_id", set_id)
+        return query.eq("window_key", window) if window is not None else query
+
+    try:
+        return first_non_empty((_source_row(client, table_name, configure) or {}).get("input_fingerprint"))
+    except Exception:
+        logger.warning(
+            "[snapshot-fingerprint] stored fingerprint read failed table=%s set_id=%s", table_name, set_id, exc_info=True
+        )
+        return None
+
+
+def set_page_snapshot_is_current(
+    client: Any, set_id: str, fingerprint: Optional[SnapshotInputFingerprint]
+) -> bool:
+    if fingerprint is None:
+        return False
+    return stored_input_fingerprint(client, "pokemon_set_page_snapshot_latest", set_id) == fingerprint.value
+
+
+def coordinated_market_snapshots_are_current(
+    client: Any, set_id: str, fingerprint: Optional[SnapshotInputFingerprint], *, window: str
+) -> bool:
+    """Both coordinated rows must carry the fingerprint: a Cards row written by
+    a run whose dashboard write then failed is not a current generation."""
+
+    if fingerprint is None:
+        return False
+    expected = fingerprint.value
+    return (
+        stored_input_fingerprint(client, "pokemon_set_cards_snapshot_latest", set_id) == expected
+        and stored_input_fingerprint(client, "pokemon_set_market_dashboard_snapshot_latest", set_id, window=window)
+        == expected
+    )
+
+
+def stamp_input_fingerprint(row: Dict[str, Any], fingerprint: Optional[SnapshotInputFingerprint]) -> Dict[str, Any]:
+    """Return `row` with the fingerprint recorded in its payload's snapshot meta."""
+
+    if fingerprint is None:
+        return row
+    payload = dict(row.get("payload_json") or {})
+    meta = dict(payload.get("meta") or {})
+    snapshot_meta = dict(meta.get("snapshot") or {})
+    snapshot_meta["inputFingerprint"] = fingerprint.value
+    snapshot_meta["inputFingerprintVersion"] = SNAPSHOT_INPUT_FINGERPRINT_VERSION
+    meta["snapshot"] = snapshot_meta
+    payload["meta"] = meta
+    return {**row, "payload_json": payload}
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+"""Set-parallel snapshot builds with batched writes.
+
+The per-set builders (set pages, coordinated cards + market dashboards) spend
+nearly all of their time waiting on PostgREST, one set after another. Here the
+per-set builds run on a bounded thread pool instead, each set keeping its own
+bounded retry (`run_snapshot_operation_with_retry`, a fresh client per
+attempt), while the main thread collects the built rows and writes them in
+batches - one upsert request per table per batch rather than per set.
+
+The service modules read through their module-level `public_read_client`,
+which `snapshot_service_client_scope` swaps for the duration of an attempt.
+Swapping a module global from several threads at once would route one set's
+reads through another set's client, so a fan-out installs a single
+`_ThreadBoundClient` in those modules for the whole run and each worker binds
+its attempt's fresh client to its own thread.
+
+A set is reported built only after every write of its batch committed, which
+keeps the publish-then-revalidate ordering of the sequential builders.
+"""
+
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from backend.db.services.data_service_health import is_transient_data_service_error
+from backend.scripts.pokemon_snapshot_builders import (
+    build_coordinated_set_market_snapshot_rows,
+    get_client,
+    refresh_canonical_card_market_prices_for_set,
+    snapshot_service_client_scope,
+    upsert_rows,
+)
+from backend.scripts.snapshot_input_fingerprint import (
+    coordinated_market_input_fingerprint,
+    coordinated_market_snapshots_are_current,
+    stamp_input_fingerprint,
+)
+from backend.scripts.snapshot_query_retry import run_snapshot_operation_with_retry
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FANOUT_UPSERT_BATCH_SIZE = 10
+
+
+class _ThreadBoundClient:
+    """Resolves every attribute on the client the calling thread bound, or on
+    the run's default client outside a bound worker attempt."""
+
+    def __init__(self, default_client: Any) -> None:
+        self._default_client = default_client
+        self._local = threading.local()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(getattr(self._local, "client", None) or self._default_client, name)
+
+    @contextmanager
+    def bind(self, client: Any) -> Iterator[None]:
+        previous = getattr(self._local, "client", None)
+        self._local.client = client
+        try:
+            yield
+        finally:
+            self._local.client = previous
+
+
+@dataclass
+class SetFanoutOutcome:
+    set_row: Dict[str, Any]
+    value: Any = None
+    error: Optional[Exception] = None
+    # Set when the run stopped before this set was attempted.
+    not_attempted: bool = False
+
+    @property
+    def built(self) -> bool:
+        return self.error is None and not self.not_attempted
+
+    @property
+    def unchanged(self) -> bool:
+        """Built with nothing to write: the stored snapshot was already current."""
+        return self.built and self.value is None
+
+
+def run_set_fanout(
+    target_sets: Sequence[Dict[str, Any]],
+    build_set: Callable[[Dict[str, Any], Any], Any],
+    write_batch: Callable[[Any, List[Any]], None],
+    *,
+    workers: int,
+    operation_name: str,
+    batch_size: int = DEFAULT_FANOUT_UPSERT_BATCH_SIZE,
+    max_consecutive_transient_failures: Optional[int] = None,
+    client_factory: Callable[[], Any] = get_client,
+) -> List[SetFanoutOutcome]:
+    """Build every set on up to `workers` threads and write the results in batches.
+
+    `build_set(set_row, client)` runs on a worker thread, once per attempt, and
+    returns that set's rows without writing them. `write_batch(client, values)`
+    runs on the calling thread with up to `batch_size` built values; it is
+    retried as a whole, so it must be idempotent (upserts are). A failed batch
+    fails every set in it. A build that returns None has nothing to write (its
+    stored snapshot is already current) and is reported built without joining
+    a batch.
+
+    `max_consecutive_transient_failures` is the sequential builders' circuit
+    breaker: after that many consecutive exhausted transient failures the sets
+    not yet started are abandoned (reported `not_attempted`).
+
+    Outcomes are returned in `target_sets` order.
+    """
+
+    outcomes = [SetFanoutOutcome(set_row=set_row) for set_row in target_sets]
+    proxy = _ThreadBoundClient(client_factory())
+    safe_batch_size = max(1, int(batch_size or DEFAULT_FANOUT_UPSERT_BATCH_SIZE))
+    pending_writes: List[SetFanoutOutcome] = []
+    consecutive_transient_failures = 0
+
+    def build_with_retry(outcome: SetFanoutOutcome) -> Any:
+        def attempt(fresh_client: Any) -> Any:
+            with proxy.bind(fresh_client):
+                return build_set(outcome.set_row, fresh_client)
+
+        return run_snapshot_operation_with_retry(
+            attempt,
+            operation_name=operation_name,
+            set_id=str(outcome.set_row.get("id") or ""),
+            client_factory=client_factory,
+        )
+
+    def flush() -> None:
+        batch = pending_writes[:]
+        pending_writes.clear()
+        if not batch:
+            return
+        try:
+            run_snapshot_operation_with_retry(
+                lambda fresh_client: write_batch(fresh_client, [outcome.value for outcome in batch]),
+                operation_name=f"{operation_name} batch write",
+                client_factory=client_factory,
+            )
+        except Exception as exc:
+            logger.exception("%s batch write failed sets=%s", operation_name, len(batch))
+            for outcome in batch:
+                outcome.error = exc
+
+    logger.info(
+        "%s fan-out sets=%s workers=%s upsert_batch_size=%s",
+        operation_name,
+        len(target_sets),
+        workers,
+        safe_batch_size,
+    )
+    threshold = None if max_consecutive_transient_failures is None else max(1, int(max_consecutive_transient_failures))
+    queued = iter(outcomes)
+    with snapshot_service_client_scope(proxy):
+        with ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix="snapshot-set") as pool:
+            running: Dict[Future, SetFanoutOutcome] = {}
+            stopped = False
+            while True:
+                # Submit lazily, never more than `workers` sets in flight, so a
+                # tripped circuit breaker leaves every later set unstarted.
+                while not stopped and len(running) < max(1, int(workers)):
+                    outcome = next(queued, None)
+                    if outcome is None:
+                        break
+                    running[pool.submit(build_with_retry, outcome)] = outcome
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcome = running.pop(future)
+                    try:
+                        outcome.value = future.result()
+                    except Exception as exc:
+                        outcome.error = exc
+                        if is_transient_data_service_error(exc):
+                            consecutive_transient_failures += 1
+                        else:
+                            consecutive_transient_failures = 0
+                        continue
+                    consecutive_transient_failures = 0
+                    if outcome.value is None:
+                        continue
+                    pending_writes.append(outcome)
+                    if len(pending_writes) >= safe_batch_size:
+                        flush()
+                if not stopped and threshold is not None and consecutive_transient_failures >= threshold:
+                    stopped = True
+                    abandoned = list(queued)
+                    for outcome in abandoned:
+                        outcome.not_attempted = True
+                    logger.error(
+                        "%s stopping after %s consecutive transient failures; %s set(s) not attempted",
+                        operation_name,
+                        consecutive_transient_failures,
+                        len(abandoned),
+                    )
+            flush()
+    return outcomes
+
+
+def run_coordinated_market_fanout(
+    target_sets: Sequence[Dict[str, Any]],
+    *,
+    days: int,
+    window: str,
+    commit: bool,
+    workers: int,
+    batch_size: int = DEFAULT_FANOUT_UPSERT_BATCH_SIZE,
+    max_consecutive_transient_failures: Optional[int] = None,
+    client_factory: Callable[[], Any] = get_client,
+    skip_unchanged: bool = False,
+) -> List[SetFanoutOutcome]:
+    """The coordinated Cards + Top Chase history + Market Dashboard build, set-parallel.
+
+    Each batch is written in the same order the sequential builders write one
+    set - every Cards row, then the Top Chase history, then the dashboards - so
+    a dashboard is never published ahead of the Cards generation it was
+    validated against.
+
+    With `skip_unchanged` a set whose stored Cards and dashboard rows already
+    carry its input fingerprint is not built (its outcome is `unchanged`).
+    """
+    def build_set(set_row: Dict[str, Any], fresh_client: Any) -> Any:
+        refresh_canonical_card_market_prices_for_set(fresh_client, str(set_row["id"]), commit=commit)
+        fingerprint = None
+        if skip_unchanged:
+            fingerprint = coordinated_market_input_fingerprint(fresh_client, set_row, days=days, window=window)
+            if coordinated_market_snapshots_are_current(fresh_client, str(set_row["id"]), fingerprint, window=window):
+                return None
+        cards_row, dashboard_row, history_rows = build_coordinated_set_market_snapshot_rows(
+            set_row, days=days, window=window, client=fresh_client
+        )
+        return (
+            stamp_input_fingerprint(cards_row, fingerprint),
+            stamp_input_fingerprint(dashboard_row, fingerprint),
+            history_rows,
+        )
+
+    def write_batch(fresh_client: Any, built: List[Any]) -> None:
+        upsert_rows(
+            fresh_client,
+            "pokemon_set_cards_snapshot_latest",
+            [cards_row for cards_row, _dashboard_row, _history_rows in built],
+            on_conflict="set_id",
+            commit=commit,
+            batch_size=len(built),
+        )
+        upsert_rows(
+            fresh_client,
+            "pokemon_set_top_chase_card_daily_history",
+            [row for _cards_row, _dashboard_row, history_rows in built for row in history_rows],
+            on_conflict="set_id,snapshot_date,rank",
+            commit=commit,
+        )
+        upsert_rows(
+            fresh_client,
+            "pokemon_set_market_dashboard_snapshot_latest",
+            [dashboard_row for _cards_row, dashboard_row, _history_rows in built],
+            on_conflict="set_id,window_key",
+            commit=commit,
+            batch_size=len(built),
+        )
+
+    return run_set_fanout(
+        target_sets,
+        build_set,
+        write_batch,
+        workers=workers,
+        operation_name="build market dashboard snapshot",
+        batch_size=batch_size,
+        max_consecutive_transient_failures=max_consecutive_transient_failures,
+        client_factory=client_factory,
+    )
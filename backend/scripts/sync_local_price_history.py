@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+"""Sync the local columnar price-history store from `card_variant_price_observations`.
+
+Run after a scrape lands, before the market builders; only the days since
+each set's last synced market date are read. Point the builders at the store
+with `--price-history-store`.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from backend.db.services.local_price_history_store import (
+    DEFAULT_LOCAL_PRICE_HISTORY_DAYS,
+    DEFAULT_LOCAL_PRICE_HISTORY_ROOT,
+    LocalPriceHistoryStore,
+)
+from backend.scripts.pokemon_snapshot_builders import get_client, list_pokemon_sets, resolve_set_row
+
+
+logger = logging.getLogger("sync_local_price_history")
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 200
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Sync Pokemon price observations into the local price-history store.")
+    target_group = parser.add_mutually_exclusive_group(required=True)
+    target_group.add_argument("--all", action="store_true", help="Sync all Pokemon sets")
+    target_group.add_argument("--set-id", help="Set id, canonical key, or Pokemon API set id to sync")
+    parser.add_argument("--root", default=str(DEFAULT_LOCAL_PRICE_HISTORY_ROOT), help="Store directory")
+    parser.add_argument(
+        "--history-days",
+        type=int,
+        default=DEFAULT_LOCAL_PRICE_HISTORY_DAYS,
+        help="Days of history to keep per set; 0 keeps the full history",
+    )
+    parser.add_argument("--through", help="Last UTC capture day to sync, YYYY-MM-DD (default: today)")
+    parser.add_argument("--log-level", default="INFO", choices=("DEBUG", "INFO", "WARNING", "ERROR"))
+    return parser
+
+
+def _chunks(values: Sequence[str], size: int = DEFAULT_CHUNK_SIZE) -> Iterable[List[str]]:
+    for index in range(0, len(values), size):
+        yield list(values[index : index + size])
+
+
+def _paged_ids(client: Any, table: str, configure_query) -> List[str]:
+    ids: List[str] = []
+    start = 0
+    while True:
+        page = list(
+            configure_query(client.table(table).select("id")).order("id").range(start, start + DEFAULT_PAGE_SIZE - 1).execute().data
+            or []
+        )
+        ids.extend(str(row["id"]) for row in page if row.get("id"))
+        if len(page) < DEFAULT_PAGE_SIZE:
+            return ids
+        start += DEFAULT_PAGE_SIZE
+
+
+def set_variant_ids(client: Any, set_id: str) -> List[str]:
+    card_ids = _paged_ids(client, "cards", lambda query: query.eq("set_id", set_id))
+    variant_ids: List[str] = []
+    for card_id_chunk in _chunks(card_ids):
+        variant_ids.extend(_paged_ids(client, "card_variants", lambda query, ids=card_id_chunk: query.in_("card_id", ids)))
+    return variant_ids
+
+
+def _through(value: str | None) -> date:
+    if not value:
+        return datetime.now(timezone.utc).date()
+    try:
+        return date.fromisoformat(value)
+    except ValueError as exc:
+        raise SystemExit(f"--through must be YYYY-MM-DD, got {value!r}") from exc
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    logging.basicConfig(level=getattr(logging, args.log_level), format="%(levelname)s %(message)s")
+    through = _through(args.through)
+    client = get_client()
+    set_rows: List[Dict[str, Any]] = list_pokemon_sets(client) if args.all else [resolve_set_row(client, args.set_id)]
+    store = LocalPriceHistoryStore(Path(args.root))
+    started = time.perf_counter()
+    synced = 0
+    failed = 0
+    rows = 0
+
+    for set_row in set_rows:
+        set_id = str(set_row.get("id") or "")
+        if not set_id:
+            continue
+        try:
+            rows += store.sync_set(
+                client,
+                set_id,
+                set_variant_ids(client, set_id),
+                through=through,
+                history_days=args.history_days or None,
+            )
+            synced += 1
+        except Exception:
+            failed += 1
+            logger.exception("failed price-history sync set_id=%s", set_id)
+
+    logger.info(
+        "Done. sets=%s synced=%s failed=%s rows_read=%s through=%s elapsed_ms=%s",
+        len(set_rows),
+        synced,
+        failed,
+        rows,
+        through.isoformat(),
+        round((time.perf_counter() - started) * 1000, 2),
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
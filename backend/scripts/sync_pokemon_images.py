@@ -96,6 +96,35 @@ def get_target_sets(explicit_sets: Optional[List[str]]) -> List[str]:
         return DEFAULT_SETS
 
 
+def prefetch_api_sets(service, set_names: List[str]) -> None:
+    """Fetch the target sets' API cards up front, several sets per query.
+
+    ``sync_set`` then reads each set from the client's prefetched cards. Sets
+    without a ``pokemon_api_set_id`` (and any prefetch failure) simply fall
+    back to the per-set fetch inside ``sync_set``.
+    """
+    try:
+        from backend.db.clients.supabase_client import supabase
+
+        response = (
+            supabase.table("sets")
+            .select("name,pokemon_api_set_id")
+            .in_("name", set_names)
+            .execute()
+        )
+        rows = response.data if response and response.data else []
+        api_set_ids = [
+            str(row.get("pokemon_api_set_id")).strip()
+            for row in rows
+            if str(row.get("pokemon_api_set_id") or "").strip()
+        ]
+        if api_set_ids:
+            print(f"[SYNC] Prefetching cards for {len(api_set_ids)} Pokemon API set(s)")
+            service.client.prefetch_sets(api_set_ids)
+    except Exception as exc:
+        print(f"[WARN] Pokemon API prefetch failed ({exc}); fetching sets one at a time")
+
+
 def main() -> int:
     args = build_parser().parse_args()
     dry_run = not args.apply
@@ -109,6 +138,7 @@ def main() -> int:
     from backend.db.services.pokemon_tcg_image_sync_service import PokemonTCGImageSyncService
 
     service = PokemonTCGImageSyncService()
+    prefetch_api_sets(service, target_sets)
     exit_code = 0
 
     for set_name in target_sets:
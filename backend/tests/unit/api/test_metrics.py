@@ -0,0 +1,94 @@
+"""Per-route metrics: the registry must render valid Prometheus text, and the
+API must feed it from every request and from the payload `meta.timings`."""
+
+import pytest
+from fastapi.testclient import TestClient  # type: ignore[reportMissingImports]
+
+from backend.api import main as api_main
+from backend.utils.metrics_registry import MetricsRegistry, REGISTRY
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    REGISTRY.reset()
+    yield
+    REGISTRY.reset()
+
+
+def _sample_lines(text, name):
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, route='/a"b')
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert _sample_lines(text, "demo_seconds_bucket") == [
+        'demo_seconds_bucket{route="/a\\"b",le="0.1"} 2',
+        'demo_seconds_bucket{route="/a\\"b",le="1"} 3',
+        'demo_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+    ]
+    assert 'demo_seconds_sum{route="/a\\"b"} 3.65' in text
+    assert 'demo_seconds_count{route="/a\\"b"} 4' in text
+
+
+def test_registry_returns_the_same_metric_and_rejects_a_different_shape():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo.", ("result",))
+
+    assert registry.counter("demo_total", "Demo.", ("result",)) is counter
+    with pytest.raises(ValueError):
+        registry.histogram("demo_total", "Demo.", ("result",))
+    with pytest.raises(ValueError):
+        counter.inc(other="x")
+
+
+def test_requests_are_measured_by_route_template_with_payload_timings(monkeypatch):
+    def fake_insights(set_id):
+        return {
+            "set": {"id": set_id},
+            "meta": {"timings": {"snapshotQueryMs": 12.0, "snapshotReadMs": 20.0, "set_resolve_ms": 4.0}},
+        }
+
+    monkeypatch.setattr(api_main, "get_pokemon_set_insights_critical_snapshot_payload", fake_insights)
+    monkeypatch.delenv("INTERNAL_METRICS_TOKEN", raising=False)
+    monkeypatch.setenv("INTERNAL_METRICS_OPEN", "true")
+    client = TestClient(api_main.app)
+
+    for set_id in ("ascendedHeroes", "prismaticEvolutions"):
+        assert client.get(f"/tcgs/pokemon/sets/{set_id}/insights/critical").status_code == 200
+    text = client.get("/internal/metrics").text
+
+    route = "/tcgs/pokemon/sets/{set_id}/insights/critical"
+    assert f'evr_api_request_duration_seconds_count{{route="{route}",method="GET",status="200"}} 2' in text
+    assert f'evr_api_response_bytes_count{{route="{route}"}} 2' in text
+    assert f'evr_api_db_query_seconds_sum{{route="{route}"}} 0.024' in text
+    assert f'evr_api_route_phase_seconds_count{{route="{route}",phase="snapshot_read"}} 2' in text
+    assert f'evr_api_route_phase_seconds_count{{route="{route}",phase="set_resolve"}} 2' in text
+    # Raw set identifiers never become label values.
+    assert "ascendedHeroes" not in text
+
+
+def test_metrics_endpoint_requires_the_token_when_configured(monkeypatch):
+    monkeypatch.setenv("INTERNAL_METRICS_TOKEN", "scrape-secret")
+    client = TestClient(api_main.app)
+
+    assert client.get("/internal/metrics").status_code == 401
+    response = client.get("/internal/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+
+def test_metrics_endpoint_is_hidden_without_a_token_unless_explicitly_opened(monkeypatch):
+    monkeypatch.delenv("INTERNAL_METRICS_TOKEN", raising=False)
+    monkeypatch.delenv("INTERNAL_METRICS_OPEN", raising=False)
+    client = TestClient(api_main.app)
+
+    assert client.get("/internal/metrics").status_code == 404
+    monkeypatch.setenv("INTERNAL_METRICS_OPEN", "true")
+    assert client.get("/internal/metrics").status_code == 200
@@ -0,0 +1,111 @@
+"""The opt-in warm start must prefetch every public set and the Explore
+snapshots once, report cold until it has, and never keep the process out of
+rotation because one prefetch failed."""
+
+import asyncio
+
+from fastapi.testclient import TestClient  # type: ignore[reportMissingImports]
+
+from backend.api import main as api_main
+from backend.api import warm_start
+
+
+SET_IDS = ["11111111-2222-3333-4444-555555555555", "66666666-7777-8888-9999-000000000000"]
+
+
+def _install_fakes(monkeypatch, *, shell=None, rankings=None):
+    calls = {"shells": [], "rankings": 0, "movers": 0, "set_value": 0, "catalog": 0}
+
+    def catalog():
+        calls["catalog"] += 1
+        return {"sets": [{"id": set_id, "name": f"Set {index}"} for index, set_id in enumerate(SET_IDS)]}
+
+    async def read_shell(set_id):
+        calls["shells"].append(set_id)
+        if shell:
+            shell(set_id)
+        return {"set": {"id": set_id}}
+
+    def read_rankings():
+        calls["rankings"] += 1
+        if rankings:
+            rankings()
+        return {"targets": []}
+
+    def read_movers():
+        calls["movers"] += 1
+        return {}
+
+    def read_set_value():
+        calls["set_value"] += 1
+        return {}
+
+    monkeypatch.setattr(warm_start, "get_pokemon_sets_catalog_payload", catalog)
+    monkeypatch.setattr(warm_start, "get_pokemon_set_shell_snapshot_payload_async", read_shell)
+    monkeypatch.setattr(warm_start, "get_pokemon_explore_rankings_snapshot_payload", read_rankings)
+    monkeypatch.setattr(warm_start, "read_explore_card_movers_snapshot", read_movers)
+    monkeypatch.setattr(warm_start, "read_explore_set_value_snapshot", read_set_value)
+    return calls
+
+
+def test_warm_start_prefetches_every_public_set_and_explore_snapshot(monkeypatch):
+    calls = _install_fakes(monkeypatch)
+
+    state = asyncio.run(warm_start.run_warm_start(warm_start.WarmStartState(), set_concurrency=2))
+
+    assert state.status == "warm"
+    assert state.ready
+    assert sorted(calls["shells"]) == sorted(SET_IDS)
+    assert (calls["catalog"], calls["rankings"], calls["movers"], calls["set_value"]) == (1, 1, 1, 1)
+    assert state.steps["pokemon_sets_catalog"]["sets"] == 2
+    assert state.steps["set_shells"] == {**state.steps["set_shells"], "status": "ok", "sets": 2, "failed": 0}
+
+
+def test_failed_steps_are_reported_but_do_not_block_readiness(monkeypatch):
+    def fail_one_shell(set_id):
+        if set_id == SET_IDS[0]:
+            raise RuntimeError("cold socket")
+
+    def fail_rankings():
+        raise RuntimeError("rankings down")
+
+    _install_fakes(monkeypatch, shell=fail_one_shell, rankings=fail_rankings)
+
+    state = asyncio.run(warm_start.run_warm_start(warm_start.WarmStartState()))
+
+    assert state.status == "warm"
+    assert state.steps["explore_rankings"] == {**state.steps["explore_rankings"], "status": "failed", "error": "RuntimeError"}
+    assert state.steps["set_shells"]["status"] == "ok"
+    assert state.steps["set_shells"]["failed"] == 1
+
+
+def test_ready_endpoint_is_503_until_warm(monkeypatch):
+    state = warm_start.WarmStartState(status="warming")
+    monkeypatch.setattr(api_main, "get_warm_start_state", lambda: state)
+
+    cold = api_main.readiness_check()
+    state.status = "warm"
+    warm = api_main.readiness_check()
+
+    assert cold.status_code == 503
+    assert warm.status_code == 200
+
+
+def test_lifespan_runs_warm_start_only_when_opted_in(monkeypatch):
+    calls = _install_fakes(monkeypatch)
+
+    monkeypatch.delenv(warm_start.WARM_START_ENV, raising=False)
+    with TestClient(api_main.app) as client:
+        response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "disabled"
+    assert calls["catalog"] == 0
+
+    monkeypatch.setenv(warm_start.WARM_START_ENV, "true")
+    with TestClient(api_main.app) as client:
+        for _ in range(200):
+            response = client.get("/ready")
+            if response.status_code == 200:
+                break
+    assert response.json()["status"] == "warm"
+    assert sorted(calls["shells"]) == sorted(SET_IDS)
@@ -0,0 +1,81 @@
+import pandas as pd
+
+from backend.calculations.packCalcsRefractored.evrCalculator import PackEVCalculator
+from backend.calculations.utils.rarity_classification import normalize_rarity_key
+from backend.calculations.utils.special_type_normalization import (
+    derive_aggregation_key,
+    derive_pattern_key,
+    normalize_special_type_key,
+)
+from backend.constants.tcg.pokemon.scarletAndVioletEra.prismaticEvolutions import (
+    SetPrismaticEvolutionsConfig,
+)
+
+
+class _RowWiseCalculator(PackEVCalculator):
+    """The row-by-row `apply` derivations the distinct-value mapping replaced."""
+
+    def _derive_rarity_columns(self, df):
+        df['rarity_raw'] = df['Rarity'].astype(str).str.lower().str.strip()
+        df['rarity_group'] = df['rarity_raw'].map(self.config.RARITY_MAPPING)
+        df['rarity_key'] = df['Rarity'].apply(normalize_rarity_key)
+
+    def _derive_special_type_columns(self, df):
+        df['special_type_raw'] = df['Special Type'].astype(str).str.lower().str.strip()
+        df['special_type_key'] = df['Special Type'].apply(normalize_special_type_key)
+
+    def _derive_aggregation_columns(self, df):
+        df['pattern_key'] = df['special_type_key'].apply(derive_pattern_key)
+        df['base_rarity_key'] = df['rarity_key']
+        df['aggregation_key'] = df.apply(
+            lambda row: derive_aggregation_key(row['rarity_key'], row['special_type_key']),
+            axis=1,
+        )
+        df['classification_key'] = df['base_rarity_key']
+
+    def _calculate_ev_columns(self, df):
+        df['Effective_Pull_Rate'] = df.apply(
+            lambda row: self.calculate_effective_pull_rate(
+                row['rarity_group'], row['Pull Rate (1/X)'], row.get('pattern_key', '')
+            ),
+            axis=1,
+        )
+        self._apply_pattern_overlay_pull_rate_overrides(df)
+        df['EV'] = df['Price ($)'] / df['Effective_Pull_Rate']
+
+
+def _frame():
+    rows = []
+    specs = [
+        ("Common", "", "$0.10", 46.0),
+        ("Uncommon", "", "0.25", 33.0),
+        ("Rare", "", "1.5", 12.0),
+        ("Double Rare", "", "4", 36.0),
+        ("Common", "Poke Ball", "2.75", 302.0),
+        ("Uncommon", "Master Ball", "9.5", 1249.0),
+        ("Special Illustration Rare", "", "120", 1403.0),
+        ("Mystery Rarity", "", "3", 99.0),
+        (None, "", "5", 50.0),
+    ]
+    for index in range(60):
+        rarity, special_type, price, pull_rate = specs[index % len(specs)]
+        rows.append({
+            "Card Name": f"Card {index} - {index}/131",
+            "Card Number": "" if index % 2 else f"{index:03d}",
+            "Rarity": rarity,
+            "Special Type": special_type if index % 7 else None,
+            "Price ($)": price,
+            "Pull Rate (1/X)": pull_rate,
+            "Pack Price": 5.5,
+        })
+    return pd.DataFrame(rows)
+
+
+def test_distinct_mapping_matches_the_row_wise_frame_exactly():
+    config = SetPrismaticEvolutionsConfig
+
+    expected, expected_pack_price = _RowWiseCalculator(config).load_and_prepare_data(_frame())
+    actual, actual_pack_price = PackEVCalculator(config).load_and_prepare_data(_frame())
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+    assert actual_pack_price == expected_pack_price
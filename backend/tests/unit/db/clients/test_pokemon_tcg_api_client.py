@@ -9,6 +9,8 @@ All HTTP is faked; nothing here touches the live API.
 """
 
 import json
+import threading
+import time
 
 import pytest
 import requests
@@ -18,6 +20,7 @@ from backend.db.clients.pokemon_tcg_api_client import (
     PokemonTCGAPIClient,
     PokemonTCGAPIError,
 )
+from backend.db.clients.pokemon_tcg_response_cache import PokemonTCGResponseCache
 
 
 # ---------------------------------------------------------------------------
@@ -409,3 +412,90 @@ def test_completion_summary_reports_totals(caplog):
     assert "unique_cards=120" in caplog.text
     assert "reported_total=120" in caplog.text
     assert "pages_requested=2" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# Concurrent pages, combined set queries and the response cache
+# ---------------------------------------------------------------------------
+
+
+class _RoutingSession:
+    """Answers by query and page, so concurrent requests need no scripted order."""
+
+    def __init__(self, cards_by_set, updated_at=None, page_delay=0.0):
+        self._cards_by_set = cards_by_set
+        self._updated_at = updated_at or {}
+        self._page_delay = page_delay
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        params = dict(params or {})
+        with self._lock:
+            self.calls.append({"url": url, "params": params})
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            if url.endswith("/sets"):
+                ids = [term.split(":", 1)[1] for term in params["q"].split(" OR ")]
+                return _FakeResponse(payload={
+                    "data": [{"id": set_id, "updatedAt": self._updated_at[set_id]} for set_id in ids],
+                })
+            time.sleep(self._page_delay)
+            set_ids = [term.split(":", 1)[1] for term in params["q"].strip("()").split(" OR ")]
+            cards = [card for set_id in set_ids for card in self._cards_by_set[set_id]]
+            start = (params["page"] - 1) * params["pageSize"]
+            return _FakeResponse(payload={
+                "data": cards[start:start + params["pageSize"]],
+                "totalCount": len(cards),
+            })
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+def _set_cards(set_id, count):
+    return [
+        {**_card(f"{set_id}-{i}", i), "set": {"id": set_id, "name": set_id}}
+        for i in range(1, count + 1)
+    ]
+
+
+def test_concurrent_pages_after_total_count_are_yielded_in_order():
+    session = _RoutingSession({"me5": _set_cards("me5", 450)}, page_delay=0.02)
+    client = _make_client(session, page_concurrency=3)
+
+    cards = list(client.iter_cards_for_set("me5", rate_limit_delay=0))
+
+    assert [card["pokemon_tcg_api_id"] for card in cards] == [f"me5-{i}" for i in range(1, 451)]
+    assert [call["params"]["page"] for call in session.calls[:1]] == [1]
+    assert sorted(call["params"]["page"] for call in session.calls) == [1, 2, 3, 4, 5]
+    assert 1 < session.max_in_flight <= 3
+
+
+def test_prefetch_combines_sets_into_one_query_and_reuses_cache_until_updated(tmp_path):
+    cards_by_set = {"sv1": _set_cards("sv1", 3), "sv2": _set_cards("sv2", 2)}
+    cache = PokemonTCGResponseCache(tmp_path)
+
+    session = _RoutingSession(cards_by_set, {"sv1": "2024/01/01", "sv2": "2024/01/01"})
+    client = _make_client(session, response_cache=cache)
+    cards = list(client.iter_cards_for_sets(["sv1", "sv2"], rate_limit_delay=0))
+
+    assert [card["pokemon_tcg_api_id"] for card in cards] == [
+        "sv1-1", "sv1-2", "sv1-3", "sv2-1", "sv2-2",
+    ]
+    card_calls = [call for call in session.calls if call["url"].endswith("/cards")]
+    assert [call["params"]["q"] for call in card_calls] == ["(set.id:sv1 OR set.id:sv2)"]
+
+    # A new run with sv2 unchanged only pages through sv1 again.
+    session = _RoutingSession(cards_by_set, {"sv1": "2024/02/01", "sv2": "2024/01/01"})
+    client = _make_client(session, response_cache=cache)
+    sv2_cards = list(client.iter_cards_for_set("sv2", rate_limit_delay=0))
+    sv1_cards = list(client.iter_cards_for_set("sv1", rate_limit_delay=0))
+
+    assert [card["pokemon_tcg_api_id"] for card in sv2_cards] == ["sv2-1", "sv2-2"]
+    assert len(sv1_cards) == 3
+    card_calls = [call for call in session.calls if call["url"].endswith("/cards")]
+    assert [call["params"]["q"] for call in card_calls] == ["set.id:sv1"]
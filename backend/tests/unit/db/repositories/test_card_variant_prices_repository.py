@@ -148,3 +148,64 @@ def test_canonical_refresh_env_can_pin_repository_plural_contract(monkeypatch):
     monkeypatch.setattr(repo, "_canonical_refresh_rpc_name", None)
     repo._refresh_canonical_prices(["v1"])
     assert calls == [repo._CANONICAL_REFRESH_PLURAL]
+
+
+def test_bulk_ingest_sends_columnar_chunks_and_refreshes_changed_rows(monkeypatch):
+    calls = []
+    class Rpc:
+        def __init__(self, name, params): self.name, self.params = name, params
+        def execute(self):
+            if self.name != repo.BULK_INGEST_RPC:
+                return SimpleNamespace(data=[])
+            count = len(self.params["p_variants"]["card_id"])
+            return SimpleNamespace(data={
+                "variant_ids": [f"variant-{card_id}" for card_id in self.params["p_variants"]["card_id"]],
+                "conflicts": [{"position": 1, "message": "contradicts"}] if count > 1 else [],
+                "variants_inserted": count, "identities_linked": 0,
+                "attempted_rows": len(self.params["p_prices"]["variant_position"]),
+                "inserted_ids": [7], "updated_count": 1, "skipped_existing_duplicates": 0,
+                "duplicate_rows_in_batch": 0,
+                "changed_rows": [{"card_variant_id": "variant-c0", "captured_at": "2026-08-02"}],
+            })
+    class Client:
+        def rpc(self, name, params): calls.append((name, params)); return Rpc(name, params)
+    monkeypatch.setattr(retry, "create_client", lambda _url, _key: Client())
+    monkeypatch.setattr(repo, "BULK_INGEST_CHUNK_SIZE", 2)
+    monkeypatch.setattr(repo, "_canonical_refresh_rpc_name", None)
+    price = {"condition_id": 1, "market_price": 2.5, "captured_at": "2026-08-02T09:00:00+00:00"}
+    items = [({"card_id": f"c{index}", "printing_type": "holo", "special_type": None, "edition": None},
+              {"provider": "tcgplayer", "external_product_id": str(index), "external_variant_key": "k"}
+              if index == 0 else None, [dict(price)]) for index in range(3)]
+
+    stats = repo.ingest_card_variants_and_prices_bulk(items)
+
+    bulk_calls = [params for name, params in calls if name == repo.BULK_INGEST_RPC]
+    assert [params["p_variants"]["card_id"] for params in bulk_calls] == [["c0", "c1"], ["c2"]]
+    assert bulk_calls[0]["p_variants"]["identity_product_id"] == ["0", None]
+    assert bulk_calls[0]["p_prices"] == {
+        "variant_position": [0, 1], "condition_id": [1, 1], "source": ["UNKNOWN"] * 2,
+        "captured_at": ["2026-08-02"] * 2, "market_price": [2.5, 2.5], "high_price": [None] * 2,
+        "low_price": [None] * 2, "currency": ["USD"] * 2,
+    }
+    assert stats["variant_ids"] == ["variant-c0", "variant-c1", "variant-c2"]
+    assert stats["conflicts"] == [(1, "contradicts")]
+    assert (stats["inserted_ids"], stats["updated_count"], stats["db_batch_operations"]) == ([7, 7], 2, 2)
+    assert calls[-2] == ("refresh_pokemon_set_value_daily_history_for_variants",
+                         {"p_card_variant_ids": ["variant-c0"], "p_start_date": "2026-08-02"})
+
+
+def test_bulk_ingest_reports_an_undeployed_rpc_for_fallback(monkeypatch):
+    class MissingRpc(Exception):
+        code = "PGRST202"
+    class Rpc:
+        def execute(self): raise MissingRpc("function not found 404")
+    class Client:
+        def rpc(self, _name, _params): return Rpc()
+    monkeypatch.setattr(retry, "create_client", lambda _url, _key: Client())
+
+    try:
+        repo.ingest_card_variants_and_prices_bulk([({"card_id": "c"}, None, [])])
+    except repo.BulkIngestRpcUnavailable:
+        pass
+    else:
+        raise AssertionError("missing bulk ingest RPC was not reported")
@@ -0,0 +1,145 @@
+"""Write-behind buffering of scrape heartbeats and diagnostic writes."""
+
+import json
+from types import SimpleNamespace
+
+import backend.db.repositories.scrape_diagnostics_repository as diag
+import backend.db.repositories.scrape_jobs_repository as repo
+from backend.db.repositories.scrape_write_behind import (
+    ScrapeWriteBehindBuffer,
+    active_scrape_write_behind,
+    scrape_write_behind_scope,
+)
+
+
+class _Writes:
+    def __init__(self, fail_updates=False):
+        self.fail_updates = fail_updates
+        self.heartbeat_errors = {}
+        self.log = []
+
+    def heartbeat(self, job_id, worker_id=None, lease_seconds=None):
+        self.log.append(("heartbeat", job_id))
+        if job_id in self.heartbeat_errors:
+            raise self.heartbeat_errors.pop(job_id)
+        return None if job_id == 13 else {"id": job_id}
+
+    def update(self, run_id, run_data):
+        self.log.append(("update", run_id, dict(run_data)))
+        return None if self.fail_updates else {"id": run_id}
+
+    def failures(self, rows):
+        self.log.append(("failures", len(rows)))
+        return rows
+
+
+def _buffer(writes, clock=lambda: 0.0):
+    return ScrapeWriteBehindBuffer(
+        heartbeat=writes.heartbeat,
+        write_run_update=writes.update,
+        write_failure_rows=writes.failures,
+        flush_seconds=3600,
+        max_batch_rows=2,
+        clock=clock,
+    )
+
+
+def test_buffered_diagnostics_coalesce_and_land_before_finalize(monkeypatch):
+    writes = _Writes()
+    rpc_calls = []
+
+    def rpc(name, params):
+        writes.log.append(("rpc", name))
+        rpc_calls.append(params)
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=[{"ok": True}]))
+
+    monkeypatch.setattr(repo, "supabase", SimpleNamespace(rpc=rpc))
+
+    with scrape_write_behind_scope(_buffer(writes)):
+        assert diag.update_scrape_job_run("run-1", {"status": "running", "items_attempted": 1}) is None
+        diag.update_scrape_job_run("run-1", {"status": "failed"})
+        diag.insert_scrape_job_run_failures([{"run_id": "run-1", "entity_key": key} for key in "abc"])
+        assert writes.log == [], "nothing is written on the caller's thread"
+
+        assert repo.finalize_scrape_job(7, "run-1", "failed")["ok"] is True
+
+    assert writes.log == [
+        ("update", "run-1", {"status": "failed", "items_attempted": 1}),
+        ("failures", 2),
+        ("failures", 1),
+        ("rpc", "finalize_scrape_job"),
+    ]
+    assert active_scrape_write_behind() is None
+
+
+def test_writes_the_finalization_flush_cannot_make_go_to_a_recovery_record(monkeypatch, tmp_path):
+    writes = _Writes(fail_updates=True)
+    monkeypatch.setattr(repo, "_RECOVERY_DIR", tmp_path)
+    monkeypatch.setattr(repo, "supabase", SimpleNamespace(
+        rpc=lambda *_args: SimpleNamespace(execute=lambda: SimpleNamespace(data=[{"ok": True}])),
+    ))
+
+    with scrape_write_behind_scope(_buffer(writes)):
+        diag.update_scrape_job_run("run-2", {"status": "failed"})
+        result = repo.finalize_scrape_job(8, "run-2", "failed")
+
+    assert result["ok"] is True
+    records = list(tmp_path.glob("finalize_job_8_*.json"))
+    assert len(records) == 1
+    record = json.loads(records[0].read_text(encoding="utf-8"))
+    assert record["unflushed_writes"]["run_updates"] == {"run-2": {"status": "failed"}}
+
+
+def test_background_flush_renews_due_leases_and_drops_lost_jobs():
+    writes = _Writes()
+    now = [0.0]
+    buffer = _buffer(writes, clock=lambda: now[0])
+    buffer.track_heartbeat(12, "worker", lease_seconds=90)
+    buffer.track_heartbeat(13, "worker", lease_seconds=90)
+
+    buffer._renew_due_leases()
+    assert writes.log == []
+
+    now[0] = 30.0
+    buffer._renew_due_leases()
+    now[0] = 60.0
+    buffer._renew_due_leases()
+
+    assert writes.log == [("heartbeat", 12), ("heartbeat", 13), ("heartbeat", 12)]
+
+
+def test_a_transient_heartbeat_error_is_retried_on_the_next_flush():
+    writes = _Writes()
+    writes.heartbeat_errors[12] = RuntimeError("503 gateway")
+    now = [0.0]
+    buffer = _buffer(writes, clock=lambda: now[0])
+    buffer.track_heartbeat(12, "worker", lease_seconds=90)
+
+    now[0] = 30.0
+    buffer._renew_due_leases()
+    now[0] = 35.0
+    buffer._renew_due_leases()
+
+    assert writes.log == [("heartbeat", 12), ("heartbeat", 12)]
+    assert 12 in buffer._leases
+
+
+def test_finalizing_one_job_leaves_other_runs_writes_queued(monkeypatch, tmp_path):
+    writes = _Writes(fail_updates=True)
+    monkeypatch.setattr(repo, "_RECOVERY_DIR", tmp_path)
+    monkeypatch.setattr(repo, "supabase", SimpleNamespace(
+        rpc=lambda *_args: SimpleNamespace(execute=lambda: SimpleNamespace(data=[{"ok": True}])),
+    ))
+    buffer = _buffer(writes)
+
+    with scrape_write_behind_scope(buffer):
+        diag.update_scrape_job_run("run-a", {"status": "failed"})
+        diag.update_scrape_job_run("run-b", {"status": "running"})
+        diag.insert_scrape_job_run_failures([{"run_id": "run-b", "entity_key": "x"}])
+        repo.finalize_scrape_job(9, "run-a", "failed")
+
+        record = json.loads(next(tmp_path.glob("finalize_job_9_*.json")).read_text(encoding="utf-8"))
+        assert record["unflushed_writes"] == {"run_updates": {"run-a": {"status": "failed"}}, "failure_rows": []}
+        assert writes.log == [("update", "run-a", {"status": "failed"})]
+        assert buffer._run_updates == {"run-b": {"status": "running"}}
+        assert buffer._failure_rows == [{"run_id": "run-b", "entity_key": "x"}]
@@ -0,0 +1,20 @@
+"""Fake PostgREST keyset paging for `card_variant_price_observations` reads."""
+
+import re
+
+
+_KEYSET_CURSOR = re.compile(r'^captured_at\.gt\."(?P<captured_at>[^"]+)",and\(captured_at\.eq\."[^"]+",id\.gt\.(?P<id>[^)]+)\)$')
+
+
+def keyset_page(rows, query):
+    """One keyset page the way PostgREST serves it: the rows strictly after the
+    `or_` cursor in (captured_at, id) order, up to the query's limit."""
+    page = sorted(rows, key=lambda row: (row["captured_at"], row["id"]))
+    for expression in query.or_filters:
+        cursor = _KEYSET_CURSOR.match(expression)
+        assert cursor is not None, expression
+        page = [
+            row for row in page
+            if (row["captured_at"], row["id"]) > (cursor["captured_at"], type(row["id"])(cursor["id"]))
+        ]
+    return page[: query.limit_value]
@@ -0,0 +1,61 @@
+import threading
+import time
+
+from backend.db.services.batch_processor import BatchProcessor
+
+
+class _Processor(BatchProcessor):
+    MAX_WORKERS = 3
+    PRICE_BATCH_SIZE = 2
+
+    def __init__(self, fail_batch=None):
+        self.fail_batch = fail_batch
+        self.events = []
+        self.lock = threading.Lock()
+
+    def _log(self, event):
+        with self.lock:
+            self.events.append(event)
+
+    def _process_batch_worker(self, batch_data, batch_id):
+        # Later batches finish first, so shipping must reorder them.
+        time.sleep(0.02 * (5 - batch_id))
+        if batch_id == self.fail_batch:
+            raise RuntimeError("boom")
+        self._log(("processed", batch_id))
+        return {"batch_id": batch_id, "inserted_items": len(batch_data), "errors": [],
+                "prices_to_ship": [{"batch": batch_id, "item": item} for item in batch_data]}
+
+    def _ship_batch_prices(self, price_batch, batch_id):
+        self._log(("shipped", batch_id))
+        return {"inserted_count": len(price_batch), "attempted_rows": len(price_batch)}
+
+
+def test_pipeline_ships_in_batch_order_and_reports_stage_metrics():
+    processor = _Processor()
+    batches = processor.divide_work_into_batches(list(range(10)), batch_size=2)
+    results = {"inserted_prices": 0, "errors": []}
+
+    expected, shipped, errors = processor.process_and_ship_pipelined(
+        batches, lambda batch, _batch_id: batch, results)
+
+    assert (expected, shipped, errors) == (10, 10, [])
+    assert [batch for event, batch in processor.events if event == "shipped"] == [0, 1, 2, 3, 4]
+    assert (results["inserted_prices"], results["inserted_items"]) == (10, 10)
+    metrics = results["pipeline_metrics"]
+    assert [metrics[stage]["batches"] for stage in ("prepare", "process", "ship")] == [5, 5, 5]
+    assert metrics["process"]["items"] == 10 and metrics["workers"] == 3
+    assert metrics["ship"]["itemsPerSecond"] > 0
+
+
+def test_pipeline_reports_a_failed_batch_and_ships_the_rest():
+    processor = _Processor(fail_batch=1)
+    batches = processor.divide_work_into_batches(list(range(6)), batch_size=2)
+    results = {"inserted_prices": 0, "errors": []}
+
+    expected, shipped, errors = processor.process_and_ship_pipelined(
+        batches, lambda batch, _batch_id: batch, results)
+
+    assert (expected, shipped) == (4, 4)
+    assert errors == ["Batch 1 processing failed: boom"]
+    assert [batch for event, batch in processor.events if event == "shipped"] == [0, 2]
@@ -289,3 +289,40 @@ def test_new_variant_fallback_remains_available(monkeypatch):
     assert result["errors"] == []
     assert result["inserted_variants"] == 1
     assert result["persistence_metrics"]["variantWriteOperations"] == 1
+
+
+def test_bulk_ingest_sends_work_items_without_mutating_them(monkeypatch):
+    work, _card_ids = _payload(3)
+    work[0][1].append({"condition_id": 1, "market_price": 1.0, "captured_at": "2026-08-02"})
+    sent = []
+    def ingest(items):
+        sent.extend(items)
+        return {"variant_ids": ["v0", None, "v2"], "conflicts": [(1, "contradicts")],
+                "variants_inserted": 2, "identities_linked": 2, "rpc_operations": 1,
+                "attempted_rows": 1, "inserted_count": 1, "inserted_ids": [9], "updated_count": 0,
+                "skipped_duplicates": 0, "skipped_existing_duplicates": 0, "duplicate_rows_in_batch": 0,
+                "db_batch_operations": 1, "price_read_operations": 0, "price_write_operations": 1}
+    monkeypatch.setenv(module.CardsService.BULK_INGEST_ENV, "true")
+    monkeypatch.setattr(module, "ingest_card_variants_and_prices_bulk", ingest)
+    service = module.CardsService()
+    assert service._bulk_ingest_enabled()
+    results = {"inserted_variants": 0, "external_identities_linked": 0, "inserted_prices": 0,
+               "price_rows_attempted": 0, "price_rows_skipped_duplicates": 0, "price_rows_updated": 0,
+               "price_batch_operations": 0, "errors": [], "error_codes": []}
+
+    errors = service._ingest_work_items_bulk(work, results)
+
+    assert [variant for variant, _identity, _prices in sent] == [
+        {"card_id": f"card-{index}", "printing_type": "holo", "special_type": None, "edition": None}
+        for index in range(3)]
+    assert all("_external_identity" in variant for variant, _prices, _key in work)
+    assert errors == ["Bulk ingest error on item 1: contradicts"]
+    assert results["error_codes"] == [module.ERROR_EXTERNAL_VARIANT_IDENTITY_CONFLICT]
+    assert (results["inserted_variants"], results["external_identities_linked"], results["inserted_prices"]) == (2, 2, 1)
+
+
+def test_bulk_ingest_falls_back_to_batch_phases_when_rpc_is_missing(monkeypatch):
+    monkeypatch.setattr(module, "ingest_card_variants_and_prices_bulk",
+                        lambda _items: (_ for _ in ()).throw(module.BulkIngestRpcUnavailable("PGRST202")))
+    work, _card_ids = _payload(1)
+    assert module.CardsService()._ingest_work_items_bulk(work, {}) is None
@@ -247,3 +247,35 @@ def test_load_card_payload_filters_excluded_variant_ids(
     assert len(payload) == 2
     assert payload[0]["variants"] == []
     assert payload[1]["variants"][0]["variant_id"] == included_variant_id
+
+
+@patch("backend.db.services.evr_input_repository.supabase")
+def test_price_watermark_reads_the_newest_price_writes_of_the_set(mock_supabase):
+    newest = {
+        "card_variant_price_observations": [{"captured_at": "2026-10-19T01:00:00+00:00"}],
+        "sealed_product_price_observations": [],
+        "pokemon_set_value_daily_history": [{"updated_at": "2026-10-19T01:05:00+00:00"}],
+    }
+    queries = {}
+
+    def table(name):
+        query = MagicMock()
+        for method in ("select", "eq", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute.return_value = MagicMock(data=newest[name])
+        queries[name] = query
+        return query
+
+    mock_supabase.table.side_effect = table
+
+    watermark = EVRInputRepository().load_price_watermark("set-1")
+
+    assert watermark == {
+        "card_price_captured_at": "2026-10-19T01:00:00+00:00",
+        "sealed_price_captured_at": None,
+        "set_value_history_updated_at": "2026-10-19T01:05:00+00:00",
+    }
+    queries["card_variant_price_observations"].eq.assert_called_once_with("card_variants.cards.set_id", "set-1")
+    queries["sealed_product_price_observations"].eq.assert_called_once_with("sealed_products.set_id", "set-1")
+    for query in queries.values():
+        query.limit.assert_called_once_with(1)
@@ -594,3 +594,112 @@ def test_targets_publish_average_loss_when_losing_as_a_passthrough(monkeypatch):
     # The unconditional gap on this row is 4.99 - 6.11 = -1.12; the conditional
     # loss is 3.42. Nothing may collapse the two.
     assert first["expected_loss_when_losing"] != first["pack_cost"] - first["mean_value"]
+
+
+def test_rank_score_columns_ranks_every_metric_with_id_tie_break_and_tiers():
+    target_ids = ["set-c", "set-a", "set-b", "set-d"]
+    ranked = service._rank_score_columns(
+        target_ids,
+        {
+            "pack_score": [50.0, 80.0, 80.0, None],
+            "profit_score": [1.0, 2.0, 3.0, 4.0],
+        },
+    )
+
+    assert ranked["pack_score"] == {
+        "set-a": {"rank": 1, "tier": "S", "cohortSize": 3},
+        "set-b": {"rank": 2, "tier": "C", "cohortSize": 3},
+        "set-c": {"rank": 3, "tier": "D", "cohortSize": 3},
+        "set-d": {"rank": None, "tier": None, "cohortSize": 3},
+    }
+    assert [ranked["profit_score"][target_id]["rank"] for target_id in target_ids] == [4, 3, 2, 1]
+    assert service._calculate_score_ranks_and_tiers(
+        [{"target_id": target_id, "pack_score": score} for target_id, score in zip(target_ids, [50.0, 80.0, 80.0, None])],
+        "pack_score",
+    ) == ranked["pack_score"]
+
+
+def test_incremental_build_reads_canonical_prices_only_for_changed_sets(monkeypatch):
+    handlers = _build_handlers()
+    generation_ids = {"set-1": "gen-1", "set-2": "gen-2"}
+    handlers["pokemon_set_cards_snapshot_latest"] = lambda _q: [
+        {"set_id": set_id, "generation_id": generation_id} for set_id, generation_id in generation_ids.items()
+    ]
+    handlers["pokemon_set_page_snapshot_latest"] = lambda _q: []
+    canonical_prices = handlers["pokemon_canonical_card_market_prices_latest"]
+    client = _Client(handlers)
+    monkeypatch.setattr(service, "public_read_client", client)
+    _stub_collector_appeal_bundle(monkeypatch)
+    monkeypatch.setattr(
+        service,
+        "build_rip_interpretation",
+        lambda _summary_row: {"meta": {"packScore": {"label": "Good value", "severity": "neutral"}}},
+    )
+
+    def _canonical_price_reads():
+        return [call for call in client.calls if call.table_name == "pokemon_canonical_card_market_prices_latest"]
+
+    full = service.get_rip_statistics_targets_payload()
+    cache = service.RankingsContributionCache()
+    first = service.get_rip_statistics_targets_payload(contribution_cache=cache)
+    assert first["targets"] == full["targets"]
+
+    client.calls.clear()
+    second = service.get_rip_statistics_targets_payload(contribution_cache=cache)
+    assert second["targets"] == full["targets"]
+    assert _canonical_price_reads() == []
+    assert second["meta"]["sources"]["pokemon_canonical_card_market_prices_latest"] == "CACHED"
+    assert cache.reused["top_10_card_value"] == 2
+
+    generation_ids["set-2"] = "gen-2b"
+    handlers["pokemon_canonical_card_market_prices_latest"] = lambda q: [
+        row for row in canonical_prices(q) if row["set_id"] == "set-2"
+    ]
+    client.calls.clear()
+    third = service.get_rip_statistics_targets_payload(contribution_cache=cache)
+    targets_by_id = {target["target_id"]: target for target in third["targets"]}
+
+    assert {value for call in _canonical_price_reads() for _field, values in call.in_filters for value in values} == {"set-2"}
+    assert targets_by_id["set-1"]["top_10_card_value"] == 75.0
+    assert targets_by_id["set-2"]["top_10_card_value"] == 150.0
+
+
+def test_incremental_top_chase_rereads_only_sets_with_a_new_run(monkeypatch):
+    chase_by_run = {
+        run_id: {
+            "cardName": f"Chase {run_id}", "currentMarketPrice": 100, "impliedOddsOneInN": 200,
+            "packsFor50PercentChance": 139, "sourceCalculationRunId": run_id,
+        }
+        for run_id in ("run-1", "run-2", "run-2b")
+    }
+    page_rows = {
+        "set-1": {"set_id": "set-1", "updated_at": "2026-01-04T08:00:00Z", "payload_json": {"ripDecision": {"topChase": chase_by_run["run-1"]}}},
+        "set-2": {"set_id": "set-2", "updated_at": "2026-01-04T08:00:00Z", "payload_json": {"ripDecision": {"topChase": chase_by_run["run-2"]}}},
+    }
+    client = _Client({
+        "pokemon_set_page_snapshot_latest": lambda q: [
+            page_rows[set_id] for _field, values in q.in_filters for set_id in values if set_id in page_rows
+        ],
+    })
+    monkeypatch.setattr(service, "public_read_client", client)
+    cache = service.RankingsContributionCache()
+    ranked_rows = [
+        {"set_id": "set-1", "calculation_run_id": "run-1"},
+        {"set_id": "set-2", "calculation_run_id": "run-2"},
+    ]
+
+    service._load_rankings_top_chase_lookup_incremental(ranked_rows, cache, sources={}, warnings=[])
+    page_rows["set-2"] = {
+        "set_id": "set-2", "updated_at": "2026-01-05T08:00:00Z",
+        "payload_json": {"ripDecision": {"topChase": chase_by_run["run-2b"]}},
+    }
+    ranked_rows[1] = {"set_id": "set-2", "calculation_run_id": "run-2b"}
+    client.calls.clear()
+    sources = {}
+    lookup = service._load_rankings_top_chase_lookup_incremental(ranked_rows, cache, sources=sources, warnings=[])
+
+    payload_reads = [call for call in client.calls if call.select_fields == "set_id,payload_json"]
+    assert [call.in_filters for call in payload_reads] == [[("set_id", ["set-2"])]]
+    assert lookup["set-1"]["cardName"] == "Chase run-1"
+    assert lookup["set-2"]["cardName"] == "Chase run-2b"
+    assert cache.stats() == {"rankings_top_chase": {"reused": 1, "recomputed": 3}}
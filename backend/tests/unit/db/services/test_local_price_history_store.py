@@ -0,0 +1,202 @@
+"""The local price-history store: incremental month partitions, reads only when
+the store provably holds the whole window, and the daily matrix queries."""
+
+from datetime import date, datetime, timezone
+
+import numpy as np
+
+from backend.db.services import local_price_history_store as store_module
+from backend.db.services import price_observation_history_reader as reader
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client):
+        self.client = client
+        self.variant_ids = []
+        self.lower = None
+        self.upper = None
+        self.or_filters = []
+        self.limit_value = None
+
+    def select(self, _fields):
+        return self
+
+    def in_(self, field, values):
+        if field == "card_variant_id":
+            self.variant_ids = list(values)
+        return self
+
+    def gte(self, _field, value):
+        self.lower = value
+        return self
+
+    def lt(self, _field, value):
+        self.upper = value
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def or_(self, expression):
+        self.or_filters.append(expression)
+        return self
+
+    def limit(self, value):
+        self.limit_value = value
+        return self
+
+    def execute(self):
+        self.client.queries.append(self)
+        rows = sorted(
+            (
+                row
+                for row in self.client.rows
+                if row["card_variant_id"] in self.variant_ids
+                and (self.lower is None or row["captured_at"][:10] >= self.lower[:10])
+                and (self.upper is None or row["captured_at"][:10] < self.upper[:10])
+            ),
+            key=lambda row: (row["captured_at"], row["id"]),
+        )
+        for expression in self.or_filters:
+            after = next(
+                (row["captured_at"], row["id"])
+                for row in rows
+                if expression == reader.keyset_after_filter(row["captured_at"], row["id"])
+            )
+            rows = [row for row in rows if (row["captured_at"], row["id"]) > after]
+        return _Result(rows[: self.limit_value])
+
+
+class _Client:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def table(self, table_name):
+        assert table_name == "card_variant_price_observations"
+        return _Query(self)
+
+
+def _observation(observation_id, variant_id, captured_at, price, condition_id="nm"):
+    return {
+        "id": observation_id,
+        "card_variant_id": variant_id,
+        "condition_id": condition_id,
+        "market_price": price,
+        "source": "tcgplayer",
+        "captured_at": captured_at,
+    }
+
+
+def test_sync_appends_only_the_days_since_the_last_synced_market_date(tmp_path):
+    client = _Client([
+        _observation(1, "variant-a", "2026-06-30T08:00:00+00:00", 10.0),
+        _observation(2, "variant-a", "2026-07-01T08:00:00+00:00", 11.0),
+        _observation(3, "variant-b", "2026-07-01T09:00:00+00:00", 4.0),
+    ])
+    store = store_module.LocalPriceHistoryStore(tmp_path)
+
+    assert store.sync_set(client, "set-1", ["variant-b", "variant-a"], through=date(2026, 7, 1), history_days=30) == 3
+    client.rows += [
+        _observation(4, "variant-a", "2026-07-01T20:00:00+00:00", 11.5),
+        _observation(5, "variant-b", "2026-07-02T09:00:00+00:00", 4.5),
+    ]
+    client.queries.clear()
+
+    # The re-sync reads from the last synced day on, including its late capture.
+    assert store.sync_set(client, "set-1", ["variant-a", "variant-b"], through=date(2026, 7, 2), history_days=30) == 4
+    assert client.queries[0].lower == "2026-07-01"
+    assert sorted(path.name for path in (tmp_path / "set-1").iterdir()) == ["2026-06.npz", "2026-07.npz", "manifest.json"]
+
+    # A fresh store instance reads the partitions back from disk, in the
+    # network reader's order, without touching the client.
+    history = store_module.LocalPriceHistoryStore(tmp_path).read(
+        variant_ids=["variant-a", "variant-b"],
+        captured_from="2026-06-02",
+        captured_before="2026-07-03",
+        fields=("condition_id", "market_price", "captured_at"),
+    )
+    assert [row["id"] for row in history.rows()] == [1, 2, 3, 4, 5]
+    assert history.rows()[0] == {
+        "id": 1,
+        "card_variant_id": "variant-a",
+        "condition_id": "nm",
+        "market_price": 10.0,
+        "captured_at": "2026-06-30T08:00:00+00:00",
+    }
+    assert history.variant_index.tolist() == [0, 0, 1, 0, 1]
+
+
+def test_reads_outside_the_synced_window_fall_back_to_the_network(tmp_path):
+    client = _Client([
+        _observation(1, "variant-a", "2026-07-01T08:00:00+00:00", 10.0),
+        _observation(2, "variant-a", "2026-07-01T09:00:00+00:00", 12.0, condition_id="lp"),
+    ])
+    store = store_module.LocalPriceHistoryStore(tmp_path)
+    store.sync_set(client, "set-1", ["variant-a"], through=date(2026, 7, 1), history_days=10)
+
+    assert store.read(variant_ids=["variant-a", "variant-untracked"], captured_from="2026-06-25") is None
+    assert store.read(variant_ids=["variant-a"], captured_from="2026-06-01") is None
+    assert store.read(variant_ids=["variant-a"]) is None
+    assert store.read(variant_ids=["variant-a"], captured_from="2026-06-25", captured_through="2026-07-05") is None
+
+    client.queries.clear()
+    diagnostics = {}
+    with reader.local_price_history_scope(store):
+        history = reader.read_price_observation_history(
+            client,
+            variant_ids=["variant-a"],
+            condition_by_variant={"variant-a": "lp"},
+            captured_from="2026-06-25",
+            captured_before="2026-07-02",
+            diagnostics=diagnostics,
+        )
+        reader.read_price_observation_history(client, variant_ids=["variant-a"])
+
+    assert [row["id"] for row in history.rows()] == [2]
+    assert diagnostics == {"observationLocalReadCount": 1, "observationRowsLoaded": 1}
+    # Only the unbounded read went to the network.
+    assert len(client.queries) == 1
+    assert reader._local_store is None
+
+
+def test_open_ended_reads_fall_back_to_the_network_once_the_store_is_stale(tmp_path):
+    client = _Client([_observation(1, "variant-a", "2026-10-05T08:00:00+00:00", 10.0)])
+    now = [datetime(2026, 10, 10, 18, 0, tzinfo=timezone.utc)]
+    store = store_module.LocalPriceHistoryStore(tmp_path, clock=lambda: now[0])
+    store.sync_set(client, "set-1", ["variant-a"], through=date(2026, 10, 10), history_days=30)
+
+    assert [row["id"] for row in store.read(variant_ids=["variant-a"], captured_from="2026-10-01").rows()] == [1]
+
+    now[0] = datetime(2026, 10, 13, 9, 0, tzinfo=timezone.utc)
+    assert store.read(variant_ids=["variant-a"], captured_from="2026-10-01") is None
+    # A bounded read inside the synced window is still served.
+    assert store.read(variant_ids=["variant-a"], captured_from="2026-10-01", captured_through="2026-10-10") is not None
+
+
+def test_daily_price_matrix_takes_each_days_latest_capture_and_carries_it_forward():
+    history = reader.read_price_observation_history(
+        _Client([
+            _observation(1, "variant-a", "2026-06-28T08:00:00+00:00", 8.0),
+            _observation(2, "variant-a", "2026-07-01T08:00:00+00:00", 9.0),
+            _observation(3, "variant-a", "2026-07-01T20:00:00+00:00", 10.0),
+            _observation(4, "variant-a", "2026-07-03T08:00:00+00:00", 12.0),
+            _observation(5, "variant-b", "2026-07-02T08:00:00+00:00", 5.0),
+        ]),
+        variant_ids=["variant-a", "variant-b"],
+    )
+
+    matrix = store_module.daily_price_matrix(history, start=date(2026, 6, 30), end=date(2026, 7, 3))
+
+    assert matrix.prices[0].tolist() == [8.0, 10.0, 10.0, 12.0]
+    assert np.isnan(matrix.prices[1, :2]).all() and matrix.prices[1, 2:].tolist() == [5.0, 5.0]
+    assert matrix.observed.tolist() == [[False, True, False, True], [False, False, True, False]]
+    assert store_module.latest_prices(matrix).tolist() == [12.0, 5.0]
+    amount, percent = store_module.window_deltas(matrix, 3)
+    assert amount[0] == 4.0 and percent[0] == 50.0
+    assert np.isnan(amount[1]) and np.isnan(percent[1])
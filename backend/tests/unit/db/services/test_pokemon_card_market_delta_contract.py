@@ -403,18 +403,27 @@ def test_observation_query_paginates_and_deduplicates_exact_rows():
 
     class Query:
         def __init__(self):
-            self.range_value = None
+            self.limit_value = None
+            self.cursor = None
 
         def select(self, *_args, **_kwargs): return self
         def in_(self, *_args, **_kwargs): return self
+        def eq(self, *_args, **_kwargs): return self
         def gte(self, *_args, **_kwargs): return self
         def order(self, *_args, **_kwargs): return self
-        def range(self, start, end):
-            self.range_value = (start, end)
+        def or_(self, expression):
+            self.cursor = expression
+            return self
+        def limit(self, value):
+            self.limit_value = value
             return self
         def execute(self):
-            start, end = self.range_value
-            return Result(rows[start:end + 1])
+            # Serves the rows strictly after the keyset cursor; the duplicated
+            # row arrives inside one page, next to its original.
+            start = 0
+            if self.cursor is not None:
+                start = 1 + max(index for index, row in enumerate(rows) if f"id.gt.{row['id']})" in self.cursor)
+            return Result(rows[start:start + self.limit_value])
 
     class Client:
         def table(self, _name): return Query()
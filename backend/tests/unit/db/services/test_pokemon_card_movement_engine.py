@@ -0,0 +1,94 @@
+"""The set-wide movement engine must reproduce the scalar delta contract exactly."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from backend.db.services.pokemon_card_market_delta_contract import calculate_pokemon_card_market_delta
+from backend.db.services.pokemon_card_movement_engine import (
+    build_card_movement_matrix,
+    calculate_card_market_deltas,
+)
+
+
+LATEST_MARKET_DATE = "2026-07-20"
+
+
+def _random_observations(rng, variant_id):
+    end = date.fromisoformat(LATEST_MARKET_DATE)
+    observations = []
+    for _ in range(rng.choice([0, 1, 2, 5, 20, 60])):
+        day = end - timedelta(days=rng.randint(-2, 420))
+        hour = rng.choice([0, 6, 6, 23])
+        observations.append(
+            {
+                "card_variant_id": variant_id,
+                "condition_id": "nm",
+                "market_price": rng.choice([None, 0, "bad", round(rng.uniform(0.2, 80), 2), 5.005, 5.015]),
+                "source": rng.choice(["tcgplayer", None]),
+                "captured_at": rng.choice(
+                    [f"{day.isoformat()}T{hour:02d}:00:00+00:00", f"{day.isoformat()}T23:30:00-07:00", None]
+                ),
+            }
+        )
+    return observations
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_engine_matches_the_scalar_contract_for_every_window(seed):
+    rng = random.Random(seed)
+    observations_by_variant = {f"variant-{index}": _random_observations(rng, f"variant-{index}") for index in range(40)}
+    selections = [
+        {
+            "variant_id": rng.choice([*observations_by_variant, "variant-unobserved"]),
+            "condition_id": "nm",
+            "current_price": rng.choice([12.5, 0.4, 0, -1, 33.335, round(rng.uniform(0.5, 90), 2)]),
+            "current_source_date": rng.choice([None, "2026-07-18T10:00:00+00:00", LATEST_MARKET_DATE]),
+            "current_source": rng.choice([None, "tcgplayer"]),
+        }
+        for _ in range(60)
+    ]
+    matrix = build_card_movement_matrix(observations_by_variant, latest_market_date=LATEST_MARKET_DATE)
+
+    for window_days in (1, 7, 30, 90, 365):
+        expected = [
+            calculate_pokemon_card_market_delta(
+                observations=observations_by_variant.get(selection["variant_id"], []),
+                selected_current_price=selection["current_price"],
+                selected_variant_id=selection["variant_id"],
+                selected_condition_id=selection["condition_id"],
+                latest_market_date=LATEST_MARKET_DATE,
+                requested_window_days=window_days,
+                selected_current_source_date=selection["current_source_date"],
+                selected_current_source=selection["current_source"],
+            )
+            for selection in selections
+        ]
+
+        assert calculate_card_market_deltas(matrix, selections, requested_window_days=window_days) == expected
+
+
+def test_engine_takes_each_days_latest_capture_and_ignores_days_after_the_market_date():
+    matrix = build_card_movement_matrix(
+        {
+            "variant-a": [
+                {"market_price": 10.0, "captured_at": "2026-07-13T08:00:00+00:00"},
+                {"market_price": 11.0, "captured_at": "2026-07-13T20:00:00+00:00"},
+                {"market_price": 99.0, "captured_at": "2026-07-21T08:00:00+00:00"},
+            ]
+        },
+        latest_market_date=LATEST_MARKET_DATE,
+    )
+
+    [delta] = calculate_card_market_deltas(
+        matrix,
+        [{"variant_id": "variant-a", "condition_id": "nm", "current_price": 13.2}],
+        requested_window_days=7,
+    )
+
+    assert delta["startDate"] == "2026-07-13"
+    assert delta["startingPrice"] == 11.0
+    assert delta["changeAmount"] == 2.2
+    assert delta["historyPointCount"] == 1
+    assert delta["reliable"] is True
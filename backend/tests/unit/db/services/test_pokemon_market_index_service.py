@@ -1,7 +1,10 @@
+import random
+
 import pytest
 
 from backend.db.services.pokemon_market_index_service import (
     _paged_source_rows, build_index_rows, build_market_overview, read_index_history)
+from backend.domain.pokemon.market_index import build_chain_linked_history
 
 
 SETS = [
@@ -41,6 +44,38 @@ def test_input_order_does_not_change_source_fingerprints():
     assert [(r["index_key"], r["source_generation_fingerprint"]) for r in forward] == [(r["index_key"], r["source_generation_fingerprint"]) for r in reverse]
 
 
+def test_array_build_matches_chaining_one_complete_observation_per_date():
+    rng = random.Random(7)
+    sets = [{"id": f"set-{index:02d}", "canonical_key": f"k{index}", "release_date": f"2026-01-{1 + index % 6:02d}"}
+            for index in rng.sample(range(12), 12)]
+    days = [f"2026-01-{day:02d}" for day in range(1, 21)]
+    # Roughly one set-day in fifty is missing, unpriced or has no priced cards.
+    rows = [source(day, pokemon_set["id"], scope, rng.choice([0, *[round(rng.uniform(1, 400), 2)] * 80]),
+                   rng.choice([0, *[20] * 80]))
+            for day in days for pokemon_set in sets for scope in ("standard", "top10") if rng.random() > 0.01]
+
+    built = build_index_rows(sets, rows)
+
+    for index_key, scope in (("raw", "standard"), ("top10", "top10")):
+        cells = {(row["snapshot_date"], row["set_id"]): row for row in rows if row["value_scope"] == scope}
+        observations = []
+        for day in days:
+            active = [pokemon_set for pokemon_set in sets if pokemon_set["release_date"] <= day]
+            cohort = [cells.get((day, pokemon_set["id"])) for pokemon_set in active]
+            if active and all(row and row["set_value"] > 0 and row["priced_card_count"] > 0 for row in cohort):
+                observations.append({"marketDate": day, "constituents": [
+                    {"setId": row["set_id"], "setValue": float(row["set_value"])} for row in cohort]})
+        expected = build_chain_linked_history(observations)
+        actual = [row for row in built if row["index_key"] == index_key]
+        assert len(expected) > 2
+        assert [(row["market_date"], row["basket_value"], row["normalized_index_value"], row["daily_return"],
+                 row["previous_market_date"], row["diagnostics_json"]["commonSetIds"]) for row in actual] == [
+            (row["marketDate"], row["basketValue"], row["normalizedIndexValue"], row["dailyReturn"],
+             row["previousMarketDate"], row["commonSetIds"]) for row in expected]
+        assert [[item["setId"] for item in row["constituents_json"]] for row in actual] == [
+            [item["setId"] for item in row["constituents"]] for row in expected]
+
+
 def test_paged_source_rows_has_total_order_across_tied_date_boundary():
     rows = [source("2026-01-01", f"set-{index:04d}", scope, index + 1, 10)
             for index in range(501) for scope in ("standard", "top10")]
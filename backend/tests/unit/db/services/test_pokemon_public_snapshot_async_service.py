@@ -0,0 +1,338 @@
+"""The async set-page readers must serve what the sync readers serve, without
+holding a thread, and must overlap the reads that do not depend on each other."""
+
+import asyncio
+
+import pytest
+from postgrest.exceptions import APIError
+
+from backend.db.services import (
+    pokemon_public_snapshot_async_service,
+    pokemon_public_snapshot_service,
+    pokemon_set_market_service,
+    public_read_retry,
+)
+from backend.db.services.pokemon_set_market_service import PokemonSetMarketError
+
+
+_TEST_UUID = "11111111-2222-3333-4444-555555555555"
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, table_name, client):
+        self.table_name = table_name
+        self.client = client
+        self.eq_filters = []
+        self.in_filters = []
+        self.select_fields = None
+        self.limit_value = None
+
+    def select(self, fields):
+        self.select_fields = fields
+        return self
+
+    def eq(self, field, value):
+        self.eq_filters.append((field, value))
+        return self
+
+    def in_(self, field, values):
+        self.in_filters.append((field, list(values)))
+        return self
+
+    def limit(self, value):
+        self.limit_value = value
+        return self
+
+    def _rows(self):
+        self.client.executed.append(self)
+        handler = self.client.handlers[self.table_name]
+        return handler(self)
+
+
+class _SyncQuery(_Query):
+    def execute(self):
+        return _Result(self._rows())
+
+
+class _AsyncQuery(_Query):
+    async def execute(self):
+        client = self.client
+        client.in_flight += 1
+        client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        try:
+            # Yield once so concurrently gathered reads are all in flight
+            # before any of them completes.
+            await asyncio.sleep(0)
+            return _Result(self._rows())
+        finally:
+            client.in_flight -= 1
+
+
+class _Client:
+    query_class = _SyncQuery
+
+    def __init__(self, handlers):
+        self.handlers = handlers
+        self.executed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def table(self, table_name):
+        return self.query_class(table_name, self)
+
+
+class _AsyncClient(_Client):
+    query_class = _AsyncQuery
+
+
+@pytest.fixture(autouse=True)
+def reset_public_read_circuit():
+    public_read_retry._reset_public_read_circuit_breaker_for_tests()
+    yield
+    public_read_retry._reset_public_read_circuit_breaker_for_tests()
+
+
+def _use_clients(monkeypatch, handlers):
+    sync_client = _Client(handlers)
+    async_client = _AsyncClient(handlers)
+    monkeypatch.setattr(pokemon_public_snapshot_service, "public_read_client", sync_client)
+    monkeypatch.setattr(
+        pokemon_public_snapshot_async_service, "get_async_public_read_client", lambda: async_client
+    )
+    return sync_client, async_client
+
+
+def _without_timings(payload):
+    meta = dict(payload.get("meta") or {})
+    meta.pop("timings", None)
+    return {**payload, "meta": meta}
+
+
+_SHELL_ROW = {
+    "set_id": _TEST_UUID,
+    "set_identity_json": {"id": _TEST_UUID, "name": "Shell Set"},
+    "title_card_json": {"pack_score": 71.5},
+    "rip_summary_json": {},
+    "market_summary_json": {},
+    "risk_summary_json": {},
+    "concentration_json": {},
+    "desirability_summary_json": {},
+    "as_of": "2026-06-28",
+    "source_updated_at": "2026-06-28T00:00:00+00:00",
+    "updated_at": "2026-06-28T00:00:00+00:00",
+}
+
+_DASHBOARD_ROWS = [
+    {
+        "window_key": "365d",
+        "set_value_histories_json": {"standard": [{"date": "2026-06-28", "setValue": 123.45}]},
+        "latest_market_date": "2026-06-28",
+        "updated_at": "2026-06-28T00:00:00+00:00",
+        "snapshot_meta": {"generationId": "gen-1", "movementContractVersion": "v3"},
+    }
+]
+
+
+def test_shell_reads_row_and_set_value_history_concurrently_and_matches_sync(monkeypatch):
+    _sync, async_client = _use_clients(
+        monkeypatch,
+        {
+            "pokemon_set_page_snapshot_latest": lambda _query: [dict(_SHELL_ROW)],
+            "pokemon_set_market_dashboard_snapshot_latest": lambda _query: [dict(row) for row in _DASHBOARD_ROWS],
+        },
+    )
+
+    expected = pokemon_public_snapshot_service.get_pokemon_set_shell_snapshot_payload(_TEST_UUID)
+    payload = asyncio.run(
+        pokemon_public_snapshot_async_service.get_pokemon_set_shell_snapshot_payload_async(_TEST_UUID)
+    )
+
+    assert _without_timings(payload) == _without_timings(expected)
+    assert payload["setValueHistoriesByScope"]["standard"][-1]["setValue"] == 123.45
+    assert async_client.max_in_flight == 2
+    assert "payload_json," not in async_client.executed[0].select_fields
+
+
+def test_shell_missing_row_discards_history_and_returns_fallback(monkeypatch):
+    _use_clients(
+        monkeypatch,
+        {
+            "pokemon_set_page_snapshot_latest": lambda _query: [],
+            "pokemon_set_market_dashboard_snapshot_latest": lambda _query: list(_DASHBOARD_ROWS),
+            "sets": lambda _query: [{"id": _TEST_UUID, "name": "Shell Set", "canonical_key": "shellSet"}],
+        },
+    )
+
+    payload = asyncio.run(
+        pokemon_public_snapshot_async_service.get_pokemon_set_shell_snapshot_payload_async(_TEST_UUID)
+    )
+
+    assert payload["meta"]["fallback"] is True
+    assert payload["setValueHistoriesByScope"] == {}
+    assert payload["set"]["name"] == "Shell Set"
+
+
+def test_page_snapshot_matches_sync_reader(monkeypatch):
+    page_row = {
+        "set_id": _TEST_UUID,
+        "payload_json": {"summary": {"set_id": _TEST_UUID}, "top_hits": [{"card_id": "c1"}], "meta": {}},
+        "as_of": "2026-06-28",
+        "source_updated_at": "2026-06-28T00:00:00+00:00",
+        "updated_at": "2026-06-28T00:00:00+00:00",
+    }
+    _use_clients(monkeypatch, {"pokemon_set_page_snapshot_latest": lambda _query: [dict(page_row)]})
+
+    expected = pokemon_public_snapshot_service.get_pokemon_set_page_snapshot_payload(_TEST_UUID)
+    payload = asyncio.run(
+        pokemon_public_snapshot_async_service.get_pokemon_set_page_snapshot_payload_async(_TEST_UUID)
+    )
+
+    assert _without_timings(payload) == _without_timings(expected)
+    assert "snapshot_query_ms" in payload["meta"]["timings"]
+
+
+def test_page_snapshot_read_failure_maps_to_explore_page_error(monkeypatch):
+    from backend.db.services.explore_page_service import ExplorePageError
+
+    def fail(_query):
+        raise RuntimeError("boom")
+
+    _use_clients(monkeypatch, {"pokemon_set_page_snapshot_latest": fail})
+
+    with pytest.raises(ExplorePageError) as excinfo:
+        asyncio.run(
+            pokemon_public_snapshot_async_service.get_pokemon_set_page_snapshot_payload_async(_TEST_UUID)
+        )
+    assert excinfo.value.code == "POKEMON_SET_PAGE_SNAPSHOT_FAILED"
+
+
+def test_overview_matches_sync_reader(monkeypatch):
+    overview_row = {
+        "set_id": _TEST_UUID,
+        "window_key": "365d",
+        "set_value_histories_json": {"standard": [{"date": "2026-06-28", "setValue": 1.0}]},
+        "performance_vs_cost_history_json": [],
+        "available_scopes_json": [],
+        "latest_market_date": "2026-06-28",
+        "updated_at": "2026-06-28T00:00:00+00:00",
+    }
+    _use_clients(
+        monkeypatch, {"pokemon_set_market_dashboard_snapshot_latest": lambda _query: [dict(overview_row)]}
+    )
+
+    expected = pokemon_public_snapshot_service.get_pokemon_set_overview_snapshot_payload(_TEST_UUID)
+    payload = asyncio.run(
+        pokemon_public_snapshot_async_service.get_pokemon_set_overview_snapshot_payload_async(_TEST_UUID)
+    )
+
+    assert _without_timings(payload) == _without_timings(expected)
+
+
+def test_cards_page_reads_cards_row_and_dashboard_generation_concurrently(monkeypatch):
+    cards_row = {
+        "set_id": _TEST_UUID,
+        "cards_json": [
+            {"card_id": "c1", "name": "Alpha", "number": "1", "rarity": "Common"},
+            {"card_id": "c2", "name": "Beta", "number": "2", "rarity": "Rare"},
+        ],
+        "card_count": 2,
+        "updated_at": "2026-06-28T00:00:00+00:00",
+        "snapshot_meta": {"generationId": "gen-1", "movementContractVersion": "v3"},
+    }
+    _sync, async_client = _use_clients(
+        monkeypatch,
+        {
+            "pokemon_set_cards_snapshot_latest": lambda _query: [dict(cards_row)],
+            "pokemon_set_market_dashboard_snapshot_latest": lambda _query: [dict(_DASHBOARD_ROWS[0])],
+        },
+    )
+
+    expected = pokemon_public_snapshot_service.get_pokemon_set_cards_page_snapshot_payload(_TEST_UUID, page_size=1)
+    payload = asyncio.run(
+        pokemon_public_snapshot_async_service.get_pokemon_set_cards_page_snapshot_payload_async(
+            _TEST_UUID, page_size=1
+        )
+    )
+
+    assert _without_timings(payload) == _without_timings(expected)
+    assert payload["meta"]["movementGeneration"]["status"] == "match"
+    assert async_client.max_in_flight == 2
+    assert [query.table_name for query in async_client.executed] == [
+        "pokemon_set_cards_snapshot_latest",
+        "pokemon_set_market_dashboard_snapshot_latest",
+    ]
+
+
+def test_async_resolver_issues_exact_match_lookups_together(monkeypatch):
+    def read_sets(query):
+        if ("canonical_key", "prismaticEvolutions") in query.eq_filters:
+            return [{"id": _TEST_UUID, "name": "Prismatic Evolutions", "canonical_key": "prismaticEvolutions"}]
+        return []
+
+    client = _AsyncClient({"sets": read_sets})
+
+    row = asyncio.run(
+        pokemon_set_market_service.resolve_pokemon_set_identifier_async("prismaticEvolutions", client=client)
+    )
+
+    assert row["id"] == _TEST_UUID
+    assert client.max_in_flight == 3
+    assert [query.eq_filters[0][0] for query in client.executed] == ["id", "canonical_key", "pokemon_api_set_id"]
+
+
+def test_async_resolver_retries_a_transient_failure_on_a_fresh_client(monkeypatch):
+    def dead_socket(_query):
+        raise APIError({"message": "schema cache unavailable", "code": "PGRST002", "hint": None, "details": None})
+
+    stale = _AsyncClient({"sets": dead_socket})
+    fresh = _AsyncClient({"sets": lambda _query: [{"id": _TEST_UUID, "name": "Fresh"}]})
+    monkeypatch.setattr(pokemon_set_market_service, "create_async_public_read_client", lambda: fresh)
+
+    row = asyncio.run(pokemon_set_market_service.resolve_pokemon_set_identifier_async(_TEST_UUID, client=stale))
+
+    assert row["name"] == "Fresh"
+
+
+def test_async_resolver_miss_is_a_settled_404():
+    client = _AsyncClient({"sets": lambda _query: []})
+
+    with pytest.raises(PokemonSetMarketError) as excinfo:
+        asyncio.run(pokemon_set_market_service.resolve_pokemon_set_identifier_async("nope", client=client))
+    assert excinfo.value.status_code == 404
+
+
+def test_identical_concurrent_cards_page_requests_share_one_read(monkeypatch):
+    cards_row = {
+        "set_id": _TEST_UUID,
+        "cards_json": [{"card_id": "c1", "name": "Alpha", "number": "1", "rarity": "Common"}],
+        "card_count": 1,
+        "updated_at": "2026-06-28T00:00:00+00:00",
+        "snapshot_meta": {},
+    }
+    _sync, async_client = _use_clients(
+        monkeypatch,
+        {
+            "pokemon_set_cards_snapshot_latest": lambda _query: [dict(cards_row)],
+            "pokemon_set_market_dashboard_snapshot_latest": lambda _query: [],
+        },
+    )
+    read = pokemon_public_snapshot_async_service.get_pokemon_set_cards_page_snapshot_payload_async
+
+    async def scenario():
+        return await asyncio.gather(
+            read(_TEST_UUID, page="1"),
+            read(_TEST_UUID, page=1),
+            read(_TEST_UUID, page=2),
+        )
+
+    first, same, other_page = asyncio.run(scenario())
+
+    assert first is same
+    assert other_page is not first
+    # Two distinct requests, each reading the cards row and the dashboard meta.
+    assert len(async_client.executed) == 4
@@ -1,3 +1,5 @@
+import json
+import re
 from pathlib import Path
 
 import pytest
@@ -69,7 +71,29 @@ class _Query:
         return self
 
     def execute(self):
-        return _Result(self.handlers[self.table_name](self))
+        rows = self.handlers[self.table_name](self)
+        return _Result([_project_json_paths(row, getattr(self, "select_fields", None)) for row in rows or []])
+
+
+def _project_json_paths(row, select_fields):
+    """Resolve `alias:column->a->b` select entries the way Postgres would, for
+    fake rows that carry the whole JSON column. Aliases the handler already
+    returned are left as they are."""
+    if not isinstance(row, dict) or not select_fields:
+        return row
+    projected = dict(row)
+    for field in select_fields.split(","):
+        alias, separator, expression = field.strip().partition(":")
+        if not separator or "->" not in expression or alias in projected:
+            continue
+        column, *path = re.split(r"->>?", expression)
+        node = row.get(column)
+        for key in path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if "->>" in expression and node is not None and not isinstance(node, str):
+            node = json.dumps(node)
+        projected[alias] = node
+    return projected
 
 
 class _Client:
@@ -6000,3 +6024,125 @@ def test_invalid_product_family_rankings_never_fabricate_enrichment():
     payload["productFamilyRankings"]["authorityTargetCount"] = 5
     assert pokemon_public_snapshot_service.upgrade_rankings_set_rip_contract_if_needed(payload) is payload
     assert "cohortSize" not in payload["targets"][0]["setRipV1"]
+
+
+# ---------------------------------------------------------------------------
+# Section-addressable reads: card validation and the Insights readers select
+# only their `payload_json->section` projections, so each route transfers the
+# sections it serves instead of the whole snapshot blob.
+# ---------------------------------------------------------------------------
+
+
+class _ByteCountingClient(_Client):
+    """Returns exactly the selected columns, as PostgREST would, and records
+    the serialized size of what each read transferred."""
+
+    def __init__(self, handlers):
+        super().__init__(handlers)
+        self.bytes_read = []
+
+    def table(self, table_name):
+        client = self
+
+        class _CountingQuery(_Query):
+            def execute(self):
+                rows = []
+                for row in self.handlers[self.table_name](self):
+                    projected = _project_json_paths(row, self.select_fields)
+                    selected = [field.strip().partition(":")[0] for field in self.select_fields.split(",")]
+                    rows.append({field: projected.get(field) for field in selected})
+                client.bytes_read.append(len(json.dumps(rows, default=str).encode("utf-8")))
+                return _Result(rows)
+
+        return _CountingQuery(table_name, self.handlers)
+
+
+def _json_size(value):
+    return len(json.dumps(value, default=str).encode("utf-8"))
+
+
+def _with_unrelated_bulk(payload_json):
+    """Snapshot rows also carry sections owned by other routes; these are the
+    bytes a section-addressable read must never transfer."""
+    bulk_cards = [{"id": f"bulk-{index}", "movement30d": {"points": list(range(30))}} for index in range(400)]
+    return {
+        **payload_json,
+        "marketMoversByWindow": {"30D": {"all": bulk_cards}},
+        "topChaseCards": bulk_cards,
+        "pull_rate_assumptions": {"rows": bulk_cards},
+    }
+
+
+def _read_bytes(monkeypatch, table_name, payload_json, read):
+    client = _ByteCountingClient(
+        {
+            table_name: lambda _q: [
+                {"set_id": _TEST_UUID, "card_count": 2, "updated_at": "2026-07-16T00:00:00+00:00", "payload_json": payload_json}
+            ],
+        }
+    )
+    monkeypatch.setattr(pokemon_public_snapshot_service, "public_read_client", client)
+    payload = read(_TEST_UUID)
+    assert len(client.bytes_read) == 1
+    return payload, client.bytes_read[0]
+
+
+def _sections_size(payload_json, keys):
+    return _json_size({key: payload_json[key] for key in keys if key in payload_json})
+
+
+def test_card_validation_reads_only_the_validation_sections(monkeypatch):
+    payload_json = _with_unrelated_bulk(_card_validation_payload_json_fixture(card_count=3))
+
+    payload, bytes_read = _read_bytes(
+        monkeypatch,
+        "pokemon_set_cards_snapshot_latest",
+        payload_json,
+        pokemon_public_snapshot_service.get_pokemon_set_card_validation_snapshot_payload,
+    )
+
+    assert len(payload["cards"]) == 3
+    assert payload["cards"][0]["supertype"] == "Pokémon"
+    needed = _sections_size(payload_json, ("cards", "cardDesirabilityValidation", "cardAppealMarketPriceCorrelation"))
+    assert bytes_read <= needed + 1_500
+    assert bytes_read < _json_size(payload_json) // 10
+
+
+def test_insights_critical_and_secondary_each_read_only_their_own_sections(monkeypatch):
+    payload_json = _with_unrelated_bulk(_ascended_heroes_snapshot_payload_json())
+    payload_json["history_trend"] = [{"date": f"2026-01-{day:02d}", "value": day} for day in range(1, 29)] * 10
+    secondary_keys = ("rip_statistics", "percentiles", "distribution_bins", "threshold_bins", "top_hits",
+                      "rankings", "history_trend", "openingDesirability")
+    critical_keys = tuple(
+        key for key in payload_json
+        if key not in secondary_keys
+        and key not in ("marketMoversByWindow", "topChaseCards", "pull_rate_assumptions", "meta")
+    )
+
+    critical, critical_bytes = _read_bytes(
+        monkeypatch,
+        "pokemon_set_page_snapshot_latest",
+        payload_json,
+        pokemon_public_snapshot_service.get_pokemon_set_insights_critical_snapshot_payload,
+    )
+    secondary, secondary_bytes = _read_bytes(
+        monkeypatch,
+        "pokemon_set_page_snapshot_latest",
+        payload_json,
+        pokemon_public_snapshot_service.get_pokemon_set_insights_secondary_snapshot_payload,
+    )
+    _full, full_bytes = _read_bytes(
+        monkeypatch,
+        "pokemon_set_page_snapshot_latest",
+        payload_json,
+        pokemon_public_snapshot_service.get_pokemon_set_insights_snapshot_payload,
+    )
+
+    assert critical["rip"]["score"] == 82.20942
+    assert len(secondary["historyTrend"]) == 280
+    assert critical_bytes <= _sections_size(payload_json, critical_keys) + 2_000
+    assert secondary_bytes <= _sections_size(payload_json, secondary_keys) + 2_000
+    # The split is server-side: neither half transfers the other's sections.
+    assert critical_bytes < secondary_bytes
+    assert secondary_bytes < _sections_size(payload_json, critical_keys + secondary_keys)
+    assert full_bytes < _json_size(payload_json) // 4
@@ -3,6 +3,7 @@ import pytest
 
 from backend.db.services import pokemon_set_market_service
 from backend.db.services import public_read_retry
+from backend.tests.unit.db.services.keyset_pagination_fake import keyset_page
 
 
 class _ImmediateSleepTime:
@@ -57,6 +58,7 @@ class _Query:
         self.gte_filters = []
         self.gt_filters = []
         self.lt_filters = []
+        self.or_filters = []
         self.order_fields = []
         self.limit_value = None
         self.range_value = None
@@ -93,6 +95,10 @@ class _Query:
         self.limit_value = value
         return self
 
+    def or_(self, filters):
+        self.or_filters.append(filters)
+        return self
+
     def range(self, start, end):
         self.range_value = (start, end)
         return self
@@ -111,6 +117,7 @@ class _Client:
         return _Query(table_name, self.handlers)
 
 
+
 def test_top_chase_window_observations_paginate_past_postgrest_cap_and_keep_newest_rows():
     observations = [
         {
@@ -133,8 +140,7 @@ def test_top_chase_window_observations_paginate_past_postgrest_cap_and_keep_newe
 
     def read_observations(query):
         queries.append(query)
-        start, end = query.range_value
-        return observations[start : end + 1]
+        return keyset_page(observations, query)
 
     sources = {}
     rows = pokemon_set_market_service._load_price_observation_rows_for_window(
@@ -149,7 +155,12 @@ def test_top_chase_window_observations_paginate_past_postgrest_cap_and_keep_newe
 
     assert len(rows) == 1002
     assert [row["captured_at"][:10] for row in rows[-2:]] == ["2026-07-26", "2026-07-27"]
-    assert [query.range_value for query in queries] == [(0, 999), (1000, 1999)]
+    assert [query.limit_value for query in queries] == [1000, 1000]
+    assert [query.or_filters for query in queries] == [
+        [],
+        ['captured_at.gt."2026-07-22T12:00:00+00:00",and(captured_at.eq."2026-07-22T12:00:00+00:00",id.gt.1000)'],
+    ]
+    assert all(query.range_value is None for query in queries)
     assert all(
         query.select_fields == "id,card_variant_id,condition_id,market_price,source,captured_at"
         for query in queries
@@ -184,8 +195,7 @@ def test_canonical_top_chase_history_uses_paginated_newest_market_date():
 
     def read_observations(query):
         queries.append(query)
-        start, end = query.range_value
-        return observations[start : end + 1]
+        return keyset_page(observations, query)
 
     client = _Client({"card_variant_price_observations": read_observations})
     history_by_variant, diagnostics, meta = (
@@ -1365,3 +1375,26 @@ def test_resolve_pokemon_set_identifier_gives_up_after_the_bounded_retry(monkeyp
     assert not isinstance(excinfo.value, pokemon_set_market_service.PokemonSetMarketError) or \
         excinfo.value.status_code >= 500
     assert handler.calls <= 2, "the live request path retries at most once"
+
+
+def test_chase_trend_history_reads_only_the_trend_window_and_its_lookback(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    from backend.db.services.price_observation_history_reader import PriceObservationHistory
+
+    reads = []
+
+    def fake_read(_client, **kwargs):
+        reads.append(kwargs)
+        return PriceObservationHistory(variant_ids=tuple(kwargs["variant_ids"]), fields=(), rows=[])
+
+    monkeypatch.setattr(pokemon_set_market_service, "read_price_observation_history", fake_read)
+
+    pokemon_set_market_service._load_variant_price_history(
+        [{"card_variant_id": "variant-a", "condition_id": "nm"}], 90, {}, []
+    )
+
+    expected = datetime.now(timezone.utc) - timedelta(
+        days=90 + pokemon_set_market_service.TOP_CHASE_HISTORY_LOOKBACK_DAYS
+    )
+    assert abs(datetime.fromisoformat(reads[0]["captured_from"]) - expected) < timedelta(minutes=1)
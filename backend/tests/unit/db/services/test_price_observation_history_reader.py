@@ -0,0 +1,183 @@
+"""The shared observation reader: keyset pages per variant chunk, chunks read
+concurrently, and the observations returned as columns."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from backend.db.services import price_observation_history_reader as reader
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client):
+        self.client = client
+        self.in_filters = {}
+        self.eq_filters = {}
+        self.or_filters = []
+        self.limit_value = None
+
+    def select(self, fields):
+        self.select_fields = fields
+        return self
+
+    def in_(self, field, values):
+        self.in_filters[field] = list(values)
+        return self
+
+    def eq(self, field, value):
+        self.eq_filters[field] = value
+        return self
+
+    def gt(self, *_args):
+        return self
+
+    def gte(self, *_args):
+        return self
+
+    def lt(self, *_args):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def or_(self, expression):
+        self.or_filters.append(expression)
+        return self
+
+    def limit(self, value):
+        self.limit_value = value
+        return self
+
+    def execute(self):
+        self.client.queries.append(self)
+        self.client.threads.add(threading.current_thread().name)
+        variants = set(self.in_filters["card_variant_id"])
+        rows = sorted(
+            (row for row in self.client.rows if row["card_variant_id"] in variants),
+            key=lambda row: (row["captured_at"], row["id"]),
+        )
+        for expression in self.or_filters:
+            after = next(
+                (row["captured_at"], row["id"]) for row in rows if expression == reader.keyset_after_filter(row["captured_at"], row["id"])
+            )
+            rows = [row for row in rows if (row["captured_at"], row["id"]) > after]
+        return _Result(rows[: self.limit_value])
+
+
+class _Client:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.threads = set()
+
+    def table(self, table_name):
+        assert table_name == "card_variant_price_observations"
+        return _Query(self)
+
+
+def _observation(observation_id, variant_id, captured_at, price, condition_id="nm"):
+    return {
+        "id": observation_id,
+        "card_variant_id": variant_id,
+        "condition_id": condition_id,
+        "market_price": price,
+        "source": "tcgplayer",
+        "captured_at": captured_at,
+    }
+
+
+def test_reader_pages_each_chunk_by_keyset_and_returns_columns_in_chunk_order():
+    client = _Client([
+        _observation(5, "variant-b", "2026-07-02T08:00:00+00:00", 7.5),
+        _observation(1, "variant-a", "2026-07-01T08:00:00+00:00", 10.0),
+        _observation(2, "variant-a", "2026-07-01T08:00:00+00:00", 11.0),
+        _observation(3, "variant-a", "2026-07-03T23:30:00+00:00", "12.25"),
+        _observation(4, "variant-c", "2026-07-01T09:00:00+00:00", None),
+    ])
+    diagnostics = {}
+
+    history = reader.read_price_observation_history(
+        client,
+        variant_ids=["variant-a", "variant-b", "variant-c"],
+        condition_ids=["nm"],
+        page_size=2,
+        chunk_size=2,
+        max_workers=2,
+        diagnostics=diagnostics,
+    )
+
+    assert history.variant_ids == ("variant-a", "variant-b", "variant-c")
+    assert history.variant_index.tolist() == [0, 0, 1, 0, 2]
+    assert history.day.tolist() == [np.datetime64(day, "D").item() for day in (
+        "2026-07-01", "2026-07-01", "2026-07-02", "2026-07-03", "2026-07-01",
+    )]
+    assert history.price[:4].tolist() == [10.0, 11.0, 7.5, 12.25]
+    assert np.isnan(history.price[4])
+    assert [row["id"] for row in history.rows()] == [1, 2, 5, 3, 4]
+    assert [row["id"] for row in history.reversed().rows()] == [4, 3, 5, 2, 1]
+    # The first chunk paged twice, each time after the last key it saw.
+    assert [query.or_filters for query in client.queries if query.or_filters] == [
+        [reader.keyset_after_filter("2026-07-01T08:00:00+00:00", 2)],
+        [reader.keyset_after_filter("2026-07-03T23:30:00+00:00", 3)],
+    ]
+    assert all(query.eq_filters == {"condition_id": "nm"} for query in client.queries)
+    assert diagnostics == {"observationQueryCount": 4, "observationPageCount": 4, "observationRowsLoaded": 5}
+    assert any(name.startswith("price-observations") for name in client.threads)
+
+
+def test_reader_keeps_only_each_variants_own_condition():
+    client = _Client([
+        _observation(1, "variant-a", "2026-07-01", 10.0, condition_id="nm"),
+        _observation(2, "variant-a", "2026-07-02", 9.0, condition_id="lp"),
+        _observation(3, "variant-b", "2026-07-02", 4.0, condition_id="lp"),
+    ])
+
+    history = reader.read_price_observation_history(
+        client,
+        variant_ids=["variant-a", "variant-b"],
+        condition_ids=["lp", "nm"],
+        condition_by_variant={"variant-a": "nm", "variant-b": "lp"},
+    )
+
+    assert [row["id"] for row in history.rows()] == [1, 3]
+    assert client.queries[0].in_filters["condition_id"] == ["lp", "nm"]
+
+
+def test_reader_refuses_a_full_page_it_cannot_continue_from():
+    client = _Client([
+        {**_observation(1, "variant-a", "2026-07-01", 10.0), "id": None},
+        {**_observation(2, "variant-a", "2026-07-02", 10.0), "id": None},
+    ])
+
+    with pytest.raises(ValueError, match="keyset pagination did not advance"):
+        reader.read_price_observation_history(client, variant_ids=["variant-a"], page_size=2)
+
+
+def test_diagnostics_accumulate_across_reads_and_arrays_are_built_on_demand():
+    client = _Client([
+        _observation(1, "variant-a", "2026-07-01T08:00:00+00:00", 10.0),
+        _observation(2, "variant-b", "2026-07-02T08:00:00+00:00", 4.0),
+    ])
+    diagnostics = {}
+
+    first = reader.read_price_observation_history(client, variant_ids=["variant-a"], diagnostics=diagnostics)
+    second = reader.read_price_observation_history(client, variant_ids=["variant-b"], diagnostics=diagnostics)
+
+    assert diagnostics["observationRowsLoaded"] == 2
+    assert first._arrays is None
+    assert second.rows() == [{
+        "id": 2,
+        "card_variant_id": "variant-b",
+        "condition_id": "nm",
+        "market_price": 4.0,
+        "source": "tcgplayer",
+        "captured_at": "2026-07-02T08:00:00+00:00",
+    }]
+    assert second._arrays is None
+    assert second.price.tolist() == [4.0]
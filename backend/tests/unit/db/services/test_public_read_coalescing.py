@@ -0,0 +1,155 @@
+"""Identical concurrent public reads must share one read, and only while it is in flight."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.db.services import pokemon_public_snapshot_service, public_read_coalescing
+from backend.db.services.public_read_coalescing import (
+    coalescing_key,
+    get_public_read_coalescing_stats,
+    run_coalesced_read,
+    run_coalesced_read_async,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_coalescing():
+    public_read_coalescing._reset_public_read_coalescing_for_tests()
+    yield
+    public_read_coalescing._reset_public_read_coalescing_for_tests()
+
+
+def _wait_for_coalesced(family, count, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if get_public_read_coalescing_stats().get(family, {}).get("coalesced", 0) >= count:
+            return
+        time.sleep(0.001)
+    raise AssertionError(f"{count} followers never joined {family}")
+
+
+def _run_threads(count, target):
+    results = [None] * count
+
+    def run(index):
+        try:
+            results[index] = target()
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_concurrent_identical_reads_execute_once_and_share_the_result():
+    calls = []
+    payload = {"targets": ["a"]}
+
+    def read():
+        calls.append(1)
+        _wait_for_coalesced("explore_rankings", 3)
+        return payload
+
+    key = coalescing_key("explore_rankings", None, (50,))
+    results = _run_threads(4, lambda: run_coalesced_read(key, read))
+
+    assert calls == [1]
+    assert all(result is payload for result in results)
+    assert get_public_read_coalescing_stats() == {"explore_rankings": {"executed": 1, "coalesced": 3}}
+
+
+def test_followers_receive_the_leaders_exception():
+    def read():
+        _wait_for_coalesced("set_page", 2)
+        raise RuntimeError("boom")
+
+    key = coalescing_key("set_page", "set-1")
+    results = _run_threads(3, lambda: run_coalesced_read(key, read))
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert get_public_read_coalescing_stats()["set_page"] == {"executed": 1, "coalesced": 2}
+
+
+def test_key_is_released_once_the_read_settles():
+    calls = []
+    key = coalescing_key("set_page", "set-1")
+
+    run_coalesced_read(key, lambda: calls.append("first"))
+    run_coalesced_read(key, lambda: calls.append("second"))
+
+    assert calls == ["first", "second"]
+    assert get_public_read_coalescing_stats()["set_page"] == {"executed": 2, "coalesced": 0}
+
+
+def test_different_params_and_sets_are_not_coalesced():
+    async def scenario():
+        async def read(value):
+            await asyncio.sleep(0)
+            return value
+
+        return await asyncio.gather(
+            run_coalesced_read_async(coalescing_key("set_overview", "set-1", ("365d",)), lambda: read(1)),
+            run_coalesced_read_async(coalescing_key("set_overview", "set-1", ("30d",)), lambda: read(2)),
+            run_coalesced_read_async(coalescing_key("set_overview", "set-2", ("365d",)), lambda: read(3)),
+        )
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+    assert get_public_read_coalescing_stats()["set_overview"] == {"executed": 3, "coalesced": 0}
+
+
+def test_async_followers_survive_a_cancelled_leader():
+    async def scenario():
+        release = asyncio.Event()
+        calls = []
+
+        async def read():
+            calls.append(1)
+            await release.wait()
+            return {"ok": True}
+
+        key = coalescing_key("set_shell", "set-1")
+        leader = asyncio.ensure_future(run_coalesced_read_async(key, read))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(run_coalesced_read_async(key, read))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+        return calls, await follower, leader
+
+    calls, result, leader = asyncio.run(scenario())
+
+    assert calls == [1]
+    assert result == {"ok": True}
+    assert leader.cancelled()
+
+
+def test_concurrent_rankings_requests_share_one_snapshot_read(monkeypatch):
+    reads = []
+
+    def read(clamped_limit):
+        reads.append(clamped_limit)
+        _wait_for_coalesced("explore_rankings", 2)
+        return {"targets": [], "meta": {"request": {"limit": clamped_limit}}}
+
+    monkeypatch.setattr(pokemon_public_snapshot_service, "_read_pokemon_explore_rankings_snapshot_payload", read)
+
+    # "12" and 12 sanitize to the same limit, so they are the same request.
+    limits = iter(["12", 12, "12"])
+    lock = threading.Lock()
+
+    def request():
+        with lock:
+            limit = next(limits)
+        return pokemon_public_snapshot_service.get_pokemon_explore_rankings_snapshot_payload(limit=limit)
+
+    results = _run_threads(3, request)
+
+    assert reads == [12]
+    assert all(result is results[0] for result in results)
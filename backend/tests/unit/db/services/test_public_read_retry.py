@@ -113,3 +113,141 @@ def test_successful_half_open_probe_closes_circuit():
         client_factory=lambda: "unused",
         monotonic=lambda: clock[0],
     ) == "normal-initial"
+
+
+def test_async_live_retry_uses_initial_then_fresh_client_without_blocking():
+    import asyncio
+
+    initial = object()
+    fresh = object()
+    seen = []
+    sleeps = []
+
+    async def operation(client):
+        seen.append(client)
+        if client is initial:
+            raise _transient_error()
+        return "ok"
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+
+    result = asyncio.run(
+        public_read_retry.run_public_read_with_retry_async(
+            operation,
+            operation_name="fixture",
+            initial_client=initial,
+            client_factory=lambda: fresh,
+            sleep=record_sleep,
+            jitter=lambda _start, _end: 0.25,
+        )
+    )
+
+    assert result == "ok"
+    assert seen == [initial, fresh]
+    assert sleeps == [0.25]
+
+
+def test_async_retry_closes_the_clients_it_created_but_not_the_callers():
+    import asyncio
+
+    class _Pool:
+        def __init__(self):
+            self.closed = False
+
+        async def aclose(self):
+            self.closed = True
+
+    class _SupabaseLikeClient:
+        def __init__(self):
+            self._postgrest = _Pool()
+
+    initial, fresh = _SupabaseLikeClient(), _SupabaseLikeClient()
+
+    async def operation(client):
+        if client is initial:
+            raise _transient_error()
+        return "ok"
+
+    async def no_sleep(_delay):
+        return None
+
+    assert asyncio.run(
+        public_read_retry.run_public_read_with_retry_async(
+            operation,
+            operation_name="fixture",
+            initial_client=initial,
+            client_factory=lambda: fresh,
+            sleep=no_sleep,
+            jitter=lambda _start, _end: 0.0,
+        )
+    ) == "ok"
+    assert fresh._postgrest.closed is True
+    assert initial._postgrest.closed is False
+
+
+def test_async_and_sync_live_paths_share_one_circuit():
+    import asyncio
+
+    clock = [100.0]
+
+    def failing(_client):
+        raise _transient_error()
+
+    with pytest.raises(APIError):
+        public_read_retry.run_public_read_with_retry(
+            failing,
+            operation_name="fixture",
+            initial_client="initial",
+            client_factory=lambda: "fresh",
+            sleep=lambda delay: clock.__setitem__(0, clock[0] + delay),
+            jitter=lambda _start, _end: 0.25,
+            monotonic=lambda: clock[0],
+        )
+
+    async def never_called(_client):
+        raise AssertionError("an open circuit must not reach PostgREST")
+
+    with pytest.raises(public_read_retry.PublicReadCircuitOpenError):
+        asyncio.run(
+            public_read_retry.run_public_read_with_retry_async(
+                never_called,
+                operation_name="fixture",
+                initial_client="async-initial",
+                client_factory=lambda: "async-fresh",
+                monotonic=lambda: clock[0],
+            )
+        )
+
+
+def test_retries_are_counted_per_path_and_operation_without_page_index():
+    from backend.utils.metrics_registry import PUBLIC_READ_RETRIES
+
+    before_live = PUBLIC_READ_RETRIES.value(path="live", operation="counted")
+    before_batch = PUBLIC_READ_RETRIES.value(path="batch", operation="counted.page")
+    calls = []
+
+    def flaky(_client=None):
+        calls.append(1)
+        if len(calls) % 2:
+            raise _transient_error()
+        return "ok"
+
+    public_read_retry.run_public_read_with_retry(
+        flaky,
+        operation_name="counted",
+        initial_client="initial",
+        client_factory=lambda: "fresh",
+        sleep=lambda _delay: None,
+        jitter=lambda _start, _end: 0.25,
+        monotonic=lambda: 100.0,
+    )
+    public_read_retry.run_batch_read_with_retry(
+        flaky,
+        operation_name="counted.page[3]",
+        sleep=lambda _delay: None,
+        jitter=lambda _start, _end: 0.0,
+    )
+
+    assert PUBLIC_READ_RETRIES.value(path="live", operation="counted") == before_live + 1
+    assert PUBLIC_READ_RETRIES.value(path="batch", operation="counted.page") == before_batch + 1
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+MIGRATION = (Path(__file__).resolve().parents[3]
+             / "db/migrations/20260821090000_create_card_variant_price_bulk_ingest_rpc.sql")
+
+
+def _statements(sql: str) -> str:
+    return "\n".join(
+        line for line in sql.splitlines() if not line.strip().startswith("--"))
+
+
+def test_bulk_ingest_rpc_upserts_on_the_daily_and_identity_keys():
+    sql = _statements(MIGRATION.read_text(encoding="utf-8"))
+    assert "FUNCTION public.ingest_card_variant_prices_bulk(" in sql
+    assert "ON CONFLICT (card_variant_id, condition_id, source, captured_date) DO UPDATE" in sql
+    assert "ON CONFLICT (provider, external_product_id, external_variant_key) DO NOTHING" in sql
+    # Unchanged same-day rows are not rewritten.
+    assert "IS DISTINCT FROM (EXCLUDED.market_price, EXCLUDED.high_price, EXCLUDED.low_price)" in sql
+
+
+def test_bulk_ingest_rpc_is_service_role_only():
+    sql = _statements(MIGRATION.read_text(encoding="utf-8"))
+    assert ("REVOKE ALL ON FUNCTION public.ingest_card_variant_prices_bulk(JSONB, JSONB) "
+            "FROM PUBLIC, anon, authenticated;") in sql
+    assert "GRANT EXECUTE ON FUNCTION public.ingest_card_variant_prices_bulk(JSONB, JSONB) TO service_role;" in sql
+    assert "DELETE FROM" not in sql.upper()
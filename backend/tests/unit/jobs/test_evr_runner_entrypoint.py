@@ -19,6 +19,7 @@ def test_main_invokes_orchestrator_with_cli_args(
         input_source="db",
         trigger="scheduled",
         run_label="nightly-run",
+        refresh_inputs=False,
     )
 
     exit_code = evr_runner.main()
@@ -33,6 +34,7 @@ def test_main_invokes_orchestrator_with_cli_args(
             "trigger": "scheduled",
             "run_label": "nightly-run",
         },
+        refresh_inputs=False,
     )
 
 
@@ -53,6 +55,7 @@ def test_main_returns_nonzero_when_orchestrator_fails(
         input_source="db",
         trigger="manual",
         run_label=None,
+        refresh_inputs=False,
     )
     mock_orchestrator_cls.return_value.run.side_effect = RuntimeError("boom")
 
@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend.Scraper.clients import async_tcgplayer_client
+from backend.Scraper.clients.async_tcgplayer_client import AsyncTCGPlayerClient
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    monkeypatch.setenv("REQUEST_DELAY_MIN_SECONDS", "0")
+    monkeypatch.setenv("REQUEST_DELAY_MAX_SECONDS", "0")
+    monkeypatch.setenv("HTTP_BACKOFF_BASE_SECONDS", "0")
+    state = {"in_flight": 0, "peak": 0, "responses": {}, "requested": []}
+
+    async def handler(request):
+        url = str(request.url)
+        state["requested"].append(url)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return state["responses"][url].pop(0)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        async_tcgplayer_client.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return state
+
+
+def test_price_guides_are_fetched_concurrently_and_cached(transport):
+    transport["responses"] = {
+        "https://tcg.test/cards": [httpx.Response(200, json={"result": [1, 2]})],
+        "https://tcg.test/sealed": [httpx.Response(200, json={"result": [3]})],
+    }
+    client = AsyncTCGPlayerClient()
+
+    cards, sealed = client.fetch_price_data_many(["https://tcg.test/cards", "https://tcg.test/sealed"])
+
+    assert (cards, sealed) == ({"result": [1, 2]}, {"result": [3]})
+    assert transport["peak"] == 2
+    # The blocking path reads the same response cache.
+    assert client.fetch_price_data("https://tcg.test/cards") == {"result": [1, 2]}
+    metrics = client.get_metrics()
+    assert metrics["http_requests_total"] == 2
+    assert metrics["http_requests_cache_misses"] == 2
+    assert metrics["http_requests_cache_hits"] == 1
+
+
+def test_challenge_pages_count_as_rate_limits_and_are_retried(transport):
+    transport["responses"] = {
+        "https://tcg.test/price/1": [
+            httpx.Response(200, headers={"Content-Type": "text/html"}, text="Verify you are human"),
+            httpx.Response(200, json={"result": [{"buckets": [{"marketPrice": 4.5}]}]}),
+        ],
+        "https://tcg.test/price/2": [httpx.Response(404), httpx.Response(404), httpx.Response(404)],
+    }
+    client = AsyncTCGPlayerClient()
+
+    assert client.fetch_product_market_prices(["https://tcg.test/price/1", "https://tcg.test/price/2"]) == [4.5, None]
+    metrics = client.get_metrics()
+    assert metrics["rate_limit_events"] == 1
+    assert metrics["retry_count_total"] == 3
+    assert metrics["http_requests_total"] == 5
+
+
+def test_malformed_price_guide_is_retried_before_it_is_cached_or_recorded(transport, monkeypatch, tmp_path):
+    monkeypatch.setenv("TCGPLAYER_PRICE_GUIDE_STORE_DIR", str(tmp_path))
+    good = b'{"result": [1, 2]}'
+    transport["responses"] = {
+        "https://tcg.test/cards": [
+            httpx.Response(200, content=b'{"result": [1, 2,}', headers={"ETag": '"bad"'}),
+            httpx.Response(200, content=good, headers={"ETag": '"v1"'}),
+        ],
+    }
+    client = AsyncTCGPlayerClient()
+
+    (fetch,) = client.fetch_price_data_many(["https://tcg.test/cards"], conditional_urls=["https://tcg.test/cards"])
+
+    assert fetch.content == good and list(fetch.rows()) == [1, 2]
+    assert client.get_metrics()["retry_count_total"] == 1
+    assert client.price_guide_store.stored_body_hash("https://tcg.test/cards") == fetch.body_hash
+    assert client.price_guide_store.conditional_headers("https://tcg.test/cards")["If-None-Match"] == '"v1"'
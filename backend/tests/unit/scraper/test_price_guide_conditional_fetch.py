@@ -0,0 +1,122 @@
+import httpx
+import pytest
+
+from backend.Scraper.clients import async_tcgplayer_client
+from backend.Scraper.services.orchestrators import tcg_player_orchestrator
+from backend.Scraper.services.orchestrators.tcg_player_orchestrator import TCGScraper
+
+
+CARD_URL = "https://tcg.test/cards"
+SEALED_URL = "https://tcg.test/sealed"
+
+
+class _Config:
+    SET_NAME = "Test Set"
+    CARD_DETAILS_URL = CARD_URL
+    SEALED_DETAILS_URL = SEALED_URL
+    PULL_RATE_MAPPING = {"common": 1.5}
+
+
+class _Parser:
+    parse_calls = 0
+
+    def __init__(self, _mapping):
+        self.last_card_parse_report = {}
+
+    def parse_card_rows(self, rows):
+        _Parser.parse_calls += 1
+        rows = list(rows)
+        self.last_card_parse_report = {"raw_rows": len(rows)}
+        return [{"name": row, "prices": {"market": 1.0}} for row in rows]
+
+    def parse_sealed_products(self, _config, _client, sealed_raw=None):
+        return list(sealed_raw["result"])
+
+
+class _Dto:
+    def __init__(self, cards, sealed):
+        self.cards, self.sealed = cards, sealed
+
+    def model_dump(self):
+        return {"data": {"cards": [dict(card) for card in self.cards], "sealed_products": self.sealed}}
+
+
+class _Ingest:
+    def __init__(self):
+        self.calls = 0
+
+    def ingest(self, payload):
+        self.calls += 1
+        return {"success": True, "set_id": "set-1"}
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    monkeypatch.setenv("REQUEST_DELAY_MIN_SECONDS", "0")
+    monkeypatch.setenv("REQUEST_DELAY_MAX_SECONDS", "0")
+    monkeypatch.setenv("TCGPLAYER_PRICE_GUIDE_STORE_DIR", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    _Parser.parse_calls = 0
+    monkeypatch.setattr(tcg_player_orchestrator, "TCGPlayerParser", _Parser)
+    monkeypatch.setattr(tcg_player_orchestrator, "validate_ingestion_result",
+                        lambda _payload, result: {"setId": result["set_id"], "ingestionSuccess": True})
+    state = {"cards": {"result": ["a", "b"]}, "etag": '"v1"', "statuses": []}
+
+    def handler(request):
+        if str(request.url) == SEALED_URL:
+            return httpx.Response(200, json={"result": [{"name": "box"}]})
+        if request.headers.get("If-None-Match") == state["etag"]:
+            state["statuses"].append(304)
+            return httpx.Response(304)
+        state["statuses"].append(200)
+        return httpx.Response(200, json=state["cards"], headers={"ETag": state["etag"]})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        async_tcgplayer_client.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return state
+
+
+def _scrape(market_date, ingest):
+    scraper = TCGScraper(target_market_date=market_date)
+    scraper.enable_db_ingestion = True
+    scraper.ingest_controller = ingest
+    scraper.dto_builder.build = lambda _config, cards, sealed: _Dto(cards, sealed)
+    return scraper.scrape(_Config, "unused.xlsx")
+
+
+def test_unchanged_guide_reuses_the_stored_parse_but_still_ingests_a_new_market_date(server, tmp_path):
+    ingest = _Ingest()
+    first = _scrape("2026-07-18", ingest)
+    second = _scrape("2026-07-19", ingest)
+
+    assert server["statuses"] == [200, 304]
+    assert _Parser.parse_calls == 1
+    assert [card["name"] for card in second["data"]["cards"]] == [card["name"] for card in first["data"]["cards"]]
+    assert {card["_market_date"] for card in second["data"]["cards"]} == {"2026-07-19"}
+    assert second["_scrape_outcome"]["priceGuideUnchanged"] is True
+    assert second["_scrape_outcome"]["priceGuideParseReused"] is True
+    assert second["_scrape_outcome"]["rawRows"] == 2
+    assert second["_scrape_outcome"]["ingestionSkipped"] is False
+    assert ingest.calls == 2
+    assert not (tmp_path / "payload_debug.json").exists()
+
+
+def test_rerun_for_an_already_ingested_market_date_skips_ingestion_until_the_body_changes(server):
+    ingest = _Ingest()
+    _scrape("2026-07-18", ingest)
+    rerun = _scrape("2026-07-18", ingest)
+
+    assert ingest.calls == 1
+    assert rerun["_scrape_outcome"]["ingestionSkipped"] is True
+    assert rerun["_scrape_outcome"]["setId"] == "set-1"
+
+    server["cards"], server["etag"] = {"result": ["a", "b", "c"]}, '"v2"'
+    changed = _scrape("2026-07-18", ingest)
+
+    assert ingest.calls == 2 and _Parser.parse_calls == 2
+    assert changed["_scrape_outcome"]["priceGuideUnchanged"] is False
+    assert len(changed["data"]["cards"]) == 3
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from backend.Scraper.clients.price_guide_store import PriceGuideFetch
+from backend.Scraper.helpers.record_helper import freeze_records, thaw_records
+from backend.Scraper.parsers.price_guide_stream import iter_price_guide_rows, validate_price_guide_body
+from backend.Scraper.parsers.tcgplayer_parser import TCGPlayerParser
+
+
+def _row(product_id, printing, condition, price):
+    return {"productID": product_id, "productName": f"Card {product_id} - 00{product_id}",
+            "number": f"00{product_id}", "condition": condition, "marketPrice": price,
+            "rarity": "Rare", "printing": printing, "set": "Test", "setAbbrv": "TST"}
+
+
+ROWS = [
+    _row(1, "Holofoil", "Near Mint Holofoil", 3.5),
+    _row(2, "Normal", "Lightly Played", 1.0),
+    _row(1, "Normal", "Near Mint", 0.75),
+    _row(2, "Normal", "Near Mint", 1.25),
+    _row(1, "Holofoil", "Near Mint Holofoil", 3.5),  # duplicate NM row
+    _row(3, "Normal", "Damaged", 0.1),  # no NM row
+]
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 7, 4096])
+def test_streamed_rows_match_a_full_decode_across_chunk_boundaries(chunk_bytes):
+    body = json.dumps({"success": True, "result": ROWS, "errors": ["é"]}).encode("utf-8")
+    assert list(iter_price_guide_rows(body, chunk_bytes=chunk_bytes)) == ROWS
+    assert list(iter_price_guide_rows(b'{"errors": [], "result": []}')) == []
+    with pytest.raises(ValueError):
+        list(iter_price_guide_rows(body[:-40], chunk_bytes=chunk_bytes))
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 4096])
+def test_validation_rejects_any_body_that_is_not_one_complete_object(chunk_bytes):
+    body = json.dumps({"success": True, "result": ROWS}).encode("utf-8")
+    validate_price_guide_body(body + b"\n", chunk_bytes=chunk_bytes)
+    validate_price_guide_body(b"{}", chunk_bytes=chunk_bytes)
+    for malformed in (body[:-40] + b"}", body.replace(b'"Holofoil"', b"Holofoil", 1), body + b"{}", b"[]"):
+        with pytest.raises(ValueError):
+            validate_price_guide_body(malformed, chunk_bytes=chunk_bytes)
+
+
+def test_streamed_parse_matches_parse_cards_and_records_are_frozen():
+    body = json.dumps({"result": ROWS}).encode("utf-8")
+    full_parser, streamed_parser = TCGPlayerParser({}), TCGPlayerParser({})
+
+    expected = full_parser.parse_cards({"result": ROWS})
+    streamed = streamed_parser.parse_card_rows(
+        PriceGuideFetch(data=None, body_hash=None, unchanged=False, content=body).rows())
+
+    assert streamed == expected
+    assert streamed_parser.last_card_parse_report == full_parser.last_card_parse_report
+    assert streamed_parser.last_card_parse_report["missing_nm_variant_groups"] == ["3|edition=|printing_type=non-holo|special_type="]
+    frozen = freeze_records(streamed)
+    with pytest.raises(TypeError):
+        frozen[0]["prices"]["market"] = 0
+    assert thaw_records(frozen) == expected
@@ -0,0 +1,44 @@
+import pytest
+
+from backend.Scraper.clients.shared_rate_limiter import SharedRateLimiter, shared_rate_limiter_scope
+from backend.Scraper.clients.tcgplayer_client import SustainedRateLimitError, TCGPlayerClient
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 3))
+        self.now += seconds
+
+
+def test_token_bucket_paces_after_the_burst_and_enforces_the_budget():
+    clock = _Clock()
+    limiter = SharedRateLimiter(requests_per_second=2.0, burst=2, max_requests=4,
+                                max_consecutive_rate_limits=3, clock=clock, sleep=clock.sleep)
+
+    assert [limiter.acquire() for _ in range(5)] == [True, True, True, True, False]
+    assert clock.sleeps == [0.5, 0.5]
+    assert limiter.exhausted_reason == "request_cap_exceeded"
+
+
+def test_rate_limit_streak_is_shared_across_clients():
+    limiter = SharedRateLimiter(requests_per_second=100.0, burst=1, max_requests=100,
+                                max_consecutive_rate_limits=3)
+    first, second = TCGPlayerClient(), TCGPlayerClient()
+
+    with shared_rate_limiter_scope(limiter):
+        first._record_rate_limit_event("429", 1, "url")
+        second._record_rate_limit_event("429", 1, "url")
+        with pytest.raises(SustainedRateLimitError):
+            first._record_rate_limit_event("429", 2, "url")
+        # Every other worker is refused its next request.
+        with pytest.raises(SustainedRateLimitError):
+            second._acquire_shared_request(limiter)
+
+    assert second.metrics["aborted_due_to_rate_limit"] is True
@@ -0,0 +1,57 @@
+from backend.scripts import build_pokemon_market_index_history as index_history
+from backend.scripts.backfill_checkpoint import chunk_rows_by_date, date_ranges, load_backfill_checkpoint
+
+
+SCOPE = {"job": "test", "startDate": "2026-01-01"}
+
+
+def test_date_ranges_cover_the_span_without_overlap():
+    assert list(date_ranges("2026-01-01", "2026-01-10", 4)) == [
+        ("2026-01-01", "2026-01-04"),
+        ("2026-01-05", "2026-01-08"),
+        ("2026-01-09", "2026-01-10"),
+    ]
+    rows = [{"market_date": day} for day in ("2026-01-09", "2026-01-01", "2026-01-02", "2026-01-09")]
+    assert [[row["market_date"] for row in chunk] for chunk in chunk_rows_by_date(rows, "market_date", 4)] == [
+        ["2026-01-01", "2026-01-02"],
+        ["2026-01-09", "2026-01-09"],
+    ]
+
+
+def test_checkpoint_resumes_only_under_the_same_parameters(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    load_backfill_checkpoint(path, SCOPE).record("set-a", "2026-02-01")
+
+    assert load_backfill_checkpoint(path, SCOPE).completed_through("set-a") == "2026-02-01"
+    assert load_backfill_checkpoint(path, {**SCOPE, "startDate": "2025-01-01"}).completed_through("set-a") is None
+
+
+def test_index_rows_are_written_one_range_per_request_and_resume_after_the_last_committed_range(tmp_path, monkeypatch):
+    rows = [{"market_date": f"2026-01-{day:02d}", "index_key": key} for day in range(1, 11) for key in ("raw", "top10")]
+    writes = []
+
+    def persist(_client, chunk):
+        if chunk[0]["market_date"] == "2026-01-09" and not writes[-1:] == ["fail-once"]:
+            writes.append("fail-once")
+            raise RuntimeError("connection reset")
+        writes.append([row["market_date"] for row in chunk])
+        return len(chunk)
+
+    monkeypatch.setattr(index_history, "persist_index_rows", persist)
+    path = tmp_path / "index.json"
+
+    try:
+        index_history.persist_in_ranges(object(), rows, chunk_days=4, checkpoint=load_backfill_checkpoint(path, SCOPE))
+    except RuntimeError:
+        pass
+    persisted = index_history.persist_in_ranges(
+        object(), rows, chunk_days=4, checkpoint=load_backfill_checkpoint(path, SCOPE)
+    )
+
+    assert [write if write == "fail-once" else (write[0], write[-1], len(write)) for write in writes] == [
+        ("2026-01-01", "2026-01-04", 8),
+        ("2026-01-05", "2026-01-08", 8),
+        "fail-once",
+        ("2026-01-09", "2026-01-10", 4),
+    ]
+    assert persisted == 4
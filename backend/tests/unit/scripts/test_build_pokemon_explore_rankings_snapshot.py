@@ -39,3 +39,36 @@ def test_rankings_defers_with_exit_3_when_gate_closed(monkeypatch, capsys):
     assert excinfo.value.code == 3
     assert built == []
     assert "publication gate CLOSED" in capsys.readouterr().out
+
+
+def test_incremental_rankings_build_loads_and_saves_the_contribution_cache(monkeypatch, tmp_path):
+    published = []
+    cache_path = tmp_path / "contributions.json"
+    monkeypatch.setenv("PUBLICATION_GATE_MODE", "disabled")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "build_pokemon_explore_rankings_snapshot.py",
+            "--all",
+            "--commit",
+            "--incremental",
+            "--contribution-cache",
+            str(cache_path),
+        ],
+    )
+    monkeypatch.setattr(command, "get_client", lambda: object())
+
+    def _publish(_client, **kwargs):
+        cache = kwargs["contribution_cache"]
+        cache.store("top_10_card_value", "set-1", "fp-1", 42.0)
+        published.append(cache)
+
+    monkeypatch.setattr(command, "publish_explore_rip_rankings_snapshot", _publish)
+
+    command.main()
+
+    assert len(published) == 1
+    assert published[0].path == cache_path
+    reloaded = command.load_contribution_cache(cache_path)
+    assert reloaded.lookup("top_10_card_value", "set-1", "fp-1") == {"fingerprint": "fp-1", "contribution": 42.0}
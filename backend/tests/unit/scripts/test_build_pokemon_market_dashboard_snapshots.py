@@ -145,3 +145,105 @@ def test_cards_market_defers_with_exit_3_when_gate_closed(monkeypatch, capsys):
     assert code == 3
     assert built == []
     assert "publication gate CLOSED" in capsys.readouterr().out
+
+
+def test_parallel_build_writes_each_batch_cards_then_history_then_dashboards(monkeypatch, capsys):
+    from backend.scripts import snapshot_set_fanout as fanout
+
+    writes = []
+    revalidated = []
+    monkeypatch.setenv("PUBLICATION_GATE_MODE", "disabled")
+    monkeypatch.setenv("MARKET_PUBLICATION_GATE_MODE", "disabled")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["build_pokemon_market_dashboard_snapshots.py", "--all", "--commit", "--workers", "4", "--upsert-batch-size", "3"],
+    )
+    monkeypatch.setattr(command, "get_client", lambda: object())
+    monkeypatch.setattr(
+        command,
+        "resolve_target_sets",
+        lambda _client, _args: [{"id": f"set-{index}", "name": str(index)} for index in range(6)],
+    )
+    monkeypatch.setattr(command, "should_commit", lambda _args: True)
+    monkeypatch.setattr(
+        command,
+        "notify_set_publication",
+        lambda set_row, **_kwargs: revalidated.append(set_row["id"]),
+    )
+
+    def build(set_row, **_kwargs):
+        set_id = set_row["id"]
+        return ({"set_id": set_id}, {"set_id": set_id, "window_key": "365d"}, [{"set_id": set_id, "rank": 1}])
+
+    monkeypatch.setattr(fanout, "build_coordinated_set_market_snapshot_rows", build)
+    monkeypatch.setattr(fanout, "refresh_canonical_card_market_prices_for_set", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(
+        fanout, "upsert_rows", lambda _client, table, rows, **_kwargs: writes.append((table, len(rows)))
+    )
+
+    assert command.main() == 0
+
+    assert writes == [
+        ("pokemon_set_cards_snapshot_latest", 3),
+        ("pokemon_set_top_chase_card_daily_history", 3),
+        ("pokemon_set_market_dashboard_snapshot_latest", 3),
+    ] * 2
+    assert sorted(revalidated) == [f"set-{index}" for index in range(6)]
+    assert "built=6 skipped=0 failed=0" in capsys.readouterr().out
+
+
+def test_parallel_skip_unchanged_writes_and_revalidates_only_changed_sets(monkeypatch, capsys):
+    from backend.scripts import snapshot_set_fanout as fanout
+    from backend.scripts.snapshot_input_fingerprint import SnapshotInputFingerprint
+
+    built = []
+    writes = []
+    revalidated = []
+    monkeypatch.setenv("PUBLICATION_GATE_MODE", "disabled")
+    monkeypatch.setenv("MARKET_PUBLICATION_GATE_MODE", "disabled")
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["build_pokemon_market_dashboard_snapshots.py", "--all", "--commit", "--workers", "2", "--skip-unchanged"],
+    )
+    monkeypatch.setattr(command, "get_client", lambda: object())
+    monkeypatch.setattr(
+        command,
+        "resolve_target_sets",
+        lambda _client, _args: [{"id": f"set-{index}", "name": str(index)} for index in range(4)],
+    )
+    monkeypatch.setattr(command, "should_commit", lambda _args: True)
+    monkeypatch.setattr(command, "notify_set_publication", lambda set_row, **_k: revalidated.append(set_row["id"]))
+    monkeypatch.setattr(
+        fanout,
+        "coordinated_market_input_fingerprint",
+        lambda _client, set_row, **_k: SnapshotInputFingerprint("coordinated_market", {"set": set_row["id"]}),
+    )
+    # Even-numbered sets already carry their current fingerprint.
+    monkeypatch.setattr(
+        fanout,
+        "coordinated_market_snapshots_are_current",
+        lambda _client, set_id, _fingerprint, **_k: int(set_id[-1]) % 2 == 0,
+    )
+
+    def build(set_row, **_kwargs):
+        set_id = set_row["id"]
+        built.append(set_id)
+        return ({"set_id": set_id, "payload_json": {}}, {"set_id": set_id, "payload_json": {}}, [])
+
+    monkeypatch.setattr(fanout, "build_coordinated_set_market_snapshot_rows", build)
+    monkeypatch.setattr(fanout, "refresh_canonical_card_market_prices_for_set", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(fanout, "upsert_rows", lambda _client, table, rows, **_kwargs: writes.append((table, rows)))
+
+    assert command.main() == 0
+
+    assert sorted(built) == ["set-1", "set-3"]
+    assert sorted(revalidated) == ["set-1", "set-3"]
+    cards_rows = [row for table, rows in writes if table == "pokemon_set_cards_snapshot_latest" for row in rows]
+    assert sorted(row["set_id"] for row in cards_rows) == ["set-1", "set-3"]
+    expected = SnapshotInputFingerprint("coordinated_market", {"set": "set-1"}).value
+    assert next(row for row in cards_rows if row["set_id"] == "set-1")["payload_json"]["meta"]["snapshot"][
+        "inputFingerprint"
+    ] == expected
+    assert "built=2 skipped=0 failed=0 unchanged=2" in capsys.readouterr().out
@@ -1,4 +1,6 @@
 import sys
+import threading
+import time
 import types
 
 import pytest
@@ -42,8 +44,8 @@ def test_orchestration_runs_children_when_gate_open(monkeypatch):
         "set sealed market snapshots",
         "coordinated set cards and market dashboards",
         "global market set value",
-        "global explore card movers",
         "explore rankings",
+        "global explore card movers",
         "set pages",
     ]
 
@@ -141,3 +143,158 @@ def test_global_set_value_step_invokes_the_existing_builder_script(monkeypatch):
     args = captured["global market set value"]
     assert args[0] == "backend/scripts/build_pokemon_explore_set_value_snapshot.py"
     assert "--dry-run" in args
+
+
+def test_deferral_skips_only_the_steps_that_read_the_deferred_outputs(monkeypatch, caplog):
+    steps_run = []
+    _stub_gate(monkeypatch, proceed=True)
+    monkeypatch.setattr(
+        command,
+        "_run_step",
+        lambda label, args: steps_run.append(label) or (
+            3 if label == "coordinated set cards and market dashboards" else 0
+        ),
+    )
+    monkeypatch.setattr(sys, "argv", ["build_pokemon_public_snapshots.py", "--commit"])
+
+    with caplog.at_level("INFO"):
+        with pytest.raises(SystemExit) as excinfo:
+            command.main()
+
+    assert excinfo.value.code == 3
+    # Nothing was published by the deferred step, so its readers never run;
+    # the independent steps still do.
+    assert steps_run == [
+        "set sealed market snapshots",
+        "coordinated set cards and market dashboards",
+        "explore rankings",
+    ]
+    assert "SKIPPED: global market set value" in caplog.text
+    assert "SKIPPED: set pages" in caplog.text
+
+
+def test_a_failed_producer_does_not_withhold_its_dependents(monkeypatch):
+    steps_run = []
+    _stub_gate(monkeypatch, proceed=True)
+    monkeypatch.setattr(
+        command,
+        "_run_step",
+        lambda label, args: steps_run.append(label) or (
+            1 if label == "coordinated set cards and market dashboards" else 0
+        ),
+    )
+    monkeypatch.setattr(sys, "argv", ["build_pokemon_public_snapshots.py", "--commit"])
+
+    with pytest.raises(SystemExit) as excinfo:
+        command.main()
+
+    assert excinfo.value.code == 1
+    assert len(steps_run) == 6
+
+
+def test_independent_steps_run_concurrently_and_dependents_wait(monkeypatch):
+    roots = threading.Barrier(3, timeout=5)
+    finished = set()
+    started_after = {}
+    lock = threading.Lock()
+
+    def fake_run_step(label, args):
+        with lock:
+            started_after[label] = set(finished)
+        if label in {
+            "set sealed market snapshots",
+            "coordinated set cards and market dashboards",
+            "explore rankings",
+        }:
+            roots.wait()  # raises BrokenBarrierError unless all three overlap
+        with lock:
+            finished.add(label)
+        return 0
+
+    _stub_gate(monkeypatch, proceed=True)
+    monkeypatch.setattr(command, "_run_step", fake_run_step)
+    monkeypatch.setattr(sys, "argv", ["build_pokemon_public_snapshots.py", "--commit", "--max-workers", "3"])
+
+    command.main()
+
+    assert "coordinated set cards and market dashboards" in started_after["global market set value"]
+    assert {"explore rankings", "coordinated set cards and market dashboards"} <= started_after[
+        "global explore card movers"
+    ]
+    assert {"explore rankings", "coordinated set cards and market dashboards"} <= started_after["set pages"]
+
+
+def test_set_pages_wait_for_every_artifact_they_read(monkeypatch):
+    finished = []
+    started_after = {}
+    lock = threading.Lock()
+
+    def fake_run_step(label, args):
+        with lock:
+            started_after[label] = set(finished)
+        if label == "set sealed market snapshots":
+            time.sleep(0.05)  # the slowest root must still precede set pages
+        with lock:
+            finished.append(label)
+        return 0
+
+    _stub_gate(monkeypatch, proceed=True)
+    monkeypatch.setattr(command, "_run_step", fake_run_step)
+    monkeypatch.setattr(sys, "argv", ["build_pokemon_public_snapshots.py", "--commit", "--max-workers", "4"])
+
+    command.main()
+
+    assert command.step_dependencies(
+        command.build_steps(mode_flag="--commit", days=365, window="365d", gate_forward=[])
+    )["set pages"] == [
+        "set sealed market snapshots",
+        "explore rankings",
+        "coordinated set cards and market dashboards",
+    ]
+    assert {
+        "set sealed market snapshots",
+        "explore rankings",
+        "coordinated set cards and market dashboards",
+    } <= started_after["set pages"]
+
+
+def test_critical_path_follows_the_slowest_dependency_chain():
+    steps = command.build_steps(mode_flag="--commit", days=365, window="365d", gate_forward=[])
+    durations = {
+        "set sealed market snapshots": 30.0,
+        "coordinated set cards and market dashboards": 100.0,
+        "global market set value": 10.0,
+        "global explore card movers": 5.0,
+        "explore rankings": 50.0,
+        "set pages": 40.0,
+    }
+    outcomes = [
+        command.StepOutcome(step.label, 0, started=0.0, finished=durations[step.label]) for step in steps
+    ]
+
+    seconds, path = command.critical_path(outcomes, command.step_dependencies(steps))
+
+    assert seconds == 140.0
+    assert path == ["coordinated set cards and market dashboards", "set pages"]
+
+
+def test_a_step_may_only_read_outputs_of_earlier_steps():
+    steps = [
+        command.SnapshotStep("reader", ("a.py",), inputs=("artifact",)),
+        command.SnapshotStep("writer", ("b.py",), outputs=("artifact",)),
+    ]
+
+    with pytest.raises(ValueError, match="no earlier step produces"):
+        command.step_dependencies(steps)
+
+
+def test_skip_unchanged_is_forwarded_only_to_the_per_set_builders(monkeypatch):
+    captured = {}
+    _stub_gate(monkeypatch, proceed=True)
+    monkeypatch.setattr(command, "_run_step", lambda label, args: captured.setdefault(label, args) and 0)
+    monkeypatch.setattr(sys, "argv", ["build_pokemon_public_snapshots.py", "--commit", "--skip-unchanged"])
+
+    command.main()
+
+    forwarded = sorted(label for label, args in captured.items() if "--skip-unchanged" in args)
+    assert forwarded == ["coordinated set cards and market dashboards", "set pages"]
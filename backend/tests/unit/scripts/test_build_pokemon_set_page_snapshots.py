@@ -6,7 +6,7 @@ from backend.db.services.explore_page_service import ExplorePageError
 from backend.scripts import build_pokemon_set_page_snapshots as command
 
 
-def _run(monkeypatch, *, build, argv=None, gate_mode="disabled"):
+def _run(monkeypatch, *, build, argv=None, gate_mode="disabled", target_sets=None):
     # Unit tests run in an explicitly-configured test environment, so the
     # publication gate is put in its sanctioned local/test `disabled` mode unless
     # a test wants to exercise real (required) gate behaviour.
@@ -19,7 +19,7 @@ def _run(monkeypatch, *, build, argv=None, gate_mode="disabled"):
     monkeypatch.setattr(
         command,
         "resolve_target_sets",
-        lambda _client, _args: [{"id": "set-1", "name": "Alpha"}, {"id": "set-2", "name": "Beta"}],
+        lambda _client, _args: target_sets or [{"id": "set-1", "name": "Alpha"}, {"id": "set-2", "name": "Beta"}],
     )
     monkeypatch.setattr(command, "build_set_page_snapshot_row", build)
     monkeypatch.setattr(command, "upsert_row", lambda *_a, **_k: None)
@@ -114,3 +114,88 @@ def test_cli_dry_run_reports_gate_decision_and_no_commit(monkeypatch, capsys):
     # No real writes: every upsert saw commit=False.
     assert seen_commit and all(value is False for value in seen_commit)
     assert "publication gate decision (dry-run)" in capsys.readouterr().out
+
+
+def test_parallel_build_prefetches_shared_inputs_once_and_batches_upserts(monkeypatch, capsys):
+    prefetched = []
+    contexts = set()
+    batches = []
+    context = object()
+
+    def prefetch(client):
+        prefetched.append(client)
+        return context
+
+    def build(set_row, client=None, context=None):
+        contexts.add(id(context))
+        if set_row["id"] == "set-2":
+            raise ExplorePageError(status_code=500, message="boom", code="SUMMARY_QUERY_FAILED")
+        return {"set_id": set_row["id"]}
+
+    monkeypatch.setattr(command, "prefetch_set_page_build_context", prefetch)
+    monkeypatch.setattr(
+        command,
+        "upsert_rows",
+        lambda _client, table, rows, **_k: batches.append((table, [row["set_id"] for row in rows])),
+    )
+
+    code = _run(
+        monkeypatch,
+        build=build,
+        argv=["build_pokemon_set_page_snapshots.py", "--all", "--commit", "--workers", "3", "--upsert-batch-size", "2"],
+        target_sets=[{"id": f"set-{index}", "name": str(index)} for index in range(1, 6)],
+    )
+
+    assert code == 1
+    assert len(prefetched) == 1
+    assert contexts == {id(context)}
+    written = sorted(set_id for _table, rows in batches for set_id in rows)
+    assert written == ["set-1", "set-3", "set-4", "set-5"]
+    assert all(table == "pokemon_set_page_snapshot_latest" and len(rows) <= 2 for table, rows in batches)
+    assert "built=4 skipped=0 failed=1" in capsys.readouterr().out
+
+
+def test_skip_unchanged_neither_rebuilds_nor_rewrites_a_current_page(monkeypatch, capsys):
+    from backend.scripts.snapshot_input_fingerprint import SnapshotInputFingerprint
+
+    built = []
+    written = []
+    revalidated = []
+    fingerprints = {set_id: SnapshotInputFingerprint("set_page", {"run": set_id}) for set_id in ("set-1", "set-2")}
+    stored = {"set-1": fingerprints["set-1"].value, "set-2": "fingerprint-of-an-older-run"}
+
+    monkeypatch.setattr(command, "set_page_input_fingerprint", lambda _client, set_row: fingerprints[set_row["id"]])
+    monkeypatch.setattr(
+        command,
+        "set_page_snapshot_is_current",
+        lambda _client, set_id, fingerprint: stored[set_id] == fingerprint.value,
+    )
+    monkeypatch.setattr(command, "notify_set_publication", lambda set_row, **_k: revalidated.append(set_row["id"]))
+
+    def build(set_row, client=None):
+        built.append(set_row["id"])
+        return {"set_id": set_row["id"], "payload_json": {"meta": {"snapshot": {"type": "set_page"}}}}
+
+    def run():
+        monkeypatch.setattr(command, "upsert_row", lambda _client, _table, row, **_k: written.append(row))
+        monkeypatch.setattr(sys, "argv", ["build_pokemon_set_page_snapshots.py", "--all", "--commit", "--skip-unchanged"])
+        return command.main()
+
+    monkeypatch.setattr(command, "get_client", lambda: object())
+    monkeypatch.setattr(command, "should_commit", lambda _args: True)
+    monkeypatch.setenv("PUBLICATION_GATE_MODE", "disabled")
+    monkeypatch.setattr(
+        command,
+        "resolve_target_sets",
+        lambda _client, _args: [{"id": "set-1", "name": "Alpha"}, {"id": "set-2", "name": "Beta"}],
+    )
+    monkeypatch.setattr(command, "build_set_page_snapshot_row", build)
+
+    assert run() == 0
+
+    assert built == ["set-2"]
+    assert revalidated == ["set-2"]
+    assert [row["set_id"] for row in written] == ["set-2"]
+    assert written[0]["payload_json"]["meta"]["snapshot"]["inputFingerprint"] == fingerprints["set-2"].value
+    assert written[0]["payload_json"]["meta"]["snapshot"]["type"] == "set_page"
+    assert "built=1 skipped=0 failed=0 unchanged=1" in capsys.readouterr().out
@@ -1,4 +1,5 @@
 from backend.scripts import pokemon_snapshot_builders
+from backend.tests.unit.db.services.keyset_pagination_fake import keyset_page
 from backend.scripts.set_value_scope_invariants import SetValueScopeInvariantError
 import pytest
 
@@ -34,6 +35,8 @@ class _Query:
         self.gt_filters = []
         self.lt_filters = []
         self.range_filter = None
+        self.limit_value = None
+        self.or_filters = []
         self.select_fields = None
         self.order_fields = []
 
@@ -70,6 +73,11 @@ class _Query:
         return self
 
     def limit(self, _value):
+        self.limit_value = _value
+        return self
+
+    def or_(self, filters):
+        self.or_filters.append(filters)
         return self
 
     def range(self, start, end):
@@ -88,6 +96,7 @@ class _Client:
         return _Query(table_name, self.handlers)
 
 
+
 class _RpcCall:
     def __init__(self, data):
         self.data = data
@@ -687,8 +696,7 @@ def test_ascended_heroes_coordinated_builder_paginates_top_chase_and_preserves_1
 
     def read_observations(query):
         history_queries.append(query)
-        start, end = query.range_filter
-        return observations[start : end + 1]
+        return keyset_page(observations, query)
 
     client = _Client({"card_variant_price_observations": read_observations})
     canonical_context = {
@@ -835,7 +843,9 @@ def test_ascended_heroes_coordinated_builder_paginates_top_chase_and_preserves_1
         )
     )
 
-    assert [query.range_filter for query in history_queries] == [(0, 999), (1000, 1999)]
+    assert [query.limit_value for query in history_queries] == [1000, 1000]
+    assert [len(query.or_filters) for query in history_queries] == [0, 1]
+    assert all(query.range_filter is None for query in history_queries)
     assert all(
         query.select_fields == "id,card_variant_id,condition_id,captured_at,market_price"
         for query in history_queries
@@ -880,8 +890,7 @@ def test_legacy_top_chase_observation_fallback_is_paginated():
 
     def read_observations(query):
         queries.append(query)
-        start, end = query.range_filter
-        return observations[start : end + 1]
+        return keyset_page(observations, query)
 
     histories = pokemon_snapshot_builders._load_top_chase_histories_from_observations(
         _Client({"card_variant_price_observations": read_observations}),
@@ -893,7 +902,11 @@ def test_legacy_top_chase_observation_fallback_is_paginated():
         canonical_context={},
     )
 
-    assert [query.range_filter for query in queries] == [(0, 999), (1000, 1999)]
+    assert [query.limit_value for query in queries] == [1000, 1000]
+    assert [query.or_filters for query in queries] == [
+        [],
+        ['captured_at.gt."2026-07-22T12:00:00+00:00",and(captured_at.eq."2026-07-22T12:00:00+00:00",id.gt.1000)'],
+    ]
     assert histories["legacy-variant"][-1]["date"] == "2026-07-27"
 
 
@@ -2698,3 +2711,44 @@ def test_mixed_freshness_july_16_17_25_full_contract():
 
     # Explicitly stale simulation data is permitted (present, dated, labeled).
     assert fresh["openingProfitVsCost"] == {"sourceDate": "2026-07-17", "status": "stale"}
+
+
+def test_set_pages_built_from_a_prefetched_context_read_the_leaderboard_once(monkeypatch):
+    leaderboard_reads = []
+    monkeypatch.setattr(
+        pokemon_snapshot_builders,
+        "get_explore_page_payload",
+        lambda target_type, set_id: {
+            "summary": {"calculation_run_id": f"run-{set_id}", "pack_score": 80, "mean_value": 5},
+            "top_hits": [],
+            "meta": {"warnings": []},
+        },
+    )
+    monkeypatch.setattr(
+        pokemon_snapshot_builders,
+        "get_rip_statistics_targets_payload",
+        lambda limit, **_kwargs: leaderboard_reads.append(limit) or {"targets": []},
+    )
+    client = _Client(
+        {
+            "simulation_input_cards_with_near_mint_price": lambda _query: [],
+            "simulation_input_cards": lambda _query: [],
+            "pokemon_set_cards_snapshot_latest": lambda _query: [],
+            "pokemon_explore_rankings_snapshot_latest": lambda _query: [{"updated_at": "2026-06-25T11:59:00+00:00"}],
+            "explore_rip_statistics_latest": lambda _query: [],
+            "simulation_latest_by_target": lambda _query: [],
+        }
+    )
+
+    context = pokemon_snapshot_builders.prefetch_set_page_build_context(client)
+    rows = [
+        pokemon_snapshot_builders.build_set_page_snapshot_row(
+            {"id": set_id, "name": set_id}, client=client, context=context
+        )
+        for set_id in ("set-1", "set-2")
+    ]
+
+    assert leaderboard_reads == [pokemon_snapshot_builders.DEFAULT_RANKINGS_LIMIT]
+    for row in rows:
+        completeness = row["payload_json"]["meta"]["snapshotCompleteness"]
+        assert completeness["explore_rankings_snapshot_updated_at"] == "2026-06-25T11:59:00+00:00"
@@ -634,7 +634,7 @@ def _patch_main_pipeline(monkeypatch, *, gate_allowed=True, override=False, fail
     )
     monkeypatch.setattr(refresh, "_resolve_sets", lambda _client, set_id=None: [{"id": "set-1", "canonical_key": "alpha"}])
 
-    def _build_plan(_client, *, set_rows, window):
+    def _build_plan(_client, *, set_rows, window, **_kwargs):
         plan = refresh.SetRefreshPlan(
             set_row=set_rows[0],
             cards=refresh.FreshnessResult("cards", True, "stale"),
@@ -1919,3 +1919,240 @@ def test_the_generation_comparison_never_downloads_the_cards_payload():
     # The bare column would be the whole document.
     assert "payload_json," not in columns
     assert columns != "payload_json"
+
+
+# ---------------------------------------------------------------------------
+# Set-wide planning prefetch: same verdicts as the per-set reads, far fewer
+# requests.
+# ---------------------------------------------------------------------------
+
+
+class _PostgrestTable:
+    """Just enough PostgREST to run the planner: eq/in_/order/limit/range,
+    JSON-path projections, NULLS FIRST on descending order, and a missing
+    column rejecting the whole SELECT."""
+
+    def __init__(self, db, name):
+        self._db = db
+        self._name = name
+        self._columns = []
+        self._filters = []
+        self._order = []
+        self._slice = (0, None)
+
+    def select(self, columns):
+        self._columns = [column.strip() for column in columns.split(",")]
+        return self
+
+    def eq(self, field_name, value):
+        self._filters.append((field_name, lambda actual, value=value: actual == value))
+        return self
+
+    def in_(self, field_name, values):
+        allowed = set(values)
+        self._filters.append((field_name, lambda actual: actual in allowed))
+        return self
+
+    def order(self, column, desc=False):
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, count):
+        self._slice = (self._slice[0], self._slice[0] + count)
+        return self
+
+    def range(self, start, end):
+        self._slice = (start, end + 1)
+        return self
+
+    def _project(self, row, column):
+        alias, _, path = column.partition(":")
+        if not path:
+            return column, row.get(column)
+        parts = path.replace("->>", "->").split("->")
+        value = row.get(parts[0])
+        for part in parts[1:]:
+            value = value.get(part) if isinstance(value, dict) else None
+        return alias, value
+
+    def execute(self):
+        self._db["requests"].append(self._name)
+        missing = self._db["missing_columns"].get(self._name, set())
+        if any(column.partition(":")[0] in missing for column in self._columns):
+            raise RuntimeError(f"column {self._name} does not exist")
+        rows = [
+            row for row in self._db["tables"].get(self._name, [])
+            if all(check(row.get(field_name)) for field_name, check in self._filters)
+        ]
+        for column, desc in reversed(self._order):
+            present = sorted((row for row in rows if row.get(column) is not None), key=lambda row: row[column], reverse=desc)
+            nulls = [row for row in rows if row.get(column) is None]
+            rows = nulls + present if desc else present + nulls
+        rows = rows[self._slice[0]:self._slice[1]]
+        data = [dict(self._project(row, column) for column in self._columns) for row in rows]
+        return type("Result", (), {"data": data})()
+
+
+class _PostgrestClient:
+    def __init__(self, tables, missing_columns=None):
+        self.db = {"tables": tables, "missing_columns": missing_columns or {}, "requests": []}
+
+    def table(self, name):
+        return _PostgrestTable(self.db, name)
+
+
+def _snapshot_meta(generation_id):
+    return {
+        "snapshot": {
+            "movementContractVersion": "v1",
+            "generationId": generation_id,
+            "windowConvention": "trailing",
+            "movementAsOfDate": "2026-06-20",
+            "builtAt": "2026-06-21T00:00:00+00:00",
+        }
+    }
+
+
+def _planning_tables():
+    tables = {
+        "cards": [], "pokemon_canonical_cards": [], "card_variants": [],
+        "card_variant_price_observations": [], "pokemon_canonical_card_market_prices_latest": [],
+        "pokemon_set_cards_snapshot_latest": [], "pokemon_set_market_dashboard_snapshot_latest": [],
+        "pokemon_set_page_snapshot_latest": [], "explore_rip_statistics_latest": [],
+        "simulation_latest_by_target": [], "pokemon_set_value_daily_history": [],
+        "pokemon_desirability_composite_scores": [{"updated_at": "2026-06-01T00:00:00+00:00"}],
+        "pokemon_explore_rankings_snapshot_latest": [
+            {"tcg": "pokemon", "scope": "rip-statistics", "updated_at": "2026-06-22T00:00:00+00:00"}
+        ],
+    }
+    for index in range(1, 5):
+        set_id = f"set-{index}"
+        tables["cards"].append({
+            "id": f"card-{index}", "set_id": set_id,
+            "updated_at": "2026-06-10T00:00:00+00:00", "created_at": "2026-06-01T00:00:00+00:00",
+        })
+        # set-2 has one card with no updated_at: DESC sorts it first, so its
+        # cards watermark falls through to created_at.
+        tables["cards"].append({
+            "id": f"card-{index}b", "set_id": set_id,
+            "updated_at": None if index == 2 else "2026-06-11T00:00:00+00:00",
+            "created_at": "2026-06-23T00:00:00+00:00",
+        })
+        tables["pokemon_canonical_cards"].append({"id": f"canon-{index}", "set_id": set_id, "created_at": "2026-06-05T00:00:00+00:00"})
+        tables["card_variants"].append({"id": f"variant-{index}", "card_id": f"card-{index}", "updated_at": "2026-06-10T00:00:00+00:00"})
+        tables["card_variant_price_observations"].append({
+            "card_variant_id": f"variant-{index}",
+            "captured_at": f"2026-06-1{index}T00:00:00+00:00",
+        })
+        tables["pokemon_canonical_card_market_prices_latest"].append({
+            "set_id": set_id, "canonical_card_id": f"canon-{index}", "card_variant_id": f"variant-{index}", "market_price": 4.0,
+        })
+        tables["pokemon_set_value_daily_history"].append({
+            "set_id": set_id, "value_scope": "standard", "snapshot_date": "2026-06-20",
+            "updated_at": "2026-06-20T12:00:00+00:00",
+        })
+        tables["simulation_latest_by_target"].append({
+            "target_type": "set", "target_id": set_id, "calculation_run_id": f"run-{index}",
+            "run_at": "2026-06-19T00:00:00+00:00",
+        })
+        if index != 4:  # set-4 has no snapshots at all
+            tables["pokemon_set_cards_snapshot_latest"].append({
+                "set_id": set_id,
+                "cards_json": [{"marketPrice": 4.0, "movement7d": {"percentChange": 1.0}}],
+                "card_count": 1,
+                "payload_json": {"meta": _snapshot_meta(f"gen-{index}"), "cardAppealMarketPriceCorrelation": {"pearson": 0.4}},
+                "updated_at": "2026-06-22T00:00:00+00:00",
+            })
+            tables["pokemon_set_market_dashboard_snapshot_latest"].append({
+                "set_id": set_id,
+                "window_key": "365d",
+                # set-3's dashboard belongs to an older cards generation.
+                "payload_json": {
+                    "meta": {
+                        **_snapshot_meta("gen-old" if index == 3 else f"gen-{index}"),
+                        "setValueHistoryLatestDateByScope": {"standard": "2026-06-20"},
+                    }
+                },
+                "latest_market_date": "2026-06-20",
+                "updated_at": "2026-06-22T00:00:00+00:00",
+            })
+            tables["pokemon_set_page_snapshot_latest"].append({
+                "set_id": set_id,
+                "payload_json": {
+                    "summary": {"pack_rank": 2} if index == 1 else {},
+                    "meta": {"snapshotCompleteness": {"explore_rankings_snapshot_updated_at": "x"}, "warnings": []},
+                },
+                "updated_at": "2026-06-22T00:00:00+00:00",
+            })
+    return tables
+
+
+def _plan_verdicts(client, *, prefetch, monkeypatch):
+    monkeypatch.setattr(
+        refresh, "_global_snapshot_staleness", lambda _c, *, family: refresh.FreshnessResult(family, False, "fresh")
+    )
+    set_rows = [{"id": f"set-{index}", "canonical_key": f"key{index}"} for index in range(1, 5)]
+    plans, _rankings, _validation, _checks = refresh._build_plan(client, set_rows=set_rows, window="365d", prefetch=prefetch)
+    return [
+        (
+            plan.set_row["id"],
+            [(result.stale, result.reason, result.snapshot_updated_at, result.max_dependency_updated_at)
+             for result in (plan.cards, plan.market_dashboard, plan.set_page)],
+        )
+        for plan in plans
+    ]
+
+
+def test_prefetched_planning_reaches_the_per_set_verdicts_with_fewer_requests(monkeypatch):
+    missing = {"simulation_latest_by_target": {"updated_at"}}
+    per_set = _PostgrestClient(_planning_tables(), missing)
+    prefetched = _PostgrestClient(_planning_tables(), missing)
+
+    expected = _plan_verdicts(per_set, prefetch=False, monkeypatch=monkeypatch)
+    actual = _plan_verdicts(prefetched, prefetch=True, monkeypatch=monkeypatch)
+
+    assert actual == expected
+    assert dict(expected)["set-3"][1][:2] == (True, "cards and market dashboard generation IDs differ")
+    assert dict(expected)["set-4"][0][:2] == (True, "snapshot row missing")
+    # The NULL updated_at makes set-2 read its cards watermark from created_at.
+    assert dict(expected)["set-2"][0][3] == "2026-06-23T00:00:00+00:00"
+    assert len(prefetched.db["requests"]) < len(per_set.db["requests"])
+    for table in ("pokemon_set_cards_snapshot_latest", "pokemon_set_page_snapshot_latest", "cards"):
+        assert prefetched.db["requests"].count(table) < per_set.db["requests"].count(table)
+    assert refresh._PLANNING_SOURCE_INDEX is None
+
+
+def test_a_failed_set_wide_read_falls_back_to_per_set_reads(monkeypatch):
+    client = _PostgrestClient(_planning_tables())
+    original_execute = _PostgrestTable.execute
+
+    def execute(query):
+        if query._name == "pokemon_set_page_snapshot_latest" and query._slice == (0, refresh.PLANNING_PREFETCH_PAGE_SIZE):
+            raise RuntimeError("statement timeout")
+        return original_execute(query)
+
+    monkeypatch.setattr(_PostgrestTable, "execute", execute)
+    verdicts = dict(_plan_verdicts(client, prefetch=True, monkeypatch=monkeypatch))
+
+    # A failed chunk is not "snapshot row missing" for every set in it.
+    assert verdicts["set-1"][2][1] != "snapshot row missing"
+    assert verdicts["set-4"][2][1] == "snapshot row missing"
+
+
+def test_prefetched_timestamps_follow_descending_nulls_first_order():
+    index = refresh.PlanningSourceIndex()
+    source = refresh.PlanningSource("cards", "set_id,updated_at", order_by=("updated_at",))
+    index.sources[("cards", "set_id,updated_at")] = (
+        source, {"set-1": [{"updated_at": "2026-06-01T00:00:00+00:00"}, {"updated_at": None}]}
+    )
+    index.sources[("cards", "set_id,created_at")] = (
+        source, {"set-1": [{"created_at": "2026-05-01T00:00:00+00:00"}, {"created_at": "2026-05-02T00:00:00.25+00:00"}]}
+    )
+
+    latest, checks = index.latest_timestamp("cards", ("updated_at", "created_at"), (("set_id", "set-1"),), ())
+
+    assert latest == "2026-05-02T00:00:00.25+00:00"
+    assert checks == ["cards.updated_at: ok", "cards.created_at: ok"]
+    # Anything the prefetch did not read verbatim is left to the per-set read.
+    assert index.latest_timestamp("cards", ("updated_at",), (("set_id", "set-9"),), ()) is None
+    assert index.latest_timestamp("cards", ("updated_at",), (("set_id", "set-1"), ("extra", 1)), ()) is None
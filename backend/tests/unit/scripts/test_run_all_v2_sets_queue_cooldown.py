@@ -113,3 +113,24 @@ def test_the_queue_still_attempts_every_set_after_a_transient_failure(batch_harn
 
     assert len(orchestrator.calls) == 3
     assert [result["success"] for result in results] == [False, True, True]
+
+
+def test_a_pool_worker_reuses_its_warm_orchestrator_across_sets(monkeypatch):
+    class _V2Config(_Config):
+        USE_MONTE_CARLO_V2 = True
+
+    built = []
+    orchestrator = _Orchestrator([None, RuntimeError("Missing required field: pack_cost")])
+    stub = types.ModuleType("backend.jobs.evr_runner")
+    stub.EVRRunOrchestrator = lambda: built.append(True) or orchestrator
+    monkeypatch.setitem(sys.modules, "backend.jobs.evr_runner", stub)
+    monkeypatch.setattr(batch, "notify_slack", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(batch, "discover_sets", lambda: {"set1": _V2Config, "set2": _V2Config})
+    monkeypatch.setattr(batch, "_WORKER_ORCHESTRATOR", None)
+
+    first = batch.run_set_in_worker("set1")
+    second = batch.run_set_in_worker("set2")
+
+    assert [result["success"] for result in first + second] == [True, False]
+    assert orchestrator.calls == ["set1", "set2"]
+    assert built == [True]
@@ -6,6 +6,8 @@ No subprocess is ever launched — the command runners are injected.
 """
 
 import copy
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import pytest
 
@@ -1037,3 +1039,81 @@ def test_the_public_rip_audit_selects_exactly_the_three_contract_columns(patched
 
     selects = [op[2] for op in client.ops if op[0] == "select" and op[1] == "explore_rip_statistics_latest"]
     assert selects == ["set_id,calculation_run_id,financial_rip_v3_score_version"]
+
+
+# --------------------------------------------------------------------------- #
+# Pool mode: warm worker processes instead of one subprocess per set
+# --------------------------------------------------------------------------- #
+class _InlinePool(ThreadPoolExecutor):
+    """Stands in for the process pool: same submit/initializer contract, no spawn."""
+
+    created = []
+
+    def __init__(self, max_workers, mp_context=None, initializer=None):
+        super().__init__(max_workers=max_workers, initializer=initializer)
+        _InlinePool.created.append(max_workers)
+
+
+@pytest.fixture
+def inline_pool(monkeypatch):
+    from backend.scripts import run_all_v2_sets
+
+    _InlinePool.created = []
+    warmed = []
+    monkeypatch.setattr(orchestrator, "ProcessPoolExecutor", _InlinePool)
+    monkeypatch.setattr(run_all_v2_sets, "warm_simulation_worker", lambda: warmed.append(True))
+    return run_all_v2_sets, warmed
+
+
+def test_pool_mode_isolates_a_failing_set_and_keeps_the_outcome_order(monkeypatch, inline_pool):
+    run_all_v2_sets, warmed = inline_pool
+
+    def fake_run_set(set_key):
+        if set_key == "beta":
+            return [{"set": set_key, "success": False, "error": "Missing pack_cost", "duration": 1.0}]
+        if set_key == "gamma":
+            raise RuntimeError("worker-side bug")
+        return [{"set": set_key, "success": True, "error": None, "duration": 2.5}]
+
+    monkeypatch.setattr(run_all_v2_sets, "run_set_in_worker", fake_run_set)
+
+    outcomes = orchestrator.run_simulations_for_sets(["alpha", "beta", "gamma", "delta"], workers=8)
+
+    assert [outcome.canonical_key for outcome in outcomes] == ["alpha", "beta", "gamma", "delta"]
+    assert [outcome.succeeded for outcome in outcomes] == [True, False, False, True]
+    assert outcomes[0].duration_seconds == 2.5
+    assert outcomes[1].reason == "run_all_v2_sets failed: Missing pack_cost"
+    assert "RuntimeError" in outcomes[2].reason
+    # Never more workers than sets; every worker warmed once.
+    assert _InlinePool.created == [4]
+    assert 1 <= len(warmed) <= 4
+
+
+def test_sets_orphaned_by_a_broken_pool_rerun_in_isolated_subprocesses(monkeypatch, inline_pool):
+    run_all_v2_sets, _warmed = inline_pool
+    commands = []
+
+    def fake_run_set(set_key):
+        if set_key in {"beta", "gamma"}:
+            raise BrokenProcessPool("a worker died")
+        return [{"set": set_key, "success": True, "duration": 1.0}]
+
+    monkeypatch.setattr(run_all_v2_sets, "run_set_in_worker", fake_run_set)
+    def fake_run_command(command, **_kwargs):
+        commands.append(command[-1])
+        return 1 if command[-1] == "gamma" else 0
+
+    monkeypatch.setattr(orchestrator, "_run_command", fake_run_command)
+
+    outcomes = orchestrator.run_simulations_for_sets(["alpha", "beta", "gamma"], workers=2)
+
+    assert commands == ["beta", "gamma"]
+    assert [outcome.succeeded for outcome in outcomes] == [True, True, False]
+    assert outcomes[2].reason == "run_all_v2_sets exited 1"
+
+
+def test_default_simulation_workers_leave_one_core_free(monkeypatch):
+    monkeypatch.setattr(orchestrator.os, "cpu_count", lambda: 8)
+    assert orchestrator.default_simulation_workers() == 7
+    monkeypatch.setattr(orchestrator.os, "cpu_count", lambda: None)
+    assert orchestrator.default_simulation_workers() == 1
@@ -6,6 +6,9 @@ as trigger_source=scheduled.
 """
 
 import os
+import threading
+import time
+from types import SimpleNamespace
 
 import pytest
 
@@ -262,3 +265,91 @@ def test_failed_set_finalizes_then_worker_continues(monkeypatch):
     dispatcher.dispatch_next_scrape_job()
     assert [call[0][0] for call in calls] == [1, 2]
     assert [call[1]["final_status"] for call in calls] == ["failed", "completed"]
+
+
+def test_concurrent_workers_share_one_limiter_and_honour_max_jobs(monkeypatch):
+    import threading
+
+    from backend.Scraper.clients import shared_rate_limiter
+
+    monkeypatch.setenv("SCRAPE_DISPATCHER_WORKERS", "3")
+    monkeypatch.setenv("SCRAPE_DRAIN_MAX_JOBS", "4")
+    monkeypatch.setenv("MAX_HTTP_REQUESTS_PER_RUN", "123")
+    jobs = iter({"id": job_id, "set_id": f"set-{job_id}", "market_date": "2026-07-18"} for job_id in range(1, 10))
+    claimed_by = []
+    monkeypatch.setattr(dispatcher, "claim_next_scrape_job",
+                        lambda worker_id=None, **_kwargs: claimed_by.append(worker_id) or next(jobs))
+    both_running = threading.Barrier(2, timeout=5)
+    limiters, processed = set(), []
+
+    def process(job, _date):
+        limiters.add(id(shared_rate_limiter.active_shared_rate_limiter()))
+        if job["id"] <= 2:
+            both_running.wait()  # two jobs are in flight at the same time
+        processed.append(job["id"])
+
+    monkeypatch.setattr(dispatcher, "_process_claimed_job", process)
+    monkeypatch.setattr(dispatcher, "_run_idle_completion_check",
+                        lambda *_args: pytest.fail("the queue was never empty"))
+
+    assert dispatcher.dispatch_next_scrape_job() == 0
+    assert sorted(processed) == [1, 2, 3, 4]
+    assert len(claimed_by) == 4 and all(":w" in worker for worker in claimed_by)
+    assert len(limiters) == 1 and shared_rate_limiter.active_shared_rate_limiter() is None
+
+
+def test_concurrent_workers_stop_claiming_once_the_shared_budget_is_spent(monkeypatch):
+    monkeypatch.setenv("SCRAPE_DISPATCHER_WORKERS", "2")
+    monkeypatch.setenv("SCRAPE_DRAIN_MAX_JOBS", "10")
+    monkeypatch.setenv("MAX_HTTP_REQUESTS_PER_RUN", "2")
+    jobs = iter({"id": job_id, "set_id": "a", "market_date": "2026-07-18"} for job_id in range(1, 10))
+    monkeypatch.setattr(dispatcher, "claim_next_scrape_job", lambda **_kwargs: next(jobs))
+
+    def process(job, _date):
+        from backend.Scraper.clients.shared_rate_limiter import active_shared_rate_limiter
+
+        limiter = active_shared_rate_limiter()
+        while limiter.acquire():
+            pass
+
+    monkeypatch.setattr(dispatcher, "_process_claimed_job", process)
+    monkeypatch.setattr(dispatcher, "_run_idle_completion_check", lambda *_args: {"requeued": 0})
+    dispatcher.dispatch_next_scrape_job()
+
+    # The first job spends the whole run's budget; at most the job claimed
+    # concurrently with it also runs, and nothing is claimed afterwards.
+    assert next(jobs)["id"] <= 3
+
+
+def test_heartbeat_retries_transient_errors_and_stops_only_when_the_job_is_gone(monkeypatch):
+    class _ImmediateEvent:
+        def __init__(self):
+            self.flag = False
+
+        def set(self):
+            self.flag = True
+
+        def wait(self, _timeout=None):
+            return self.flag
+
+    replies = iter([RuntimeError("503 gateway"), {"id": 5}, None])
+    calls = []
+
+    def heartbeat(job_id, **kwargs):
+        calls.append(kwargs.get("raise_errors"))
+        reply = next(replies)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    monkeypatch.setattr(dispatcher, "threading", SimpleNamespace(Event=_ImmediateEvent, Thread=threading.Thread))
+    monkeypatch.setattr(dispatcher, "heartbeat_scrape_job", heartbeat)
+
+    with dispatcher._job_heartbeat(5, "worker", 90):
+        for _ in range(200):
+            if len(calls) == 3:
+                break
+            time.sleep(0.01)
+        time.sleep(0.05)  # a thread that kept beating would call a fourth time
+
+    assert calls == [True, True, True]
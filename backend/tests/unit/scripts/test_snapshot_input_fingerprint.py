@@ -0,0 +1,204 @@
+import types
+
+from backend.scripts import snapshot_input_fingerprint as fingerprints
+
+
+class _Query:
+    def __init__(self, client, table):
+        self._client = client
+        self._table = table
+        self._filters = []
+        self._order = None
+
+    def select(self, _columns):
+        return self
+
+    def eq(self, field, value):
+        self._filters.append((field, value))
+        return self
+
+    def order(self, field, desc=False):
+        self._order = (field, desc)
+        return self
+
+    def limit(self, _count):
+        return self
+
+    def execute(self):
+        if self._table in self._client.failing:
+            raise RuntimeError(f"{self._table} unavailable")
+        rows = [
+            row
+            for row in self._client.tables.get(self._table, [])
+            if all(str(row.get(field)) == str(value) for field, value in self._filters if field in row)
+        ]
+        if self._order is not None:
+            field, desc = self._order
+            rows.sort(key=lambda row: str(row.get(field) or ""), reverse=desc)
+        return types.SimpleNamespace(data=rows)
+
+
+class _Client:
+    def __init__(self, tables, failing=()):
+        self.tables = tables
+        self.failing = set(failing)
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+def _market_tables(**overrides):
+    tables = {
+        "pokemon_canonical_card_market_prices_latest": [
+            {"set_id": "set-1", "card_variant_id": "v-1", "market_price": 4.5, "captured_at": "2026-08-01",
+             "refreshed_at": "2026-08-02T01:00:00Z"},
+            {"set_id": "set-1", "card_variant_id": "v-2", "market_price": 12.0, "captured_at": "2026-08-01",
+             "refreshed_at": "2026-08-02T01:00:00Z"},
+        ],
+        "pokemon_set_value_daily_history": [
+            {"set_id": "set-1", "snapshot_date": "2026-08-01", "updated_at": "2026-08-02T00:00:00Z"},
+        ],
+        "calculation_history_trend": [
+            {"target_type": "set", "target_id": "set-1", "snapshot_date": "2026-07-30", "calculation_run_id": "run-1"},
+        ],
+        "explore_rip_statistics_latest": [{"set_id": "set-1", "calculation_run_id": "run-1", "run_at": "2026-07-30"}],
+    }
+    tables.update(overrides)
+    return tables
+
+
+def _market_fingerprint(client):
+    return fingerprints.coordinated_market_input_fingerprint(
+        client, {"id": "set-1", "name": "Alpha"}, days=365, window="365d"
+    )
+
+
+def test_market_fingerprint_ignores_refresh_timestamps_and_row_order():
+    tables = _market_tables()
+    baseline = _market_fingerprint(_Client(tables)).value
+
+    refreshed = [dict(row, refreshed_at="2026-08-03T01:00:00Z") for row in reversed(tables[
+        "pokemon_canonical_card_market_prices_latest"
+    ])]
+
+    assert _market_fingerprint(_Client(_market_tables(
+        pokemon_canonical_card_market_prices_latest=refreshed
+    ))).value == baseline
+
+
+def test_market_fingerprint_changes_with_a_selected_price_or_a_new_run():
+    baseline = _market_fingerprint(_Client(_market_tables())).value
+    repriced = [
+        dict(row, market_price=5.0 if row["card_variant_id"] == "v-1" else row["market_price"])
+        for row in _market_tables()["pokemon_canonical_card_market_prices_latest"]
+    ]
+    rerun = [{"set_id": "set-1", "calculation_run_id": "run-2", "run_at": "2026-08-02"}]
+
+    assert _market_fingerprint(_Client(_market_tables(
+        pokemon_canonical_card_market_prices_latest=repriced
+    ))).value != baseline
+    assert _market_fingerprint(_Client(_market_tables(explore_rip_statistics_latest=rerun))).value != baseline
+
+
+def test_an_unreadable_source_yields_no_fingerprint_so_the_set_rebuilds():
+    client = _Client(_market_tables(), failing={"pokemon_set_value_daily_history"})
+
+    fingerprint = _market_fingerprint(client)
+
+    assert fingerprint is None
+    assert not fingerprints.coordinated_market_snapshots_are_current(client, "set-1", fingerprint, window="365d")
+
+
+def test_stamped_fingerprint_is_what_the_next_run_compares_against():
+    fingerprint = _market_fingerprint(_Client(_market_tables()))
+    row = {"set_id": "set-1", "payload_json": {"meta": {"snapshot": {"generationId": "g-1"}}}}
+
+    stamped = fingerprints.stamp_input_fingerprint(row, fingerprint)
+
+    snapshot_meta = stamped["payload_json"]["meta"]["snapshot"]
+    assert snapshot_meta["generationId"] == "g-1"
+    assert snapshot_meta["inputFingerprint"] == fingerprint.value
+    assert "inputFingerprint" not in row["payload_json"]["meta"]["snapshot"]
+
+
+def _set_page_tables(**overrides):
+    tables = {
+        "explore_rip_statistics_latest": [{"set_id": "set-1", "calculation_run_id": "run-1", "run_at": "2026-07-30"}],
+        "pokemon_explore_rankings_snapshot_latest": [
+            {
+                "tcg": "pokemon",
+                "scope": "rip-statistics",
+                "updated_at": "2026-08-02T03:00:00Z",
+                "ranking_payload_json": {"targets": [{"target_id": "set-1", "rank": 2}, {"target_id": "set-2", "rank": 1}]},
+            }
+        ],
+        "pokemon_set_cards_snapshot_latest": [
+            {"set_id": "set-1", "input_fingerprint": "market-a", "generation_id": "g-1"},
+        ],
+        "pokemon_set_market_dashboard_snapshot_latest": [
+            {"set_id": "set-1", "window_key": "365d", "input_fingerprint": "market-a", "generation_id": "g-2"},
+        ],
+    }
+    tables.update(overrides)
+    return tables
+
+
+def _set_page_fingerprint(client, **kwargs):
+    return fingerprints.set_page_input_fingerprint(client, {"id": "set-1", "name": "Alpha"}, **kwargs)
+
+
+def test_set_page_fingerprint_ignores_rewrites_that_carry_the_same_content():
+    baseline = _set_page_fingerprint(_Client(_set_page_tables())).value
+    tables = _set_page_tables()
+    rankings_row = dict(tables["pokemon_explore_rankings_snapshot_latest"][0], updated_at="2026-08-03T03:00:00Z")
+    cards_row = dict(tables["pokemon_set_cards_snapshot_latest"][0], generation_id="g-3")
+    dashboard_row = dict(tables["pokemon_set_market_dashboard_snapshot_latest"][0], generation_id="g-4")
+
+    assert _set_page_fingerprint(_Client(_set_page_tables(
+        pokemon_explore_rankings_snapshot_latest=[rankings_row],
+        pokemon_set_cards_snapshot_latest=[cards_row],
+        pokemon_set_market_dashboard_snapshot_latest=[dashboard_row],
+    ))).value == baseline
+
+
+def test_set_page_fingerprint_changes_with_a_rank_or_a_market_rebuild_from_new_inputs():
+    baseline = _set_page_fingerprint(_Client(_set_page_tables())).value
+    tables = _set_page_tables()
+    reranked = dict(
+        tables["pokemon_explore_rankings_snapshot_latest"][0],
+        ranking_payload_json={"targets": [{"target_id": "set-1", "rank": 1}, {"target_id": "set-2", "rank": 2}]},
+    )
+    repriced_cards = dict(tables["pokemon_set_cards_snapshot_latest"][0], input_fingerprint="market-b")
+    unstamped_cards = {"set_id": "set-1", "generation_id": "g-1"}
+
+    assert _set_page_fingerprint(_Client(_set_page_tables(
+        pokemon_explore_rankings_snapshot_latest=[reranked]
+    ))).value != baseline
+    assert _set_page_fingerprint(_Client(_set_page_tables(
+        pokemon_set_cards_snapshot_latest=[repriced_cards]
+    ))).value != baseline
+    assert _set_page_fingerprint(_Client(_set_page_tables(
+        pokemon_set_cards_snapshot_latest=[unstamped_cards]
+    ))).value != baseline
+
+
+def test_set_page_fingerprint_hashes_the_prefetched_leaderboard_and_its_failure():
+    client = _Client(_set_page_tables(), failing={"pokemon_explore_rankings_snapshot_latest"})
+    context = fingerprints.SetPageBuildContext(
+        rankings_payload={"targets": [{"target_id": "set-1", "rank": 2}], "meta": {"warnings": []}},
+        rankings_error=None,
+        rankings_snapshot_updated_at="2026-08-02T03:00:00Z",
+    )
+    later_context = fingerprints.SetPageBuildContext(
+        rankings_payload={"targets": [{"target_id": "set-1", "rank": 2}], "meta": {"warnings": ["late"]}},
+        rankings_error=None,
+        rankings_snapshot_updated_at="2026-08-03T03:00:00Z",
+    )
+    failed_context = fingerprints.SetPageBuildContext(
+        rankings_payload=None, rankings_error=RuntimeError("leaderboard unavailable"), rankings_snapshot_updated_at=None
+    )
+
+    assert _set_page_fingerprint(client, context=context).value == _set_page_fingerprint(
+        client, context=later_context
+    ).value
+    assert _set_page_fingerprint(client, context=failed_context) is None
@@ -0,0 +1,95 @@
+"""Set-parallel snapshot fan-out: per-thread clients, batch-level write
+failures and the consecutive-transient-failure circuit breaker."""
+
+import threading
+
+from postgrest.exceptions import APIError
+
+from backend.db.services import explore_page_service
+from backend.scripts import snapshot_set_fanout as fanout
+
+
+def _sets(count):
+    return [{"id": f"set-{index}"} for index in range(count)]
+
+
+def _no_wait_retry(monkeypatch):
+    real_retry = fanout.run_snapshot_operation_with_retry
+    monkeypatch.setattr(
+        fanout,
+        "run_snapshot_operation_with_retry",
+        lambda operation, **kwargs: real_retry(
+            operation, **kwargs, sleep=lambda _delay: None, jitter=lambda _start, _end: 0
+        ),
+    )
+
+
+def test_service_reads_resolve_on_the_client_of_the_calling_workers_attempt():
+    seen = {}
+    barrier = threading.Barrier(3, timeout=5)
+    clients = iter(range(100))
+
+    class _Client:
+        def __init__(self):
+            self.name = f"client-{next(clients)}"
+
+    def build(set_row, fresh_client):
+        barrier.wait()  # every set is in flight at once
+        seen[set_row["id"]] = (explore_page_service.public_read_client.name, fresh_client.name)
+        return set_row["id"]
+
+    original = explore_page_service.public_read_client
+    outcomes = fanout.run_set_fanout(
+        _sets(3), build, lambda _client, _values: None, workers=3, operation_name="test", client_factory=_Client
+    )
+
+    assert all(outcome.built for outcome in outcomes)
+    assert all(service_client == own_client for service_client, own_client in seen.values())
+    assert len({own_client for _service_client, own_client in seen.values()}) == 3
+    assert explore_page_service.public_read_client is original
+
+
+def test_a_failed_batch_write_fails_only_the_sets_in_that_batch(monkeypatch):
+    _no_wait_retry(monkeypatch)
+    written = []
+
+    def write_batch(_client, values):
+        if "set-0" in values:
+            raise RuntimeError("payload rejected")
+        written.extend(values)
+
+    outcomes = fanout.run_set_fanout(
+        _sets(4),
+        lambda set_row, _client: set_row["id"],
+        write_batch,
+        workers=1,
+        operation_name="test",
+        batch_size=2,
+        client_factory=object,
+    )
+
+    assert [outcome.built for outcome in outcomes] == [False, False, True, True]
+    assert written == ["set-2", "set-3"]
+
+
+def test_consecutive_transient_failures_abandon_the_sets_not_yet_started(monkeypatch):
+    _no_wait_retry(monkeypatch)
+    attempted = []
+
+    def build(set_row, _client):
+        attempted.append(set_row["id"])
+        raise APIError({"message": "schema cache unavailable", "code": "PGRST002", "hint": None, "details": None})
+
+    outcomes = fanout.run_set_fanout(
+        _sets(5),
+        build,
+        lambda _client, _values: None,
+        workers=1,
+        operation_name="test",
+        max_consecutive_transient_failures=2,
+        client_factory=object,
+    )
+
+    assert [outcome.error is not None for outcome in outcomes[:2]] == [True, True]
+    assert sorted(set(attempted)) == ["set-0", "set-1"]
+    assert all(outcome.not_attempted for outcome in outcomes[2:])
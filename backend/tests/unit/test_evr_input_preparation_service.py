@@ -376,3 +376,91 @@ def test_prepare_for_set_rejects_prismatic_when_non_pattern_base_pools_are_empty
     with patch("builtins.print"):
         with pytest.raises(ValueError, match="Prismatic Evolutions input contract violated"):
             service.prepare_for_set(PrismaticConfig(), "prismaticEvolutions", "Prismatic Evolutions")
+
+
+def test_prepare_for_set_serves_cached_inputs_until_price_ingestion(tmp_path, monkeypatch):
+    from backend.db.services.evr_input_cache import EVRInputCache, INPUT_CACHE_DIR_ENV, record_evr_price_ingestion
+
+    monkeypatch.setenv(INPUT_CACHE_DIR_ENV, str(tmp_path))
+    repository = Mock()
+    transformer = Mock()
+    repository.resolve_set_id.return_value = "set-uuid"
+    repository.load_price_watermark.return_value = {"card_price_captured_at": "2026-10-18T20:00:00+00:00"}
+    repository.load_inputs.return_value = {"set": {"id": "set-uuid"}, "diagnostics": {"total_cards_loaded": 1}}
+    transformer.transform.return_value = {"card_rows": [], "diagnostics": {}}
+    transformer.to_legacy_calculator_payload.return_value = {
+        "dataframe": pd.DataFrame(
+            [{"Card Name": "Charizard", "Rarity": "rare", "Price ($)": 100.0, "Reverse Variant Price ($)": 90.0}]
+        ),
+        "pack_price": 6.0,
+        "etb_variants": {"standard": {"etb_price": 55.0}},
+        "diagnostics": {},
+    }
+    service = EVRInputPreparationService(repository=repository, transformer=transformer, cache=EVRInputCache(tmp_path))
+
+    with patch("builtins.print"):
+        first = service.prepare_for_set(Config(), "base", "Base")
+        second = service.prepare_for_set(Config(), "base", "Base")
+        assert repository.load_inputs.call_count == 1
+        pd.testing.assert_frame_equal(second["dataframe"], first["dataframe"])
+        assert second["etb_variants"] == {"standard": {"etb_price": 55.0}}
+
+        service.prepare_for_set(Config(), "base", "Base", refresh_inputs=True)
+        assert repository.load_inputs.call_count == 2
+
+        record_evr_price_ingestion("set-uuid")
+        service.prepare_for_set(Config(), "base", "Base")
+        assert repository.load_inputs.call_count == 3
+
+        service.prepare_for_set(Config(), "base", "Base")
+        assert repository.load_inputs.call_count == 3
+
+        # Prices ingested by another worker, without this cache directory.
+        repository.load_price_watermark.return_value = {"card_price_captured_at": "2026-10-19T20:00:00+00:00"}
+        service.prepare_for_set(Config(), "base", "Base")
+        assert repository.load_inputs.call_count == 4
+
+
+def test_cache_hits_replay_the_input_diagnostics_and_key_on_the_phoenix_market_date(tmp_path, monkeypatch):
+    from datetime import datetime, timezone
+
+    from backend.db.services import evr_input_cache, evr_input_preparation_service
+    from backend.db.services.evr_input_cache import EVRInputCache
+
+    repository = Mock()
+    transformer = Mock()
+    repository.resolve_set_id.return_value = "set-uuid"
+    repository.load_price_watermark.return_value = {"card_price_captured_at": "2026-10-18T20:00:00+00:00"}
+    repository.load_inputs.return_value = {"set": {"id": "set-uuid"}, "diagnostics": {"total_cards_loaded": 151}}
+    transformer.transform.return_value = {"card_rows": [], "diagnostics": {}}
+    transformer.to_legacy_calculator_payload.return_value = {
+        "dataframe": pd.DataFrame(
+            [{"Card Name": "Charizard", "Rarity": "rare", "Price ($)": 100.0, "Reverse Variant Price ($)": 90.0}]
+        ),
+        "pack_price": 6.0,
+        "diagnostics": {},
+    }
+    service = EVRInputPreparationService(repository=repository, transformer=transformer, cache=EVRInputCache(tmp_path))
+    emitted = []
+    monkeypatch.setattr(evr_input_preparation_service, "debug_print", emitted.append)
+
+    from backend.Scraper.helpers.market_date_helper import resolve_phoenix_market_date
+
+    clock = [datetime(2026, 10, 18, 20, 0, tzinfo=timezone.utc)]
+    monkeypatch.setattr(evr_input_cache, "resolve_phoenix_market_date", lambda: resolve_phoenix_market_date(clock[0]))
+
+    with patch("builtins.print"):
+        first = service.prepare_for_set(Config(), "base", "Base")
+        emitted.clear()
+        # 05:00 UTC the next day is still 2026-10-18 in Phoenix.
+        clock[0] = datetime(2026, 10, 19, 5, 0, tzinfo=timezone.utc)
+        second = service.prepare_for_set(Config(), "base", "Base")
+        assert repository.load_inputs.call_count == 1
+        pd.testing.assert_frame_equal(second["dataframe"], first["dataframe"])
+        diagnostics_lines = [line for line in emitted if line.startswith("[DB_INPUT_DIAGNOSTICS]")]
+        assert len(diagnostics_lines) == 1 and '"total_cards_loaded": 151' in diagnostics_lines[0]
+        assert any(line.startswith("[DB_INPUT_ROW_AUDIT]") for line in emitted)
+
+        clock[0] = datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)
+        service.prepare_for_set(Config(), "base", "Base")
+        assert repository.load_inputs.call_count == 2
@@ -0,0 +1,218 @@
+"""Process-local metrics registry rendered in the Prometheus text format.
+
+Counters and fixed-bucket histograms only - the two shapes the API needs to
+answer "what are p50/p99 per route in production" without re-running a
+performance audit. No client library dependency: a scrape renders the current
+state of every metric, and quantiles are computed by the scraper from the
+cumulative buckets as usual.
+
+Usage:
+    from backend.utils.metrics_registry import REGISTRY
+
+    REGISTRY.counter("evr_api_cache_lookups_total", "...", ("cache", "result")).inc(cache="x", result="hit")
+    REGISTRY.histogram("evr_api_request_duration_seconds", "...", ("route",)).observe(0.042, route="/health")
+
+Metrics are get-or-create by name, so modules declare the ones they feed at
+import time and the same object is returned everywhere.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+LATENCY_BUCKETS_SECONDS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PAYLOAD_BUCKETS_BYTES: Tuple[float, ...] = (
+    1_024,
+    4_096,
+    16_384,
+    65_536,
+    262_144,
+    1_048_576,
+    4_194_304,
+    16_777_216,
+)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    rendered = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs)
+    return f"{{{rendered}}}" if rendered else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(sorted(labels))}")
+        return tuple("" if labels[name] is None else str(labels[name]) for name in self.label_names)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = self._header()
+        for key, value in values:
+            lines.append(f"{self.name}{_format_labels(zip(self.label_names, key))} {_format_value(value)}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        # Per label set: per-bucket (non-cumulative) counts plus +Inf, sum, count.
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._label_values(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+            counts, totals = series
+            counts[index] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    def count(self, **labels: object) -> int:
+        with self._lock:
+            series = self._series.get(self._label_values(labels))
+            return int(series[1][1]) if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, (list(counts), list(totals))) for key, (counts, totals) in self._series.items())
+        lines = self._header()
+        for key, (counts, (total, observed)) in series:
+            labels = list(zip(self.label_names, key))
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels([*labels, ("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(observed)}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is None:
+                self._metrics[metric.name] = metric
+                return metric
+        if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+            raise ValueError(f"metric {metric.name} is already registered with a different shape")
+        return existing
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter(name, documentation, label_names))  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None,
+    ) -> Histogram:
+        return self._get_or_create(  # type: ignore[return-value]
+            Histogram(name, documentation, label_names, buckets or LATENCY_BUCKETS_SECONDS)
+        )
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Clear every recorded sample, keeping the registered metrics. For tests."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "evr_api_cache_lookups_total",
+    "In-process cache and single-flight lookups by outcome.",
+    ("cache", "result"),
+)
+PUBLIC_READ_RETRIES = REGISTRY.counter(
+    "evr_api_public_read_retries_total",
+    "PostgREST read attempts retried after a transient failure.",
+    ("path", "operation"),
+)